@@ -0,0 +1,51 @@
+"""Encoding and decoding time of the JSON codecs.
+
+Run with orjson installed to compare both codecs::
+
+    python benchmarks/bench_codec.py
+"""
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Callable, List
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import samples  # noqa: E402
+
+from pytmv1 import JsonCodec, OrjsonCodec  # noqa: E402
+
+
+def _bench(name: str, func: Callable[[], Any], size: int) -> None:
+    runs: int = 5
+    best: float = min(timeit.repeat(func, number=1, repeat=runs))
+    print(
+        f"{name:<40} {best * 1000:>9.1f} ms {size / best / 2**20:>9.1f} MB/s"
+    )
+
+
+def main() -> None:
+    page: Any = samples.activity_page(5000)
+    tasks: List[Any] = [
+        {"agentGuid": f"{i:032x}", "description": "isolate"}
+        for i in range(10_000)
+    ]
+    for codec in (JsonCodec(), OrjsonCodec()):
+        name: str = type(codec).__name__
+        body: bytes = codec.dumps(page)
+        _bench(
+            f"{name} loads (5000 records)",
+            lambda: codec.loads(body),
+            len(body),
+        )
+        _bench(
+            f"{name} dumps (5000 records)",
+            lambda: codec.dumps(page),
+            len(body),
+        )
+        size: int = len(codec.dumps(tasks))
+        _bench(f"{name} dumps (10000 tasks)", lambda: codec.dumps(tasks), size)
+
+
+if __name__ == "__main__":
+    main()
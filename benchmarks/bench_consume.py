@@ -0,0 +1,69 @@
+"""Wall time of a consume call whose consumer waits on I/O
+(ie: a database insert), records consumed by the calling thread
+or by a pool of consumer threads.
+
+    python benchmarks/bench_consume.py
+"""
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pytmv1 import ExceptionObject, GetExceptionListResp  # noqa: E402
+from pytmv1.core import Core  # noqa: E402
+
+PAGES: int = 4
+PAGE_SIZE: int = 250
+FETCH_SEC: float = 0.05
+CONSUME_SEC: float = 0.001
+
+
+def _pages() -> Iterator[GetExceptionListResp]:
+    for i in range(PAGES):
+        time.sleep(FETCH_SEC)
+        yield GetExceptionListResp(
+            nextLink=(
+                "https://host/v3.0/path?skipToken=c2tpcFRva2Vu"
+                if i < PAGES - 1
+                else None
+            ),
+            items=[ExceptionObject.construct() for _ in range(PAGE_SIZE)],
+        )
+
+
+def _consume(core: Core, workers: int, ordered: bool = False) -> Any:
+    pages: Iterator[GetExceptionListResp] = _pages()
+    setattr(core, "_fetch_page", lambda *args, **kwargs: next(pages))
+    return core.send_linkable(
+        GetExceptionListResp,
+        "/path",
+        lambda item: time.sleep(CONSUME_SEC),
+        workers=workers,
+        ordered=ordered,
+    )
+
+
+def _bench(name: str, func: Callable[[], Any]) -> None:
+    start: float = time.perf_counter()
+    func()
+    elapsed: float = time.perf_counter() - start
+    count: int = PAGES * PAGE_SIZE
+    print(
+        f"{name:<40} {elapsed * 1000:>9.2f} ms"
+        f" {count / elapsed:>12,.0f} items/s"
+    )
+
+
+def main() -> None:
+    core: Core = Core("bench", "token", "https://host", 1, 1, 30, 30)
+    _bench("inline", lambda: _consume(core, 0))
+    _bench("workers=1", lambda: _consume(core, 1))
+    _bench("workers=8, ordered", lambda: _consume(core, 8, True))
+    for workers in (4, 8, 16):
+        _bench(f"workers={workers}", lambda: _consume(core, workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Memory footprint per record of models, compact records and dicts.
+
+Run with the pydantic version to measure installed::
+
+    python benchmarks/bench_memory.py
+"""
+import gc
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Type
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import samples  # noqa: E402
+
+from pytmv1 import (  # noqa: E402
+    EndpointActivity,
+    SaeAlert,
+    TiAlert,
+)
+from pytmv1.compact import compact  # noqa: E402
+from pytmv1.compat import PYDANTIC_VERSION, parse_obj  # noqa: E402
+
+
+def _footprint(build: Callable[[], List[Any]]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    records: List[Any] = build()
+    size: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del records
+    return size
+
+
+def _measure(
+    class_: Type[Any], sample: Callable[[int], Dict[str, Any]], count: int
+) -> None:
+    body: bytes = json.dumps([sample(i) for i in range(count)]).encode()
+    models: Callable[[], List[Any]] = lambda: [
+        parse_obj(class_, item) for item in json.loads(body)
+    ]
+    for name, build in (
+        ("dict", lambda: json.loads(body)),
+        ("model", models),
+        ("compact", lambda: [compact(model) for model in models()]),
+    ):
+        size: int = _footprint(build)
+        print(
+            f"{class_.__name__:<20} {name:<10} {size / count:>9,.0f} B/record"
+        )
+
+
+def main() -> None:
+    print(f"pydantic {PYDANTIC_VERSION}")
+    _measure(EndpointActivity, samples.endpoint_activity, 5000)
+    _measure(SaeAlert, samples.sae_alert, 1000)
+    _measure(TiAlert, samples.ti_alert, 1000)
+
+
+if __name__ == "__main__":
+    main()
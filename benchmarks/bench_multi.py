@@ -0,0 +1,64 @@
+"""Processing time of the 207 responses of bulk actions, from the raw
+body to the model or the error (decoding, validation and parsing).
+
+    python benchmarks/bench_multi.py
+"""
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import samples  # noqa: E402
+from requests import Response  # noqa: E402
+
+from pytmv1 import JsonCodec, MultiResp  # noqa: E402
+from pytmv1.codec import default_codec  # noqa: E402
+from pytmv1.core import _decode, _parse_data, _validate  # noqa: E402
+from pytmv1.exceptions import ServerMultiJsonError  # noqa: E402
+
+
+def _bench(name: str, func: Callable[[], Any], count: int) -> None:
+    runs: int = 20
+    best: float = min(timeit.repeat(func, number=1, repeat=runs))
+    print(f"{name:<40} {best * 1000:>9.2f} ms {count / best:>12,.0f} items/s")
+
+
+def _response(codec: JsonCodec, status: int, count: int) -> Response:
+    raw_response: Response = Response()
+    raw_response.status_code = 207
+    raw_response.headers["Content-Type"] = "application/json"
+    raw_response._content = codec.dumps(samples.multi_status(count, status))
+    return raw_response
+
+
+def _process(raw_response: Response, codec: JsonCodec) -> Any:
+    body: Any = _decode(raw_response, codec)
+    try:
+        _validate(raw_response, body)
+    except ServerMultiJsonError as exc:
+        return exc
+    return _parse_data(raw_response, MultiResp, body)
+
+
+def main() -> None:
+    count: int = 1000
+    for codec in (JsonCodec(), default_codec()):
+        name: str = type(codec).__name__
+        for status in (202, 400):
+            raw_response: Response = _response(codec, status, count)
+            _bench(
+                f"{name} decode ({count}, {status})",
+                lambda: _decode(raw_response, codec),
+                count,
+            )
+            _bench(
+                f"{name} process ({count}, {status})",
+                lambda: _process(raw_response, codec),
+                count,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Parse time of alert and endpoint activity pages.
+
+Run with the pydantic version to measure installed::
+
+    python benchmarks/bench_parse.py
+"""
+import json
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import samples  # noqa: E402
+from requests import Response  # noqa: E402
+
+from pytmv1 import (  # noqa: E402
+    EndpointActivity,
+    GetAlertListResp,
+    GetEndpointActivityDataResp,
+    ParseMode,
+)
+from pytmv1.batch import build_batch  # noqa: E402
+from pytmv1.compat import PYDANTIC_VERSION, parse_obj  # noqa: E402
+from pytmv1.core import _parse_data, _parse_items  # noqa: E402
+from pytmv1.projection import project_linkable  # noqa: E402
+
+
+def _bench(name: str, func: Callable[[], Any], count: int) -> None:
+    runs: int = 5
+    best: float = min(timeit.repeat(func, number=1, repeat=runs))
+    print(
+        f"{name:<40} {best * 1000:>9.1f} ms {count / best:>12,.0f} records/s"
+    )
+
+
+def _page(
+    class_: Type[Any],
+    page: Dict[str, Any],
+    count: int,
+    fields: Tuple[str, ...],
+) -> None:
+    body: bytes = json.dumps(page).encode("utf-8")
+    response: Response = Response()
+    response.headers["Content-Type"] = "application/json"
+    _bench(
+        f"{class_.__name__} ({count})",
+        lambda: _parse_data(response, class_, json.loads(body)),
+        count,
+    )
+    for mode in (ParseMode.CONSTRUCT, ParseMode.RAW):
+        _bench(
+            f"{class_.__name__} ({count}, {mode.value})",
+            lambda: _parse_items(class_, json.loads(body)["items"], mode),
+            count,
+        )
+    _bench(
+        f"{class_.__name__} ({count}, lazy, 4 fields)",
+        lambda: _read(
+            _parse_items(class_, json.loads(body)["items"], ParseMode.LAZY),
+            fields,
+        ),
+        count,
+    )
+
+
+def _read(records: List[Any], fields: Tuple[str, ...]) -> None:
+    for record in records:
+        for name in fields:
+            getattr(record, name)
+
+
+def main() -> None:
+    print(f"pydantic {PYDANTIC_VERSION}")
+    _page(
+        GetAlertListResp,
+        samples.alert_page(1000),
+        1000,
+        ("id", "severity", "score", "created_date_time"),
+    )
+    page: Dict[str, Any] = samples.activity_page(5000)
+    _page(
+        GetEndpointActivityDataResp,
+        page,
+        5000,
+        ("event_id", "endpoint_host_name", "dpt", "tags"),
+    )
+    body: bytes = json.dumps(page).encode("utf-8")
+    _bench(
+        "EndpointActivity (5000, batch)",
+        lambda: build_batch(EndpointActivity, json.loads(body)["items"]),
+        5000,
+    )
+    select: List[str] = ["eventId", "endpointHostName", "dpt", "tags"]
+    selected: bytes = json.dumps(
+        {
+            **page,
+            "items": [
+                {alias: item[alias] for alias in select if alias in item}
+                for item in page["items"]
+            ],
+        }
+    ).encode("utf-8")
+    _bench(
+        "EndpointActivity (5000, select 4 fields)",
+        lambda: parse_obj(GetEndpointActivityDataResp, json.loads(selected)),
+        5000,
+    )
+    _bench(
+        "EndpointActivity (5000, select 4, slim)",
+        lambda: parse_obj(
+            project_linkable(GetEndpointActivityDataResp, select),
+            json.loads(selected),
+        ),
+        5000,
+    )
+
+
+if __name__ == "__main__":
+    main()
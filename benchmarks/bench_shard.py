@@ -0,0 +1,149 @@
+"""Wall time of a multi-day endpoint activity export, sent as a single
+search paged one page at a time or split in time windows fetched
+concurrently. Every request (page or count) waits for the simulated
+latency of the server.
+
+    python benchmarks/bench_shard.py
+"""
+import bisect
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pytmv1 import (  # noqa: E402
+    EndpointActivity,
+    GetEndpointActivityDataCountResp,
+    GetEndpointActivityDataResp,
+    ShardPolicy,
+)
+from pytmv1.core import Core  # noqa: E402
+from pytmv1.model.enums import Api, SearchMode  # noqa: E402
+
+DAYS: int = 3
+RECORDS: int = 20_000
+PAGE_SIZE: int = 500
+LATENCY_SEC: float = 0.05
+START: str = "2024-01-01T00:00:00Z"
+END: str = f"2024-01-{1 + DAYS:02d}T00:00:00Z"
+
+
+def _epoch(value: str) -> int:
+    return int(
+        datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ")
+        .replace(tzinfo=timezone.utc)
+        .timestamp()
+    )
+
+
+# Busier during the day: every 4th record falls in the first hour
+TIMES: List[int] = sorted(
+    _epoch(START)
+    + (i * 3600 // RECORDS if i % 4 == 0 else i * DAYS * 86400 // RECORDS)
+    for i in range(RECORDS)
+)
+
+
+def _process(class_: Any, uri: str, method: Any = None, **kwargs: Any) -> Any:
+    time.sleep(LATENCY_SEC)
+    params: Optional[Dict[str, Any]] = kwargs.get("params")
+    if params:
+        start, end = _epoch(params["startDateTime"]), _epoch(
+            params["endDateTime"]
+        )
+        skip: int = 0
+    else:
+        query: Dict[str, List[str]] = parse_qs(urlsplit(uri).query)
+        start, end, skip = (
+            int(query[name][0]) for name in ("start", "end", "skip")
+        )
+    first: int = bisect.bisect_left(TIMES, start)
+    after: int = bisect.bisect_right(TIMES, end)
+    records: List[int] = TIMES[first:after]
+    if params and params.get("mode") == SearchMode.COUNT_ONLY:
+        return GetEndpointActivityDataCountResp.construct(
+            total_count=len(records)
+        )
+    last: int = skip + PAGE_SIZE
+    return GetEndpointActivityDataResp.construct(
+        next_link=(
+            f"https://host/v3.0/path?start={start}&end={end}&skip={last}"
+            if last < len(records)
+            else None
+        ),
+        items=[
+            EndpointActivity.construct(event_time=t)
+            for t in records[skip:last]
+        ],
+    )
+
+
+def _export(
+    core: Core,
+    policy: Optional[ShardPolicy],
+    ordered: bool = False,
+    prefetch: int = 0,
+) -> Any:
+    consumed: List[int] = []
+    params: Dict[str, Any] = {
+        "startDateTime": START,
+        "endDateTime": END,
+        "top": PAGE_SIZE,
+        "mode": SearchMode.DEFAULT,
+    }
+    if policy is None:
+        result: Any = core.send_linkable(
+            GetEndpointActivityDataResp,
+            Api.GET_ENDPOINT_ACTIVITY_DATA,
+            lambda item: consumed.append(item.event_time),
+            params=params,
+        )
+    else:
+        result = core.send_sharded(
+            GetEndpointActivityDataResp,
+            GetEndpointActivityDataCountResp,
+            Api.GET_ENDPOINT_ACTIVITY_DATA,
+            lambda item: consumed.append(item.event_time),
+            policy,
+            prefetch,
+            ordered=ordered,
+            params=params,
+        )
+    assert (consumed if ordered else sorted(consumed)) == TIMES, result
+    return result
+
+
+def _bench(name: str, func: Callable[[], Any]) -> None:
+    start: float = time.perf_counter()
+    func()
+    elapsed: float = time.perf_counter() - start
+    print(
+        f"{name:<40} {elapsed * 1000:>9.2f} ms"
+        f" {RECORDS / elapsed:>12,.0f} items/s"
+    )
+
+
+def main() -> None:
+    core: Core = Core("bench", "token", "https://host", 1, 1, 30, 30)
+    setattr(core, "_process", _process)
+    _bench("single search", lambda: _export(core, None))
+    for workers in (1, 2, 4, 8):
+        _bench(
+            f"shards=8, workers={workers}",
+            lambda: _export(core, ShardPolicy(shards=8, workers=workers)),
+        )
+    for prefetch in (0, 4):
+        _bench(
+            f"shards=8, workers=8, ordered, prefetch={prefetch}",
+            lambda: _export(
+                core, ShardPolicy(shards=8, workers=8), True, prefetch
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
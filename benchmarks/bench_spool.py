@@ -0,0 +1,77 @@
+"""Memory held by the pages fetched ahead of a stalled consumer, pages
+buffered in memory (prefetch) or on disk (SpoolPolicy).
+
+    python benchmarks/bench_spool.py
+"""
+import json
+import sys
+import tempfile
+import threading
+import tracemalloc
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import samples  # noqa: E402
+from requests import Response  # noqa: E402
+
+from pytmv1 import GetEndpointActivityDataResp, SpoolPolicy  # noqa: E402
+from pytmv1.core import Core  # noqa: E402
+
+PAGES: int = 40
+PAGE_SIZE: int = 500
+
+
+def _responses(fetched: threading.Event) -> Iterator[Response]:
+    page: Any = samples.activity_page(PAGE_SIZE)
+    for i in range(PAGES):
+        page["nextLink"] = (
+            f"https://host/v3.0/path?skipToken={i}" if i < PAGES - 1 else None
+        )
+        raw_response: Response = Response()
+        raw_response.status_code = 200
+        raw_response.headers["Content-Type"] = "application/json"
+        raw_response._content = json.dumps(page).encode()
+        if i == PAGES - 1:
+            fetched.set()
+        yield raw_response
+
+
+def _consume(spooling: Optional[SpoolPolicy]) -> None:
+    core: Core = Core(
+        "bench", "token", "https://host", 1, 1, 30, 30, spooling=spooling
+    )
+    fetched = threading.Event()
+    responses: Iterator[Response] = _responses(fetched)
+    setattr(core, "_send_internal", lambda *args, **kwargs: next(responses))
+    peak: int = 0
+
+    def consumer(item: Any) -> None:
+        nonlocal peak
+        if not peak:
+            fetched.wait()
+            peak = tracemalloc.get_traced_memory()[0]
+
+    tracemalloc.start()
+    core.send_linkable(
+        GetEndpointActivityDataResp,
+        "/path",
+        consumer,
+        prefetch=0 if spooling else PAGES,
+    )
+    tracemalloc.stop()
+    name: str = "spool" if spooling else "memory"
+    print(
+        f"{name:<10} {peak / 1024 / 1024:>9.1f} MiB held after {PAGES} pages"
+    )
+
+
+def main() -> None:
+    _consume(None)
+    with tempfile.TemporaryDirectory() as directory:
+        _consume(SpoolPolicy(directory))
+
+
+if __name__ == "__main__":
+    main()
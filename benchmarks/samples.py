@@ -0,0 +1,210 @@
+"""Synthetic Vision One pages used by the benchmarks."""
+import random
+from typing import Any, Dict, List
+
+RANDOM = random.Random(42)
+
+
+def endpoint_activity(index: int) -> Dict[str, Any]:
+    return {
+        "dpt": 443,
+        "dst": f"10.0.{index % 250}.{index % 200}",
+        "endpointGuid": f"35fa11da-a24e-40cf-8b56-{index:012d}",
+        "endpointHostName": f"host-{index % 300}",
+        "endpointIp": [f"10.1.{index % 250}.1", "fe80::1"],
+        "eventId": str(RANDOM.randint(1, 14)),
+        "eventSubId": RANDOM.choice([0, 1, 2, 3, 4, 5]),
+        "objectIntegrityLevel": RANDOM.choice([0, 4096, 8192, 12288, 16384]),
+        "objectTrueType": 7,
+        "objectSubTrueType": 7001,
+        "winEventId": 4688,
+        "eventTime": 1_680_000_000_000 + index,
+        "eventTimeDT": "2023-03-28T10:40:00.000Z",
+        "hostName": f"host-{index % 300}",
+        "logonUser": ["SYSTEM", f"user{index % 50}"],
+        "objectCmd": "C:\\Windows\\system32\\svchost.exe -k netsvcs -p",
+        "objectFileHashSha1": "0D9C8B51FA4F9F8D6B2C8D9B7E0B3F5C2E1A4D6F",
+        "objectFilePath": "C:\\Windows\\System32\\svchost.exe",
+        "objectHostName": "update.example.com",
+        "objectIp": "203.0.113.7",
+        "objectIps": ["203.0.113.7", "203.0.113.8"],
+        "objectPort": 443,
+        "objectRegistryData": "",
+        "objectRegistryKeyHandle": "hklm",
+        "objectRegistryValue": "",
+        "objectSigner": ["Microsoft Windows"],
+        "objectSignerValid": [True],
+        "objectUser": "SYSTEM",
+        "os": RANDOM.choice(["Windows", "Linux", "macOS"]),
+        "parentCmd": "C:\\Windows\\system32\\services.exe",
+        "parentFileHashSha1": "1A2B3C4D5E6F708192A3B4C5D6E7F8091A2B3C4D",
+        "parentFilePath": "C:\\Windows\\System32\\services.exe",
+        "processCmd": "C:\\Windows\\system32\\svchost.exe -k netsvcs",
+        "processFileHashSha1": "0D9C8B51FA4F9F8D6B2C8D9B7E0B3F5C2E1A4D6F",
+        "processFilePath": "C:\\Windows\\System32\\svchost.exe",
+        "request": "https://update.example.com/path?query=1",
+        "searchDL": "SDL",
+        "spt": 52000 + index % 1000,
+        "src": "10.1.0.1",
+        "srcFileHashSha1": "",
+        "srcFilePath": "",
+        "tags": ["MITREV9.T1059", "XSAE.F1234"],
+        "uuid": f"c5a7b2d0-0000-4000-8000-{index:012d}",
+    }
+
+
+def _host() -> Dict[str, Any]:
+    return {"name": "host", "ips": ["1.1.1.1", "2.2.2.2"], "guid": "guid"}
+
+
+def _alert(index: int, provider: str) -> Dict[str, Any]:
+    return {
+        "schemaVersion": "1.12",
+        "id": f"WB-{index}",
+        "investigationStatus": "New",
+        "workbenchLink": "https://portal.xdr.trendmicro.com/#/workbench",
+        "alertProvider": provider,
+        "model": "Possible Credential Dumping via Registry",
+        "score": 64,
+        "severity": "high",
+        "createdDateTime": "2023-03-28T10:40:00Z",
+        "updatedDateTime": "2023-03-28T10:40:00Z",
+        "impactScope": {
+            "desktopCount": 1,
+            "serverCount": 0,
+            "accountCount": 1,
+            "emailAddressCount": 0,
+            "entities": [
+                {
+                    "entityId": f"host-{index}",
+                    "entityType": "host",
+                    "entityValue": _host(),
+                    "relatedEntities": [f"user-{index}"],
+                    "relatedIndicatorIds": [1],
+                    "provenance": ["Alert"],
+                },
+                {
+                    "entityId": f"user-{index}",
+                    "entityType": "account",
+                    "entityValue": f"user{index}",
+                    "relatedEntities": [f"host-{index}"],
+                    "relatedIndicatorIds": [],
+                    "provenance": ["Alert"],
+                },
+            ],
+        },
+        "indicators": [
+            {
+                "id": 1,
+                "type": "command_line",
+                "field": "objectCmd",
+                "value": "reg save HKLM\\SAM sam.save",
+                "relatedEntities": [f"host-{index}"],
+                "filterIds": ["f-1"],
+                "provenance": ["Alert"],
+            },
+            {
+                "id": 2,
+                "type": "host",
+                "field": "endpointHostName",
+                "value": _host(),
+                "relatedEntities": [f"host-{index}"],
+                "filterIds": ["f-1"],
+                "provenance": ["Alert"],
+            },
+        ],
+    }
+
+
+def sae_alert(index: int) -> Dict[str, Any]:
+    alert: Dict[str, Any] = _alert(index, "SAE")
+    alert["description"] = "Credential dumping via registry"
+    alert["matchedRules"] = [
+        {
+            "id": "r-1",
+            "name": "Potential Credential Dumping via Registry",
+            "matchedFilters": [
+                {
+                    "id": "f-1",
+                    "name": "Possible Credential Dumping via Registry Hive",
+                    "matchedDateTime": "2023-03-28T10:39:00Z",
+                    "mitreTechniqueIds": ["V9.T1003.004", "T1003"],
+                    "matchedEvents": [
+                        {
+                            "uuid": f"e-{index}",
+                            "matchedDateTime": "2023-03-28T10:39:00Z",
+                            "type": "TELEMETRY_PROCESS",
+                        }
+                    ],
+                }
+            ],
+        }
+    ]
+    return alert
+
+
+def ti_alert(index: int) -> Dict[str, Any]:
+    alert: Dict[str, Any] = _alert(index, "TI")
+    alert.update(
+        {
+            "campaign": "campaign",
+            "industry": "industry",
+            "regionAndCountry": "region",
+            "createdBy": "n/a",
+            "totalIndicatorCount": 2,
+            "matchedIndicatorCount": 1,
+            "reportLink": "https://portal.xdr.trendmicro.com/#/report",
+            "matchedIndicatorPatterns": [
+                {
+                    "id": "p-1",
+                    "pattern": "[file:name = 'sample.exe']",
+                    "tags": ["STIX2.malicious-activity"],
+                    "matchedLogs": [],
+                }
+            ],
+        }
+    )
+    return alert
+
+
+def activity_page(count: int = 5000) -> Dict[str, Any]:
+    return {
+        "nextLink": "https://api.xdr.trendmicro.com/v3.0/search?skipToken=a",
+        "progressRate": 100,
+        "items": [endpoint_activity(i) for i in range(count)],
+    }
+
+
+def alert_page(count: int = 1000) -> Dict[str, Any]:
+    items: List[Dict[str, Any]] = [
+        sae_alert(i) if i % 2 else ti_alert(i) for i in range(count)
+    ]
+    return {"totalCount": count, "count": count, "items": items}
+
+
+def multi_status(count: int = 1000, status: int = 202) -> List[Dict[str, Any]]:
+    if status >= 400:
+        return [
+            {
+                "status": status,
+                "body": {
+                    "error": {"code": "BadRequest", "message": f"task {i}"}
+                },
+            }
+            for i in range(count)
+        ]
+    return [
+        {
+            "status": status,
+            "headers": [
+                {
+                    "name": "Operation-Location",
+                    "value": (
+                        "https://api.xdr.trendmicro.com/v3.0/"
+                        f"response/tasks/{i:08d}"
+                    ),
+                }
+            ],
+        }
+        for i in range(count)
+    ]
@@ -1,5 +1,32 @@
 from .__about__ import __version__
+from .async_caller import AsyncClient, async_client
+from .batch import (
+    Column,
+    DictionaryColumn,
+    ListColumn,
+    PrimitiveColumn,
+    RecordBatch,
+    StringColumn,
+)
 from .caller import Client, client
+from .checkpoint import (
+    Checkpoint,
+    CheckpointStore,
+    FileCheckpointStore,
+    SqliteCheckpointStore,
+)
+from .codec import JsonCodec, OrjsonCodec
+from .compact import (
+    CompactRecord,
+    EmailActivityRecord,
+    EndpointActivityRecord,
+    EndpointRecord,
+    SaeAlertRecord,
+    TiAlertRecord,
+    compact,
+    compact_type,
+)
+from .lazy import LazyRecord, lazy_type
 from .mapper import map_cef
 from .model.commons import (
     Account,
@@ -40,6 +67,7 @@ from .model.enums import (
     InvestigationStatus,
     ObjectType,
     OperatingSystem,
+    ParseMode,
     ProductCode,
     Provenance,
     Provider,
@@ -92,36 +120,67 @@ from .model.responses import (
     SandboxSubmissionStatusResp,
     SandboxSubmitUrlTaskResp,
     SandboxSuspiciousListResp,
+    SaveFileResp,
     SubmitFileToSandboxResp,
     TerminateProcessTaskResp,
 )
+from .paginator import AsyncPaginator, Paginator, PendingItems
+from .policy import (
+    BulkPolicy,
+    LogPolicy,
+    ParsePolicy,
+    PollPolicy,
+    RetryPolicy,
+    ShardPolicy,
+    SpoolPolicy,
+)
+from .projection import project
 from .results import MultiResult, Result, ResultCode
+from .spool import SpooledItems
+from .watcher import AsyncTaskWatcher, TaskWatcher
 
 __all__ = [
     "__version__",
+    "async_client",
     "client",
+    "compact",
+    "compact_type",
+    "lazy_type",
     "map_cef",
+    "project",
     "Account",
     "AccountTask",
     "AccountTaskResp",
     "AddAlertNoteResp",
     "Alert",
+    "AsyncClient",
+    "AsyncPaginator",
+    "AsyncTaskWatcher",
     "BaseTaskResp",
     "BlockListTaskResp",
+    "BulkPolicy",
     "BytesResp",
+    "Checkpoint",
+    "CheckpointStore",
     "Client",
     "CollectFileTaskResp",
+    "Column",
+    "CompactRecord",
     "ConnectivityResp",
     "ConsumeLinkableResp",
     "CustomScriptTask",
+    "DictionaryColumn",
     "Digest",
     "EmailActivity",
+    "EmailActivityRecord",
     "EmailMessage",
     "EmailMessageIdTask",
     "EmailMessageTaskResp",
     "EmailMessageUIdTask",
     "Endpoint",
     "EndpointActivity",
+    "EndpointActivityRecord",
+    "EndpointRecord",
     "EndpointTask",
     "EndpointTaskResp",
     "Entity",
@@ -130,6 +189,7 @@ __all__ = [
     "EventID",
     "EventSubID",
     "ExceptionObject",
+    "FileCheckpointStore",
     "FileTask",
     "GetAlertDetailsResp",
     "GetAlertListResp",
@@ -146,6 +206,10 @@ __all__ = [
     "Indicator",
     "IntegrityLevel",
     "InvestigationStatus",
+    "JsonCodec",
+    "LazyRecord",
+    "ListColumn",
+    "LogPolicy",
     "MatchedEvent",
     "MatchedFilter",
     "MatchedIndicatorPattern",
@@ -160,17 +224,27 @@ __all__ = [
     "ObjectTask",
     "ObjectType",
     "OperatingSystem",
+    "OrjsonCodec",
+    "Paginator",
+    "ParseMode",
+    "ParsePolicy",
+    "PendingItems",
+    "PollPolicy",
+    "PrimitiveColumn",
     "ProcessTask",
     "ProductCode",
     "Provenance",
     "Provider",
     "QueryField",
     "QueryOp",
+    "RecordBatch",
     "Result",
     "ResultCode",
+    "RetryPolicy",
     "RiskLevel",
     "CustomScriptTaskResp",
     "SaeAlert",
+    "SaeAlertRecord",
     "SaeIndicator",
     "SandboxAction",
     "SandboxAnalysisResultResp",
@@ -178,16 +252,24 @@ __all__ = [
     "SandboxSubmissionStatusResp",
     "SandboxSubmitUrlTaskResp",
     "SandboxSuspiciousListResp",
+    "SaveFileResp",
     "SandboxSuspiciousObject",
     "ScanAction",
     "Severity",
+    "ShardPolicy",
+    "SpooledItems",
+    "SqliteCheckpointStore",
+    "SpoolPolicy",
     "Status",
+    "StringColumn",
     "SubmitFileToSandboxResp",
     "SuspiciousObject",
     "SuspiciousObjectTask",
+    "TaskWatcher",
     "TaskAction",
     "TerminateProcessTaskResp",
     "TiAlert",
+    "TiAlertRecord",
     "TiIndicator",
     "Value",
     "ValueList",
@@ -21,7 +21,7 @@ class HTTPConnectionPool(HTTPUrllib):
         assert_same_host=True,
         timeout=30,
         pool_timeout=10,
-        release_conn=True,
+        release_conn=None,
         chunked=False,
         body_pos=None,
         preload_content=True,
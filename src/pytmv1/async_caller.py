@@ -0,0 +1,2161 @@
+from __future__ import annotations
+
+import logging
+from logging import Logger
+from types import TracebackType
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    Union,
+)
+
+from . import utils
+from .async_core import AsyncCore
+from .batch import RecordBatch
+from .checkpoint import Checkpoint, CheckpointStore
+from .codec import JsonCodec
+from .compat import model_dump
+from .model.commons import (
+    EmailActivity,
+    Endpoint,
+    EndpointActivity,
+    ExceptionObject,
+    SaeAlert,
+    SuspiciousObject,
+    TiAlert,
+)
+from .model.enums import (
+    Api,
+    HttpMethod,
+    InvestigationStatus,
+    ParseMode,
+    QueryOp,
+    SearchMode,
+)
+from .model.requests import (
+    AccountTask,
+    CustomScriptTask,
+    EmailMessageIdTask,
+    EmailMessageUIdTask,
+    EndpointTask,
+    FileTask,
+    ObjectTask,
+    ProcessTask,
+    SuspiciousObjectTask,
+)
+from .model.responses import (
+    AddAlertNoteResp,
+    BaseTaskResp,
+    BytesResp,
+    ConnectivityResp,
+    ConsumeLinkableResp,
+    GetAlertDetailsResp,
+    GetAlertListResp,
+    GetEmailActivityDataCountResp,
+    GetEmailActivityDataResp,
+    GetEndpointActivityDataCountResp,
+    GetEndpointActivityDataResp,
+    GetEndpointDataResp,
+    GetExceptionListResp,
+    GetSuspiciousListResp,
+    MultiResp,
+    MultiUrlResp,
+    NoContentResp,
+    S,
+    SandboxAnalysisResultResp,
+    SandboxSubmissionStatusResp,
+    SandboxSuspiciousListResp,
+    SaveFileResp,
+    SubmitFileToSandboxResp,
+)
+from .paginator import AsyncPaginator
+from .policy import (
+    BulkPolicy,
+    LogPolicy,
+    ParsePolicy,
+    PollPolicy,
+    RetryPolicy,
+    ShardPolicy,
+    SpoolPolicy,
+)
+from .projection import project_linkable, select_fields
+from .results import MultiResult, Result
+from .stream import Destination, Upload
+from .watcher import AsyncTaskWatcher, Watchable
+
+log: Logger = logging.getLogger(__name__)
+
+
+def async_client(
+    name: str,
+    token: str,
+    url: str,
+    pool_connections: int = 1,
+    pool_maxsize: int = 1,
+    connect_timeout: int = 30,
+    read_timeout: int = 30,
+    retry: Optional[RetryPolicy] = None,
+    polling: Optional[PollPolicy] = None,
+    bulk: Optional[BulkPolicy] = None,
+    logs: Optional[LogPolicy] = None,
+    parse_mode: ParseMode = ParseMode.VALIDATED,
+    codec: Optional[JsonCodec] = None,
+    parsing: Optional[ParsePolicy] = None,
+    spooling: Optional[SpoolPolicy] = None,
+) -> AsyncClient:
+    """Helper function to initialize an :class:`AsyncClient`.
+
+    :param name: Identify the application using this library.
+    :type name: str
+    :param token: Authentication token created for your account.
+    :type token: str
+    :param url: Vision One API url this client connects to.
+    :type url: str
+    :param pool_connections: (optional) Number of connection to cache,
+     kept for parity with :func:`~pytmv1.client`, the asynchronous
+     client holds a single pool.
+    :type pool_connections: int
+    :param pool_maxsize: (optional) Maximum size of the pool, both the
+     number of concurrent connections and of idle connections kept.
+    :type pool_maxsize: int
+    :param connect_timeout: (optional) Seconds before connection timeout.
+    :type connect_timeout: int
+    :param read_timeout: (optional) Seconds before read timeout.
+    :type connect_timeout: int
+    :param retry: (optional) Retry policy applied to failed requests,
+     requests are not retried if not set.
+    :type retry: Optional[RetryPolicy]
+    :param polling: (optional) Schedule of the status requests sent
+     while waiting for a result, default schedule used if not set.
+    :type polling: Optional[PollPolicy]
+    :param bulk: (optional) Splitting of bulk requests in chunks sent
+     concurrently, default limits used if not set.
+    :type bulk: Optional[BulkPolicy]
+    :param logs: (optional) Logging of the HTTP requests and responses,
+     bodies are truncated to 1024 bytes if not set.
+    :type logs: Optional[LogPolicy]
+    :param parse_mode: (optional) Parsing of the paginated records:
+     validated models, records validating each field on first access,
+     unvalidated models built with ``construct()`` or plain dicts,
+     validated models by default.
+    :type parse_mode: ParseMode
+    :param codec: (optional) JSON encoding of the requests and decoding
+     of the responses, orjson if installed and the standard library
+     otherwise if not set.
+    :type codec: Optional[JsonCodec]
+    :param parsing: (optional) Validation of large pages in worker
+     processes, pages are validated by the fetching thread if not set.
+    :type parsing: Optional[ParsePolicy]
+    :param spooling: (optional) Buffering on disk of the pages fetched by
+     consume calls, pages are held in memory if not set.
+    :type spooling: Optional[SpoolPolicy]
+    :rtype: AsyncClient
+    """
+    log.debug(
+        "Initializing new async client with [Appname=%s, Token=*****, URL=%s]",
+        name,
+        url,
+    )
+    return AsyncClient(
+        AsyncCore(
+            name,
+            token,
+            url,
+            pool_connections,
+            pool_maxsize,
+            connect_timeout,
+            read_timeout,
+            retry,
+            polling,
+            bulk,
+            logs,
+            parse_mode,
+            codec,
+            parsing,
+            spooling,
+        )
+    )
+
+
+class AsyncClient:
+    def __init__(self, core: AsyncCore):
+        self._core = core
+
+    async def __aenter__(self) -> AsyncClient:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes the underlying connection pool."""
+        await self._core.close()
+
+    async def add_alert_note(
+        self, alert_id: str, note: str
+    ) -> Result[AddAlertNoteResp]:
+        """Adds a note to the specified Workbench alert.
+
+        :param alert_id: Workbench alert id.
+        :type alert_id: str
+        :param note: Value of the note.
+        :type note: str
+        :rtype: Result[AddAlertNoteResp]:
+        """
+        return await self._core.send(
+            AddAlertNoteResp,
+            Api.ADD_ALERT_NOTE.value.format(alert_id),
+            HttpMethod.POST,
+            json={"content": note},
+        )
+
+    async def add_to_block_list(
+        self, *objects: ObjectTask
+    ) -> MultiResult[MultiResp]:
+        """Adds object(s) to the Suspicious Object List,
+        which blocks the objects on subsequent detections.
+
+        :param objects: Object(s) to add.
+        :type objects: Tuple[ObjectTask, ...]
+        :rtype: MultiResult[MultiResp]
+        """
+        return await self._core.send_multi(
+            MultiResp,
+            Api.ADD_TO_BLOCK_LIST,
+            json=utils.build_object_request(*objects),
+        )
+
+    async def add_to_exception_list(
+        self, *objects: ObjectTask
+    ) -> MultiResult[MultiResp]:
+        """Adds object(s) to the Exception List.
+
+        :param objects: Object(s) to add.
+        :type objects: Tuple[ObjectTask, ...]
+        :rtype: MultiResult[MultiResp]
+        """
+        return await self._core.send_multi(
+            MultiResp,
+            Api.ADD_TO_EXCEPTION_LIST,
+            json=utils.build_object_request(*objects),
+        )
+
+    async def add_to_suspicious_list(
+        self, *objects: SuspiciousObjectTask
+    ) -> MultiResult[MultiResp]:
+        """Adds object(s) to the Suspicious Object List.
+
+        :param objects: Object(s) to add.
+        :type objects: Tuple[SuspiciousObjectTask, ...]
+        :rtype: MultiResult[MultiResp]
+        """
+        return await self._core.send_multi(
+            MultiResp,
+            Api.ADD_TO_SUSPICIOUS_LIST,
+            json=utils.build_suspicious_request(*objects),
+        )
+
+    async def collect_file(self, *files: FileTask) -> MultiResult[MultiResp]:
+        """Collects a file from one or more endpoints and then sends the files
+        to Vision One in a password-protected archive.
+
+        :param files: File(s) to collect.
+        :type files: Tuple[FileTask, ...]
+        :rtype: MultiResult[MultiResp]
+        """
+        return await self._core.send_endpoint(
+            Api.COLLECT_ENDPOINT_FILE, *files
+        )
+
+    async def consume_alert_list(
+        self,
+        consumer: Callable[
+            [Union[SaeAlert, TiAlert]], Optional[Awaitable[None]]
+        ],
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+        workers: int = 0,
+        queue_size: int = 1000,
+        ordered: bool = False,
+        checkpoint: Optional[CheckpointStore] = None,
+        resume_from: Optional[Checkpoint] = None,
+    ) -> Result[ConsumeLinkableResp]:
+        """Retrieves and consume workbench alerts.
+
+        :param consumer: Function which will consume every record in result.
+        :type consumer: Callable[[Union[SaeAlert, TiAlert]],
+         Optional[Awaitable[None]]]
+        :param start_time: Date that indicates the start of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to 24 hours before the request is made.
+        :type start_time: Optional[str]
+        :param end_time: Date that indicates the end of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to the time the request is made.
+        :type end_time: Optional[str]
+        :param prefetch: Number of pages fetched in background
+         while the current page is consumed, disabled if 0.
+        :type prefetch: int
+        :param stream: Parse records one at a time while the page is
+         downloaded instead of loading the whole page in memory,
+         ``prefetch`` is ignored if set.
+        :type stream: bool
+        :param parse_mode: Parsing of the records, validated models,
+         lazily validated records, unvalidated models or plain dicts,
+         client default if not set.
+        :type parse_mode: Optional[ParseMode]
+        :param workers: Number of tasks consuming the records while the
+         next records are fetched, records are consumed by the calling
+         task if 0. Errors raised by ``consumer`` are then collected in
+         the response instead of stopping the consumption.
+        :type workers: int
+        :param queue_size: Maximum number of records fetched ahead of the
+         consumers, fetching waits while the queue is full.
+        :type queue_size: int
+        :param ordered: Consume the records one at a time in their order
+         by a single worker.
+        :type ordered: bool
+        :param checkpoint: Store of the position of the consumption, saved
+         once all the records of a page are consumed, nothing is saved
+         if not set.
+        :type checkpoint: Optional[CheckpointStore]
+        :param resume_from: Position to resume the consumption from
+         (ie: ``checkpoint.load()``), the filters of the first call are
+         carried by its ``next_link``.
+        :type resume_from: Optional[Checkpoint]
+        :rtype: Result[ConsumeLinkableResp]:
+        """
+        return await self._core.send_linkable(
+            GetAlertListResp,
+            Api.GET_ALERT_LIST,
+            consumer,
+            prefetch,
+            stream,
+            parse_mode,
+            workers,
+            queue_size,
+            ordered,
+            checkpoint,
+            resume_from,
+            params=utils.filter_none(
+                {
+                    "startDateTime": start_time,
+                    "endDateTime": end_time,
+                    "orderBy": "createdDateTime desc",
+                }
+            ),
+        )
+
+    async def consume_email_activity_data(
+        self,
+        consumer: Callable[[EmailActivity], Optional[Awaitable[None]]],
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        select: Optional[List[str]] = None,
+        top: int = 500,
+        op: QueryOp = QueryOp.AND,
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+        workers: int = 0,
+        queue_size: int = 1000,
+        ordered: bool = False,
+        checkpoint: Optional[CheckpointStore] = None,
+        resume_from: Optional[Checkpoint] = None,
+        shards: Optional[ShardPolicy] = None,
+        slim: bool = False,
+        **fields: str,
+    ) -> Result[ConsumeLinkableResp]:
+        """Retrieves and consume email activity data in a paginated list
+         filtered by provided values.
+
+        :param consumer: Function which will consume every record in result.
+        :type consumer: Callable[[EmailActivity], Optional[Awaitable[None]]]
+        :param start_time: Date that indicates the start of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to 24 hours before the request is made.
+        :type start_time: Optional[str]
+        :param end_time: Date that indicates the end of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to the time the request is made.
+        :type end_time: Optional[str]
+        :param select: List of fields to include in the search results,
+        if no fields are specified, the query returns all supported fields.
+        Fields are named after the model (ie: mail_msg_id)
+        or the API (ie: mailMsgId).
+        :type select: Optional[List[str]]
+        :param top: Number of records fetched per page.
+        :type top: int
+        :param op: Operator to apply between fields (ie: uuid=... OR tags=...)
+        :type op: QueryOp
+        :param fields: Field/value used to filter result (ie: uuid="123456")
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :param prefetch: Number of pages fetched in background
+         while the current page is consumed, disabled if 0.
+        :type prefetch: int
+        :param stream: Parse records one at a time while the page is
+         downloaded instead of loading the whole page in memory,
+         ``prefetch`` is ignored if set.
+        :type stream: bool
+        :param parse_mode: Parsing of the records, validated models,
+         lazily validated records, unvalidated models or plain dicts,
+         client default if not set.
+        :type parse_mode: Optional[ParseMode]
+        :param workers: Number of tasks consuming the records while the
+         next records are fetched, records are consumed by the calling
+         task if 0. Errors raised by ``consumer`` are then collected in
+         the response instead of stopping the consumption.
+        :type workers: int
+        :param queue_size: Maximum number of records fetched ahead of the
+         consumers, fetching waits while the queue is full.
+        :type queue_size: int
+        :param ordered: Consume the records one at a time in their order
+         by a single worker.
+        :type ordered: bool
+        :param checkpoint: Store of the position of the consumption, saved
+         once all the records of a page are consumed, nothing is saved
+         if not set.
+        :type checkpoint: Optional[CheckpointStore]
+        :param resume_from: Position to resume the consumption from
+         (ie: ``checkpoint.load()``), the filters of the first call are
+         carried by its ``next_link``.
+        :type resume_from: Optional[Checkpoint]
+        :param shards: Splitting of the search in time windows of roughly
+         equal volume fetched concurrently, the records of a window are
+         consumed after those of the previous windows if ``ordered`` is
+         set and as soon as fetched otherwise. Up to ``prefetch`` pages
+         (at least one) of every window are fetched ahead of the consumer.
+         Pages are not streamed and ``checkpoint`` and ``resume_from`` do
+         not apply. The search is sent over the whole range if not set.
+        :type shards: Optional[ShardPolicy]
+        :param slim: Parse the records with a model validating only the
+         selected fields (see :func:`~pytmv1.project`), faster on large
+         pages but the records are not instances of the activity model
+         and lack the other fields.
+        :type slim: bool
+        :rtype: Result[ConsumeLinkableResp]:
+        """
+        params: Dict[str, str] = utils.build_activity_request(
+            start_time,
+            end_time,
+            select_fields(EmailActivity, select),
+            top,
+            SearchMode.DEFAULT,
+        )
+        headers: Dict[str, str] = utils.activity_query(op, **fields)
+        if shards:
+            return await self._core.send_sharded(
+                project_linkable(
+                    GetEmailActivityDataResp, select if slim else None
+                ),
+                GetEmailActivityDataCountResp,
+                Api.GET_EMAIL_ACTIVITY_DATA,
+                consumer,
+                shards,
+                prefetch,
+                parse_mode,
+                workers,
+                queue_size,
+                ordered,
+                params=params,
+                headers=headers,
+            )
+        return await self._core.send_linkable(
+            project_linkable(
+                GetEmailActivityDataResp, select if slim else None
+            ),
+            Api.GET_EMAIL_ACTIVITY_DATA,
+            consumer,
+            prefetch,
+            stream,
+            parse_mode,
+            workers,
+            queue_size,
+            ordered,
+            checkpoint,
+            resume_from,
+            params=params,
+            headers=headers,
+        )
+
+    async def consume_endpoint_activity_data(
+        self,
+        consumer: Callable[[EndpointActivity], Optional[Awaitable[None]]],
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        select: Optional[List[str]] = None,
+        top: int = 500,
+        op: QueryOp = QueryOp.AND,
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+        workers: int = 0,
+        queue_size: int = 1000,
+        ordered: bool = False,
+        checkpoint: Optional[CheckpointStore] = None,
+        resume_from: Optional[Checkpoint] = None,
+        shards: Optional[ShardPolicy] = None,
+        slim: bool = False,
+        **fields: str,
+    ) -> Result[ConsumeLinkableResp]:
+        """Retrieves and consume endpoint activity data in a paginated list
+         filtered by provided values.
+
+        :param consumer: Function which will consume every record in result.
+        :type consumer: Callable[[EndpointActivity], Optional[Awaitable[None]]]
+        :param start_time: Date that indicates the start of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to 24 hours before the request is made.
+        :type start_time: Optional[str]
+        :param end_time: Date that indicates the end of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to the time the request is made.
+        :type end_time: Optional[str]
+        :param select: List of fields to include in the search results,
+        if no fields are specified, the query returns all supported fields.
+        Fields are named after the model (ie: endpoint_guid)
+        or the API (ie: endpointGuid).
+        :type select: Optional[List[str]]
+        :param top: Number of records fetched per page.
+        :type top: int
+        :param op: Operator to apply between fields (ie: dpt=... OR src=...)
+        :type op: QueryOp
+        :param fields: Field/value used to filter result (ie: dpt="443")
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :param prefetch: Number of pages fetched in background
+         while the current page is consumed, disabled if 0.
+        :type prefetch: int
+        :param stream: Parse records one at a time while the page is
+         downloaded instead of loading the whole page in memory,
+         ``prefetch`` is ignored if set.
+        :type stream: bool
+        :param parse_mode: Parsing of the records, validated models,
+         lazily validated records, unvalidated models or plain dicts,
+         client default if not set.
+        :type parse_mode: Optional[ParseMode]
+        :param workers: Number of tasks consuming the records while the
+         next records are fetched, records are consumed by the calling
+         task if 0. Errors raised by ``consumer`` are then collected in
+         the response instead of stopping the consumption.
+        :type workers: int
+        :param queue_size: Maximum number of records fetched ahead of the
+         consumers, fetching waits while the queue is full.
+        :type queue_size: int
+        :param ordered: Consume the records one at a time in their order
+         by a single worker.
+        :type ordered: bool
+        :param checkpoint: Store of the position of the consumption, saved
+         once all the records of a page are consumed, nothing is saved
+         if not set.
+        :type checkpoint: Optional[CheckpointStore]
+        :param resume_from: Position to resume the consumption from
+         (ie: ``checkpoint.load()``), the filters of the first call are
+         carried by its ``next_link``.
+        :type resume_from: Optional[Checkpoint]
+        :param shards: Splitting of the search in time windows of roughly
+         equal volume fetched concurrently, the records of a window are
+         consumed after those of the previous windows if ``ordered`` is
+         set and as soon as fetched otherwise. Up to ``prefetch`` pages
+         (at least one) of every window are fetched ahead of the consumer.
+         Pages are not streamed and ``checkpoint`` and ``resume_from`` do
+         not apply. The search is sent over the whole range if not set.
+        :type shards: Optional[ShardPolicy]
+        :param slim: Parse the records with a model validating only the
+         selected fields (see :func:`~pytmv1.project`), faster on large
+         pages but the records are not instances of the activity model
+         and lack the other fields.
+        :type slim: bool
+        :rtype: Result[ConsumeLinkableResp]:
+        """
+        params: Dict[str, str] = utils.build_activity_request(
+            start_time,
+            end_time,
+            select_fields(EndpointActivity, select),
+            top,
+            SearchMode.DEFAULT,
+        )
+        headers: Dict[str, str] = utils.activity_query(op, **fields)
+        if shards:
+            return await self._core.send_sharded(
+                project_linkable(
+                    GetEndpointActivityDataResp, select if slim else None
+                ),
+                GetEndpointActivityDataCountResp,
+                Api.GET_ENDPOINT_ACTIVITY_DATA,
+                consumer,
+                shards,
+                prefetch,
+                parse_mode,
+                workers,
+                queue_size,
+                ordered,
+                params=params,
+                headers=headers,
+            )
+        return await self._core.send_linkable(
+            project_linkable(
+                GetEndpointActivityDataResp, select if slim else None
+            ),
+            Api.GET_ENDPOINT_ACTIVITY_DATA,
+            consumer,
+            prefetch,
+            stream,
+            parse_mode,
+            workers,
+            queue_size,
+            ordered,
+            checkpoint,
+            resume_from,
+            params=params,
+            headers=headers,
+        )
+
+    async def consume_endpoint_data(
+        self,
+        consumer: Callable[[Endpoint], Optional[Awaitable[None]]],
+        op: QueryOp,
+        *values: str,
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+        workers: int = 0,
+        queue_size: int = 1000,
+        ordered: bool = False,
+        checkpoint: Optional[CheckpointStore] = None,
+        resume_from: Optional[Checkpoint] = None,
+    ) -> Result[ConsumeLinkableResp]:
+        """Retrieves and consume endpoints.
+
+        :param consumer: Function which will consume every record in result.
+        :type consumer: Callable[[Endpoint], Optional[Awaitable[None]]]
+        :param op: Query operator to apply.
+        :type op: QueryOp
+        :param values: Agent guid, login account, endpoint name, ip address,
+        mac address, operating system, product code.
+        :type values: Tuple[str, ...]
+        :param prefetch: Number of pages fetched in background
+         while the current page is consumed, disabled if 0.
+        :type prefetch: int
+        :param stream: Parse records one at a time while the page is
+         downloaded instead of loading the whole page in memory,
+         ``prefetch`` is ignored if set.
+        :type stream: bool
+        :param parse_mode: Parsing of the records, validated models,
+         lazily validated records, unvalidated models or plain dicts,
+         client default if not set.
+        :type parse_mode: Optional[ParseMode]
+        :param workers: Number of tasks consuming the records while the
+         next records are fetched, records are consumed by the calling
+         task if 0. Errors raised by ``consumer`` are then collected in
+         the response instead of stopping the consumption.
+        :type workers: int
+        :param queue_size: Maximum number of records fetched ahead of the
+         consumers, fetching waits while the queue is full.
+        :type queue_size: int
+        :param ordered: Consume the records one at a time in their order
+         by a single worker.
+        :type ordered: bool
+        :param checkpoint: Store of the position of the consumption, saved
+         once all the records of a page are consumed, nothing is saved
+         if not set.
+        :type checkpoint: Optional[CheckpointStore]
+        :param resume_from: Position to resume the consumption from
+         (ie: ``checkpoint.load()``), the filters of the first call are
+         carried by its ``next_link``.
+        :type resume_from: Optional[Checkpoint]
+        :rtype: Result[ConsumeLinkableResp]:
+        """
+        return await self._core.send_linkable(
+            GetEndpointDataResp,
+            Api.GET_ENDPOINT_DATA,
+            consumer,
+            prefetch,
+            stream,
+            parse_mode,
+            workers,
+            queue_size,
+            ordered,
+            checkpoint,
+            resume_from,
+            headers=utils.endpoint_query(op, *values),
+        )
+
+    async def consume_exception_list(
+        self,
+        consumer: Callable[[ExceptionObject], Optional[Awaitable[None]]],
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+        workers: int = 0,
+        queue_size: int = 1000,
+        ordered: bool = False,
+        checkpoint: Optional[CheckpointStore] = None,
+        resume_from: Optional[Checkpoint] = None,
+    ) -> Result[ConsumeLinkableResp]:
+        """Retrieves and consume exception objects.
+
+        :param consumer: Function which will consume every record in result.
+        :type consumer: Callable[[ExceptionObject], Optional[Awaitable[None]]]
+        :param prefetch: Number of pages fetched in background
+         while the current page is consumed, disabled if 0.
+        :type prefetch: int
+        :param stream: Parse records one at a time while the page is
+         downloaded instead of loading the whole page in memory,
+         ``prefetch`` is ignored if set.
+        :type stream: bool
+        :param parse_mode: Parsing of the records, validated models,
+         lazily validated records, unvalidated models or plain dicts,
+         client default if not set.
+        :type parse_mode: Optional[ParseMode]
+        :param workers: Number of tasks consuming the records while the
+         next records are fetched, records are consumed by the calling
+         task if 0. Errors raised by ``consumer`` are then collected in
+         the response instead of stopping the consumption.
+        :type workers: int
+        :param queue_size: Maximum number of records fetched ahead of the
+         consumers, fetching waits while the queue is full.
+        :type queue_size: int
+        :param ordered: Consume the records one at a time in their order
+         by a single worker.
+        :type ordered: bool
+        :param checkpoint: Store of the position of the consumption, saved
+         once all the records of a page are consumed, nothing is saved
+         if not set.
+        :type checkpoint: Optional[CheckpointStore]
+        :param resume_from: Position to resume the consumption from
+         (ie: ``checkpoint.load()``), the filters of the first call are
+         carried by its ``next_link``.
+        :type resume_from: Optional[Checkpoint]
+        :rtype: Result[ConsumeLinkableResp]:
+        """
+        return await self._core.send_linkable(
+            GetExceptionListResp,
+            Api.GET_EXCEPTION_LIST,
+            consumer,
+            prefetch,
+            stream,
+            parse_mode,
+            workers,
+            queue_size,
+            ordered,
+            checkpoint,
+            resume_from,
+        )
+
+    async def consume_suspicious_list(
+        self,
+        consumer: Callable[[SuspiciousObject], Optional[Awaitable[None]]],
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+        workers: int = 0,
+        queue_size: int = 1000,
+        ordered: bool = False,
+        checkpoint: Optional[CheckpointStore] = None,
+        resume_from: Optional[Checkpoint] = None,
+    ) -> Result[ConsumeLinkableResp]:
+        """Retrieves and consume suspicious objects.
+
+        :param consumer: Function which will consume every record in result.
+        :type consumer: Callable[[SuspiciousObject], Optional[Awaitable[None]]]
+        :param prefetch: Number of pages fetched in background
+         while the current page is consumed, disabled if 0.
+        :type prefetch: int
+        :param stream: Parse records one at a time while the page is
+         downloaded instead of loading the whole page in memory,
+         ``prefetch`` is ignored if set.
+        :type stream: bool
+        :param parse_mode: Parsing of the records, validated models,
+         lazily validated records, unvalidated models or plain dicts,
+         client default if not set.
+        :type parse_mode: Optional[ParseMode]
+        :param workers: Number of tasks consuming the records while the
+         next records are fetched, records are consumed by the calling
+         task if 0. Errors raised by ``consumer`` are then collected in
+         the response instead of stopping the consumption.
+        :type workers: int
+        :param queue_size: Maximum number of records fetched ahead of the
+         consumers, fetching waits while the queue is full.
+        :type queue_size: int
+        :param ordered: Consume the records one at a time in their order
+         by a single worker.
+        :type ordered: bool
+        :param checkpoint: Store of the position of the consumption, saved
+         once all the records of a page are consumed, nothing is saved
+         if not set.
+        :type checkpoint: Optional[CheckpointStore]
+        :param resume_from: Position to resume the consumption from
+         (ie: ``checkpoint.load()``), the filters of the first call are
+         carried by its ``next_link``.
+        :type resume_from: Optional[Checkpoint]
+        :rtype: Result[ConsumeLinkableResp]:
+        """
+        return await self._core.send_linkable(
+            GetSuspiciousListResp,
+            Api.GET_SUSPICIOUS_LIST,
+            consumer,
+            prefetch,
+            stream,
+            parse_mode,
+            workers,
+            queue_size,
+            ordered,
+            checkpoint,
+            resume_from,
+        )
+
+    async def delete_email_message(
+        self, *messages: Union[EmailMessageUIdTask, EmailMessageIdTask]
+    ) -> MultiResult[MultiResp]:
+        """Deletes a message from one or more mailboxes.
+
+        :param messages: Message(s) to delete.
+        :type messages: Tuple[EmailUIdTask, EmailMsgIdTask, ...]
+        :rtype: MultiResult[MultiResp]
+        """
+        return await self._core.send_multi(
+            MultiResp,
+            Api.DELETE_EMAIL_MESSAGE,
+            json=[
+                model_dump(task, by_alias=True, exclude_none=True)
+                for task in messages
+            ],
+        )
+
+    async def disable_account(
+        self, *accounts: AccountTask
+    ) -> MultiResult[MultiResp]:
+        """Signs the user out of all active application and browser sessions,
+        and prevents the user from signing in any new session.
+
+        :param accounts: Account(s) to disable.
+        :type accounts: Tuple[AccountTask, ...]
+        :rtype: MultiResult[MultiResp]
+        """
+        return await self._core.send_multi(
+            MultiResp,
+            Api.DISABLE_ACCOUNT,
+            json=[
+                model_dump(task, by_alias=True, exclude_none=True)
+                for task in accounts
+            ],
+        )
+
+    async def download_sandbox_analysis_result(
+        self,
+        submit_id: str,
+        poll: bool = True,
+        poll_time_sec: float = 1800,
+    ) -> Result[BytesResp]:
+        """Downloads the analysis results of the specified object as PDF.
+
+        :param submit_id: Sandbox submission id.
+        :type submit_id: str
+        :param poll: If we should wait until the task is finished before
+        to return the result.
+        :type poll: bool
+        :param poll_time_sec: Maximum time to wait for the result to
+         be available.
+        :type poll_time_sec: float
+        :rtype: Result[BytesResp]:
+        """
+        return await self._core.send_sandbox_result(
+            BytesResp,
+            Api.DOWNLOAD_SANDBOX_ANALYSIS_RESULT,
+            submit_id,
+            poll,
+            poll_time_sec,
+        )
+
+    async def download_sandbox_investigation_package(
+        self,
+        submit_id: str,
+        poll: bool = True,
+        poll_time_sec: float = 1800,
+    ) -> Result[BytesResp]:
+        """Downloads the Investigation Package of the specified object.
+
+        :param submit_id: Sandbox submission id.
+        :type submit_id: str
+        :param poll: If we should wait until the task is finished before
+        to return the result.
+        :type poll: bool
+        :param poll_time_sec: Maximum time to wait for the result to
+         be available.
+        :type poll_time_sec: float
+        :rtype: Result[BytesResp]:
+        """
+        return await self._core.send_sandbox_result(
+            BytesResp,
+            Api.DOWNLOAD_SANDBOX_INVESTIGATION_PACKAGE,
+            submit_id,
+            poll,
+            poll_time_sec,
+        )
+
+    async def edit_alert_status(
+        self,
+        alert_id: str,
+        status: InvestigationStatus,
+        if_match: str,
+    ) -> Result[NoContentResp]:
+        """Edit the status of an alert or investigation triggered in Workbench.
+
+        :param alert_id: Workbench alert id.
+        :type alert_id: str
+        :param status: Status to be updated.
+        :type status: InvestigationStatus
+        :param if_match: Target resource will be updated only if
+         it matches ETag of the target one.
+        :type if_match: str
+        :rtype: Result[NoContentResp]:
+        """
+        return await self._core.send(
+            NoContentResp,
+            Api.EDIT_ALERT_STATUS.value.format(alert_id),
+            HttpMethod.PATCH,
+            json={"investigationStatus": status},
+            headers={
+                "If-Match": (
+                    if_match
+                    if if_match.startswith('"')
+                    else '"' + if_match + '"'
+                )
+            },
+        )
+
+    async def enable_account(
+        self, *accounts: AccountTask
+    ) -> MultiResult[MultiResp]:
+        """Allows the user to sign in to new application and browser sessions.
+
+        :param accounts: Account(s) to enable.
+        :type accounts: Tuple[AccountTask, ...]
+        :rtype: MultiResult[MultiResp]
+        """
+        return await self._core.send_multi(
+            MultiResp,
+            Api.ENABLE_ACCOUNT,
+            json=[
+                model_dump(task, by_alias=True, exclude_none=True)
+                for task in accounts
+            ],
+        )
+
+    async def get_alert_details(
+        self, alert_id: str
+    ) -> Result[GetAlertDetailsResp]:
+        """Displays information about the specified alert.
+
+        :param alert_id: Workbench alert id.
+        :type alert_id: str
+        :rtype: Result[GetAlertDetailsResp]:
+        """
+        return await self._core.send(
+            GetAlertDetailsResp,
+            Api.GET_ALERT_DETAILS.value.format(alert_id),
+        )
+
+    async def get_alert_list(
+        self, start_time: Optional[str] = None, end_time: Optional[str] = None
+    ) -> Result[GetAlertListResp]:
+        """Retrieves workbench alerts in a paginated list.
+
+        :param start_time: Date that indicates the start of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to 24 hours before the request is made.
+        :type start_time: Optional[str]
+        :param end_time: Date that indicates the end of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to the time the request is made.
+        :type end_time: Optional[str]
+        :rtype: Result[GetAlertListResp]:
+        """
+        return await self._core.send(
+            GetAlertListResp,
+            Api.GET_ALERT_LIST,
+            params=utils.filter_none(
+                {
+                    "startDateTime": start_time,
+                    "endDateTime": end_time,
+                    "orderBy": "createdDateTime desc",
+                }
+            ),
+        )
+
+    async def get_base_task_result(
+        self,
+        task_id: str,
+        poll: bool = True,
+        poll_time_sec: float = 1800,
+    ) -> Result[BaseTaskResp]:
+        """Retrieves the result of a response task.
+
+        :param task_id: Task id.
+        :type task_id: str
+        :param poll: If we should wait until the task is finished before
+         to return the result.
+        :type poll: bool
+        :param poll_time_sec: Maximum time to wait for the result
+        to be available.
+        :type poll_time_sec: float
+        :rtype: Result[BaseTaskResultResp]:
+        """
+        return await self._core.send_task_result(
+            BaseTaskResp, task_id, poll, poll_time_sec
+        )
+
+    async def get_email_activity_data(
+        self,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        select: Optional[List[str]] = None,
+        top: int = 500,
+        op: QueryOp = QueryOp.AND,
+        slim: bool = False,
+        **fields: str,
+    ) -> Result[GetEmailActivityDataResp]:
+        """Retrieves email activity data in a paginated list
+         filtered by provided values.
+
+        :param start_time: Date that indicates the start of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to 24 hours before the request is made.
+        :type start_time: Optional[str]
+        :param end_time: Date that indicates the end of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to the time the request is made.
+        :type end_time: Optional[str]
+        :param select: List of fields to include in the search results,
+        if no fields are specified, the query returns all supported fields.
+        Fields are named after the model (ie: mail_msg_id)
+        or the API (ie: mailMsgId).
+        :type select: Optional[List[str]]
+        :param top: Number of records fetched per page.
+        :type top: int
+        :param op: Operator to apply between fields (ie: uuid=... OR tags=...)
+        :type op: QueryOp
+        :param fields: Field/value used to filter result (ie: uuid="123456")
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :param slim: Parse the records with a model validating only the
+         selected fields (see :func:`~pytmv1.project`), faster on large
+         pages but the records are not instances of the activity model
+         and lack the other fields.
+        :type slim: bool
+        :rtype: Result[GetEmailActivityDataResp]:
+        """
+        return await self._core.send(
+            project_linkable(
+                GetEmailActivityDataResp, select if slim else None
+            ),
+            Api.GET_EMAIL_ACTIVITY_DATA,
+            params=utils.build_activity_request(
+                start_time,
+                end_time,
+                select_fields(EmailActivity, select),
+                top,
+                SearchMode.DEFAULT,
+            ),
+            headers=utils.activity_query(op, **fields),
+        )
+
+    async def get_email_activity_data_count(
+        self,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        select: Optional[List[str]] = None,
+        top: int = 500,
+        op: QueryOp = QueryOp.AND,
+        **fields: str,
+    ) -> Result[GetEmailActivityDataCountResp]:
+        """Retrieves the count of email activity data in a paginated list
+         filtered by provided values.
+
+        :param start_time: Date that indicates the start of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to 24 hours before the request is made.
+        :type start_time: Optional[str]
+        :param end_time: Date that indicates the end of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to the time the request is made.
+        :type end_time: Optional[str]
+        :param select: List of fields to include in the search results,
+        if no fields are specified, the query returns all supported fields.
+        Fields are named after the model (ie: mail_msg_id)
+        or the API (ie: mailMsgId).
+        :type select: Optional[List[str]]
+        :param top: Number of records fetched per page.
+        :type top: int
+        :param op: Operator to apply between fields (ie: uuid=... OR tags=...)
+        :type op: QueryOp
+        :param fields: Field/value used to filter result (ie: uuid="123456")
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :rtype: Result[GetEmailActivityDataCountResp]:
+        """
+        return await self._core.send(
+            GetEmailActivityDataCountResp,
+            Api.GET_EMAIL_ACTIVITY_DATA,
+            params=utils.build_activity_request(
+                start_time,
+                end_time,
+                select_fields(EmailActivity, select),
+                top,
+                SearchMode.COUNT_ONLY,
+            ),
+            headers=utils.activity_query(op, **fields),
+        )
+
+    async def get_endpoint_activity_data(
+        self,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        select: Optional[List[str]] = None,
+        top: int = 500,
+        op: QueryOp = QueryOp.AND,
+        slim: bool = False,
+        **fields: str,
+    ) -> Result[GetEndpointActivityDataResp]:
+        """Retrieves endpoint activity data in a paginated list
+         filtered by provided values.
+
+        :param start_time: Date that indicates the start of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to 24 hours before the request is made.
+        :type start_time: Optional[str]
+        :param end_time: Date that indicates the end of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to the time the request is made.
+        :type end_time: Optional[str]
+        :param select: List of fields to include in the search results,
+        if no fields are specified, the query returns all supported fields.
+        Fields are named after the model (ie: endpoint_guid)
+        or the API (ie: endpointGuid).
+        :type select: Optional[List[str]]
+        :param top: Number of records fetched per page.
+        :type top: int
+        :param op: Operator to apply between fields (ie: dpt=... OR src=...)
+        :type op: QueryOp
+        :param fields: Field/value used to filter result (ie: dpt="443")
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :param slim: Parse the records with a model validating only the
+         selected fields (see :func:`~pytmv1.project`), faster on large
+         pages but the records are not instances of the activity model
+         and lack the other fields.
+        :type slim: bool
+        :rtype: Result[GetEndpointActivityDataResp]:
+        """
+        return await self._core.send(
+            project_linkable(
+                GetEndpointActivityDataResp, select if slim else None
+            ),
+            Api.GET_ENDPOINT_ACTIVITY_DATA,
+            params=utils.build_activity_request(
+                start_time,
+                end_time,
+                select_fields(EndpointActivity, select),
+                top,
+                SearchMode.DEFAULT,
+            ),
+            headers=utils.activity_query(op, **fields),
+        )
+
+    async def get_endpoint_activity_data_count(
+        self,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        select: Optional[List[str]] = None,
+        top: int = 500,
+        op: QueryOp = QueryOp.AND,
+        **fields: str,
+    ) -> Result[GetEndpointActivityDataCountResp]:
+        """Retrieves the count of endpoint activity data in a paginated list
+        filtered by provided values.
+
+        :param start_time: Date that indicates the start of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to 24 hours before the request is made.
+        :type start_time: Optional[str]
+        :param end_time: Date that indicates the end of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to the time the request is made.
+        :type end_time: Optional[str]
+        :param select: List of fields to include in the search results,
+        if no fields are specified, the query returns all supported fields.
+        Fields are named after the model (ie: endpoint_guid)
+        or the API (ie: endpointGuid).
+        :type select: Optional[List[str]]
+        :param top: Number of records fetched per page.
+        :type top: int
+        :param op: Operator to apply between fields (ie: dpt=... OR src=...)
+        :type op: QueryOp
+        :param fields: Field/value used to filter result (ie: dpt="443")
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :rtype: Result[GetEndpointActivityDataCountResp]:
+        """
+        return await self._core.send(
+            GetEndpointActivityDataCountResp,
+            Api.GET_ENDPOINT_ACTIVITY_DATA,
+            params=utils.build_activity_request(
+                start_time,
+                end_time,
+                select_fields(EndpointActivity, select),
+                top,
+                SearchMode.COUNT_ONLY,
+            ),
+            headers=utils.activity_query(op, **fields),
+        )
+
+    async def get_endpoint_data(
+        self, op: QueryOp, *values: str
+    ) -> Result[GetEndpointDataResp]:
+        """Retrieves endpoints in a paginated list filtered by provided values.
+
+        :param op: Query operator to apply.
+        :type op: QueryOp
+        :param values: Agent guid, login account, endpoint name, ip address,
+        mac address, operating system, product code.
+        :type values: Tuple[str, ...]
+        :rtype: Result[GetEndpointDataResp]:
+        """
+        return await self._core.send(
+            GetEndpointDataResp,
+            Api.GET_ENDPOINT_DATA,
+            headers=utils.endpoint_query(op, *values),
+        )
+
+    async def get_exception_list(self) -> Result[GetExceptionListResp]:
+        """Retrieves exception objects in a paginated list.
+
+        :rtype: Result[GetExceptionListResp]:
+        """
+        return await self._core.send(
+            GetExceptionListResp, Api.GET_EXCEPTION_LIST
+        )
+
+    async def get_sandbox_analysis_result(
+        self,
+        submit_id: str,
+        poll: bool = True,
+        poll_time_sec: float = 1800,
+    ) -> Result[SandboxAnalysisResultResp]:
+        """Retrieves the analysis results of the specified object.
+
+        :param submit_id: Sandbox submission id.
+        :type submit_id: str
+        :param poll: If we should wait until the task is finished before
+         to return the result.
+        :type poll: bool
+        :param poll_time_sec: Maximum time to wait for the result
+         to be available.
+        :type poll_time_sec: float
+        :rtype: Result[SandboxAnalysisResultResp]:
+        """
+        return await self._core.send_sandbox_result(
+            SandboxAnalysisResultResp,
+            Api.GET_SANDBOX_ANALYSIS_RESULT,
+            submit_id,
+            poll,
+            poll_time_sec,
+        )
+
+    async def get_sandbox_submission_status(
+        self, submit_id: str
+    ) -> Result[SandboxSubmissionStatusResp]:
+        """Retrieves the submission status of the specified object.
+
+        :param submit_id: Sandbox submission id.
+        :type submit_id: str
+        :rtype: Result[SandboxSubmissionStatusResp]:
+        """
+        return await self._core.send(
+            SandboxSubmissionStatusResp,
+            Api.GET_SANDBOX_SUBMISSION_STATUS.value.format(submit_id),
+        )
+
+    async def get_sandbox_suspicious_list(
+        self,
+        submit_id: str,
+        poll: bool = True,
+        poll_time_sec: float = 1800,
+    ) -> Result[SandboxSuspiciousListResp]:
+        """Retrieves the suspicious object list associated to the
+        specified object.
+
+        :param submit_id: Sandbox submission id.
+        :type submit_id: str
+        :param poll: If we should wait until the task is finished before
+         to return the result.
+        :type poll: bool
+        :param poll_time_sec: Maximum time to wait for the result
+         to be available.
+        :type poll_time_sec: float
+        :rtype: Result[SandboxSuspiciousListResp]:
+        """
+        return await self._core.send_sandbox_result(
+            SandboxSuspiciousListResp,
+            Api.GET_SANDBOX_SUSPICIOUS_LIST,
+            submit_id,
+            poll,
+            poll_time_sec,
+        )
+
+    async def get_suspicious_list(
+        self,
+    ) -> Result[GetSuspiciousListResp]:
+        """Retrieves suspicious objects in a paginated list.
+
+        :rtype: Result[GetSuspiciousListResp]:
+        """
+        return await self._core.send(
+            GetSuspiciousListResp, Api.GET_SUSPICIOUS_LIST
+        )
+
+    async def get_task_result(
+        self,
+        task_id: str,
+        class_: Type[S],
+        poll: bool = True,
+        poll_time_sec: float = 1800,
+    ) -> Result[S]:
+        """Retrieves the result of a response task.
+
+        :param task_id: Task id.
+        :type task_id: str
+        :param class_: Expected task result class.
+        :type class_: Type[S]
+        :param poll: If we should wait until the task is finished before
+         to return the result.
+        :type poll: bool
+        :param poll_time_sec: Maximum time to wait for the result
+        to be available.
+        :type poll_time_sec: float
+        :rtype: Result[S]:
+        """
+        return await self._core.send_task_result(
+            class_, task_id, poll, poll_time_sec
+        )
+
+    async def isolate_endpoint(
+        self, *endpoints: EndpointTask
+    ) -> MultiResult[MultiResp]:
+        """Disconnects one or more endpoints from the network
+        but allows communication with the managing Trend Micro server product.
+
+        :param endpoints: Endpoint(s) to isolate.
+        :type endpoints: Tuple[EndpointTask, ...]
+        :rtype: MultiResult[MultiResp]
+        """
+        return await self._core.send_endpoint(Api.ISOLATE_ENDPOINT, *endpoints)
+
+    def iter_alert_list(
+        self,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        max_items: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+    ) -> AsyncPaginator[Union[SaeAlert, TiAlert]]:
+        """Lazily iterates over workbench alerts.
+
+        :param start_time: Date that indicates the start of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to 24 hours before the request is made.
+        :type start_time: Optional[str]
+        :param end_time: Date that indicates the end of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to the time the request is made.
+        :type end_time: Optional[str]
+        :param max_items: Stop fetching pages once this number of records
+         has been yielded, all records are yielded if not set.
+        :type max_items: Optional[int]
+        :param max_pages: Stop fetching once this number of pages
+         has been fetched, all pages are fetched if not set.
+        :type max_pages: Optional[int]
+        :param prefetch: Number of pages fetched in background
+         while the current page is consumed, disabled if 0.
+        :type prefetch: int
+        :param stream: Parse records one at a time while the page is
+         downloaded instead of loading the whole page in memory,
+         ``prefetch`` is ignored if set.
+        :type stream: bool
+        :param parse_mode: Parsing of the records, validated models,
+         lazily validated records, unvalidated models or plain dicts,
+         client default if not set.
+        :type parse_mode: Optional[ParseMode]
+        :rtype: AsyncPaginator[Union[SaeAlert, TiAlert]]:
+        """
+        return self._core.iter_linkable(
+            GetAlertListResp,
+            Api.GET_ALERT_LIST,
+            max_items,
+            max_pages,
+            prefetch,
+            stream,
+            parse_mode,
+            params=utils.filter_none(
+                {
+                    "startDateTime": start_time,
+                    "endDateTime": end_time,
+                    "orderBy": "createdDateTime desc",
+                }
+            ),
+        )
+
+    def iter_email_activity_batches(
+        self,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        select: Optional[List[str]] = None,
+        top: int = 500,
+        op: QueryOp = QueryOp.AND,
+        max_pages: Optional[int] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        **fields: str,
+    ) -> AsyncIterator[RecordBatch]:
+        """Lazily iterates over email activity data filtered by provided
+        values, yields one :class:`RecordBatch` per page holding the records
+        by column instead of one object per record.
+
+        :param start_time: Date that indicates the start of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to 24 hours before the request is made.
+        :type start_time: Optional[str]
+        :param end_time: Date that indicates the end of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to the time the request is made.
+        :type end_time: Optional[str]
+        :param select: List of fields to include in the search results,
+        if no fields are specified, the query returns all supported fields.
+        Fields are named after the model (ie: mail_msg_id)
+        or the API (ie: mailMsgId).
+        Batches only hold the columns of the selected fields.
+        :type select: Optional[List[str]]
+        :param top: Number of records fetched per page.
+        :type top: int
+        :param op: Operator to apply between fields (ie: uuid=... OR tags=...)
+        :type op: QueryOp
+        :param max_pages: Stop fetching once this number of pages
+         has been fetched, all pages are fetched if not set.
+        :type max_pages: Optional[int]
+        :param prefetch: Number of pages fetched in background
+         while the current batch is consumed, disabled if 0.
+        :type prefetch: int
+        :param stream: Fill the columns while the page is downloaded
+         instead of decoding the whole page first,
+         ``prefetch`` is ignored if set.
+        :type stream: bool
+        :param fields: Field/value used to filter result (ie: uuid="123456")
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :rtype: AsyncIterator[RecordBatch]:
+        """
+        return self._core.iter_batches(
+            GetEmailActivityDataResp,
+            Api.GET_EMAIL_ACTIVITY_DATA,
+            select_fields(EmailActivity, select),
+            max_pages,
+            prefetch,
+            stream,
+            params=utils.build_activity_request(
+                start_time,
+                end_time,
+                select_fields(EmailActivity, select),
+                top,
+                SearchMode.DEFAULT,
+            ),
+            headers=utils.activity_query(op, **fields),
+        )
+
+    def iter_email_activity_data(
+        self,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        select: Optional[List[str]] = None,
+        top: int = 500,
+        op: QueryOp = QueryOp.AND,
+        max_items: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+        slim: bool = False,
+        **fields: str,
+    ) -> AsyncPaginator[EmailActivity]:
+        """Lazily iterates over email activity data
+        filtered by provided values.
+
+        :param start_time: Date that indicates the start of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to 24 hours before the request is made.
+        :type start_time: Optional[str]
+        :param end_time: Date that indicates the end of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to the time the request is made.
+        :type end_time: Optional[str]
+        :param select: List of fields to include in the search results,
+        if no fields are specified, the query returns all supported fields.
+        Fields are named after the model (ie: mail_msg_id)
+        or the API (ie: mailMsgId).
+        :type select: Optional[List[str]]
+        :param top: Number of records fetched per page.
+        :type top: int
+        :param op: Operator to apply between fields (ie: uuid=... OR tags=...)
+        :type op: QueryOp
+        :param max_items: Stop fetching pages once this number of records
+         has been yielded, all records are yielded if not set.
+        :type max_items: Optional[int]
+        :param max_pages: Stop fetching once this number of pages
+         has been fetched, all pages are fetched if not set.
+        :type max_pages: Optional[int]
+        :param prefetch: Number of pages fetched in background
+         while the current page is consumed, disabled if 0.
+        :type prefetch: int
+        :param stream: Parse records one at a time while the page is
+         downloaded instead of loading the whole page in memory,
+         ``prefetch`` is ignored if set.
+        :type stream: bool
+        :param parse_mode: Parsing of the records, validated models,
+         lazily validated records, unvalidated models or plain dicts,
+         client default if not set.
+        :type parse_mode: Optional[ParseMode]
+        :param fields: Field/value used to filter result (ie: uuid="123456")
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :param slim: Parse the records with a model validating only the
+         selected fields (see :func:`~pytmv1.project`), faster on large
+         pages but the records are not instances of the activity model
+         and lack the other fields.
+        :type slim: bool
+        :rtype: AsyncPaginator[EmailActivity]:
+        """
+        return self._core.iter_linkable(
+            project_linkable(
+                GetEmailActivityDataResp, select if slim else None
+            ),
+            Api.GET_EMAIL_ACTIVITY_DATA,
+            max_items,
+            max_pages,
+            prefetch,
+            stream,
+            parse_mode,
+            params=utils.build_activity_request(
+                start_time,
+                end_time,
+                select_fields(EmailActivity, select),
+                top,
+                SearchMode.DEFAULT,
+            ),
+            headers=utils.activity_query(op, **fields),
+        )
+
+    def iter_endpoint_activity_batches(
+        self,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        select: Optional[List[str]] = None,
+        top: int = 500,
+        op: QueryOp = QueryOp.AND,
+        max_pages: Optional[int] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        **fields: str,
+    ) -> AsyncIterator[RecordBatch]:
+        """Lazily iterates over endpoint activity data filtered by provided
+        values, yields one :class:`RecordBatch` per page holding the records
+        by column instead of one object per record.
+
+        :param start_time: Date that indicates the start of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to 24 hours before the request is made.
+        :type start_time: Optional[str]
+        :param end_time: Date that indicates the end of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to the time the request is made.
+        :type end_time: Optional[str]
+        :param select: List of fields to include in the search results,
+        if no fields are specified, the query returns all supported fields.
+        Fields are named after the model (ie: endpoint_guid)
+        or the API (ie: endpointGuid).
+        Batches only hold the columns of the selected fields.
+        :type select: Optional[List[str]]
+        :param top: Number of records fetched per page.
+        :type top: int
+        :param op: Operator to apply between fields (ie: dpt=... OR src=...)
+        :type op: QueryOp
+        :param max_pages: Stop fetching once this number of pages
+         has been fetched, all pages are fetched if not set.
+        :type max_pages: Optional[int]
+        :param prefetch: Number of pages fetched in background
+         while the current batch is consumed, disabled if 0.
+        :type prefetch: int
+        :param stream: Fill the columns while the page is downloaded
+         instead of decoding the whole page first,
+         ``prefetch`` is ignored if set.
+        :type stream: bool
+        :param fields: Field/value used to filter result (ie: dpt="443")
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :rtype: AsyncIterator[RecordBatch]:
+        """
+        return self._core.iter_batches(
+            GetEndpointActivityDataResp,
+            Api.GET_ENDPOINT_ACTIVITY_DATA,
+            select_fields(EndpointActivity, select),
+            max_pages,
+            prefetch,
+            stream,
+            params=utils.build_activity_request(
+                start_time,
+                end_time,
+                select_fields(EndpointActivity, select),
+                top,
+                SearchMode.DEFAULT,
+            ),
+            headers=utils.activity_query(op, **fields),
+        )
+
+    def iter_endpoint_activity_data(
+        self,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        select: Optional[List[str]] = None,
+        top: int = 500,
+        op: QueryOp = QueryOp.AND,
+        max_items: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+        slim: bool = False,
+        **fields: str,
+    ) -> AsyncPaginator[EndpointActivity]:
+        """Lazily iterates over endpoint activity data
+        filtered by provided values.
+
+        :param start_time: Date that indicates the start of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to 24 hours before the request is made.
+        :type start_time: Optional[str]
+        :param end_time: Date that indicates the end of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to the time the request is made.
+        :type end_time: Optional[str]
+        :param select: List of fields to include in the search results,
+        if no fields are specified, the query returns all supported fields.
+        Fields are named after the model (ie: endpoint_guid)
+        or the API (ie: endpointGuid).
+        :type select: Optional[List[str]]
+        :param top: Number of records fetched per page.
+        :type top: int
+        :param op: Operator to apply between fields (ie: dpt=... OR src=...)
+        :type op: QueryOp
+        :param max_items: Stop fetching pages once this number of records
+         has been yielded, all records are yielded if not set.
+        :type max_items: Optional[int]
+        :param max_pages: Stop fetching once this number of pages
+         has been fetched, all pages are fetched if not set.
+        :type max_pages: Optional[int]
+        :param prefetch: Number of pages fetched in background
+         while the current page is consumed, disabled if 0.
+        :type prefetch: int
+        :param stream: Parse records one at a time while the page is
+         downloaded instead of loading the whole page in memory,
+         ``prefetch`` is ignored if set.
+        :type stream: bool
+        :param parse_mode: Parsing of the records, validated models,
+         lazily validated records, unvalidated models or plain dicts,
+         client default if not set.
+        :type parse_mode: Optional[ParseMode]
+        :param fields: Field/value used to filter result (ie: dpt="443")
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :param slim: Parse the records with a model validating only the
+         selected fields (see :func:`~pytmv1.project`), faster on large
+         pages but the records are not instances of the activity model
+         and lack the other fields.
+        :type slim: bool
+        :rtype: AsyncPaginator[EndpointActivity]:
+        """
+        return self._core.iter_linkable(
+            project_linkable(
+                GetEndpointActivityDataResp, select if slim else None
+            ),
+            Api.GET_ENDPOINT_ACTIVITY_DATA,
+            max_items,
+            max_pages,
+            prefetch,
+            stream,
+            parse_mode,
+            params=utils.build_activity_request(
+                start_time,
+                end_time,
+                select_fields(EndpointActivity, select),
+                top,
+                SearchMode.DEFAULT,
+            ),
+            headers=utils.activity_query(op, **fields),
+        )
+
+    def iter_endpoint_data(
+        self,
+        op: QueryOp,
+        *values: str,
+        max_items: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+    ) -> AsyncPaginator[Endpoint]:
+        """Lazily iterates over endpoints.
+
+        :param op: Query operator to apply.
+        :type op: QueryOp
+        :param values: Agent guid, login account, endpoint name, ip address,
+        mac address, operating system, product code.
+        :type values: Tuple[str, ...]
+        :param max_items: Stop fetching pages once this number of records
+         has been yielded, all records are yielded if not set.
+        :type max_items: Optional[int]
+        :param max_pages: Stop fetching once this number of pages
+         has been fetched, all pages are fetched if not set.
+        :type max_pages: Optional[int]
+        :param prefetch: Number of pages fetched in background
+         while the current page is consumed, disabled if 0.
+        :type prefetch: int
+        :param stream: Parse records one at a time while the page is
+         downloaded instead of loading the whole page in memory,
+         ``prefetch`` is ignored if set.
+        :type stream: bool
+        :param parse_mode: Parsing of the records, validated models,
+         lazily validated records, unvalidated models or plain dicts,
+         client default if not set.
+        :type parse_mode: Optional[ParseMode]
+        :rtype: AsyncPaginator[Endpoint]:
+        """
+        return self._core.iter_linkable(
+            GetEndpointDataResp,
+            Api.GET_ENDPOINT_DATA,
+            max_items,
+            max_pages,
+            prefetch,
+            stream,
+            parse_mode,
+            headers=utils.endpoint_query(op, *values),
+        )
+
+    def iter_exception_list(
+        self,
+        max_items: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+    ) -> AsyncPaginator[ExceptionObject]:
+        """Lazily iterates over exception objects.
+
+        :param max_items: Stop fetching pages once this number of records
+         has been yielded, all records are yielded if not set.
+        :type max_items: Optional[int]
+        :param max_pages: Stop fetching once this number of pages
+         has been fetched, all pages are fetched if not set.
+        :type max_pages: Optional[int]
+        :param prefetch: Number of pages fetched in background
+         while the current page is consumed, disabled if 0.
+        :type prefetch: int
+        :param stream: Parse records one at a time while the page is
+         downloaded instead of loading the whole page in memory,
+         ``prefetch`` is ignored if set.
+        :type stream: bool
+        :param parse_mode: Parsing of the records, validated models,
+         lazily validated records, unvalidated models or plain dicts,
+         client default if not set.
+        :type parse_mode: Optional[ParseMode]
+        :rtype: AsyncPaginator[ExceptionObject]:
+        """
+        return self._core.iter_linkable(
+            GetExceptionListResp,
+            Api.GET_EXCEPTION_LIST,
+            max_items,
+            max_pages,
+            prefetch,
+            stream,
+            parse_mode,
+        )
+
+    def iter_suspicious_list(
+        self,
+        max_items: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+    ) -> AsyncPaginator[SuspiciousObject]:
+        """Lazily iterates over suspicious objects.
+
+        :param max_items: Stop fetching pages once this number of records
+         has been yielded, all records are yielded if not set.
+        :type max_items: Optional[int]
+        :param max_pages: Stop fetching once this number of pages
+         has been fetched, all pages are fetched if not set.
+        :type max_pages: Optional[int]
+        :param prefetch: Number of pages fetched in background
+         while the current page is consumed, disabled if 0.
+        :type prefetch: int
+        :param stream: Parse records one at a time while the page is
+         downloaded instead of loading the whole page in memory,
+         ``prefetch`` is ignored if set.
+        :type stream: bool
+        :param parse_mode: Parsing of the records, validated models,
+         lazily validated records, unvalidated models or plain dicts,
+         client default if not set.
+        :type parse_mode: Optional[ParseMode]
+        :rtype: AsyncPaginator[SuspiciousObject]:
+        """
+        return self._core.iter_linkable(
+            GetSuspiciousListResp,
+            Api.GET_SUSPICIOUS_LIST,
+            max_items,
+            max_pages,
+            prefetch,
+            stream,
+            parse_mode,
+        )
+
+    async def quarantine_email_message(
+        self, *messages: Union[EmailMessageUIdTask, EmailMessageIdTask]
+    ) -> MultiResult[MultiResp]:
+        """Quarantine a message from one or more mailboxes.
+
+        :param messages: Message(s) to quarantine.
+        :type messages: Tuple[EmailUIdTask, EmailMsgIdTask, ...]
+        :rtype: MultiResult[MultiResp]
+        """
+        return await self._core.send_multi(
+            MultiResp,
+            Api.QUARANTINE_EMAIL_MESSAGE,
+            json=[
+                model_dump(task, by_alias=True, exclude_none=True)
+                for task in messages
+            ],
+        )
+
+    async def remove_from_block_list(
+        self, *objects: ObjectTask
+    ) -> MultiResult[MultiResp]:
+        """Removes object(s) that was added to the Suspicious Object List
+          using the "Add to block list" action
+
+        :param objects: Object(s) to remove.
+        :type objects: Tuple[ObjectTask, ...]
+        :rtype: MultiResult[MultiResp]
+        """
+        return await self._core.send_multi(
+            MultiResp,
+            Api.REMOVE_FROM_BLOCK_LIST,
+            json=utils.build_object_request(*objects),
+        )
+
+    async def remove_from_exception_list(
+        self, *objects: ObjectTask
+    ) -> MultiResult[MultiResp]:
+        """Removes object(s) from the Exception List.
+
+        :param objects: Object(s) to remove.
+        :type objects: Tuple[ObjectTask, ...]
+        :rtype: MultiResult[MultiResp]
+        """
+        return await self._core.send_multi(
+            MultiResp,
+            Api.REMOVE_FROM_EXCEPTION_LIST,
+            json=utils.build_object_request(*objects),
+        )
+
+    async def remove_from_suspicious_list(
+        self, *objects: ObjectTask
+    ) -> MultiResult[MultiResp]:
+        """Removes object(s) from the Suspicious List.
+
+        :param objects: Object(s) to remove.
+        :type objects: Tuple[ObjectTask, ...]
+        :rtype: MultiResult[MultiResp]
+        """
+        return await self._core.send_multi(
+            MultiResp,
+            Api.REMOVE_FROM_SUSPICIOUS_LIST,
+            json=utils.build_object_request(*objects),
+        )
+
+    async def reset_password_account(
+        self, *accounts: AccountTask
+    ) -> MultiResult[MultiResp]:
+        """Signs the user out of all active application and browser sessions,
+        and forces the user to create a new password during the next sign-in
+        attempt.
+
+        :param accounts: Account(s) to reset.
+        :type accounts: Tuple[AccountTask, ...]
+        :rtype: MultiResult[MultiResp]
+        """
+        return await self._core.send_multi(
+            MultiResp,
+            Api.RESET_PASSWORD,
+            json=[
+                model_dump(task, by_alias=True, exclude_none=True)
+                for task in accounts
+            ],
+        )
+
+    async def restore_endpoint(
+        self, *endpoints: EndpointTask
+    ) -> MultiResult[MultiResp]:
+        """Restores network connectivity to one or more endpoints that applied
+        the "Isolate endpoint" action.
+
+        :param endpoints: Endpoint(s) to restore.
+        :type endpoints: Tuple[EndpointTask, ...]
+        :rtype: MultiResult[MultiResp]
+        """
+        return await self._core.send_endpoint(Api.RESTORE_ENDPOINT, *endpoints)
+
+    async def restore_email_message(
+        self, *messages: Union[EmailMessageUIdTask, EmailMessageIdTask]
+    ) -> MultiResult[MultiResp]:
+        """Restore quarantined email message(s).
+
+        :param messages: Message(s) to restore.
+        :type messages: Tuple[EmailUIdTask, EmailMsgIdTask, ...]
+        :rtype: MultiResult[MultiResp]
+        """
+        return await self._core.send_multi(
+            MultiResp,
+            Api.RESTORE_EMAIL_MESSAGE,
+            json=[
+                model_dump(task, by_alias=True, exclude_none=True)
+                for task in messages
+            ],
+        )
+
+    async def run_custom_script(
+        self, *scripts: CustomScriptTask
+    ) -> MultiResult[MultiResp]:
+        """Runs multiple custom script.
+
+        :param scripts: Custom scripts to run.
+        :type scripts: Tuple[CustomScriptTask, ...]
+        :rtype: MultiResult[MultiResp]
+        """
+        return await self._core.send_multi(
+            MultiResp,
+            Api.RUN_CUSTOM_SCRIPT,
+            json=[
+                model_dump(task, by_alias=True, exclude_none=True)
+                for task in scripts
+            ],
+        )
+
+    async def save_sandbox_analysis_result(
+        self,
+        submit_id: str,
+        destination: Destination,
+        poll: bool = True,
+        poll_time_sec: float = 1800,
+    ) -> Result[SaveFileResp]:
+        """Saves the analysis results of the specified object as PDF.
+        The file is written in chunks while it is downloaded instead of
+        being loaded in memory.
+
+        :param submit_id: Sandbox submission id.
+        :type submit_id: str
+        :param destination: Path or binary file object to write to.
+        :type destination: Union[str, os.PathLike[str], IO[bytes]]
+        :param poll: If we should wait until the task is finished before
+        to return the result.
+        :type poll: bool
+        :param poll_time_sec: Maximum time to wait for the result to
+         be available.
+        :type poll_time_sec: float
+        :rtype: Result[SaveFileResp]:
+        """
+        return await self._core.send_sandbox_file(
+            Api.DOWNLOAD_SANDBOX_ANALYSIS_RESULT,
+            submit_id,
+            destination,
+            poll,
+            poll_time_sec,
+        )
+
+    async def save_sandbox_investigation_package(
+        self,
+        submit_id: str,
+        destination: Destination,
+        poll: bool = True,
+        poll_time_sec: float = 1800,
+    ) -> Result[SaveFileResp]:
+        """Saves the Investigation Package of the specified object.
+        The file is written in chunks while it is downloaded instead of
+        being loaded in memory.
+
+        :param submit_id: Sandbox submission id.
+        :type submit_id: str
+        :param destination: Path or binary file object to write to.
+        :type destination: Union[str, os.PathLike[str], IO[bytes]]
+        :param poll: If we should wait until the task is finished before
+        to return the result.
+        :type poll: bool
+        :param poll_time_sec: Maximum time to wait for the result to
+         be available.
+        :type poll_time_sec: float
+        :rtype: Result[SaveFileResp]:
+        """
+        return await self._core.send_sandbox_file(
+            Api.DOWNLOAD_SANDBOX_INVESTIGATION_PACKAGE,
+            submit_id,
+            destination,
+            poll,
+            poll_time_sec,
+        )
+
+    async def sign_out_account(
+        self, *accounts: AccountTask
+    ) -> MultiResult[MultiResp]:
+        """Signs the user out of all active application and browser sessions.
+
+        :param accounts: Account(s) to sign out.
+        :type accounts: Tuple[AccountTask, ...]
+        :rtype: MultiResult[MultiResp]
+        """
+        return await self._core.send_multi(
+            MultiResp,
+            Api.SIGN_OUT_ACCOUNT,
+            json=[
+                model_dump(task, by_alias=True, exclude_none=True)
+                for task in accounts
+            ],
+        )
+
+    async def submit_file_to_sandbox(
+        self,
+        file: Upload,
+        file_name: str,
+        document_password: Optional[str] = None,
+        archive_password: Optional[str] = None,
+        arguments: Optional[str] = None,
+    ) -> Result[SubmitFileToSandboxResp]:
+        """Submits a file to the sandbox for analysis.
+
+        :param file: Raw content in bytes, path or seekable binary file
+         object, the file is streamed while it is uploaded.
+        :type file: Union[bytes, str, os.PathLike[str], IO[bytes]]
+        :param file_name: Name of the file.
+        :type file_name: str
+        :param document_password: Password used to
+         decrypt the submitted file sample.
+        :type document_password: Optional[str]
+        :param archive_password: Password encoded in Base64 used to decrypt
+         the submitted archive.
+        :type archive_password: Optional[str]
+        :param arguments: Command line arguments to run the submitted file.
+         Only available for Portable Executable (PE) files and script files.
+        :type arguments: Optional[str]
+        :rtype: Result[SubmitFileToSandboxResp]:
+        """
+        return await self._core.send_file(
+            Api.SUBMIT_FILE_TO_SANDBOX,
+            file,
+            file_name,
+            utils.build_sandbox_file_request(
+                document_password, archive_password, arguments
+            ),
+        )
+
+    async def submit_urls_to_sandbox(
+        self, *urls: str
+    ) -> MultiResult[MultiUrlResp]:
+        """Submits URLs to the sandbox for analysis.
+
+        :param urls: URL(s) to be submitted.
+        :type urls: Tuple[str, ...]
+        :rtype: MultiResult[MultiUrlResp]
+        """
+        return await self._core.send_multi(
+            MultiUrlResp,
+            Api.SUBMIT_URLS_TO_SANDBOX,
+            json=[{"url": url} for url in urls],
+        )
+
+    async def terminate_process(
+        self, *processes: ProcessTask
+    ) -> MultiResult[MultiResp]:
+        """Terminates a process that is running on one or more endpoints.
+
+        :param processes: Process(es) to terminate.
+        :type processes: Tuple[ProcessTask, ...]
+        :rtype: MultiResult[MultiResp]
+        """
+        return await self._core.send_endpoint(
+            Api.TERMINATE_ENDPOINT_PROCESS, *processes
+        )
+
+    def wait_all(
+        self,
+        *tasks: Watchable,
+        submit_ids: Iterable[str] = (),
+        class_: Type[BaseTaskResp] = BaseTaskResp,
+        workers: int = 4,
+        poll_time_sec: float = 1800,
+    ) -> AsyncTaskWatcher:
+        """Waits for many response tasks and sandbox submissions at once,
+        results are yielded as ``(id, result)`` as soon as each task is
+        finished.
+
+        :param tasks: Task ids or results of calls creating response
+         tasks or sandbox submissions (ie: isolate_endpoint).
+        :type tasks: Union[str, MultiResult[MultiResp],
+         MultiResult[MultiUrlResp]]
+        :param submit_ids: Sandbox submission ids.
+        :type submit_ids: Iterable[str]
+        :param class_: Expected task result class.
+        :type class_: Type[BaseTaskResp]
+        :param workers: Maximum number of status requests in flight.
+        :type workers: int
+        :param poll_time_sec: Maximum time to wait for each result
+         to be available.
+        :type poll_time_sec: float
+        :rtype: AsyncTaskWatcher
+        """
+        watcher = self._core.watch(workers, poll_time_sec)
+        watcher.add(*tasks, class_=class_)
+        for submit_id in submit_ids:
+            watcher.add_submission(submit_id)
+        return watcher
+
+    async def check_connectivity(self) -> Result[ConnectivityResp]:
+        """Checks the connection to the API service
+        and verifies if your authentication token is valid.
+
+        :rtype: Result[ConnectivityResp]
+        """
+        return await self._core.send(ConnectivityResp, Api.CONNECTIVITY)
@@ -0,0 +1,1098 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import json
+import logging
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import replace
+from functools import partial
+from logging import Logger
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+import httpx
+
+from .__about__ import __version__
+from .batch import RecordBatch, build_batch
+from .checkpoint import Checkpoint, CheckpointStore, PageTracker
+from .codec import JsonCodec, default_codec
+from .compat import construct, model_dump, model_fields, validate_url
+from .core import (
+    USERAGENT_SUFFIX,
+    _chunk,
+    _chunk_items,
+    _decode,
+    _failed_items,
+    _format,
+    _is_importable,
+    _merge_multi,
+    _next_uri,
+    _page_tracker,
+    _parse_data,
+    _parse_items,
+    _pending_page,
+    _prefetch_depth,
+    _read_items,
+    _start_pool,
+    _submit_page,
+    _update_envelope,
+    _validate,
+    _verify_digest,
+)
+from .exceptions import ParseModelError
+from .logs import LazyStr, fields, mask_headers, truncate
+from .model.enums import Api, HttpMethod, ParseMode, SearchMode, Status
+from .model.requests import EndpointTask
+from .model.responses import (
+    MR,
+    BaseActivityCountResp,
+    BaseLinkableResp,
+    C,
+    ConsumeLinkableResp,
+    MultiResp,
+    R,
+    S,
+    SandboxSubmissionStatusResp,
+    SaveFileResp,
+    SubmitFileToSandboxResp,
+)
+from .paginator import (
+    AsyncPaginator,
+    PendingItems,
+    _aiter_items,
+    _async_consume_pooled,
+    _async_merge,
+    _no_scope,
+)
+from .policy import (
+    DEFAULT_BULK,
+    DEFAULT_LOG,
+    DEFAULT_PARSE,
+    DEFAULT_POLL,
+    NO_RETRY,
+    BulkPolicy,
+    LogPolicy,
+    ParsePolicy,
+    PollPolicy,
+    RetryPolicy,
+    ShardPolicy,
+    SpoolPolicy,
+)
+from .results import (
+    HANDLED_ERRORS,
+    _error,
+    async_multi_result,
+    async_result,
+    call_stats,
+)
+from .shard import ShardPlanner, TimeWindow
+from .spool import Spool, SpooledItems, open_spool
+from .stream import (
+    CHUNK_SIZE,
+    Destination,
+    FileSink,
+    ItemsParser,
+    MultipartStream,
+    Upload,
+    open_upload,
+)
+from .watcher import AsyncTaskWatcher
+
+T = TypeVar("T")
+
+log: Logger = logging.getLogger(__name__)
+
+
+class AsyncCore:
+    def __init__(
+        self,
+        appname: str,
+        token: str,
+        url: str,
+        pool_connections: int,
+        pool_maxsize: int,
+        connect_timeout: int,
+        read_timeout: int,
+        retry: Optional[RetryPolicy] = None,
+        polling: Optional[PollPolicy] = None,
+        bulk: Optional[BulkPolicy] = None,
+        logs: Optional[LogPolicy] = None,
+        parse_mode: ParseMode = ParseMode.VALIDATED,
+        codec: Optional[JsonCodec] = None,
+        parsing: Optional[ParsePolicy] = None,
+        spooling: Optional[SpoolPolicy] = None,
+    ):
+        # httpx holds a single pool, pool_connections (the number of
+        # pools of the sync client, one per host) has no counterpart
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=pool_maxsize,
+                max_keepalive_connections=pool_maxsize,
+            ),
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+        )
+        self._retry = retry or NO_RETRY
+        self._polling = polling or DEFAULT_POLL
+        self._bulk = bulk or DEFAULT_BULK
+        self._logs = logs or DEFAULT_LOG
+        self._parse_mode = parse_mode
+        self._codec = codec or default_codec()
+        self._parsing = parsing or DEFAULT_PARSE
+        self._spooling = spooling
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        self._parse_scopes: int = 0
+        self._appname = appname
+        self._token = token
+        self._url: str = validate_url(_format(url))
+        self._headers: Dict[str, str] = {
+            "Authorization": f"Bearer {self._token}",
+            "User-Agent": f"{self._appname}-{USERAGENT_SUFFIX}/{__version__}",
+        }
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    @async_result
+    async def send(
+        self,
+        class_: Type[R],
+        api: str,
+        method: HttpMethod = HttpMethod.GET,
+        **kwargs: Any,
+    ) -> R:
+        return await self._process(
+            class_,
+            api,
+            method,
+            **kwargs,
+        )
+
+    @async_multi_result
+    async def send_endpoint(
+        self,
+        api: Api,
+        *tasks: EndpointTask,
+    ) -> MultiResp:
+        return await self._process_multi(
+            MultiResp,
+            api,
+            json=[
+                model_dump(task, by_alias=True, exclude_none=True)
+                for task in tasks
+            ],
+        )
+
+    @async_result
+    async def send_file(
+        self,
+        api: Api,
+        file: Upload,
+        file_name: str,
+        fields: Dict[str, str],
+    ) -> SubmitFileToSandboxResp:
+        with open_upload(file) as opened:
+            body: MultipartStream = MultipartStream(opened, file_name, fields)
+            response: SubmitFileToSandboxResp = await self._process(
+                SubmitFileToSandboxResp,
+                api,
+                HttpMethod.POST,
+                content=body,
+                headers={
+                    "Content-Type": body.content_type,
+                    "Content-Length": str(len(body)),
+                },
+            )
+        _verify_digest(response, body)
+        return response
+
+    @async_result
+    async def send_linkable(
+        self,
+        class_: Type[BaseLinkableResp[C]],
+        api: str,
+        consumer: Callable[[C], Optional[Awaitable[None]]],
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+        workers: int = 0,
+        queue_size: int = 1000,
+        ordered: bool = False,
+        checkpoint: Optional[CheckpointStore] = None,
+        resume_from: Optional[Checkpoint] = None,
+        **kwargs: Any,
+    ) -> ConsumeLinkableResp:
+        mode: ParseMode = parse_mode or self._parse_mode
+        if resume_from:
+            if resume_from.completed:
+                log.info(
+                    "Consumption already completed [Total=%s]",
+                    resume_from.total_consumed,
+                )
+                return ConsumeLinkableResp(total_consumed=0)
+            api = _next_uri(resume_from.next_link)
+            kwargs = {"headers": kwargs.get("headers", {})}
+        tracker: Optional[PageTracker] = _page_tracker(checkpoint, resume_from)
+        async with self._parse_scope():
+            with open_spool(None if stream else self._spooling) as spool:
+                api_call: Callable[[], Awaitable[BaseLinkableResp[C]]] = (
+                    lambda: (
+                        self._fetch_page(
+                            class_, api, stream, mode, spool, **kwargs
+                        )
+                    )
+                )
+                if workers > 0:
+                    return await self._consume_linkable_pooled(
+                        api_call,
+                        consumer,
+                        kwargs.get("headers", {}),
+                        workers,
+                        queue_size,
+                        ordered,
+                        prefetch,
+                        stream,
+                        mode,
+                        spool,
+                        tracker,
+                    )
+                return ConsumeLinkableResp(
+                    total_consumed=await self._consume_linkable(
+                        api_call,
+                        consumer,
+                        kwargs.get("headers", {}),
+                        prefetch,
+                        stream,
+                        mode,
+                        spool,
+                        tracker,
+                    )
+                )
+
+    @async_result
+    async def send_sharded(
+        self,
+        class_: Type[BaseLinkableResp[C]],
+        count_class: Type[BaseActivityCountResp],
+        api: str,
+        consumer: Callable[[C], Optional[Awaitable[None]]],
+        shards: ShardPolicy,
+        prefetch: int = 0,
+        parse_mode: Optional[ParseMode] = None,
+        workers: int = 0,
+        queue_size: int = 1000,
+        ordered: bool = False,
+        **kwargs: Any,
+    ) -> ConsumeLinkableResp:
+        mode: ParseMode = parse_mode or self._parse_mode
+        params: Dict[str, Any] = kwargs.get("params", {})
+        headers: Dict[str, str] = kwargs.get("headers", {})
+        windows: List[TimeWindow] = await self._plan_windows(
+            count_class, api, shards, params, headers
+        )
+        async with self._parse_scope():
+            with open_spool(self._spooling) as spool:
+                pages: AsyncGenerator[BaseLinkableResp[C], None] = (
+                    _async_merge(
+                        [
+                            self._window_pages(
+                                class_,
+                                api,
+                                mode,
+                                spool,
+                                window.params(params),
+                                headers,
+                            )
+                            for window in windows
+                        ],
+                        shards.workers,
+                        _prefetch_depth(prefetch, mode, self._parsing, spool),
+                        ordered,
+                    )
+                )
+                try:
+                    total_count, errors = await _consume_items(
+                        _aiter_pages(pages),
+                        consumer,
+                        workers,
+                        queue_size,
+                        ordered,
+                    )
+                finally:
+                    await pages.aclose()
+        log.debug(
+            "Records consumed: [Total=%s, Failed=%s, Windows=%s]",
+            total_count,
+            len(errors),
+            len(windows),
+        )
+        return ConsumeLinkableResp(
+            total_consumed=total_count,
+            total_failed=len(errors),
+            errors=[_error(exc) for exc in errors],
+        )
+
+    @async_multi_result
+    async def send_multi(
+        self,
+        class_: Type[MR],
+        api: str,
+        **kwargs: Any,
+    ) -> MR:
+        return await self._process_multi(
+            class_,
+            api,
+            **kwargs,
+        )
+
+    @async_result
+    async def send_sandbox_file(
+        self,
+        api: Api,
+        submit_id: str,
+        destination: Destination,
+        poll: bool,
+        poll_time_sec: float,
+    ) -> SaveFileResp:
+        if poll:
+            await self._wait_submission(submit_id, poll_time_sec)
+        return await self._download(api.value.format(submit_id), destination)
+
+    @async_result
+    async def send_sandbox_result(
+        self,
+        class_: Type[R],
+        api: Api,
+        submit_id: str,
+        poll: bool,
+        poll_time_sec: float,
+    ) -> R:
+        if poll:
+            await self._wait_submission(submit_id, poll_time_sec)
+        return await self._process(class_, api.value.format(submit_id))
+
+    @async_result
+    async def send_task_result(
+        self, class_: Type[S], task_id: str, poll: bool, poll_time_sec: float
+    ) -> S:
+        status_call: Callable[[], Awaitable[S]] = lambda: self._process(
+            class_,
+            Api.GET_TASK_RESULT.value.format(task_id),
+        )
+        if poll:
+            await _poll_status(
+                status_call,
+                poll_time_sec,
+                self._polling,
+            )
+        return await status_call()
+
+    def watch(self, workers: int, poll_time_sec: float) -> AsyncTaskWatcher:
+        return AsyncTaskWatcher(self, workers, poll_time_sec, self._polling)
+
+    async def iter_batches(
+        self,
+        class_: Type[BaseLinkableResp[C]],
+        api: str,
+        select: Optional[List[str]] = None,
+        max_pages: Optional[int] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> AsyncIterator[RecordBatch]:
+        record_type: Any = model_fields(class_)["items"].annotation.__args__[0]
+        async for page in self.iter_linkable(
+            class_,
+            api,
+            None,
+            max_pages,
+            prefetch,
+            stream,
+            ParseMode.RAW,
+            **kwargs,
+        ).pages():
+            yield build_batch(
+                record_type,
+                [item async for item in _aiter_items(page)],
+                select,
+            )
+
+    def iter_linkable(
+        self,
+        class_: Type[BaseLinkableResp[C]],
+        api: str,
+        max_items: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+        **kwargs: Any,
+    ) -> AsyncPaginator[C]:
+        mode: ParseMode = parse_mode or self._parse_mode
+        return self._paginate(
+            lambda: self._fetch_page(
+                class_,
+                api,
+                stream,
+                mode,
+                **kwargs,
+            ),
+            kwargs.get("headers", {}),
+            max_items,
+            max_pages,
+            prefetch,
+            stream,
+            mode,
+            scope=self._parse_scope,
+        )
+
+    async def _consume_linkable(
+        self,
+        api_call: Callable[[], Awaitable[BaseLinkableResp[C]]],
+        consumer: Callable[[C], Optional[Awaitable[None]]],
+        headers: Dict[str, str],
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: ParseMode = ParseMode.VALIDATED,
+        spool: Optional[Spool] = None,
+        tracker: Optional[PageTracker] = None,
+    ) -> int:
+        total_count: int = 0
+        item_type: str = ""
+        paginator: AsyncPaginator[C] = self._paginate(
+            api_call,
+            headers,
+            prefetch=prefetch,
+            stream=stream,
+            parse_mode=parse_mode,
+            spool=spool,
+        )
+        items: AsyncIterable[C] = paginator
+        if tracker:
+            items = tracker.async_items(paginator.pages())
+        async for item in items:
+            consumed = consumer(item)
+            if inspect.isawaitable(consumed):
+                await consumed
+            total_count += 1
+            item_type = type(item).__name__
+        log.debug(
+            "Records consumed: [Total=%s, Type=%s]",
+            total_count,
+            item_type,
+        )
+        return total_count
+
+    async def _consume_linkable_pooled(
+        self,
+        api_call: Callable[[], Awaitable[BaseLinkableResp[C]]],
+        consumer: Callable[[C], Optional[Awaitable[None]]],
+        headers: Dict[str, str],
+        workers: int,
+        queue_size: int,
+        ordered: bool = False,
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: ParseMode = ParseMode.VALIDATED,
+        spool: Optional[Spool] = None,
+        tracker: Optional[PageTracker] = None,
+    ) -> ConsumeLinkableResp:
+        paginator: AsyncPaginator[C] = self._paginate(
+            api_call,
+            headers,
+            prefetch=prefetch,
+            stream=stream,
+            parse_mode=parse_mode,
+            spool=spool,
+        )
+        if tracker:
+            total_count, errors = await _async_consume_pooled(
+                tracker.async_entries(paginator.pages()),
+                tracker.async_wrap(consumer),
+                workers,
+                queue_size,
+                ordered,
+            )
+        else:
+            total_count, errors = await _async_consume_pooled(
+                paginator, consumer, workers, queue_size, ordered
+            )
+        log.debug(
+            "Records consumed: [Total=%s, Failed=%s, Workers=%s]",
+            total_count,
+            len(errors),
+            workers,
+        )
+        return ConsumeLinkableResp(
+            total_consumed=total_count,
+            total_failed=len(errors),
+            errors=[_error(exc) for exc in errors],
+        )
+
+    def _paginate(
+        self,
+        api_call: Callable[[], Awaitable[BaseLinkableResp[C]]],
+        headers: Dict[str, str],
+        max_items: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: ParseMode = ParseMode.VALIDATED,
+        spool: Optional[Spool] = None,
+        scope: Callable[[], AsyncContextManager[Any]] = _no_scope,
+    ) -> AsyncPaginator[C]:
+        return AsyncPaginator(
+            lambda page: (
+                api_call()
+                if page is None
+                else self._fetch_page(
+                    type(page),
+                    _next_uri(page.next_link),
+                    stream,
+                    parse_mode,
+                    spool,
+                    headers=headers,
+                )
+            ),
+            max_items,
+            max_pages,
+            (
+                0
+                if stream
+                else _prefetch_depth(
+                    prefetch, parse_mode, self._parsing, spool
+                )
+            ),
+            scope,
+        )
+
+    async def _fetch_page(
+        self,
+        class_: Type[BaseLinkableResp[C]],
+        uri: str,
+        stream: bool,
+        parse_mode: ParseMode,
+        spool: Optional[Spool] = None,
+        **kwargs: Any,
+    ) -> BaseLinkableResp[C]:
+        if spool and not stream:
+            return await self._fetch_spooled_page(
+                class_, uri, parse_mode, spool, **kwargs
+            )
+        if not stream and parse_mode == ParseMode.VALIDATED:
+            if self._parsing.processes > 0 and _is_importable(class_):
+                return await self._fetch_pooled_page(class_, uri, **kwargs)
+            return await self._process(class_, uri, **kwargs)
+        log.debug(
+            "Processing page request [Class=%s, URI=%s, Options=%s]",
+            class_.__name__,
+            uri,
+            kwargs,
+        )
+        raw_response: httpx.Response = await self._send(
+            self._prepare(uri, HttpMethod.GET, **kwargs), stream=stream
+        )
+        if not raw_response.is_success or "json" not in (
+            raw_response.headers.get("Content-Type", "")
+        ):
+            await raw_response.aread()
+            body: Any = _decode(raw_response, self._codec)
+            _validate(raw_response, body)
+            return _parse_data(raw_response, class_, body)
+        log.info(
+            "Parsing json page [Class=%s, Mode=%s, Stream=%s]",
+            class_.__name__,
+            parse_mode.value,
+            stream,
+        )
+        page: BaseLinkableResp[C] = construct(class_)
+        if stream:
+            setattr(
+                page, "items", _stream_items(page, raw_response, parse_mode)
+            )
+        else:
+            envelope: Dict[str, Any] = self._codec.loads(raw_response.content)
+            setattr(
+                page,
+                "items",
+                _parse_items(class_, envelope.pop("items", []), parse_mode),
+            )
+            _update_envelope(page, envelope)
+        return page
+
+    async def _fetch_spooled_page(
+        self,
+        class_: Type[BaseLinkableResp[C]],
+        uri: str,
+        parse_mode: ParseMode,
+        spool: Spool,
+        **kwargs: Any,
+    ) -> BaseLinkableResp[C]:
+        raw_response: httpx.Response = await self._send(
+            self._prepare(uri, HttpMethod.GET, **kwargs)
+        )
+        body: Any = _decode(raw_response, self._codec)
+        _validate(raw_response, body)
+        if not isinstance(body, dict):
+            return _parse_data(raw_response, class_, body)
+        log.info(
+            "Spooling json page [Class=%s, Size=%s]",
+            class_.__name__,
+            len(raw_response.content),
+        )
+        read: Callable[[], bytes] = await _in_thread(
+            spool.write, raw_response.content
+        )
+        return _pending_page(
+            class_,
+            body,
+            SpooledItems(
+                partial(_read_items, class_, read, self._codec, parse_mode)
+            ),
+        )
+
+    async def _fetch_pooled_page(
+        self, class_: Type[BaseLinkableResp[C]], uri: str, **kwargs: Any
+    ) -> BaseLinkableResp[C]:
+        raw_response: httpx.Response = await self._send(
+            self._prepare(uri, HttpMethod.GET, **kwargs)
+        )
+        body: Any = _decode(raw_response, self._codec)
+        _validate(raw_response, body)
+        if (
+            not isinstance(body, dict)
+            or len(raw_response.content) < self._parsing.min_bytes
+        ):
+            return _parse_data(raw_response, class_, body)
+        log.info(
+            "Parsing json page in worker [Class=%s, Size=%s]",
+            class_.__name__,
+            len(raw_response.content),
+        )
+        return _pending_page(
+            class_,
+            body,
+            PendingItems(
+                _submit_page(
+                    self._pool(), class_, raw_response.content, self._codec
+                )
+            ),
+        )
+
+    @asynccontextmanager
+    async def _parse_scope(self) -> AsyncIterator[None]:
+        """Asynchronous counterpart of :meth:`Core._parse_scope`, the
+        workers are shut down in a thread."""
+        self._parse_scopes += 1
+        try:
+            yield
+        finally:
+            self._parse_scopes -= 1
+            pool: Optional[ProcessPoolExecutor] = None
+            if not self._parse_scopes:
+                pool, self._parse_pool = self._parse_pool, None
+            if pool:
+                await _in_thread(pool.shutdown)
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if not self._parse_scopes:
+            raise RuntimeError("Parse workers used after their call")
+        if self._parse_pool is None:
+            self._parse_pool = _start_pool(self._parsing)
+        return self._parse_pool
+
+    async def _process(
+        self,
+        class_: Type[R],
+        uri: str,
+        method: HttpMethod = HttpMethod.GET,
+        **kwargs: Any,
+    ) -> R:
+        log.debug(
+            "Processing request [Method=%s, Class=%s, URI=%s, Options=%s]",
+            method.value,
+            class_.__name__,
+            uri,
+            kwargs,
+        )
+        raw_response: httpx.Response = await self._send(
+            self._prepare(uri, method, **kwargs)
+        )
+        body: Any = _decode(raw_response, self._codec)
+        _validate(raw_response, body)
+        return _parse_data(raw_response, class_, body)
+
+    async def _process_multi(
+        self, class_: Type[MR], uri: str, **kwargs: Any
+    ) -> MR:
+        items: Any = kwargs.get("json")
+        chunks: List[List[Any]] = (
+            _chunk(items, self._bulk, self._codec)
+            if isinstance(items, list)
+            else []
+        )
+        if len(chunks) < 2:
+            return await self._process(class_, uri, HttpMethod.POST, **kwargs)
+        del kwargs["json"]
+        log.debug(
+            "Processing bulk request in chunks [URI=%s, Items=%s, Chunks=%s]",
+            uri,
+            len(items),
+            len(chunks),
+        )
+        slots = asyncio.Semaphore(self._bulk.workers)
+
+        async def process_chunk(chunk: List[Any]) -> List[Dict[str, Any]]:
+            async with slots:
+                return await self._process_chunk(uri, chunk, **kwargs)
+
+        return _merge_multi(
+            class_,
+            list(await asyncio.gather(*map(process_chunk, chunks))),
+        )
+
+    async def _process_chunk(
+        self, uri: str, chunk: List[Any], **kwargs: Any
+    ) -> List[Dict[str, Any]]:
+        try:
+            raw_response: httpx.Response = await self._send(
+                self._prepare(uri, HttpMethod.POST, json=chunk, **kwargs)
+            )
+            body: Any = _decode(raw_response, self._codec)
+            if raw_response.status_code != 207:
+                _validate(raw_response, body)
+            return _chunk_items(raw_response, body)
+        except HANDLED_ERRORS as exc:
+            log.warning("Chunk failed [URI=%s, Error=%s]", uri, exc)
+            return _failed_items(exc, len(chunk))
+
+    async def _download(
+        self, uri: str, destination: Destination
+    ) -> SaveFileResp:
+        raw_response: httpx.Response = await self._send(
+            self._prepare(uri, HttpMethod.GET), stream=True
+        )
+        try:
+            content_type: str = raw_response.headers.get("Content-Type", "")
+            if not raw_response.is_success or "application" not in (
+                content_type
+            ):
+                await raw_response.aread()
+                _validate(raw_response, _decode(raw_response, self._codec))
+                raise ParseModelError(SaveFileResp.__name__, raw_response)
+            async with _file_sink(destination) as sink:
+                async for chunk in raw_response.aiter_bytes(CHUNK_SIZE):
+                    await _in_thread(sink.write, chunk)
+        finally:
+            await raw_response.aclose()
+        log.info("Download finished [URI=%s, Size=%s]", uri, sink.size)
+        return sink.response()
+
+    async def _plan_windows(
+        self,
+        count_class: Type[BaseActivityCountResp],
+        api: str,
+        policy: ShardPolicy,
+        params: Dict[str, Any],
+        headers: Dict[str, str],
+    ) -> List[TimeWindow]:
+        slots = asyncio.Semaphore(max(1, policy.workers))
+
+        async def count(window: TimeWindow) -> int:
+            async with slots:
+                response: BaseActivityCountResp = await self._process(
+                    count_class,
+                    api,
+                    params={
+                        **window.params(params),
+                        "mode": SearchMode.COUNT_ONLY,
+                    },
+                    headers=headers,
+                )
+            return response.total_count
+
+        whole: TimeWindow = TimeWindow.from_params(params)
+        planner: ShardPlanner = ShardPlanner(
+            replace(whole, count=await count(whole)), policy
+        )
+        while not planner.done:
+            planner.update(
+                list(await asyncio.gather(*map(count, planner.pending())))
+            )
+        windows: List[TimeWindow] = planner.windows()
+        log.debug(
+            "Search split in time windows [URI=%s, Windows=%s, Counts=%s]",
+            api,
+            len(windows),
+            [window.count for window in windows],
+        )
+        return windows
+
+    def _window_pages(
+        self,
+        class_: Type[BaseLinkableResp[C]],
+        api: str,
+        parse_mode: ParseMode,
+        spool: Optional[Spool],
+        params: Dict[str, Any],
+        headers: Dict[str, str],
+    ) -> AsyncIterator[BaseLinkableResp[C]]:
+        paginator: AsyncPaginator[C] = AsyncPaginator(
+            lambda page: (
+                self._fetch_page(
+                    class_,
+                    api,
+                    False,
+                    parse_mode,
+                    spool,
+                    params=params,
+                    headers=headers,
+                )
+                if page is None
+                else self._fetch_page(
+                    type(page),
+                    _next_uri(page.next_link),
+                    False,
+                    parse_mode,
+                    spool,
+                    headers=headers,
+                )
+            )
+        )
+        return paginator.pages()
+
+    def _prepare(
+        self, uri: str, method: HttpMethod, **kwargs: Any
+    ) -> httpx.Request:
+        headers: Dict[str, str] = {
+            **self._headers,
+            **kwargs.pop("headers", {}),
+        }
+        obj: Any = kwargs.pop("json", None)
+        if obj is not None:
+            headers.setdefault("Content-Type", "application/json")
+            kwargs["content"] = self._codec.dumps(obj)
+        return self._client.build_request(
+            method.value, self._url + uri, headers=headers, **kwargs
+        )
+
+    async def _wait_submission(
+        self, submit_id: str, poll_time_sec: float
+    ) -> None:
+        await _poll_status(
+            lambda: self._process(
+                SandboxSubmissionStatusResp,
+                Api.GET_SANDBOX_SUBMISSION_STATUS.value.format(submit_id),
+            ),
+            poll_time_sec,
+            self._polling,
+        )
+
+    async def _send(
+        self, request: httpx.Request, stream: bool = False
+    ) -> httpx.Response:
+        retries: int = 0
+        while True:
+            try:
+                response: httpx.Response = await self._send_internal(
+                    request, stream
+                )
+            except httpx.TransportError as exc:
+                if not self._can_retry(request.method, retries):
+                    raise
+                reason: str = type(exc).__name__
+                delay: float = self._retry.delay(retries)
+            else:
+                if (
+                    response.status_code not in self._retry.status_codes
+                    or not self._can_retry(request.method, retries)
+                ):
+                    return response
+                reason = str(response.status_code)
+                delay = self._retry.delay(
+                    retries, response.headers.get("Retry-After")
+                )
+                if stream:
+                    await response.aclose()
+            retries += 1
+            call_stats().retries += 1
+            log.warning(
+                (
+                    "Retrying request [Method=%s, URL=%s, Reason=%s, Retry=%s,"
+                    " Delay=%.2f]"
+                ),
+                request.method,
+                request.url,
+                reason,
+                retries,
+                delay,
+            )
+            await asyncio.sleep(delay)
+
+    def _can_retry(self, method: str, retries: int) -> bool:
+        return self._retry.can_retry(method, retries, call_stats().retries)
+
+    async def _send_internal(
+        self, request: httpx.Request, stream: bool = False
+    ) -> httpx.Response:
+        logged: bool = log.isEnabledFor(logging.INFO) and self._logs.sampled(
+            str(request.url)
+        )
+        if logged:
+            log.info(
+                "Sending request [Method=%s, URL=%s, Headers=%s, Body=%s]",
+                request.method,
+                request.url,
+                LazyStr(mask_headers, request.headers),
+                LazyStr(_hide_binary, request, self._logs.max_body),
+                extra=fields(request.method, request.url),
+            )
+        start_time: float = time.perf_counter()
+        response: httpx.Response = await self._client.send(
+            request, stream=stream
+        )
+        if log.isEnabledFor(logging.INFO) and (
+            logged or response.status_code >= 400
+        ):
+            elapsed: float = time.perf_counter() - start_time
+            log.info(
+                (
+                    "Received response [Status=%s, URL=%s, Elapsed=%.3f,"
+                    " Headers=%s, Body=%s]"
+                ),
+                response.status_code,
+                request.url,
+                elapsed,
+                response.headers,
+                (
+                    "***streamed content***"
+                    if stream
+                    else LazyStr(_hide_binary, response, self._logs.max_body)
+                ),
+                extra=fields(
+                    request.method, request.url, response.status_code, elapsed
+                ),
+            )
+        return response
+
+
+def _hide_binary(
+    http_object: Union[httpx.Request, httpx.Response],
+    max_body: Optional[int] = None,
+) -> str:
+    content_type = http_object.headers.get("Content-Type", "")
+    if "json" not in content_type and "application" in content_type:
+        return "***binary content***"
+    if "multipart" in content_type:
+        return "***multipart content***"
+    return truncate(http_object.content, max_body)
+
+
+@asynccontextmanager
+async def _file_sink(destination: Destination) -> AsyncIterator[FileSink]:
+    """Opens, closes and moves the file of a :class:`FileSink` in a
+    thread so that a slow disk does not block the event loop."""
+    sink: FileSink = FileSink(destination)
+    await _in_thread(sink.__enter__)
+    try:
+        yield sink
+    except BaseException:
+        await _in_thread(sink.__exit__, *sys.exc_info())
+        raise
+    await _in_thread(sink.__exit__, None, None, None)
+
+
+async def _in_thread(func: Callable[..., T], *args: Any) -> T:
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+async def _aiter_pages(
+    pages: AsyncIterable[BaseLinkableResp[C]],
+) -> AsyncIterator[C]:
+    async for page in pages:
+        async for item in _aiter_items(page):
+            yield item
+
+
+async def _consume_items(
+    items: AsyncIterable[C],
+    consumer: Callable[[C], Optional[Awaitable[None]]],
+    workers: int,
+    queue_size: int,
+    ordered: bool = False,
+) -> Tuple[int, List[Exception]]:
+    if workers > 0:
+        return await _async_consume_pooled(
+            items, consumer, workers, queue_size, ordered
+        )
+    total_count: int = 0
+    async for item in items:
+        consumed = consumer(item)
+        if inspect.isawaitable(consumed):
+            await consumed
+        total_count += 1
+    return total_count, []
+
+
+async def _stream_items(
+    page: BaseLinkableResp[C],
+    raw_response: httpx.Response,
+    parse_mode: ParseMode = ParseMode.VALIDATED,
+) -> AsyncIterator[C]:
+    parser: ItemsParser = ItemsParser()
+    class_: Type[BaseLinkableResp[C]] = type(page)
+    try:
+        async for chunk in raw_response.aiter_bytes(CHUNK_SIZE):
+            for item in _parse_items(class_, parser.feed(chunk), parse_mode):
+                yield item
+        for item in _parse_items(
+            class_, parser.feed(b"", final=True), parse_mode
+        ):
+            yield item
+    except json.JSONDecodeError as exc:
+        raise ParseModelError(class_.__name__, raw_response) from exc
+    finally:
+        await raw_response.aclose()
+    _update_envelope(page, parser.envelope)
+
+
+async def _poll_status(
+    status_call: Callable[[], Awaitable[S]],
+    poll_time_sec: float,
+    policy: PollPolicy = DEFAULT_POLL,
+) -> int:
+    start_time: float = time.time()
+    polls: int = 1
+    response: S = await status_call()
+    while response.status in [Status.QUEUED, Status.RUNNING]:
+        remaining: float = poll_time_sec - (time.time() - start_time)
+        if remaining <= 0:
+            break
+        await asyncio.sleep(min(policy.delay(polls), remaining))
+        response = await status_call()
+        polls += 1
+    call_stats().polls += polls
+    log.debug(
+        "Polling finished [Status=%s, Polls=%s, Elapsed=%.2f]",
+        response.status,
+        polls,
+        time.time() - start_time,
+    )
+    return polls
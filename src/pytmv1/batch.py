@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from array import array
+from enum import Enum
+from functools import lru_cache, partial
+from itertools import accumulate
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from .compat import model_fields
+from .model.commons import BaseConsumable
+
+CATEGORICAL_FIELDS: FrozenSet[str] = frozenset({"os", "scan_type", "tags"})
+
+_DTYPES: Dict[Any, str] = {bool: "bool", int: "int64", float: "float64"}
+_TYPE_CODES: Dict[str, str] = {"int64": "q", "float64": "d", "bool": "b"}
+
+
+class Column(ABC):
+    """Values of one field for all the records of a :class:`RecordBatch`.
+
+    Fixed width buffers are :class:`array.array` which expose the buffer
+    protocol, they can be wrapped without copy
+    (ie: ``numpy.frombuffer(column.values, "int64")``).
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    @abstractmethod
+    def to_pylist(self) -> List[Any]:
+        """Decodes the column to a list with one value per record.
+
+        :rtype: List[Any]
+        """
+
+
+class PrimitiveColumn(Column):
+    """Integers, floats or booleans stored in a typed array.
+
+    Missing values are stored as 0 and flagged by a 0 in ``validity``.
+    """
+
+    __slots__ = ("dtype", "values", "validity", "null_count")
+
+    def __init__(self, dtype: str, data: List[Any]):
+        self.dtype: str = dtype
+        self.validity: bytearray = bytearray(
+            value is not None for value in data
+        )
+        self.values: "array[Any]" = array(
+            _TYPE_CODES[dtype],
+            [0 if value is None else value for value in data],
+        )
+        self.null_count: int = len(data) - sum(self.validity)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def to_pylist(self) -> List[Any]:
+        values: List[Any] = self.values.tolist()
+        if self.dtype == "bool":
+            values = [bool(value) for value in values]
+        return [
+            value if valid else None
+            for value, valid in zip(values, self.validity)
+        ]
+
+
+class StringColumn(Column):
+    """Free text values, missing values are ``None``."""
+
+    __slots__ = ("values",)
+
+    def __init__(self, data: List[Any]):
+        self.values: List[Optional[str]] = data
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def to_pylist(self) -> List[Any]:
+        return list(self.values)
+
+
+class DictionaryColumn(Column):
+    """Categorical values stored once in ``dictionary`` and referenced
+    by their position in ``indices``, missing values are -1."""
+
+    __slots__ = ("indices", "dictionary")
+
+    def __init__(self, data: List[Any]):
+        positions: Dict[Any, int] = {}
+        self.indices: "array[int]" = array(
+            "i",
+            [
+                (
+                    -1
+                    if value is None
+                    else positions.setdefault(value, len(positions))
+                )
+                for value in data
+            ],
+        )
+        self.dictionary: List[Any] = list(positions)
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def to_pylist(self) -> List[Any]:
+        return [
+            None if index < 0 else self.dictionary[index]
+            for index in self.indices
+        ]
+
+
+class ListColumn(Column):
+    """Lists of values flattened in a child column, the values of the
+    record ``i`` are ``values[offsets[i]:offsets[i + 1]]``."""
+
+    __slots__ = ("offsets", "values")
+
+    def __init__(self, data: List[Any], child: Callable[[List[Any]], Column]):
+        lists: List[List[Any]] = [value or [] for value in data]
+        self.offsets: "array[int]" = array("q", [0])
+        self.offsets.extend(accumulate(len(value) for value in lists))
+        self.values: Column = child(
+            [value for values in lists for value in values]
+        )
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def to_pylist(self) -> List[Any]:
+        values: List[Any] = self.values.to_pylist()
+        return [
+            values[start:end]
+            for start, end in zip(self.offsets, self.offsets[1:])
+        ]
+
+
+class RecordBatch:
+    """Records of a page stored by column instead of one object per
+    record, columns are named after the fields of the record model.
+
+    :param num_rows: Number of records.
+    :type num_rows: int
+    :param columns: Columns by field name.
+    :type columns: Dict[str, Column]
+    """
+
+    __slots__ = ("num_rows", "columns")
+
+    def __init__(self, num_rows: int, columns: Dict[str, Column]):
+        self.num_rows = num_rows
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def __getitem__(self, name: str) -> Column:
+        return self.columns[name]
+
+    def to_pydict(self) -> Dict[str, List[Any]]:
+        """Decodes the batch to lists of values by field name
+        (ie: ``pandas.DataFrame(batch.to_pydict())``).
+
+        :rtype: Dict[str, List[Any]]
+        """
+        return {
+            name: column.to_pylist() for name, column in self.columns.items()
+        }
+
+
+def build_batch(
+    class_: Type[BaseConsumable],
+    records: Iterable[Any],
+    select: Optional[Iterable[str]] = None,
+) -> RecordBatch:
+    """Fills the columns of a batch from decoded JSON records.
+
+    Enumerations and :data:`CATEGORICAL_FIELDS` are dictionary encoded,
+    lists are stored with offsets and other values in typed arrays.
+
+    :param class_: Model of the records.
+    :type class_: Type[BaseConsumable]
+    :param records: Decoded JSON records.
+    :type records: Iterable[Any]
+    :param select: Aliases of the fields to keep, all fields if not set.
+    :type select: Optional[Iterable[str]]
+    :rtype: RecordBatch
+    """
+    rows: List[Any] = list(records)
+    selected: Optional[FrozenSet[str]] = frozenset(select) if select else None
+    return RecordBatch(
+        len(rows),
+        {
+            name: factory([row.get(alias) for row in rows])
+            for name, alias, factory in _schema(class_)
+            if selected is None or alias in selected
+        },
+    )
+
+
+@lru_cache(maxsize=None)
+def _schema(
+    class_: Type[BaseConsumable],
+) -> List[Tuple[str, str, Callable[[List[Any]], Column]]]:
+    return [
+        (
+            name,
+            field.alias,
+            _factory(field.annotation, name in CATEGORICAL_FIELDS),
+        )
+        for name, field in model_fields(class_).items()
+    ]
+
+
+def _factory(type_: Any, categorical: bool) -> Callable[[List[Any]], Column]:
+    origin: Any = getattr(type_, "__origin__", None)
+    args: Tuple[Any, ...] = getattr(type_, "__args__", ())
+    if origin is Union:
+        return _factory(
+            next(arg for arg in args if arg is not type(None)), categorical
+        )
+    if origin is list:
+        child: Callable[[List[Any]], Column] = _factory(args[0], categorical)
+        return lambda data: ListColumn(data, child)
+    if categorical or (isinstance(type_, type) and issubclass(type_, Enum)):
+        return DictionaryColumn
+    dtype: Optional[str] = _DTYPES.get(type_)
+    if dtype:
+        return partial(PrimitiveColumn, dtype)
+    return StringColumn
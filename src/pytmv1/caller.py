@@ -3,9 +3,22 @@ from __future__ import annotations
 import logging
 from functools import lru_cache
 from logging import Logger
-from typing import Callable, List, Optional, Type, Union
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    Union,
+)
 
 from . import utils
+from .batch import RecordBatch
+from .checkpoint import Checkpoint, CheckpointStore
+from .codec import JsonCodec
+from .compat import model_dump
 from .core import Core
 from .model.commons import (
     EmailActivity,
@@ -20,6 +33,7 @@ from .model.enums import (
     Api,
     HttpMethod,
     InvestigationStatus,
+    ParseMode,
     QueryOp,
     SearchMode,
 )
@@ -56,9 +70,23 @@ from .model.responses import (
     SandboxAnalysisResultResp,
     SandboxSubmissionStatusResp,
     SandboxSuspiciousListResp,
+    SaveFileResp,
     SubmitFileToSandboxResp,
 )
+from .paginator import Paginator
+from .policy import (
+    BulkPolicy,
+    LogPolicy,
+    ParsePolicy,
+    PollPolicy,
+    RetryPolicy,
+    ShardPolicy,
+    SpoolPolicy,
+)
+from .projection import project_linkable, select_fields
 from .results import MultiResult, Result
+from .stream import Destination, Upload
+from .watcher import TaskWatcher, Watchable
 
 log: Logger = logging.getLogger(__name__)
 
@@ -72,6 +100,14 @@ def client(
     pool_maxsize: int = 1,
     connect_timeout: int = 30,
     read_timeout: int = 30,
+    retry: Optional[RetryPolicy] = None,
+    polling: Optional[PollPolicy] = None,
+    bulk: Optional[BulkPolicy] = None,
+    logs: Optional[LogPolicy] = None,
+    parse_mode: ParseMode = ParseMode.VALIDATED,
+    codec: Optional[JsonCodec] = None,
+    parsing: Optional[ParsePolicy] = None,
+    spooling: Optional[SpoolPolicy] = None,
 ) -> Client:
     """Helper function to initialize a :class:`Client`.
 
@@ -89,6 +125,33 @@ def client(
     :type connect_timeout: int
     :param read_timeout: (optional) Seconds before read timeout.
     :type connect_timeout: int
+    :param retry: (optional) Retry policy applied to failed requests,
+     requests are not retried if not set.
+    :type retry: Optional[RetryPolicy]
+    :param polling: (optional) Schedule of the status requests sent
+     while waiting for a result, default schedule used if not set.
+    :type polling: Optional[PollPolicy]
+    :param bulk: (optional) Splitting of bulk requests in chunks sent
+     concurrently, default limits used if not set.
+    :type bulk: Optional[BulkPolicy]
+    :param logs: (optional) Logging of the HTTP requests and responses,
+     bodies are truncated to 1024 bytes if not set.
+    :type logs: Optional[LogPolicy]
+    :param parse_mode: (optional) Parsing of the paginated records:
+     validated models, records validating each field on first access,
+     unvalidated models built with ``construct()`` or plain dicts,
+     validated models by default.
+    :type parse_mode: ParseMode
+    :param codec: (optional) JSON encoding of the requests and decoding
+     of the responses, orjson if installed and the standard library
+     otherwise if not set.
+    :type codec: Optional[JsonCodec]
+    :param parsing: (optional) Validation of large pages in worker
+     processes, pages are validated by the fetching thread if not set.
+    :type parsing: Optional[ParsePolicy]
+    :param spooling: (optional) Buffering on disk of the pages fetched by
+     consume calls, pages are held in memory if not set.
+    :type spooling: Optional[SpoolPolicy]
     :rtype: Client
     """
     log.debug(
@@ -105,6 +168,14 @@ def client(
             pool_maxsize,
             connect_timeout,
             read_timeout,
+            retry,
+            polling,
+            bulk,
+            logs,
+            parse_mode,
+            codec,
+            parsing,
+            spooling,
         )
     )
 
@@ -192,6 +263,14 @@ class Client:
         consumer: Callable[[Union[SaeAlert, TiAlert]], None],
         start_time: Optional[str] = None,
         end_time: Optional[str] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+        workers: int = 0,
+        queue_size: int = 1000,
+        ordered: bool = False,
+        checkpoint: Optional[CheckpointStore] = None,
+        resume_from: Optional[Checkpoint] = None,
     ) -> Result[ConsumeLinkableResp]:
         """Retrieves and consume workbench alerts.
 
@@ -205,12 +284,50 @@ class Client:
         time range (yyyy-MM-ddThh:mm:ssZ in UTC).
         Defaults to the time the request is made.
         :type end_time: Optional[str]
+        :param prefetch: Number of pages fetched in background
+         while the current page is consumed, disabled if 0.
+        :type prefetch: int
+        :param stream: Parse records one at a time while the page is
+         downloaded instead of loading the whole page in memory,
+         ``prefetch`` is ignored if set.
+        :type stream: bool
+        :param parse_mode: Parsing of the records, validated models,
+         lazily validated records, unvalidated models or plain dicts,
+         client default if not set.
+        :type parse_mode: Optional[ParseMode]
+        :param workers: Number of threads consuming the records while the
+         next records are fetched, records are consumed by the calling
+         thread if 0. Errors raised by ``consumer`` are then collected in
+         the response instead of stopping the consumption.
+        :type workers: int
+        :param queue_size: Maximum number of records fetched ahead of the
+         consumers, fetching waits while the queue is full.
+        :type queue_size: int
+        :param ordered: Consume the records one at a time in their order
+         by a single worker.
+        :type ordered: bool
+        :param checkpoint: Store of the position of the consumption, saved
+         once all the records of a page are consumed, nothing is saved
+         if not set.
+        :type checkpoint: Optional[CheckpointStore]
+        :param resume_from: Position to resume the consumption from
+         (ie: ``checkpoint.load()``), the filters of the first call are
+         carried by its ``next_link``.
+        :type resume_from: Optional[Checkpoint]
         :rtype: Result[ConsumeLinkableResp]:
         """
         return self._core.send_linkable(
             GetAlertListResp,
             Api.GET_ALERT_LIST,
             consumer,
+            prefetch,
+            stream,
+            parse_mode,
+            workers,
+            queue_size,
+            ordered,
+            checkpoint,
+            resume_from,
             params=utils.filter_none(
                 {
                     "startDateTime": start_time,
@@ -228,6 +345,16 @@ class Client:
         select: Optional[List[str]] = None,
         top: int = 500,
         op: QueryOp = QueryOp.AND,
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+        workers: int = 0,
+        queue_size: int = 1000,
+        ordered: bool = False,
+        checkpoint: Optional[CheckpointStore] = None,
+        resume_from: Optional[Checkpoint] = None,
+        shards: Optional[ShardPolicy] = None,
+        slim: bool = False,
         **fields: str,
     ) -> Result[ConsumeLinkableResp]:
         """Retrieves and consume email activity data in a paginated list
@@ -245,6 +372,8 @@ class Client:
         :type end_time: Optional[str]
         :param select: List of fields to include in the search results,
         if no fields are specified, the query returns all supported fields.
+        Fields are named after the model (ie: mail_msg_id)
+        or the API (ie: mailMsgId).
         :type select: Optional[List[str]]
         :param top: Number of records fetched per page.
         :type top: int
@@ -253,20 +382,92 @@ class Client:
         :param fields: Field/value used to filter result (ie: uuid="123456")
         check Vision One API documentation for full list of supported fields.
         :type fields: Dict[str, str]
+        :param prefetch: Number of pages fetched in background
+         while the current page is consumed, disabled if 0.
+        :type prefetch: int
+        :param stream: Parse records one at a time while the page is
+         downloaded instead of loading the whole page in memory,
+         ``prefetch`` is ignored if set.
+        :type stream: bool
+        :param parse_mode: Parsing of the records, validated models,
+         lazily validated records, unvalidated models or plain dicts,
+         client default if not set.
+        :type parse_mode: Optional[ParseMode]
+        :param workers: Number of threads consuming the records while the
+         next records are fetched, records are consumed by the calling
+         thread if 0. Errors raised by ``consumer`` are then collected in
+         the response instead of stopping the consumption.
+        :type workers: int
+        :param queue_size: Maximum number of records fetched ahead of the
+         consumers, fetching waits while the queue is full.
+        :type queue_size: int
+        :param ordered: Consume the records one at a time in their order
+         by a single worker.
+        :type ordered: bool
+        :param checkpoint: Store of the position of the consumption, saved
+         once all the records of a page are consumed, nothing is saved
+         if not set.
+        :type checkpoint: Optional[CheckpointStore]
+        :param resume_from: Position to resume the consumption from
+         (ie: ``checkpoint.load()``), the filters of the first call are
+         carried by its ``next_link``.
+        :type resume_from: Optional[Checkpoint]
+        :param shards: Splitting of the search in time windows of roughly
+         equal volume fetched concurrently, the records of a window are
+         consumed after those of the previous windows if ``ordered`` is
+         set and as soon as fetched otherwise. Up to ``prefetch`` pages
+         (at least one) of every window are fetched ahead of the consumer.
+         Pages are not streamed and ``checkpoint`` and ``resume_from`` do
+         not apply. The search is sent over the whole range if not set.
+        :type shards: Optional[ShardPolicy]
+        :param slim: Parse the records with a model validating only the
+         selected fields (see :func:`~pytmv1.project`), faster on large
+         pages but the records are not instances of the activity model
+         and lack the other fields.
+        :type slim: bool
         :rtype: Result[ConsumeLinkableResp]:
         """
+        params: Dict[str, str] = utils.build_activity_request(
+            start_time,
+            end_time,
+            select_fields(EmailActivity, select),
+            top,
+            SearchMode.DEFAULT,
+        )
+        headers: Dict[str, str] = utils.activity_query(op, **fields)
+        if shards:
+            return self._core.send_sharded(
+                project_linkable(
+                    GetEmailActivityDataResp, select if slim else None
+                ),
+                GetEmailActivityDataCountResp,
+                Api.GET_EMAIL_ACTIVITY_DATA,
+                consumer,
+                shards,
+                prefetch,
+                parse_mode,
+                workers,
+                queue_size,
+                ordered,
+                params=params,
+                headers=headers,
+            )
         return self._core.send_linkable(
-            GetEmailActivityDataResp,
+            project_linkable(
+                GetEmailActivityDataResp, select if slim else None
+            ),
             Api.GET_EMAIL_ACTIVITY_DATA,
             consumer,
-            params=utils.build_activity_request(
-                start_time,
-                end_time,
-                select,
-                top,
-                SearchMode.DEFAULT,
-            ),
-            headers=utils.activity_query(op, **fields),
+            prefetch,
+            stream,
+            parse_mode,
+            workers,
+            queue_size,
+            ordered,
+            checkpoint,
+            resume_from,
+            params=params,
+            headers=headers,
         )
 
     def consume_endpoint_activity_data(
@@ -277,6 +478,16 @@ class Client:
         select: Optional[List[str]] = None,
         top: int = 500,
         op: QueryOp = QueryOp.AND,
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+        workers: int = 0,
+        queue_size: int = 1000,
+        ordered: bool = False,
+        checkpoint: Optional[CheckpointStore] = None,
+        resume_from: Optional[Checkpoint] = None,
+        shards: Optional[ShardPolicy] = None,
+        slim: bool = False,
         **fields: str,
     ) -> Result[ConsumeLinkableResp]:
         """Retrieves and consume endpoint activity data in a paginated list
@@ -294,6 +505,8 @@ class Client:
         :type end_time: Optional[str]
         :param select: List of fields to include in the search results,
         if no fields are specified, the query returns all supported fields.
+        Fields are named after the model (ie: endpoint_guid)
+        or the API (ie: endpointGuid).
         :type select: Optional[List[str]]
         :param top: Number of records fetched per page.
         :type top: int
@@ -302,20 +515,92 @@ class Client:
         :param fields: Field/value used to filter result (ie: dpt="443")
         check Vision One API documentation for full list of supported fields.
         :type fields: Dict[str, str]
+        :param prefetch: Number of pages fetched in background
+         while the current page is consumed, disabled if 0.
+        :type prefetch: int
+        :param stream: Parse records one at a time while the page is
+         downloaded instead of loading the whole page in memory,
+         ``prefetch`` is ignored if set.
+        :type stream: bool
+        :param parse_mode: Parsing of the records, validated models,
+         lazily validated records, unvalidated models or plain dicts,
+         client default if not set.
+        :type parse_mode: Optional[ParseMode]
+        :param workers: Number of threads consuming the records while the
+         next records are fetched, records are consumed by the calling
+         thread if 0. Errors raised by ``consumer`` are then collected in
+         the response instead of stopping the consumption.
+        :type workers: int
+        :param queue_size: Maximum number of records fetched ahead of the
+         consumers, fetching waits while the queue is full.
+        :type queue_size: int
+        :param ordered: Consume the records one at a time in their order
+         by a single worker.
+        :type ordered: bool
+        :param checkpoint: Store of the position of the consumption, saved
+         once all the records of a page are consumed, nothing is saved
+         if not set.
+        :type checkpoint: Optional[CheckpointStore]
+        :param resume_from: Position to resume the consumption from
+         (ie: ``checkpoint.load()``), the filters of the first call are
+         carried by its ``next_link``.
+        :type resume_from: Optional[Checkpoint]
+        :param shards: Splitting of the search in time windows of roughly
+         equal volume fetched concurrently, the records of a window are
+         consumed after those of the previous windows if ``ordered`` is
+         set and as soon as fetched otherwise. Up to ``prefetch`` pages
+         (at least one) of every window are fetched ahead of the consumer.
+         Pages are not streamed and ``checkpoint`` and ``resume_from`` do
+         not apply. The search is sent over the whole range if not set.
+        :type shards: Optional[ShardPolicy]
+        :param slim: Parse the records with a model validating only the
+         selected fields (see :func:`~pytmv1.project`), faster on large
+         pages but the records are not instances of the activity model
+         and lack the other fields.
+        :type slim: bool
         :rtype: Result[ConsumeLinkableResp]:
         """
+        params: Dict[str, str] = utils.build_activity_request(
+            start_time,
+            end_time,
+            select_fields(EndpointActivity, select),
+            top,
+            SearchMode.DEFAULT,
+        )
+        headers: Dict[str, str] = utils.activity_query(op, **fields)
+        if shards:
+            return self._core.send_sharded(
+                project_linkable(
+                    GetEndpointActivityDataResp, select if slim else None
+                ),
+                GetEndpointActivityDataCountResp,
+                Api.GET_ENDPOINT_ACTIVITY_DATA,
+                consumer,
+                shards,
+                prefetch,
+                parse_mode,
+                workers,
+                queue_size,
+                ordered,
+                params=params,
+                headers=headers,
+            )
         return self._core.send_linkable(
-            GetEndpointActivityDataResp,
+            project_linkable(
+                GetEndpointActivityDataResp, select if slim else None
+            ),
             Api.GET_ENDPOINT_ACTIVITY_DATA,
             consumer,
-            params=utils.build_activity_request(
-                start_time,
-                end_time,
-                select,
-                top,
-                SearchMode.DEFAULT,
-            ),
-            headers=utils.activity_query(op, **fields),
+            prefetch,
+            stream,
+            parse_mode,
+            workers,
+            queue_size,
+            ordered,
+            checkpoint,
+            resume_from,
+            params=params,
+            headers=headers,
         )
 
     def consume_endpoint_data(
@@ -323,6 +608,14 @@ class Client:
         consumer: Callable[[Endpoint], None],
         op: QueryOp,
         *values: str,
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+        workers: int = 0,
+        queue_size: int = 1000,
+        ordered: bool = False,
+        checkpoint: Optional[CheckpointStore] = None,
+        resume_from: Optional[Checkpoint] = None,
     ) -> Result[ConsumeLinkableResp]:
         """Retrieves and consume endpoints.
 
@@ -333,39 +626,175 @@ class Client:
         :param values: Agent guid, login account, endpoint name, ip address,
         mac address, operating system, product code.
         :type values: Tuple[str, ...]
+        :param prefetch: Number of pages fetched in background
+         while the current page is consumed, disabled if 0.
+        :type prefetch: int
+        :param stream: Parse records one at a time while the page is
+         downloaded instead of loading the whole page in memory,
+         ``prefetch`` is ignored if set.
+        :type stream: bool
+        :param parse_mode: Parsing of the records, validated models,
+         lazily validated records, unvalidated models or plain dicts,
+         client default if not set.
+        :type parse_mode: Optional[ParseMode]
+        :param workers: Number of threads consuming the records while the
+         next records are fetched, records are consumed by the calling
+         thread if 0. Errors raised by ``consumer`` are then collected in
+         the response instead of stopping the consumption.
+        :type workers: int
+        :param queue_size: Maximum number of records fetched ahead of the
+         consumers, fetching waits while the queue is full.
+        :type queue_size: int
+        :param ordered: Consume the records one at a time in their order
+         by a single worker.
+        :type ordered: bool
+        :param checkpoint: Store of the position of the consumption, saved
+         once all the records of a page are consumed, nothing is saved
+         if not set.
+        :type checkpoint: Optional[CheckpointStore]
+        :param resume_from: Position to resume the consumption from
+         (ie: ``checkpoint.load()``), the filters of the first call are
+         carried by its ``next_link``.
+        :type resume_from: Optional[Checkpoint]
         :rtype: Result[ConsumeLinkableResp]:
         """
         return self._core.send_linkable(
             GetEndpointDataResp,
             Api.GET_ENDPOINT_DATA,
             consumer,
+            prefetch,
+            stream,
+            parse_mode,
+            workers,
+            queue_size,
+            ordered,
+            checkpoint,
+            resume_from,
             headers=utils.endpoint_query(op, *values),
         )
 
     def consume_exception_list(
-        self, consumer: Callable[[ExceptionObject], None]
+        self,
+        consumer: Callable[[ExceptionObject], None],
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+        workers: int = 0,
+        queue_size: int = 1000,
+        ordered: bool = False,
+        checkpoint: Optional[CheckpointStore] = None,
+        resume_from: Optional[Checkpoint] = None,
     ) -> Result[ConsumeLinkableResp]:
         """Retrieves and consume exception objects.
 
         :param consumer: Function which will consume every record in result.
         :type consumer: Callable[[ExceptionObject], None]
+        :param prefetch: Number of pages fetched in background
+         while the current page is consumed, disabled if 0.
+        :type prefetch: int
+        :param stream: Parse records one at a time while the page is
+         downloaded instead of loading the whole page in memory,
+         ``prefetch`` is ignored if set.
+        :type stream: bool
+        :param parse_mode: Parsing of the records, validated models,
+         lazily validated records, unvalidated models or plain dicts,
+         client default if not set.
+        :type parse_mode: Optional[ParseMode]
+        :param workers: Number of threads consuming the records while the
+         next records are fetched, records are consumed by the calling
+         thread if 0. Errors raised by ``consumer`` are then collected in
+         the response instead of stopping the consumption.
+        :type workers: int
+        :param queue_size: Maximum number of records fetched ahead of the
+         consumers, fetching waits while the queue is full.
+        :type queue_size: int
+        :param ordered: Consume the records one at a time in their order
+         by a single worker.
+        :type ordered: bool
+        :param checkpoint: Store of the position of the consumption, saved
+         once all the records of a page are consumed, nothing is saved
+         if not set.
+        :type checkpoint: Optional[CheckpointStore]
+        :param resume_from: Position to resume the consumption from
+         (ie: ``checkpoint.load()``), the filters of the first call are
+         carried by its ``next_link``.
+        :type resume_from: Optional[Checkpoint]
         :rtype: Result[ConsumeLinkableResp]:
         """
         return self._core.send_linkable(
-            GetExceptionListResp, Api.GET_EXCEPTION_LIST, consumer
+            GetExceptionListResp,
+            Api.GET_EXCEPTION_LIST,
+            consumer,
+            prefetch,
+            stream,
+            parse_mode,
+            workers,
+            queue_size,
+            ordered,
+            checkpoint,
+            resume_from,
         )
 
     def consume_suspicious_list(
-        self, consumer: Callable[[SuspiciousObject], None]
+        self,
+        consumer: Callable[[SuspiciousObject], None],
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+        workers: int = 0,
+        queue_size: int = 1000,
+        ordered: bool = False,
+        checkpoint: Optional[CheckpointStore] = None,
+        resume_from: Optional[Checkpoint] = None,
     ) -> Result[ConsumeLinkableResp]:
         """Retrieves and consume suspicious objects.
 
         :param consumer: Function which will consume every record in result.
         :type consumer: Callable[[SuspiciousObject], None]
+        :param prefetch: Number of pages fetched in background
+         while the current page is consumed, disabled if 0.
+        :type prefetch: int
+        :param stream: Parse records one at a time while the page is
+         downloaded instead of loading the whole page in memory,
+         ``prefetch`` is ignored if set.
+        :type stream: bool
+        :param parse_mode: Parsing of the records, validated models,
+         lazily validated records, unvalidated models or plain dicts,
+         client default if not set.
+        :type parse_mode: Optional[ParseMode]
+        :param workers: Number of threads consuming the records while the
+         next records are fetched, records are consumed by the calling
+         thread if 0. Errors raised by ``consumer`` are then collected in
+         the response instead of stopping the consumption.
+        :type workers: int
+        :param queue_size: Maximum number of records fetched ahead of the
+         consumers, fetching waits while the queue is full.
+        :type queue_size: int
+        :param ordered: Consume the records one at a time in their order
+         by a single worker.
+        :type ordered: bool
+        :param checkpoint: Store of the position of the consumption, saved
+         once all the records of a page are consumed, nothing is saved
+         if not set.
+        :type checkpoint: Optional[CheckpointStore]
+        :param resume_from: Position to resume the consumption from
+         (ie: ``checkpoint.load()``), the filters of the first call are
+         carried by its ``next_link``.
+        :type resume_from: Optional[Checkpoint]
         :rtype: Result[ConsumeLinkableResp]:
         """
         return self._core.send_linkable(
-            GetSuspiciousListResp, Api.GET_SUSPICIOUS_LIST, consumer
+            GetSuspiciousListResp,
+            Api.GET_SUSPICIOUS_LIST,
+            consumer,
+            prefetch,
+            stream,
+            parse_mode,
+            workers,
+            queue_size,
+            ordered,
+            checkpoint,
+            resume_from,
         )
 
     def delete_email_message(
@@ -381,7 +810,7 @@ class Client:
             MultiResp,
             Api.DELETE_EMAIL_MESSAGE,
             json=[
-                task.dict(by_alias=True, exclude_none=True)
+                model_dump(task, by_alias=True, exclude_none=True)
                 for task in messages
             ],
         )
@@ -400,7 +829,7 @@ class Client:
             MultiResp,
             Api.DISABLE_ACCOUNT,
             json=[
-                task.dict(by_alias=True, exclude_none=True)
+                model_dump(task, by_alias=True, exclude_none=True)
                 for task in accounts
             ],
         )
@@ -499,7 +928,7 @@ class Client:
             MultiResp,
             Api.ENABLE_ACCOUNT,
             json=[
-                task.dict(by_alias=True, exclude_none=True)
+                model_dump(task, by_alias=True, exclude_none=True)
                 for task in accounts
             ],
         )
@@ -572,6 +1001,7 @@ class Client:
         select: Optional[List[str]] = None,
         top: int = 500,
         op: QueryOp = QueryOp.AND,
+        slim: bool = False,
         **fields: str,
     ) -> Result[GetEmailActivityDataResp]:
         """Retrieves email activity data in a paginated list
@@ -587,6 +1017,8 @@ class Client:
         :type end_time: Optional[str]
         :param select: List of fields to include in the search results,
         if no fields are specified, the query returns all supported fields.
+        Fields are named after the model (ie: mail_msg_id)
+        or the API (ie: mailMsgId).
         :type select: Optional[List[str]]
         :param top: Number of records fetched per page.
         :type top: int
@@ -595,15 +1027,22 @@ class Client:
         :param fields: Field/value used to filter result (ie: uuid="123456")
         check Vision One API documentation for full list of supported fields.
         :type fields: Dict[str, str]
+        :param slim: Parse the records with a model validating only the
+         selected fields (see :func:`~pytmv1.project`), faster on large
+         pages but the records are not instances of the activity model
+         and lack the other fields.
+        :type slim: bool
         :rtype: Result[GetEmailActivityDataResp]:
         """
         return self._core.send(
-            GetEmailActivityDataResp,
+            project_linkable(
+                GetEmailActivityDataResp, select if slim else None
+            ),
             Api.GET_EMAIL_ACTIVITY_DATA,
             params=utils.build_activity_request(
                 start_time,
                 end_time,
-                select,
+                select_fields(EmailActivity, select),
                 top,
                 SearchMode.DEFAULT,
             ),
@@ -632,6 +1071,8 @@ class Client:
         :type end_time: Optional[str]
         :param select: List of fields to include in the search results,
         if no fields are specified, the query returns all supported fields.
+        Fields are named after the model (ie: mail_msg_id)
+        or the API (ie: mailMsgId).
         :type select: Optional[List[str]]
         :param top: Number of records fetched per page.
         :type top: int
@@ -648,7 +1089,7 @@ class Client:
             params=utils.build_activity_request(
                 start_time,
                 end_time,
-                select,
+                select_fields(EmailActivity, select),
                 top,
                 SearchMode.COUNT_ONLY,
             ),
@@ -662,6 +1103,7 @@ class Client:
         select: Optional[List[str]] = None,
         top: int = 500,
         op: QueryOp = QueryOp.AND,
+        slim: bool = False,
         **fields: str,
     ) -> Result[GetEndpointActivityDataResp]:
         """Retrieves endpoint activity data in a paginated list
@@ -677,6 +1119,8 @@ class Client:
         :type end_time: Optional[str]
         :param select: List of fields to include in the search results,
         if no fields are specified, the query returns all supported fields.
+        Fields are named after the model (ie: endpoint_guid)
+        or the API (ie: endpointGuid).
         :type select: Optional[List[str]]
         :param top: Number of records fetched per page.
         :type top: int
@@ -685,15 +1129,22 @@ class Client:
         :param fields: Field/value used to filter result (ie: dpt="443")
         check Vision One API documentation for full list of supported fields.
         :type fields: Dict[str, str]
+        :param slim: Parse the records with a model validating only the
+         selected fields (see :func:`~pytmv1.project`), faster on large
+         pages but the records are not instances of the activity model
+         and lack the other fields.
+        :type slim: bool
         :rtype: Result[GetEndpointActivityDataResp]:
         """
         return self._core.send(
-            GetEndpointActivityDataResp,
+            project_linkable(
+                GetEndpointActivityDataResp, select if slim else None
+            ),
             Api.GET_ENDPOINT_ACTIVITY_DATA,
             params=utils.build_activity_request(
                 start_time,
                 end_time,
-                select,
+                select_fields(EndpointActivity, select),
                 top,
                 SearchMode.DEFAULT,
             ),
@@ -722,6 +1173,8 @@ class Client:
         :type end_time: Optional[str]
         :param select: List of fields to include in the search results,
         if no fields are specified, the query returns all supported fields.
+        Fields are named after the model (ie: endpoint_guid)
+        or the API (ie: endpointGuid).
         :type select: Optional[List[str]]
         :param top: Number of records fetched per page.
         :type top: int
@@ -738,7 +1191,7 @@ class Client:
             params=utils.build_activity_request(
                 start_time,
                 end_time,
-                select,
+                select_fields(EndpointActivity, select),
                 top,
                 SearchMode.COUNT_ONLY,
             ),
@@ -883,6 +1336,483 @@ class Client:
         """
         return self._core.send_endpoint(Api.ISOLATE_ENDPOINT, *endpoints)
 
+    def iter_alert_list(
+        self,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        max_items: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+    ) -> Paginator[Union[SaeAlert, TiAlert]]:
+        """Lazily iterates over workbench alerts.
+
+        :param start_time: Date that indicates the start of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to 24 hours before the request is made.
+        :type start_time: Optional[str]
+        :param end_time: Date that indicates the end of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to the time the request is made.
+        :type end_time: Optional[str]
+        :param max_items: Stop fetching pages once this number of records
+         has been yielded, all records are yielded if not set.
+        :type max_items: Optional[int]
+        :param max_pages: Stop fetching once this number of pages
+         has been fetched, all pages are fetched if not set.
+        :type max_pages: Optional[int]
+        :param prefetch: Number of pages fetched in background
+         while the current page is consumed, disabled if 0.
+        :type prefetch: int
+        :param stream: Parse records one at a time while the page is
+         downloaded instead of loading the whole page in memory,
+         ``prefetch`` is ignored if set.
+        :type stream: bool
+        :param parse_mode: Parsing of the records, validated models,
+         lazily validated records, unvalidated models or plain dicts,
+         client default if not set.
+        :type parse_mode: Optional[ParseMode]
+        :rtype: Paginator[Union[SaeAlert, TiAlert]]:
+        """
+        return self._core.iter_linkable(
+            GetAlertListResp,
+            Api.GET_ALERT_LIST,
+            max_items,
+            max_pages,
+            prefetch,
+            stream,
+            parse_mode,
+            params=utils.filter_none(
+                {
+                    "startDateTime": start_time,
+                    "endDateTime": end_time,
+                    "orderBy": "createdDateTime desc",
+                }
+            ),
+        )
+
+    def iter_email_activity_batches(
+        self,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        select: Optional[List[str]] = None,
+        top: int = 500,
+        op: QueryOp = QueryOp.AND,
+        max_pages: Optional[int] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        **fields: str,
+    ) -> Iterator[RecordBatch]:
+        """Lazily iterates over email activity data filtered by provided
+        values, yields one :class:`RecordBatch` per page holding the records
+        by column instead of one object per record.
+
+        :param start_time: Date that indicates the start of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to 24 hours before the request is made.
+        :type start_time: Optional[str]
+        :param end_time: Date that indicates the end of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to the time the request is made.
+        :type end_time: Optional[str]
+        :param select: List of fields to include in the search results,
+        if no fields are specified, the query returns all supported fields.
+        Fields are named after the model (ie: mail_msg_id)
+        or the API (ie: mailMsgId).
+        Batches only hold the columns of the selected fields.
+        :type select: Optional[List[str]]
+        :param top: Number of records fetched per page.
+        :type top: int
+        :param op: Operator to apply between fields (ie: uuid=... OR tags=...)
+        :type op: QueryOp
+        :param max_pages: Stop fetching once this number of pages
+         has been fetched, all pages are fetched if not set.
+        :type max_pages: Optional[int]
+        :param prefetch: Number of pages fetched in background
+         while the current batch is consumed, disabled if 0.
+        :type prefetch: int
+        :param stream: Fill the columns while the page is downloaded
+         instead of decoding the whole page first,
+         ``prefetch`` is ignored if set.
+        :type stream: bool
+        :param fields: Field/value used to filter result (ie: uuid="123456")
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :rtype: Iterator[RecordBatch]:
+        """
+        return self._core.iter_batches(
+            GetEmailActivityDataResp,
+            Api.GET_EMAIL_ACTIVITY_DATA,
+            select_fields(EmailActivity, select),
+            max_pages,
+            prefetch,
+            stream,
+            params=utils.build_activity_request(
+                start_time,
+                end_time,
+                select_fields(EmailActivity, select),
+                top,
+                SearchMode.DEFAULT,
+            ),
+            headers=utils.activity_query(op, **fields),
+        )
+
+    def iter_email_activity_data(
+        self,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        select: Optional[List[str]] = None,
+        top: int = 500,
+        op: QueryOp = QueryOp.AND,
+        max_items: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+        slim: bool = False,
+        **fields: str,
+    ) -> Paginator[EmailActivity]:
+        """Lazily iterates over email activity data
+        filtered by provided values.
+
+        :param start_time: Date that indicates the start of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to 24 hours before the request is made.
+        :type start_time: Optional[str]
+        :param end_time: Date that indicates the end of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to the time the request is made.
+        :type end_time: Optional[str]
+        :param select: List of fields to include in the search results,
+        if no fields are specified, the query returns all supported fields.
+        Fields are named after the model (ie: mail_msg_id)
+        or the API (ie: mailMsgId).
+        :type select: Optional[List[str]]
+        :param top: Number of records fetched per page.
+        :type top: int
+        :param op: Operator to apply between fields (ie: uuid=... OR tags=...)
+        :type op: QueryOp
+        :param max_items: Stop fetching pages once this number of records
+         has been yielded, all records are yielded if not set.
+        :type max_items: Optional[int]
+        :param max_pages: Stop fetching once this number of pages
+         has been fetched, all pages are fetched if not set.
+        :type max_pages: Optional[int]
+        :param prefetch: Number of pages fetched in background
+         while the current page is consumed, disabled if 0.
+        :type prefetch: int
+        :param stream: Parse records one at a time while the page is
+         downloaded instead of loading the whole page in memory,
+         ``prefetch`` is ignored if set.
+        :type stream: bool
+        :param parse_mode: Parsing of the records, validated models,
+         lazily validated records, unvalidated models or plain dicts,
+         client default if not set.
+        :type parse_mode: Optional[ParseMode]
+        :param fields: Field/value used to filter result (ie: uuid="123456")
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :param slim: Parse the records with a model validating only the
+         selected fields (see :func:`~pytmv1.project`), faster on large
+         pages but the records are not instances of the activity model
+         and lack the other fields.
+        :type slim: bool
+        :rtype: Paginator[EmailActivity]:
+        """
+        return self._core.iter_linkable(
+            project_linkable(
+                GetEmailActivityDataResp, select if slim else None
+            ),
+            Api.GET_EMAIL_ACTIVITY_DATA,
+            max_items,
+            max_pages,
+            prefetch,
+            stream,
+            parse_mode,
+            params=utils.build_activity_request(
+                start_time,
+                end_time,
+                select_fields(EmailActivity, select),
+                top,
+                SearchMode.DEFAULT,
+            ),
+            headers=utils.activity_query(op, **fields),
+        )
+
+    def iter_endpoint_activity_batches(
+        self,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        select: Optional[List[str]] = None,
+        top: int = 500,
+        op: QueryOp = QueryOp.AND,
+        max_pages: Optional[int] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        **fields: str,
+    ) -> Iterator[RecordBatch]:
+        """Lazily iterates over endpoint activity data filtered by provided
+        values, yields one :class:`RecordBatch` per page holding the records
+        by column instead of one object per record.
+
+        :param start_time: Date that indicates the start of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to 24 hours before the request is made.
+        :type start_time: Optional[str]
+        :param end_time: Date that indicates the end of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to the time the request is made.
+        :type end_time: Optional[str]
+        :param select: List of fields to include in the search results,
+        if no fields are specified, the query returns all supported fields.
+        Fields are named after the model (ie: endpoint_guid)
+        or the API (ie: endpointGuid).
+        Batches only hold the columns of the selected fields.
+        :type select: Optional[List[str]]
+        :param top: Number of records fetched per page.
+        :type top: int
+        :param op: Operator to apply between fields (ie: dpt=... OR src=...)
+        :type op: QueryOp
+        :param max_pages: Stop fetching once this number of pages
+         has been fetched, all pages are fetched if not set.
+        :type max_pages: Optional[int]
+        :param prefetch: Number of pages fetched in background
+         while the current batch is consumed, disabled if 0.
+        :type prefetch: int
+        :param stream: Fill the columns while the page is downloaded
+         instead of decoding the whole page first,
+         ``prefetch`` is ignored if set.
+        :type stream: bool
+        :param fields: Field/value used to filter result (ie: dpt="443")
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :rtype: Iterator[RecordBatch]:
+        """
+        return self._core.iter_batches(
+            GetEndpointActivityDataResp,
+            Api.GET_ENDPOINT_ACTIVITY_DATA,
+            select_fields(EndpointActivity, select),
+            max_pages,
+            prefetch,
+            stream,
+            params=utils.build_activity_request(
+                start_time,
+                end_time,
+                select_fields(EndpointActivity, select),
+                top,
+                SearchMode.DEFAULT,
+            ),
+            headers=utils.activity_query(op, **fields),
+        )
+
+    def iter_endpoint_activity_data(
+        self,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        select: Optional[List[str]] = None,
+        top: int = 500,
+        op: QueryOp = QueryOp.AND,
+        max_items: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+        slim: bool = False,
+        **fields: str,
+    ) -> Paginator[EndpointActivity]:
+        """Lazily iterates over endpoint activity data
+        filtered by provided values.
+
+        :param start_time: Date that indicates the start of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to 24 hours before the request is made.
+        :type start_time: Optional[str]
+        :param end_time: Date that indicates the end of the data retrieval
+        time range (yyyy-MM-ddThh:mm:ssZ in UTC).
+        Defaults to the time the request is made.
+        :type end_time: Optional[str]
+        :param select: List of fields to include in the search results,
+        if no fields are specified, the query returns all supported fields.
+        Fields are named after the model (ie: endpoint_guid)
+        or the API (ie: endpointGuid).
+        :type select: Optional[List[str]]
+        :param top: Number of records fetched per page.
+        :type top: int
+        :param op: Operator to apply between fields (ie: dpt=... OR src=...)
+        :type op: QueryOp
+        :param max_items: Stop fetching pages once this number of records
+         has been yielded, all records are yielded if not set.
+        :type max_items: Optional[int]
+        :param max_pages: Stop fetching once this number of pages
+         has been fetched, all pages are fetched if not set.
+        :type max_pages: Optional[int]
+        :param prefetch: Number of pages fetched in background
+         while the current page is consumed, disabled if 0.
+        :type prefetch: int
+        :param stream: Parse records one at a time while the page is
+         downloaded instead of loading the whole page in memory,
+         ``prefetch`` is ignored if set.
+        :type stream: bool
+        :param parse_mode: Parsing of the records, validated models,
+         lazily validated records, unvalidated models or plain dicts,
+         client default if not set.
+        :type parse_mode: Optional[ParseMode]
+        :param fields: Field/value used to filter result (ie: dpt="443")
+        check Vision One API documentation for full list of supported fields.
+        :type fields: Dict[str, str]
+        :param slim: Parse the records with a model validating only the
+         selected fields (see :func:`~pytmv1.project`), faster on large
+         pages but the records are not instances of the activity model
+         and lack the other fields.
+        :type slim: bool
+        :rtype: Paginator[EndpointActivity]:
+        """
+        return self._core.iter_linkable(
+            project_linkable(
+                GetEndpointActivityDataResp, select if slim else None
+            ),
+            Api.GET_ENDPOINT_ACTIVITY_DATA,
+            max_items,
+            max_pages,
+            prefetch,
+            stream,
+            parse_mode,
+            params=utils.build_activity_request(
+                start_time,
+                end_time,
+                select_fields(EndpointActivity, select),
+                top,
+                SearchMode.DEFAULT,
+            ),
+            headers=utils.activity_query(op, **fields),
+        )
+
+    def iter_endpoint_data(
+        self,
+        op: QueryOp,
+        *values: str,
+        max_items: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+    ) -> Paginator[Endpoint]:
+        """Lazily iterates over endpoints.
+
+        :param op: Query operator to apply.
+        :type op: QueryOp
+        :param values: Agent guid, login account, endpoint name, ip address,
+        mac address, operating system, product code.
+        :type values: Tuple[str, ...]
+        :param max_items: Stop fetching pages once this number of records
+         has been yielded, all records are yielded if not set.
+        :type max_items: Optional[int]
+        :param max_pages: Stop fetching once this number of pages
+         has been fetched, all pages are fetched if not set.
+        :type max_pages: Optional[int]
+        :param prefetch: Number of pages fetched in background
+         while the current page is consumed, disabled if 0.
+        :type prefetch: int
+        :param stream: Parse records one at a time while the page is
+         downloaded instead of loading the whole page in memory,
+         ``prefetch`` is ignored if set.
+        :type stream: bool
+        :param parse_mode: Parsing of the records, validated models,
+         lazily validated records, unvalidated models or plain dicts,
+         client default if not set.
+        :type parse_mode: Optional[ParseMode]
+        :rtype: Paginator[Endpoint]:
+        """
+        return self._core.iter_linkable(
+            GetEndpointDataResp,
+            Api.GET_ENDPOINT_DATA,
+            max_items,
+            max_pages,
+            prefetch,
+            stream,
+            parse_mode,
+            headers=utils.endpoint_query(op, *values),
+        )
+
+    def iter_exception_list(
+        self,
+        max_items: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+    ) -> Paginator[ExceptionObject]:
+        """Lazily iterates over exception objects.
+
+        :param max_items: Stop fetching pages once this number of records
+         has been yielded, all records are yielded if not set.
+        :type max_items: Optional[int]
+        :param max_pages: Stop fetching once this number of pages
+         has been fetched, all pages are fetched if not set.
+        :type max_pages: Optional[int]
+        :param prefetch: Number of pages fetched in background
+         while the current page is consumed, disabled if 0.
+        :type prefetch: int
+        :param stream: Parse records one at a time while the page is
+         downloaded instead of loading the whole page in memory,
+         ``prefetch`` is ignored if set.
+        :type stream: bool
+        :param parse_mode: Parsing of the records, validated models,
+         lazily validated records, unvalidated models or plain dicts,
+         client default if not set.
+        :type parse_mode: Optional[ParseMode]
+        :rtype: Paginator[ExceptionObject]:
+        """
+        return self._core.iter_linkable(
+            GetExceptionListResp,
+            Api.GET_EXCEPTION_LIST,
+            max_items,
+            max_pages,
+            prefetch,
+            stream,
+            parse_mode,
+        )
+
+    def iter_suspicious_list(
+        self,
+        max_items: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+    ) -> Paginator[SuspiciousObject]:
+        """Lazily iterates over suspicious objects.
+
+        :param max_items: Stop fetching pages once this number of records
+         has been yielded, all records are yielded if not set.
+        :type max_items: Optional[int]
+        :param max_pages: Stop fetching once this number of pages
+         has been fetched, all pages are fetched if not set.
+        :type max_pages: Optional[int]
+        :param prefetch: Number of pages fetched in background
+         while the current page is consumed, disabled if 0.
+        :type prefetch: int
+        :param stream: Parse records one at a time while the page is
+         downloaded instead of loading the whole page in memory,
+         ``prefetch`` is ignored if set.
+        :type stream: bool
+        :param parse_mode: Parsing of the records, validated models,
+         lazily validated records, unvalidated models or plain dicts,
+         client default if not set.
+        :type parse_mode: Optional[ParseMode]
+        :rtype: Paginator[SuspiciousObject]:
+        """
+        return self._core.iter_linkable(
+            GetSuspiciousListResp,
+            Api.GET_SUSPICIOUS_LIST,
+            max_items,
+            max_pages,
+            prefetch,
+            stream,
+            parse_mode,
+        )
+
     def quarantine_email_message(
         self, *messages: Union[EmailMessageUIdTask, EmailMessageIdTask]
     ) -> MultiResult[MultiResp]:
@@ -896,7 +1826,7 @@ class Client:
             MultiResp,
             Api.QUARANTINE_EMAIL_MESSAGE,
             json=[
-                task.dict(by_alias=True, exclude_none=True)
+                model_dump(task, by_alias=True, exclude_none=True)
                 for task in messages
             ],
         )
@@ -962,7 +1892,7 @@ class Client:
             MultiResp,
             Api.RESET_PASSWORD,
             json=[
-                task.dict(by_alias=True, exclude_none=True)
+                model_dump(task, by_alias=True, exclude_none=True)
                 for task in accounts
             ],
         )
@@ -992,7 +1922,7 @@ class Client:
             MultiResp,
             Api.RESTORE_EMAIL_MESSAGE,
             json=[
-                task.dict(by_alias=True, exclude_none=True)
+                model_dump(task, by_alias=True, exclude_none=True)
                 for task in messages
             ],
         )
@@ -1010,10 +1940,73 @@ class Client:
             MultiResp,
             Api.RUN_CUSTOM_SCRIPT,
             json=[
-                task.dict(by_alias=True, exclude_none=True) for task in scripts
+                model_dump(task, by_alias=True, exclude_none=True)
+                for task in scripts
             ],
         )
 
+    def save_sandbox_analysis_result(
+        self,
+        submit_id: str,
+        destination: Destination,
+        poll: bool = True,
+        poll_time_sec: float = 1800,
+    ) -> Result[SaveFileResp]:
+        """Saves the analysis results of the specified object as PDF.
+        The file is written in chunks while it is downloaded instead of
+        being loaded in memory.
+
+        :param submit_id: Sandbox submission id.
+        :type submit_id: str
+        :param destination: Path or binary file object to write to.
+        :type destination: Union[str, os.PathLike[str], IO[bytes]]
+        :param poll: If we should wait until the task is finished before
+        to return the result.
+        :type poll: bool
+        :param poll_time_sec: Maximum time to wait for the result to
+         be available.
+        :type poll_time_sec: float
+        :rtype: Result[SaveFileResp]:
+        """
+        return self._core.send_sandbox_file(
+            Api.DOWNLOAD_SANDBOX_ANALYSIS_RESULT,
+            submit_id,
+            destination,
+            poll,
+            poll_time_sec,
+        )
+
+    def save_sandbox_investigation_package(
+        self,
+        submit_id: str,
+        destination: Destination,
+        poll: bool = True,
+        poll_time_sec: float = 1800,
+    ) -> Result[SaveFileResp]:
+        """Saves the Investigation Package of the specified object.
+        The file is written in chunks while it is downloaded instead of
+        being loaded in memory.
+
+        :param submit_id: Sandbox submission id.
+        :type submit_id: str
+        :param destination: Path or binary file object to write to.
+        :type destination: Union[str, os.PathLike[str], IO[bytes]]
+        :param poll: If we should wait until the task is finished before
+        to return the result.
+        :type poll: bool
+        :param poll_time_sec: Maximum time to wait for the result to
+         be available.
+        :type poll_time_sec: float
+        :rtype: Result[SaveFileResp]:
+        """
+        return self._core.send_sandbox_file(
+            Api.DOWNLOAD_SANDBOX_INVESTIGATION_PACKAGE,
+            submit_id,
+            destination,
+            poll,
+            poll_time_sec,
+        )
+
     def sign_out_account(
         self, *accounts: AccountTask
     ) -> MultiResult[MultiResp]:
@@ -1027,14 +2020,14 @@ class Client:
             MultiResp,
             Api.SIGN_OUT_ACCOUNT,
             json=[
-                task.dict(by_alias=True, exclude_none=True)
+                model_dump(task, by_alias=True, exclude_none=True)
                 for task in accounts
             ],
         )
 
     def submit_file_to_sandbox(
         self,
-        file: bytes,
+        file: Upload,
         file_name: str,
         document_password: Optional[str] = None,
         archive_password: Optional[str] = None,
@@ -1042,8 +2035,9 @@ class Client:
     ) -> Result[SubmitFileToSandboxResp]:
         """Submits a file to the sandbox for analysis.
 
-        :param file: Raw content in bytes.
-        :type file: bytes
+        :param file: Raw content in bytes, path or seekable binary file
+         object, the file is streamed while it is uploaded.
+        :type file: Union[bytes, str, os.PathLike[str], IO[bytes]]
         :param file_name: Name of the file.
         :type file_name: str
         :param document_password: Password used to
@@ -1057,14 +2051,13 @@ class Client:
         :type arguments: Optional[str]
         :rtype: Result[SubmitFileToSandboxResp]:
         """
-        return self._core.send(
-            SubmitFileToSandboxResp,
+        return self._core.send_file(
             Api.SUBMIT_FILE_TO_SANDBOX,
-            HttpMethod.POST,
-            data=utils.build_sandbox_file_request(
+            file,
+            file_name,
+            utils.build_sandbox_file_request(
                 document_password, archive_password, arguments
             ),
-            files={"file": (file_name, file, "application/octet-stream")},
         )
 
     def submit_urls_to_sandbox(self, *urls: str) -> MultiResult[MultiUrlResp]:
@@ -1093,6 +2086,39 @@ class Client:
             Api.TERMINATE_ENDPOINT_PROCESS, *processes
         )
 
+    def wait_all(
+        self,
+        *tasks: Watchable,
+        submit_ids: Iterable[str] = (),
+        class_: Type[BaseTaskResp] = BaseTaskResp,
+        workers: int = 4,
+        poll_time_sec: float = 1800,
+    ) -> TaskWatcher:
+        """Waits for many response tasks and sandbox submissions at once,
+        results are yielded as ``(id, result)`` as soon as each task is
+        finished.
+
+        :param tasks: Task ids or results of calls creating response
+         tasks or sandbox submissions (ie: isolate_endpoint).
+        :type tasks: Union[str, MultiResult[MultiResp],
+         MultiResult[MultiUrlResp]]
+        :param submit_ids: Sandbox submission ids.
+        :type submit_ids: Iterable[str]
+        :param class_: Expected task result class.
+        :type class_: Type[BaseTaskResp]
+        :param workers: Maximum number of status requests in flight.
+        :type workers: int
+        :param poll_time_sec: Maximum time to wait for each result
+         to be available.
+        :type poll_time_sec: float
+        :rtype: TaskWatcher
+        """
+        watcher = self._core.watch(workers, poll_time_sec)
+        watcher.add(*tasks, class_=class_)
+        for submit_id in submit_ids:
+            watcher.add_submission(submit_id)
+        return watcher
+
     def check_connectivity(self) -> Result[ConnectivityResp]:
         """Checks the connection to the API service
         and verifies if your authentication token is valid.
@@ -0,0 +1,351 @@
+from __future__ import annotations
+
+import inspect
+import json
+import logging
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import closing
+from dataclasses import dataclass
+from functools import partial
+from logging import Logger
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .model.responses import BaseLinkableResp, C
+from .paginator import _aiter_items
+
+log: Logger = logging.getLogger(__name__)
+
+Entry = Tuple[Any, Callable[[], None]]
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """Position of a consume call, saved once all the records of a page
+    are consumed.
+
+    :param next_link: Link of the page following the last consumed page,
+     all pages are consumed if not set.
+    :type next_link: Optional[str]
+    :param total_consumed: Number of records consumed since the first
+     call, resumed calls included.
+    :type total_consumed: int
+    """
+
+    next_link: Optional[str]
+    total_consumed: int = 0
+
+    @property
+    def completed(self) -> bool:
+        """Checks if all pages are consumed.
+
+        :rtype: bool
+        """
+        return self.next_link is None
+
+
+class CheckpointStore(ABC):
+    """Persistence of the last :class:`Checkpoint` of a consume call.
+
+    Subclass it and implement :meth:`load`, :meth:`save` and
+    :meth:`clear` to plug another storage, :meth:`save` may be called
+    from the threads consuming the records.
+    """
+
+    @abstractmethod
+    def load(self) -> Optional[Checkpoint]:
+        """Reads the last checkpoint.
+
+        :rtype: Optional[Checkpoint]
+        """
+
+    @abstractmethod
+    def save(self, checkpoint: Checkpoint) -> None:
+        """Replaces the last checkpoint.
+
+        :param checkpoint: Checkpoint to save.
+        :type checkpoint: Checkpoint
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Deletes the last checkpoint."""
+
+
+class FileCheckpointStore(CheckpointStore):
+    """Checkpoint saved to a JSON file, the file is replaced atomically
+    so that it holds either the previous or the new checkpoint.
+
+    :param path: Path of the file.
+    :type path: Union[str, os.PathLike[str]]
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]):
+        self._path: str = os.fspath(path)
+
+    def load(self) -> Optional[Checkpoint]:
+        try:
+            with open(self._path, "rb") as file:
+                data: Any = json.load(file)
+        except FileNotFoundError:
+            return None
+        return Checkpoint(data["nextLink"], data["totalConsumed"])
+
+    def save(self, checkpoint: Checkpoint) -> None:
+        temp_path: str = self._path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "nextLink": checkpoint.next_link,
+                    "totalConsumed": checkpoint.total_consumed,
+                },
+                file,
+            )
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self._path)
+
+    def clear(self) -> None:
+        try:
+            os.remove(self._path)
+        except FileNotFoundError:
+            pass
+
+
+class SqliteCheckpointStore(CheckpointStore):
+    """Checkpoints saved to a SQLite database, one row per name so that
+    several exports share a database.
+
+    :param path: Path of the database.
+    :type path: Union[str, os.PathLike[str]]
+    :param name: Name of the checkpoint (ie: name of the export).
+    :type name: str
+    """
+
+    def __init__(
+        self, path: Union[str, "os.PathLike[str]"], name: str = "default"
+    ):
+        self._path: str = os.fspath(path)
+        self._name = name
+        self._execute(
+            "CREATE TABLE IF NOT EXISTS pytmv1_checkpoint ("
+            "name TEXT PRIMARY KEY, next_link TEXT, "
+            "total_consumed INTEGER NOT NULL)"
+        )
+
+    def load(self) -> Optional[Checkpoint]:
+        row: Any = self._execute(
+            (
+                "SELECT next_link, total_consumed FROM pytmv1_checkpoint "
+                "WHERE name = ?"
+            ),
+            self._name,
+        )
+        return Checkpoint(row[0], row[1]) if row else None
+
+    def save(self, checkpoint: Checkpoint) -> None:
+        self._execute(
+            (
+                "INSERT OR REPLACE INTO pytmv1_checkpoint "
+                "(name, next_link, total_consumed) VALUES (?, ?, ?)"
+            ),
+            self._name,
+            checkpoint.next_link,
+            checkpoint.total_consumed,
+        )
+
+    def clear(self) -> None:
+        self._execute(
+            "DELETE FROM pytmv1_checkpoint WHERE name = ?", self._name
+        )
+
+    def _execute(self, sql: str, *params: Any) -> Any:
+        with closing(sqlite3.connect(self._path)) as connection:
+            with connection:
+                return connection.execute(sql, params).fetchone()
+
+
+class PageTracker:
+    """Saves a :class:`Checkpoint` once all the records of a page, and
+    of the pages before it, are consumed. Records may be consumed out of
+    order by several workers, each record is acknowledged once consumed.
+
+    :param store: Store of the checkpoints.
+    :type store: CheckpointStore
+    :param total_consumed: Number of records consumed by previous calls.
+    :type total_consumed: int
+    """
+
+    def __init__(self, store: CheckpointStore, total_consumed: int = 0):
+        self._store = store
+        self._total = total_consumed
+        self._lock = threading.Lock()
+        self._pages: Deque[_Page] = deque()
+
+    def entries(self, pages: Iterable[BaseLinkableResp[C]]) -> Iterator[Entry]:
+        """Yields the records of ``pages`` with the function
+        acknowledging their consumption.
+
+        :param pages: Pages to consume.
+        :type pages: Iterable[BaseLinkableResp[C]]
+        :rtype: Iterator[Tuple[C, Callable[[], None]]]
+        """
+        for page in pages:
+            current: _Page = self._open(page)
+            for item in page.items:
+                yield item, self._add(current)
+            self._seal(current, page)
+
+    async def async_entries(
+        self, pages: AsyncIterable[BaseLinkableResp[C]]
+    ) -> AsyncIterator[Entry]:
+        """Asynchronous counterpart of :meth:`entries`.
+
+        :param pages: Pages to consume.
+        :type pages: AsyncIterable[BaseLinkableResp[C]]
+        :rtype: AsyncIterator[Tuple[C, Callable[[], None]]]
+        """
+        async for page in pages:
+            current: _Page = self._open(page)
+            async for item in _aiter_items(page):
+                yield item, self._add(current)
+            self._seal(current, page)
+
+    def items(self, pages: Iterable[BaseLinkableResp[C]]) -> Iterator[C]:
+        """Yields the records of ``pages`` to a single consumer, a record
+        is consumed once the next one is requested.
+
+        :param pages: Pages to consume.
+        :type pages: Iterable[BaseLinkableResp[C]]
+        :rtype: Iterator[C]
+        """
+        for page in pages:
+            current: _Page = self._open(page)
+            for item in page.items:
+                yield item
+                current.count += 1
+            self._seal(current, page)
+
+    async def async_items(
+        self, pages: AsyncIterable[BaseLinkableResp[C]]
+    ) -> AsyncIterator[C]:
+        """Asynchronous counterpart of :meth:`items`.
+
+        :param pages: Pages to consume.
+        :type pages: AsyncIterable[BaseLinkableResp[C]]
+        :rtype: AsyncIterator[C]
+        """
+        async for page in pages:
+            current: _Page = self._open(page)
+            async for item in _aiter_items(page):
+                yield item
+                current.count += 1
+            self._seal(current, page)
+
+    @staticmethod
+    def wrap(consumer: Callable[[C], None]) -> Callable[[Entry], None]:
+        """Adapts a consumer of records to the entries of
+        :meth:`entries`, a failed record is acknowledged too.
+
+        :param consumer: Consumer of the records.
+        :type consumer: Callable[[C], None]
+        :rtype: Callable[[Tuple[C, Callable[[], None]]], None]
+        """
+
+        def consume(entry: Entry) -> None:
+            item, done = entry
+            try:
+                consumer(item)
+            finally:
+                done()
+
+        return consume
+
+    @staticmethod
+    def async_wrap(
+        consumer: Callable[[C], Optional[Awaitable[None]]]
+    ) -> Callable[[Entry], Awaitable[None]]:
+        """Asynchronous counterpart of :meth:`wrap`.
+
+        :param consumer: Consumer of the records.
+        :type consumer: Callable[[C], Optional[Awaitable[None]]]
+        :rtype: Callable[[Tuple[C, Callable[[], None]]], Awaitable[None]]
+        """
+
+        async def consume(entry: Entry) -> None:
+            item, done = entry
+            try:
+                consumed = consumer(item)
+                if inspect.isawaitable(consumed):
+                    await consumed
+            finally:
+                done()
+
+        return consume
+
+    def _add(self, page: _Page) -> Callable[[], None]:
+        with self._lock:
+            page.pending += 1
+            page.count += 1
+        return partial(self._done, page)
+
+    def _done(self, page: _Page) -> None:
+        with self._lock:
+            page.pending -= 1
+            self._flush()
+
+    def _flush(self) -> None:
+        checkpoint: Optional[Checkpoint] = None
+        while self._pages and self._pages[0].consumed:
+            page: _Page = self._pages.popleft()
+            self._total += page.count
+            checkpoint = Checkpoint(page.next_link, self._total)
+        if checkpoint:
+            log.debug(
+                "Saving checkpoint [Total=%s, NextLink=%s]",
+                checkpoint.total_consumed,
+                checkpoint.next_link,
+            )
+            self._store.save(checkpoint)
+
+    def _open(self, page: BaseLinkableResp[C]) -> _Page:
+        opened: _Page = _Page()
+        with self._lock:
+            self._pages.append(opened)
+        return opened
+
+    def _seal(self, page: _Page, resp: BaseLinkableResp[C]) -> None:
+        # A streamed page only reads its link once its items are read
+        with self._lock:
+            page.next_link = resp.next_link
+            page.sealed = True
+            self._flush()
+
+
+class _Page:
+    __slots__ = ("next_link", "count", "pending", "sealed")
+
+    def __init__(self) -> None:
+        self.next_link: Optional[str] = None
+        self.count: int = 0
+        self.pending: int = 0
+        self.sealed: bool = False
+
+    @property
+    def consumed(self) -> bool:
+        return self.sealed and not self.pending
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Union
+
+
+class JsonCodec:
+    """Encodes the JSON bodies of the requests sent to Vision One and
+    decodes the JSON bodies of their responses.
+
+    This codec uses the standard library, subclass it and override
+    :meth:`dumps` and :meth:`loads` to plug another JSON library,
+    :meth:`loads` raises :class:`json.JSONDecodeError` (or a subclass)
+    so that malformed responses fail the call.
+    """
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encodes an object to a UTF-8 JSON document.
+
+        :param obj: Object to encode.
+        :type obj: Any
+        :rtype: bytes
+        """
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decodes a JSON document.
+
+        :param data: JSON document.
+        :type data: Union[bytes, str]
+        :raises json.JSONDecodeError: If the document is malformed.
+        :rtype: Any
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """Codec using `orjson <https://github.com/ijl/orjson>`_,
+    several times faster than the standard library.
+
+    :raises ImportError: If orjson is not installed.
+    """
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._dumps: Callable[[Any], bytes] = orjson.dumps
+        self._loads: Callable[[Union[bytes, str]], Any] = orjson.loads
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._loads(data)
+
+
+def default_codec() -> JsonCodec:
+    """Codec used when none is configured, orjson if it is installed
+    and the standard library otherwise."""
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        return JsonCodec()
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, Tuple, Type
+
+from pydantic import BaseModel as PydanticBaseModel
+
+from .compat import model_fields, parse_obj
+from .model.commons import (
+    EmailActivity,
+    Endpoint,
+    EndpointActivity,
+    SaeAlert,
+    TiAlert,
+)
+
+
+class CompactRecord:
+    """Memory compact copy of a model, see :func:`compact_type`.
+
+    Values are held in ``__slots__`` named after the fields of the model,
+    without instance ``__dict__`` nor set of fields. Sub-models are
+    converted to compact records and lists to tuples, empty lists share
+    the empty tuple.
+    """
+
+    __slots__: Tuple[str, ...] = ()
+
+    _model: ClassVar[Type[PydanticBaseModel]]
+    _aliases: ClassVar[Tuple[str, ...]]
+
+    def __init__(self, *values: Any):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    def __getattr__(self, name: str) -> Any:
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other) and self._values() == (
+            other._values() if isinstance(other, CompactRecord) else ()
+        )
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return _rebuild, (self._model, self._values())
+
+    def __repr__(self) -> str:
+        values: str = ", ".join(
+            f"{name}={value!r}"
+            for name, value in zip(self.__slots__, self._values())
+            if value is not None
+        )
+        return f"{type(self).__name__}({values})"
+
+    @classmethod
+    def from_model(cls, model: PydanticBaseModel) -> CompactRecord:
+        """Copies a model to a compact record.
+
+        :param model: Model of the type of this record.
+        :type model: PydanticBaseModel
+        :rtype: CompactRecord
+        """
+        return cls(*(_compact(getattr(model, name)) for name in cls.__slots__))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converts the record to a dict keyed by the API field names,
+        sub-records to dicts and tuples to lists.
+
+        :rtype: Dict[str, Any]
+        """
+        return {
+            alias: _plain(value)
+            for alias, value in zip(self._aliases, self._values())
+        }
+
+    def to_model(self) -> PydanticBaseModel:
+        """Validates the record back to its model.
+
+        :rtype: PydanticBaseModel
+        """
+        return parse_obj(self._model, self.to_dict())
+
+    def _values(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+
+@lru_cache(maxsize=None)
+def compact_type(class_: Type[PydanticBaseModel]) -> Type[CompactRecord]:
+    """Creates the compact record type of a model, one type is created
+    per model (ie: ``compact_type(EndpointActivity)``).
+
+    :param class_: Model to compact.
+    :type class_: Type[PydanticBaseModel]
+    :rtype: Type[CompactRecord]
+    """
+    return type(
+        f"{class_.__name__}Record",
+        (CompactRecord,),
+        {
+            "__slots__": tuple(model_fields(class_)),
+            "__module__": __name__,
+            "_model": class_,
+            "_aliases": tuple(
+                field.alias for field in model_fields(class_).values()
+            ),
+        },
+    )
+
+
+def compact(model: PydanticBaseModel) -> CompactRecord:
+    """Copies a model to a record of its compact type.
+
+    :param model: Model to compact.
+    :type model: PydanticBaseModel
+    :rtype: CompactRecord
+    """
+    return compact_type(type(model)).from_model(model)
+
+
+EmailActivityRecord: Type[CompactRecord] = compact_type(EmailActivity)
+EndpointActivityRecord: Type[CompactRecord] = compact_type(EndpointActivity)
+EndpointRecord: Type[CompactRecord] = compact_type(Endpoint)
+SaeAlertRecord: Type[CompactRecord] = compact_type(SaeAlert)
+TiAlertRecord: Type[CompactRecord] = compact_type(TiAlert)
+
+
+def _compact(value: Any) -> Any:
+    if isinstance(value, PydanticBaseModel):
+        return compact(value)
+    if isinstance(value, list):
+        return tuple(_compact(item) for item in value) if value else ()
+    return value
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, CompactRecord):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [_plain(item) for item in value]
+    return value
+
+
+def _rebuild(
+    class_: Type[PydanticBaseModel], values: Tuple[Any, ...]
+) -> CompactRecord:
+    return compact_type(class_)(*values)
@@ -0,0 +1,196 @@
+"""Pydantic v1 and v2 support.
+
+Models and parsing go through these helpers so that the library uses the
+native API of the installed pydantic version, the v2 validator is used as
+soon as pydantic v2 is installed.
+"""
+from __future__ import annotations
+
+import copy
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    NamedTuple,
+    Set,
+    Type,
+    TypeVar,
+)
+
+import pydantic
+from pydantic import BaseModel as PydanticBaseModel
+from pydantic.version import VERSION as PYDANTIC_VERSION
+
+if TYPE_CHECKING or not PYDANTIC_VERSION.startswith("2."):
+    from pydantic.generics import GenericModel as GenericModel
+else:
+    GenericModel = PydanticBaseModel
+
+M = TypeVar("M", bound=PydanticBaseModel)
+
+PYDANTIC_V2: bool = PYDANTIC_VERSION.startswith("2.")
+
+
+class FieldSpec(NamedTuple):
+    alias: str
+    required: bool
+    annotation: Any
+
+
+def construct(class_: Type[M], **values: Any) -> M:
+    """Creates a model from trusted values without validation."""
+    if PYDANTIC_V2:
+        model: M = getattr(class_, "model_construct")(**values)
+        return model
+    return class_.construct(**values)
+
+
+def fields_set(model: PydanticBaseModel) -> Set[str]:
+    """Names of the fields explicitly set on a model."""
+    if PYDANTIC_V2:
+        names: Set[str] = getattr(model, "model_fields_set")
+        return names
+    return model.__fields_set__
+
+
+def has_pre_validators(class_: Type[PydanticBaseModel]) -> bool:
+    """Checks if a model maps its input in a :func:`pre_validator`."""
+    if PYDANTIC_V2:
+        decorators: Any = getattr(class_, "__pydantic_decorators__")
+        return bool(decorators.model_validators)
+    return bool(getattr(class_, "__pre_root_validators__", []))
+
+
+def model_dump(model: PydanticBaseModel, **kwargs: Any) -> Dict[str, Any]:
+    """Converts a model to a dict, accepts the options of ``dict()``."""
+    if PYDANTIC_V2:
+        data: Dict[str, Any] = getattr(model, "model_dump")(**kwargs)
+        return data
+    return model.dict(**kwargs)
+
+
+@lru_cache(maxsize=None)
+def model_fields(class_: Type[PydanticBaseModel]) -> Dict[str, FieldSpec]:
+    """Alias, requirement and declared type of the fields of a model."""
+    if PYDANTIC_V2:
+        return {
+            name: FieldSpec(
+                field.alias or name, field.is_required(), field.annotation
+            )
+            for name, field in getattr(class_, "model_fields").items()
+        }
+    return {
+        name: FieldSpec(field.alias, bool(field.required), field.outer_type_)
+        for name, field in class_.__fields__.items()
+    }
+
+
+def parse_obj(class_: Type[M], obj: Any) -> M:
+    """Validates a decoded JSON object against a model."""
+    if PYDANTIC_V2:
+        model: M = getattr(class_, "model_validate")(obj)
+        return model
+    return class_.parse_obj(obj)
+
+
+def parse_obj_as(type_: Any, obj: Any) -> Any:
+    """Validates a decoded JSON value against any type
+    (ie: ``List[Model]``)."""
+    if PYDANTIC_V2:
+        return _type_adapter(type_).validate_python(obj)
+    return pydantic.parse_obj_as(type_, obj)
+
+
+def pre_validator(func: Callable[..., Any]) -> Any:
+    """Registers ``func(cls, data)`` to map the input of a model
+    before its fields are validated."""
+    if PYDANTIC_V2:
+        return getattr(pydantic, "model_validator")(mode="before")(
+            classmethod(func)
+        )
+    return pydantic.root_validator(pre=True, allow_reuse=True)(func)
+
+
+def subset_model(
+    base: Type[M], class_: Type[PydanticBaseModel], names: Iterable[str]
+) -> Type[M]:
+    """Creates a model deriving from ``base`` with the named fields of
+    ``class_`` declared as in ``class_`` (ie: type, default, alias)."""
+    definitions: Dict[str, Any]
+    if PYDANTIC_V2:
+        infos: Dict[str, Any] = getattr(class_, "model_fields")
+        definitions = {
+            name: (infos[name].annotation, copy.copy(infos[name]))
+            for name in names
+        }
+    else:
+        definitions = {
+            name: (
+                class_.__fields__[name].outer_type_,
+                class_.__fields__[name].field_info,
+            )
+            for name in names
+        }
+    return pydantic.create_model(
+        class_.__name__,
+        __base__=base,
+        __module__=class_.__module__,
+        **definitions,
+    )
+
+
+def to_lower_camel(string: str) -> str:
+    """Alias generator of the models (ie: event_time_d_t -> eventTimeDT)."""
+    camel: str = "".join(word.capitalize() for word in string.split("_"))
+    return camel[:1].lower() + camel[1:]
+
+
+def validate_url(url: str) -> str:
+    """Validates an HTTP(s) URL."""
+    if PYDANTIC_V2:
+        return str(parse_obj_as(pydantic.AnyHttpUrl, url))
+    return str(pydantic.parse_obj_as(pydantic.AnyHttpUrl, url))
+
+
+def validate_field(class_: Type[M], name: str, data: Dict[str, Any]) -> Any:
+    """Validates a single field of a model from the decoded JSON object
+    of the model, the default of the field is returned if it is missing.
+
+    :raises pydantic.ValidationError: If the field is invalid
+     or required and missing.
+    """
+    field: FieldSpec = model_fields(class_)[name]
+    if field.alias not in data:
+        if field.required:
+            parse_obj(class_, data)
+        return _default(class_, name)
+    if PYDANTIC_V2:
+        return _type_adapter(field.annotation).validate_python(
+            data[field.alias]
+        )
+    model_field: Any = class_.__fields__[name]
+    value: Any
+    value, errors = model_field.validate(
+        data[field.alias], {}, loc=field.alias, cls=class_
+    )
+    if errors:
+        raise pydantic.ValidationError([errors], class_)
+    return value
+
+
+def _default(class_: Type[PydanticBaseModel], name: str) -> Any:
+    if PYDANTIC_V2:
+        return copy.deepcopy(
+            getattr(class_, "model_fields")[name].get_default(
+                call_default_factory=True
+            )
+        )
+    return class_.__fields__[name].get_default()
+
+
+@lru_cache(maxsize=None)
+def _type_adapter(type_: Any) -> Any:
+    return getattr(pydantic, "TypeAdapter")(type_)
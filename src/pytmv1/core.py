@@ -1,39 +1,92 @@
+import json
 import logging
-import re
+import multiprocessing
+import sys
+import threading
 import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from contextvars import copy_context
+from dataclasses import replace
+from functools import lru_cache, partial
 from logging import Logger
-from typing import Any, Callable, Dict, List, Type, Union
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    FrozenSet,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 from urllib.parse import SplitResult, urlsplit
 
+import httpx
 from bs4 import BeautifulSoup
-from pydantic import AnyHttpUrl, parse_obj_as
+from pydantic import BaseModel as PydanticBaseModel
+from pydantic import ValidationError
 from requests import PreparedRequest, Request, Response
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import Timeout
 
 from .__about__ import __version__
 from .adapter import HTTPAdapter
+from .batch import RecordBatch, build_batch
+from .checkpoint import Checkpoint, CheckpointStore, PageTracker
+from .codec import JsonCodec, default_codec
+from .compat import (
+    construct,
+    fields_set,
+    has_pre_validators,
+    model_dump,
+    model_fields,
+    parse_obj,
+    parse_obj_as,
+    validate_url,
+)
 from .exceptions import (
+    DigestMismatchError,
     ParseModelError,
     ServerHtmlError,
     ServerJsonError,
     ServerMultiJsonError,
     ServerTextError,
 )
+from .lazy import lazy_type
+from .logs import LazyStr, fields, mask_headers, truncate
 from .model.commons import (
+    Digest,
     Error,
     MsData,
     MsDataUrl,
     MsError,
-    MsStatus,
     SaeAlert,
     TiAlert,
 )
-from .model.enums import Api, HttpMethod, Provider, Status
+from .model.enums import (
+    Api,
+    HttpMethod,
+    ParseMode,
+    Provider,
+    SearchMode,
+    Status,
+)
 from .model.requests import EndpointTask
 from .model.responses import (
     MR,
     AddAlertNoteResp,
+    BaseActivityCountResp,
     BaseLinkableResp,
     BaseMultiResponse,
+    BaseResponse,
     BytesResp,
     C,
     ConsumeLinkableResp,
@@ -44,14 +97,58 @@ from .model.responses import (
     R,
     S,
     SandboxSubmissionStatusResp,
+    SaveFileResp,
+    SubmitFileToSandboxResp,
+)
+from .paginator import Paginator, PendingItems, _consume_pooled, _merge
+from .policy import (
+    DEFAULT_BULK,
+    DEFAULT_LOG,
+    DEFAULT_PARSE,
+    DEFAULT_POLL,
+    NO_RETRY,
+    BulkPolicy,
+    LogPolicy,
+    ParsePolicy,
+    PollPolicy,
+    RetryPolicy,
+    ShardPolicy,
+    SpoolPolicy,
+)
+from .results import (
+    HANDLED_ERRORS,
+    _error,
+    call_stats,
+    multi_result,
+    result,
 )
-from .results import multi_result, result
+from .shard import ShardPlanner, TimeWindow
+from .spool import Spool, SpooledItems, open_spool
+from .stream import (
+    CHUNK_SIZE,
+    Destination,
+    FileSink,
+    ItemsParser,
+    MultipartStream,
+    Upload,
+    open_upload,
+)
+from .watcher import TaskWatcher
 
 USERAGENT_SUFFIX: str = "PyTMV1"
 API_VERSION: str = "v3.0"
+# Union models selected by the value of a field of the records
+DISCRIMINATORS: Dict[FrozenSet[Any], Tuple[str, Dict[str, Any]]] = {
+    frozenset((SaeAlert, TiAlert)): (
+        "alertProvider",
+        {Provider.SAE.value: SaeAlert, Provider.TI.value: TiAlert},
+    ),
+}
 
 log: Logger = logging.getLogger(__name__)
 
+RawResponse = Union[Response, httpx.Response]
+
 
 class Core:
     def __init__(
@@ -63,13 +160,33 @@ class Core:
         pool_maxsize: int,
         connect_timeout: int,
         read_timeout: int,
+        retry: Optional[RetryPolicy] = None,
+        polling: Optional[PollPolicy] = None,
+        bulk: Optional[BulkPolicy] = None,
+        logs: Optional[LogPolicy] = None,
+        parse_mode: ParseMode = ParseMode.VALIDATED,
+        codec: Optional[JsonCodec] = None,
+        parsing: Optional[ParsePolicy] = None,
+        spooling: Optional[SpoolPolicy] = None,
     ):
         self._adapter = HTTPAdapter(pool_connections, pool_maxsize, 0, True)
+        self._pool_maxsize = pool_maxsize
         self._c_timeout = connect_timeout
         self._r_timeout = read_timeout
+        self._retry = retry or NO_RETRY
+        self._polling = polling or DEFAULT_POLL
+        self._bulk = bulk or DEFAULT_BULK
+        self._logs = logs or DEFAULT_LOG
+        self._parse_mode = parse_mode
+        self._codec = codec or default_codec()
+        self._parsing = parsing or DEFAULT_PARSE
+        self._spooling = spooling
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        self._parse_pool_lock = threading.Lock()
+        self._parse_scopes: int = 0
         self._appname = appname
         self._token = token
-        self._url = parse_obj_as(AnyHttpUrl, _format(url))
+        self._url: str = validate_url(_format(url))
         self._headers: Dict[str, str] = {
             "Authorization": f"Bearer {self._token}",
             "User-Agent": f"{self._appname}-{USERAGENT_SUFFIX}/{__version__}",
@@ -96,33 +213,153 @@ class Core:
         api: Api,
         *tasks: EndpointTask,
     ) -> MultiResp:
-        return self._process(
+        return self._process_multi(
             MultiResp,
             api,
-            HttpMethod.POST,
             json=[
-                task.dict(by_alias=True, exclude_none=True) for task in tasks
+                model_dump(task, by_alias=True, exclude_none=True)
+                for task in tasks
             ],
         )
 
+    @result
+    def send_file(
+        self,
+        api: Api,
+        file: Upload,
+        file_name: str,
+        fields: Dict[str, str],
+    ) -> SubmitFileToSandboxResp:
+        with open_upload(file) as opened:
+            body: MultipartStream = MultipartStream(opened, file_name, fields)
+            response: SubmitFileToSandboxResp = self._process(
+                SubmitFileToSandboxResp,
+                api,
+                HttpMethod.POST,
+                data=body,
+                headers={"Content-Type": body.content_type},
+            )
+        _verify_digest(response, body)
+        return response
+
     @result
     def send_linkable(
         self,
         class_: Type[BaseLinkableResp[C]],
         api: str,
         consumer: Callable[[C], None],
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+        workers: int = 0,
+        queue_size: int = 1000,
+        ordered: bool = False,
+        checkpoint: Optional[CheckpointStore] = None,
+        resume_from: Optional[Checkpoint] = None,
         **kwargs: Any,
     ) -> ConsumeLinkableResp:
-        return ConsumeLinkableResp(
-            total_consumed=self._consume_linkable(
-                lambda: self._process(
-                    class_,
-                    api,
-                    **kwargs,
-                ),
-                consumer,
-                kwargs.get("headers", {}),
+        mode: ParseMode = parse_mode or self._parse_mode
+        if resume_from:
+            if resume_from.completed:
+                log.info(
+                    "Consumption already completed [Total=%s]",
+                    resume_from.total_consumed,
+                )
+                return ConsumeLinkableResp(total_consumed=0)
+            api = _next_uri(resume_from.next_link)
+            kwargs = {"headers": kwargs.get("headers", {})}
+        tracker: Optional[PageTracker] = _page_tracker(checkpoint, resume_from)
+        with open_spool(
+            None if stream else self._spooling
+        ) as spool, self._parse_scope():
+            api_call: Callable[[], BaseLinkableResp[C]] = lambda: (
+                self._fetch_page(class_, api, stream, mode, spool, **kwargs)
+            )
+            if workers > 0:
+                return self._consume_linkable_pooled(
+                    api_call,
+                    consumer,
+                    kwargs.get("headers", {}),
+                    workers,
+                    queue_size,
+                    ordered,
+                    prefetch,
+                    stream,
+                    mode,
+                    spool,
+                    tracker,
+                )
+            return ConsumeLinkableResp(
+                total_consumed=self._consume_linkable(
+                    api_call,
+                    consumer,
+                    kwargs.get("headers", {}),
+                    prefetch,
+                    stream,
+                    mode,
+                    spool,
+                    tracker,
+                )
+            )
+
+    @result
+    def send_sharded(
+        self,
+        class_: Type[BaseLinkableResp[C]],
+        count_class: Type[BaseActivityCountResp],
+        api: str,
+        consumer: Callable[[C], None],
+        shards: ShardPolicy,
+        prefetch: int = 0,
+        parse_mode: Optional[ParseMode] = None,
+        workers: int = 0,
+        queue_size: int = 1000,
+        ordered: bool = False,
+        **kwargs: Any,
+    ) -> ConsumeLinkableResp:
+        mode: ParseMode = parse_mode or self._parse_mode
+        params: Dict[str, Any] = kwargs.get("params", {})
+        headers: Dict[str, str] = kwargs.get("headers", {})
+        windows: List[TimeWindow] = self._plan_windows(
+            count_class, api, shards, params, headers
+        )
+        with open_spool(self._spooling) as spool, self._parse_scope():
+            pages: Generator[BaseLinkableResp[C], None, None] = _merge(
+                [
+                    self._window_pages(
+                        class_,
+                        api,
+                        mode,
+                        spool,
+                        window.params(params),
+                        headers,
+                    )
+                    for window in windows
+                ],
+                self._threads(shards.workers),
+                _prefetch_depth(prefetch, mode, self._parsing, spool),
+                ordered,
             )
+            try:
+                total_count, errors = _consume_items(
+                    (item for page in pages for item in page.items),
+                    consumer,
+                    workers,
+                    queue_size,
+                    ordered,
+                )
+            finally:
+                pages.close()
+        log.debug(
+            "Records consumed: [Total=%s, Failed=%s, Windows=%s]",
+            total_count,
+            len(errors),
+            len(windows),
+        )
+        return ConsumeLinkableResp(
+            total_consumed=total_count,
+            total_failed=len(errors),
+            errors=[_error(exc) for exc in errors],
         )
 
     @multi_result
@@ -132,13 +369,25 @@ class Core:
         api: str,
         **kwargs: Any,
     ) -> MR:
-        return self._process(
+        return self._process_multi(
             class_,
             api,
-            HttpMethod.POST,
             **kwargs,
         )
 
+    @result
+    def send_sandbox_file(
+        self,
+        api: Api,
+        submit_id: str,
+        destination: Destination,
+        poll: bool,
+        poll_time_sec: float,
+    ) -> SaveFileResp:
+        if poll:
+            self._wait_submission(submit_id, poll_time_sec)
+        return self._download(api.value.format(submit_id), destination)
+
     @result
     def send_sandbox_result(
         self,
@@ -149,13 +398,7 @@ class Core:
         poll_time_sec: float,
     ) -> R:
         if poll:
-            _poll_status(
-                lambda: self._process(
-                    SandboxSubmissionStatusResp,
-                    Api.GET_SANDBOX_SUBMISSION_STATUS.value.format(submit_id),
-                ),
-                poll_time_sec,
-            )
+            self._wait_submission(submit_id, poll_time_sec)
         return self._process(class_, api.value.format(submit_id))
 
     @result
@@ -170,43 +413,323 @@ class Core:
             _poll_status(
                 status_call,
                 poll_time_sec,
+                self._polling,
             )
         return status_call()
 
+    def watch(self, workers: int, poll_time_sec: float) -> TaskWatcher:
+        return TaskWatcher(self, workers, poll_time_sec, self._polling)
+
+    def iter_batches(
+        self,
+        class_: Type[BaseLinkableResp[C]],
+        api: str,
+        select: Optional[List[str]] = None,
+        max_pages: Optional[int] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> Iterator[RecordBatch]:
+        record_type: Any = model_fields(class_)["items"].annotation.__args__[0]
+        for page in self.iter_linkable(
+            class_,
+            api,
+            None,
+            max_pages,
+            prefetch,
+            stream,
+            ParseMode.RAW,
+            **kwargs,
+        ).pages():
+            yield build_batch(record_type, page.items, select)
+
+    def iter_linkable(
+        self,
+        class_: Type[BaseLinkableResp[C]],
+        api: str,
+        max_items: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+        **kwargs: Any,
+    ) -> Paginator[C]:
+        mode: ParseMode = parse_mode or self._parse_mode
+        return self._paginate(
+            lambda: self._fetch_page(
+                class_,
+                api,
+                stream,
+                mode,
+                **kwargs,
+            ),
+            kwargs.get("headers", {}),
+            max_items,
+            max_pages,
+            prefetch,
+            stream,
+            mode,
+            scope=self._parse_scope,
+        )
+
     def _consume_linkable(
         self,
         api_call: Callable[[], BaseLinkableResp[C]],
         consumer: Callable[[C], None],
         headers: Dict[str, str],
-        count: int = 0,
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: ParseMode = ParseMode.VALIDATED,
+        spool: Optional[Spool] = None,
+        tracker: Optional[PageTracker] = None,
     ) -> int:
-        total_count: int = count
-        response: BaseLinkableResp[C] = api_call()
-        for item in response.items:
+        total_count: int = 0
+        item_type: str = ""
+        paginator: Paginator[C] = self._paginate(
+            api_call,
+            headers,
+            prefetch=prefetch,
+            stream=stream,
+            parse_mode=parse_mode,
+            spool=spool,
+        )
+        items: Iterable[C] = paginator
+        if tracker:
+            items = tracker.items(paginator.pages())
+        for item in items:
             consumer(item)
             total_count += 1
-        if response.next_link:
-            sr: SplitResult = urlsplit(response.next_link)
-            log.debug("Found nextLink")
-            return self._consume_linkable(
-                lambda: self._process(
-                    type(response),
-                    f"{sr.path[5:]}?{sr.query}",
-                    headers=headers,
-                ),
-                consumer,
-                headers,
-                total_count,
-            )
+            item_type = type(item).__name__
         log.debug(
             "Records consumed: [Total=%s, Type=%s]",
             total_count,
-            type(
-                response.items[0] if len(response.items) > 0 else response
-            ).__name__,
+            item_type,
         )
         return total_count
 
+    def _consume_linkable_pooled(
+        self,
+        api_call: Callable[[], BaseLinkableResp[C]],
+        consumer: Callable[[C], None],
+        headers: Dict[str, str],
+        workers: int,
+        queue_size: int,
+        ordered: bool = False,
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: ParseMode = ParseMode.VALIDATED,
+        spool: Optional[Spool] = None,
+        tracker: Optional[PageTracker] = None,
+    ) -> ConsumeLinkableResp:
+        paginator: Paginator[C] = self._paginate(
+            api_call,
+            headers,
+            prefetch=prefetch,
+            stream=stream,
+            parse_mode=parse_mode,
+            spool=spool,
+        )
+        if tracker:
+            total_count, errors = _consume_pooled(
+                tracker.entries(paginator.pages()),
+                tracker.wrap(consumer),
+                workers,
+                queue_size,
+                ordered,
+            )
+        else:
+            total_count, errors = _consume_pooled(
+                paginator, consumer, workers, queue_size, ordered
+            )
+        log.debug(
+            "Records consumed: [Total=%s, Failed=%s, Workers=%s]",
+            total_count,
+            len(errors),
+            workers,
+        )
+        return ConsumeLinkableResp(
+            total_consumed=total_count,
+            total_failed=len(errors),
+            errors=[_error(exc) for exc in errors],
+        )
+
+    def _paginate(
+        self,
+        api_call: Callable[[], BaseLinkableResp[C]],
+        headers: Dict[str, str],
+        max_items: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        parse_mode: ParseMode = ParseMode.VALIDATED,
+        spool: Optional[Spool] = None,
+        scope: Callable[[], ContextManager[Any]] = nullcontext,
+    ) -> Paginator[C]:
+        return Paginator(
+            lambda page: (
+                api_call()
+                if page is None
+                else self._fetch_page(
+                    type(page),
+                    _next_uri(page.next_link),
+                    stream,
+                    parse_mode,
+                    spool,
+                    headers=headers,
+                )
+            ),
+            max_items,
+            max_pages,
+            (
+                0
+                if stream
+                else _prefetch_depth(
+                    prefetch, parse_mode, self._parsing, spool
+                )
+            ),
+            scope,
+        )
+
+    def _fetch_page(
+        self,
+        class_: Type[BaseLinkableResp[C]],
+        uri: str,
+        stream: bool,
+        parse_mode: ParseMode,
+        spool: Optional[Spool] = None,
+        **kwargs: Any,
+    ) -> BaseLinkableResp[C]:
+        if spool and not stream:
+            return self._fetch_spooled_page(
+                class_, uri, parse_mode, spool, **kwargs
+            )
+        if not stream and parse_mode == ParseMode.VALIDATED:
+            if self._parsing.processes > 0 and _is_importable(class_):
+                return self._fetch_pooled_page(class_, uri, **kwargs)
+            return self._process(class_, uri, **kwargs)
+        log.debug(
+            "Processing page request [Class=%s, URI=%s, Options=%s]",
+            class_.__name__,
+            uri,
+            kwargs,
+        )
+        raw_response: Response = self._send(
+            self._prepare(uri, HttpMethod.GET, **kwargs), stream=stream
+        )
+        body: Any = _decode(raw_response, self._codec, stream)
+        _validate(raw_response, body)
+        if "json" not in raw_response.headers.get("Content-Type", ""):
+            return _parse_data(raw_response, class_, body)
+        log.info(
+            "Parsing json page [Class=%s, Mode=%s, Stream=%s]",
+            class_.__name__,
+            parse_mode.value,
+            stream,
+        )
+        page: BaseLinkableResp[C] = construct(class_)
+        if stream:
+            setattr(
+                page, "items", _stream_items(page, raw_response, parse_mode)
+            )
+        else:
+            envelope: Dict[str, Any] = body
+            setattr(
+                page,
+                "items",
+                _parse_items(class_, envelope.pop("items", []), parse_mode),
+            )
+            _update_envelope(page, envelope)
+        return page
+
+    def _fetch_spooled_page(
+        self,
+        class_: Type[BaseLinkableResp[C]],
+        uri: str,
+        parse_mode: ParseMode,
+        spool: Spool,
+        **kwargs: Any,
+    ) -> BaseLinkableResp[C]:
+        raw_response: Response = self._send(
+            self._prepare(uri, HttpMethod.GET, **kwargs)
+        )
+        body: Any = _decode(raw_response, self._codec)
+        _validate(raw_response, body)
+        if not isinstance(body, dict):
+            return _parse_data(raw_response, class_, body)
+        log.info(
+            "Spooling json page [Class=%s, Size=%s]",
+            class_.__name__,
+            len(raw_response.content),
+        )
+        return _pending_page(
+            class_,
+            body,
+            SpooledItems(
+                partial(
+                    _read_items,
+                    class_,
+                    spool.write(raw_response.content),
+                    self._codec,
+                    parse_mode,
+                )
+            ),
+        )
+
+    def _fetch_pooled_page(
+        self, class_: Type[BaseLinkableResp[C]], uri: str, **kwargs: Any
+    ) -> BaseLinkableResp[C]:
+        raw_response: Response = self._send(
+            self._prepare(uri, HttpMethod.GET, **kwargs)
+        )
+        body: Any = _decode(raw_response, self._codec)
+        _validate(raw_response, body)
+        if (
+            not isinstance(body, dict)
+            or len(raw_response.content) < self._parsing.min_bytes
+        ):
+            return _parse_data(raw_response, class_, body)
+        log.info(
+            "Parsing json page in worker [Class=%s, Size=%s]",
+            class_.__name__,
+            len(raw_response.content),
+        )
+        return _pending_page(
+            class_,
+            body,
+            PendingItems(
+                _submit_page(
+                    self._pool(), class_, raw_response.content, self._codec
+                )
+            ),
+        )
+
+    @contextmanager
+    def _parse_scope(self) -> Iterator[None]:
+        """Scope of a call which may validate pages in worker processes,
+        the workers are shut down once the last running call ends."""
+        with self._parse_pool_lock:
+            self._parse_scopes += 1
+        try:
+            yield
+        finally:
+            pool: Optional[ProcessPoolExecutor] = None
+            with self._parse_pool_lock:
+                self._parse_scopes -= 1
+                if not self._parse_scopes:
+                    pool, self._parse_pool = self._parse_pool, None
+            if pool:
+                # Waits for the pending pages, shutdown(wait=False) closes
+                # a pipe still used by the pool threads on Python 3.7
+                pool.shutdown()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._parse_pool_lock:
+            if not self._parse_scopes:
+                raise RuntimeError("Parse workers used after their call")
+            if self._parse_pool is None:
+                self._parse_pool = _start_pool(self._parsing)
+            return self._parse_pool
+
     def _process(
         self,
         class_: Type[R],
@@ -221,62 +744,480 @@ class Core:
             uri,
             kwargs,
         )
-        raw_response: Response = self._send_internal(
+        raw_response: Response = self._send(
             self._prepare(uri, method, **kwargs)
         )
-        _validate(raw_response)
-        return _parse_data(raw_response, class_)
+        body: Any = _decode(raw_response, self._codec)
+        _validate(raw_response, body)
+        return _parse_data(raw_response, class_, body)
+
+    def _process_multi(self, class_: Type[MR], uri: str, **kwargs: Any) -> MR:
+        items: Any = kwargs.get("json")
+        chunks: List[List[Any]] = (
+            _chunk(items, self._bulk, self._codec)
+            if isinstance(items, list)
+            else []
+        )
+        if len(chunks) < 2:
+            return self._process(class_, uri, HttpMethod.POST, **kwargs)
+        del kwargs["json"]
+        log.debug(
+            "Processing bulk request in chunks [URI=%s, Items=%s, Chunks=%s]",
+            uri,
+            len(items),
+            len(chunks),
+        )
+        with ThreadPoolExecutor(
+            min(self._threads(self._bulk.workers), len(chunks)),
+            thread_name_prefix="pytmv1-bulk",
+        ) as executor:
+            return _merge_multi(
+                class_,
+                list(
+                    executor.map(
+                        lambda chunk: copy_context().run(
+                            self._process_chunk, uri, chunk, **kwargs
+                        ),
+                        chunks,
+                    )
+                ),
+            )
+
+    def _threads(self, workers: int) -> int:
+        # The adapter pool blocks when full, extra threads would only wait
+        # for a connection and fail with EmptyPoolError
+        return max(1, min(workers, self._pool_maxsize))
+
+    def _process_chunk(
+        self, uri: str, chunk: List[Any], **kwargs: Any
+    ) -> List[Dict[str, Any]]:
+        try:
+            raw_response: Response = self._send(
+                self._prepare(uri, HttpMethod.POST, json=chunk, **kwargs)
+            )
+            body: Any = _decode(raw_response, self._codec)
+            if raw_response.status_code != 207:
+                _validate(raw_response, body)
+            return _chunk_items(raw_response, body)
+        except HANDLED_ERRORS as exc:
+            log.warning("Chunk failed [URI=%s, Error=%s]", uri, exc)
+            return _failed_items(exc, len(chunk))
+
+    def _download(self, uri: str, destination: Destination) -> SaveFileResp:
+        raw_response: Response = self._send(
+            self._prepare(uri, HttpMethod.GET), stream=True
+        )
+        try:
+            _validate(raw_response, _decode(raw_response, self._codec, True))
+            if "application" not in raw_response.headers.get(
+                "Content-Type", ""
+            ):
+                raise ParseModelError(SaveFileResp.__name__, raw_response)
+            with FileSink(destination) as sink:
+                for chunk in raw_response.iter_content(CHUNK_SIZE):
+                    sink.write(chunk)
+        finally:
+            raw_response.close()
+        log.info("Download finished [URI=%s, Size=%s]", uri, sink.size)
+        return sink.response()
+
+    def _plan_windows(
+        self,
+        count_class: Type[BaseActivityCountResp],
+        api: str,
+        policy: ShardPolicy,
+        params: Dict[str, Any],
+        headers: Dict[str, str],
+    ) -> List[TimeWindow]:
+        count: Callable[[TimeWindow], int] = lambda window: self._process(
+            count_class,
+            api,
+            params={**window.params(params), "mode": SearchMode.COUNT_ONLY},
+            headers=headers,
+        ).total_count
+        whole: TimeWindow = TimeWindow.from_params(params)
+        planner: ShardPlanner = ShardPlanner(
+            replace(whole, count=count(whole)), policy
+        )
+        with ThreadPoolExecutor(
+            self._threads(policy.workers), thread_name_prefix="pytmv1-shard"
+        ) as executor:
+            while not planner.done:
+                planner.update(
+                    list(
+                        executor.map(
+                            lambda window: copy_context().run(count, window),
+                            planner.pending(),
+                        )
+                    )
+                )
+        windows: List[TimeWindow] = planner.windows()
+        log.debug(
+            "Search split in time windows [URI=%s, Windows=%s, Counts=%s]",
+            api,
+            len(windows),
+            [window.count for window in windows],
+        )
+        return windows
+
+    def _window_pages(
+        self,
+        class_: Type[BaseLinkableResp[C]],
+        api: str,
+        parse_mode: ParseMode,
+        spool: Optional[Spool],
+        params: Dict[str, Any],
+        headers: Dict[str, str],
+    ) -> Iterator[BaseLinkableResp[C]]:
+        paginator: Paginator[C] = Paginator(
+            lambda page: (
+                self._fetch_page(
+                    class_,
+                    api,
+                    False,
+                    parse_mode,
+                    spool,
+                    params=params,
+                    headers=headers,
+                )
+                if page is None
+                else self._fetch_page(
+                    type(page),
+                    _next_uri(page.next_link),
+                    False,
+                    parse_mode,
+                    spool,
+                    headers=headers,
+                )
+            )
+        )
+        return paginator.pages()
 
     def _prepare(
         self, uri: str, method: HttpMethod, **kwargs: Any
     ) -> PreparedRequest:
+        headers: Dict[str, str] = {
+            **self._headers,
+            **kwargs.pop("headers", {}),
+        }
+        obj: Any = kwargs.pop("json", None)
+        if obj is not None:
+            headers.setdefault("Content-Type", "application/json")
+            kwargs["data"] = self._codec.dumps(obj)
         return Request(
-            method.value,
-            self._url + uri,
-            headers={**self._headers, **kwargs.pop("headers", {})},
-            **kwargs,
+            method.value, self._url + uri, headers=headers, **kwargs
         ).prepare()
 
-    def _send_internal(self, request: PreparedRequest) -> Response:
-        log.info(
-            "Sending request [Method=%s, URL=%s, Headers=%s, Body=%s]",
-            request.method,
-            request.url,
-            re.sub("Bearer \\S+", "*****", str(request.headers)),
-            _hide_binary(request),
+    def _wait_submission(self, submit_id: str, poll_time_sec: float) -> None:
+        _poll_status(
+            lambda: self._process(
+                SandboxSubmissionStatusResp,
+                Api.GET_SANDBOX_SUBMISSION_STATUS.value.format(submit_id),
+            ),
+            poll_time_sec,
+            self._polling,
         )
-        response: Response = self._adapter.send(
-            request, timeout=(self._c_timeout, self._r_timeout)
+
+    def _send(
+        self, request: PreparedRequest, stream: bool = False
+    ) -> Response:
+        retries: int = 0
+        while True:
+            try:
+                response: Response = self._send_internal(request, stream)
+            except (RequestsConnectionError, Timeout) as exc:
+                if not self._can_retry(request.method, retries):
+                    raise
+                reason: str = type(exc).__name__
+                delay: float = self._retry.delay(retries)
+            else:
+                if (
+                    response.status_code not in self._retry.status_codes
+                    or not self._can_retry(request.method, retries)
+                ):
+                    return response
+                reason = str(response.status_code)
+                delay = self._retry.delay(
+                    retries, response.headers.get("Retry-After")
+                )
+                if stream:
+                    response.close()
+            retries += 1
+            call_stats().retries += 1
+            log.warning(
+                (
+                    "Retrying request [Method=%s, URL=%s, Reason=%s, Retry=%s,"
+                    " Delay=%.2f]"
+                ),
+                request.method,
+                request.url,
+                reason,
+                retries,
+                delay,
+            )
+            time.sleep(delay)
+
+    def _can_retry(self, method: Optional[str], retries: int) -> bool:
+        return self._retry.can_retry(method, retries, call_stats().retries)
+
+    def _send_internal(
+        self, request: PreparedRequest, stream: bool = False
+    ) -> Response:
+        logged: bool = log.isEnabledFor(logging.INFO) and self._logs.sampled(
+            str(request.url)
         )
-        log.info(
-            "Received response [Status=%s, Headers=%s, Body=%s]",
-            response.status_code,
-            response.headers,
-            _hide_binary(response),
+        if logged:
+            log.info(
+                "Sending request [Method=%s, URL=%s, Headers=%s, Body=%s]",
+                request.method,
+                request.url,
+                LazyStr(mask_headers, request.headers),
+                LazyStr(_hide_binary, request, self._logs.max_body),
+                extra=fields(request.method, request.url),
+            )
+        start_time: float = time.perf_counter()
+        response: Response = self._adapter.send(
+            request, stream=stream, timeout=(self._c_timeout, self._r_timeout)
         )
+        if log.isEnabledFor(logging.INFO) and (
+            logged or response.status_code >= 400
+        ):
+            elapsed: float = time.perf_counter() - start_time
+            log.info(
+                (
+                    "Received response [Status=%s, URL=%s, Elapsed=%.3f,"
+                    " Headers=%s, Body=%s]"
+                ),
+                response.status_code,
+                request.url,
+                elapsed,
+                response.headers,
+                (
+                    "***streamed content***"
+                    if stream
+                    else LazyStr(_hide_binary, response, self._logs.max_body)
+                ),
+                extra=fields(
+                    request.method, request.url, response.status_code, elapsed
+                ),
+            )
         return response
 
 
+def _chunk(
+    items: List[Any], policy: BulkPolicy, codec: Optional[JsonCodec] = None
+) -> List[List[Any]]:
+    encoder: JsonCodec = codec or JsonCodec()
+    chunks: List[List[Any]] = []
+    size: int = 0
+    for item in items:
+        item_size: int = len(encoder.dumps(item)) + 1
+        if (
+            not chunks
+            or len(chunks[-1]) >= policy.max_items
+            or (chunks[-1] and size + item_size > policy.max_bytes)
+        ):
+            chunks.append([])
+            size = 1
+        chunks[-1].append(item)
+        size += item_size
+    return chunks
+
+
+def _chunk_items(raw_response: RawResponse, body: Any) -> List[Dict[str, Any]]:
+    if not isinstance(body, list):
+        raise ParseModelError(MultiResp.__name__, raw_response)
+    return body
+
+
+def _consume_items(
+    items: Iterable[C],
+    consumer: Callable[[C], None],
+    workers: int,
+    queue_size: int,
+    ordered: bool = False,
+) -> Tuple[int, List[Exception]]:
+    if workers > 0:
+        return _consume_pooled(items, consumer, workers, queue_size, ordered)
+    total_count: int = 0
+    for item in items:
+        consumer(item)
+        total_count += 1
+    return total_count, []
+
+
+def _construct(type_: Any, data: Any) -> Any:
+    """Builds a model and its sub-models from trusted data without
+    validation, values keep their JSON type (ie: enums are not coerced)."""
+    return _map_models(type_, data, _construct_model)
+
+
+def _construct_model(type_: Type[PydanticBaseModel], data: Any) -> Any:
+    return construct(
+        type_,
+        **{
+            name: (
+                _construct(annotation, data[alias]) if nested else data[alias]
+            )
+            for name, alias, annotation, nested in _construct_fields(type_)
+            if alias in data
+        },
+    )
+
+
+@lru_cache(maxsize=None)
+def _construct_fields(
+    class_: Type[PydanticBaseModel],
+) -> List[Tuple[str, str, Any, bool]]:
+    """Fields of a model, flagged if their type holds sub-models."""
+    return [
+        (name, field.alias, field.annotation, _has_model(field.annotation))
+        for name, field in model_fields(class_).items()
+    ]
+
+
+def _decode(
+    raw_response: RawResponse, codec: JsonCodec, stream: bool = False
+) -> Any:
+    """Decodes a JSON body once for both its validation and its parsing,
+    a streamed body is only decoded if it holds an error."""
+    status: int = raw_response.status_code
+    if status != 207 and (
+        "json" not in raw_response.headers.get("Content-Type", "")
+        or (stream and _is_http_success([status]))
+    ):
+        return None
+    content: bytes = raw_response.content
+    # A multi-status body is required, an empty one fails to decode
+    return codec.loads(content) if content or status == 207 else None
+
+
+def _failed_items(exc: Exception, count: int) -> List[Dict[str, Any]]:
+    error: Error = _error(exc)
+    return [
+        {
+            "status": error.status,
+            "body": {
+                "error": model_dump(
+                    error, exclude={"status"}, exclude_none=True
+                )
+            },
+        }
+        for _ in range(count)
+    ]
+
+
 def _format(url: str) -> str:
     return (url if url.endswith("/") else url + "/") + API_VERSION
 
 
-def _hide_binary(http_object: Union[PreparedRequest, Response]) -> str:
+def _hide_binary(
+    http_object: Union[PreparedRequest, Response],
+    max_body: Optional[int] = None,
+) -> str:
     content_type = http_object.headers.get("Content-Type", "")
     if "json" not in content_type and "application" in content_type:
         return "***binary content***"
     if isinstance(http_object, Response):
-        return http_object.text
-    if isinstance(http_object.body, bytes):
-        return str(http_object.body, encoding="utf-8")
+        return truncate(http_object.content, max_body)
+    if "multipart" in content_type:
+        return "***multipart content***"
+    if isinstance(http_object.body, (bytes, str)):
+        return truncate(http_object.body, max_body)
     return str(http_object.body)
 
 
-def _is_http_success(status_codes: List[int]) -> bool:
-    return len(list(filter(lambda s: not 200 <= s < 399, status_codes))) == 0
+def _has_model(type_: Any) -> bool:
+    return _is_model(type_) or any(
+        _has_model(arg) for arg in getattr(type_, "__args__", ())
+    )
 
 
-def _parse_data(raw_response: Response, class_: Type[R]) -> R:
+def _is_model(class_: Any) -> bool:
+    return isinstance(class_, type) and issubclass(class_, PydanticBaseModel)
+
+
+def _is_http_success(status_codes: Iterable[int]) -> bool:
+    return all(200 <= status < 399 for status in status_codes)
+
+
+def _is_importable(class_: Type[Any]) -> bool:
+    """Checks if a class is pickled by reference to its module, models
+    created at runtime (ie: by :func:`~pytmv1.project`) are not."""
+    module: Any = sys.modules.get(class_.__module__)
+    return getattr(module, class_.__qualname__, None) is class_
+
+
+def _merge_multi(
+    class_: Type[MR], responses: List[List[Dict[str, Any]]]
+) -> MR:
+    items: List[Dict[str, Any]] = [
+        item for response in responses for item in response
+    ]
+    _validate_multi(items)
+    class_d: Type[List[Any]]
+    if issubclass(class_, MultiUrlResp):
+        class_d = List[MsDataUrl]
+    else:
+        class_d = List[MsData]
+    return class_(items=parse_obj_as(class_d, items))
+
+
+def _lazy(type_: Any, data: Any) -> Any:
+    return _map_models(type_, data, lambda model, obj: lazy_type(model)(obj))
+
+
+def _map_models(
+    type_: Any,
+    data: Any,
+    build: Callable[[Type[PydanticBaseModel], Dict[str, Any]], Any],
+) -> Any:
+    """Applies ``build`` to the decoded JSON objects of the models of a
+    type, members of unions are selected and lists are mapped. Models
+    mapping their input in a pre validator are validated instead."""
+    origin: Any = getattr(type_, "__origin__", None)
+    if origin is Union:
+        return _map_models(_union_member(type_.__args__, data), data, build)
+    if origin is list and isinstance(data, list):
+        return [_map_models(type_.__args__[0], item, build) for item in data]
+    if not isinstance(data, dict) or not _is_model(type_):
+        return data
+    if has_pre_validators(type_):
+        return parse_obj(type_, data)
+    return build(type_, data)
+
+
+def _next_uri(next_link: Optional[str]) -> str:
+    sr: SplitResult = urlsplit(next_link or "")
+    return f"{sr.path[5:]}?{sr.query}"
+
+
+def _page_tracker(
+    checkpoint: Optional[CheckpointStore], resume_from: Optional[Checkpoint]
+) -> Optional[PageTracker]:
+    if checkpoint is None:
+        return None
+    return PageTracker(
+        checkpoint, resume_from.total_consumed if resume_from else 0
+    )
+
+
+def _parse_content(
+    class_: Type[BaseLinkableResp[C]], content: bytes, codec: JsonCodec
+) -> Optional[List[C]]:
+    """Decodes and validates the records of a page, runs in the worker
+    processes of :class:`ParsePolicy`. Returns None if a record is
+    invalid, see :func:`_submit_page`."""
+    body: Dict[str, Any] = codec.loads(content)
+    try:
+        return _parse_items(class_, body.get("items", []))
+    except ValidationError:
+        return None
+
+
+def _parse_data(
+    raw_response: RawResponse, class_: Type[R], body: Any = None
+) -> R:
     content_type = raw_response.headers.get("Content-Type", "")
     if "json" in content_type:
         if issubclass(class_, BaseMultiResponse):
@@ -291,29 +1232,25 @@ def _parse_data(raw_response: Response, class_: Type[R]) -> R:
             return class_(
                 items=parse_obj_as(
                     class_d,
-                    raw_response.json(),
+                    body,
                 )
             )
         log.info("Parsing json response [Class=%s]", class_.__name__)
         if class_ == GetAlertDetailsResp:
-            response_json: Dict[str, str] = raw_response.json()
             return class_(
-                alert=parse_obj_as(
-                    (
-                        SaeAlert
-                        if response_json.get("alertProvider") == Provider.SAE
-                        else TiAlert
-                    ),
-                    response_json,
+                alert=_validate_member(
+                    model_fields(class_)["alert"].annotation, body
                 ),
                 etag=raw_response.headers.get("ETag", ""),
             )
-        return class_.parse_obj(raw_response.json())
+        if _has_tagged_items(class_):
+            return _parse_tagged_page(class_, body)
+        return parse_obj(class_, body)
     if "application" in content_type and class_ == BytesResp:
         log.info("Parsing binary response")
         return class_(content=raw_response.content)
     if raw_response.status_code == 201 and class_ == AddAlertNoteResp:
-        return class_.parse_obj(raw_response.headers)
+        return parse_obj(class_, dict(raw_response.headers))
     if raw_response.status_code == 204 and class_ == NoContentResp:
         return class_()
     raise ParseModelError(class_.__name__, raw_response)
@@ -327,22 +1264,222 @@ def _parse_html(html: str) -> str:
     )
 
 
+def _pending_page(
+    class_: Type[BaseLinkableResp[C]],
+    body: Dict[str, Any],
+    items: Sequence[C],
+) -> BaseLinkableResp[C]:
+    envelope: Dict[str, Any] = dict(body)
+    envelope.pop("items", None)
+    page: BaseLinkableResp[C] = parse_obj(class_, envelope)
+    setattr(page, "items", items)
+    return page
+
+
 def _poll_status(
     status_call: Callable[[], S],
     poll_time_sec: float,
-) -> None:
+    policy: PollPolicy = DEFAULT_POLL,
+) -> int:
     start_time: float = time.time()
-    elapsed_time: float = 0
+    polls: int = 1
     response: S = status_call()
-    while elapsed_time < poll_time_sec:
-        if response.status in [Status.QUEUED, Status.RUNNING]:
-            response = status_call()
-            elapsed_time = time.time() - start_time
-        else:
+    while response.status in [Status.QUEUED, Status.RUNNING]:
+        remaining: float = poll_time_sec - (time.time() - start_time)
+        if remaining <= 0:
             break
+        time.sleep(min(policy.delay(polls), remaining))
+        response = status_call()
+        polls += 1
+    call_stats().polls += polls
+    log.debug(
+        "Polling finished [Status=%s, Polls=%s, Elapsed=%.2f]",
+        response.status,
+        polls,
+        time.time() - start_time,
+    )
+    return polls
+
+
+def _prefetch_depth(
+    prefetch: int,
+    parse_mode: ParseMode,
+    policy: ParsePolicy,
+    spool: Optional[Spool] = None,
+) -> int:
+    if spool:
+        return sys.maxsize
+    if parse_mode != ParseMode.VALIDATED:
+        return prefetch
+    return max(prefetch, policy.processes)
+
+
+def _read_items(
+    class_: Type[BaseLinkableResp[C]],
+    read: Callable[[], bytes],
+    codec: JsonCodec,
+    parse_mode: ParseMode,
+) -> List[C]:
+    """Reads the body of a page back from a :class:`Spool`
+    and parses its records."""
+    body: Dict[str, Any] = codec.loads(read())
+    return _parse_items(class_, body.get("items", []), parse_mode)
+
+
+def _start_pool(policy: ParsePolicy) -> ProcessPoolExecutor:
+    log.debug("Starting parse workers [Processes=%s]", policy.processes)
+    # Forking a process running fetch and HTTP pool threads can deadlock
+    return ProcessPoolExecutor(
+        policy.processes, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def _submit_page(
+    pool: ProcessPoolExecutor,
+    class_: Type[BaseLinkableResp[C]],
+    content: bytes,
+    codec: JsonCodec,
+) -> "Future[List[C]]":
+    """Validates the records of a page in a worker process. Validation
+    errors can't always be pickled back (list models with pydantic v1,
+    any error before pydantic-core 2.15) and break the pool, an invalid
+    page is validated again by the calling process to raise its error."""
+    parsed: Future[List[C]] = Future()
+
+    def done(future: "Future[Optional[List[C]]]") -> None:
+        try:
+            items: Optional[List[C]] = future.result()
+            if items is None:
+                items = _parse_items(
+                    class_, codec.loads(content).get("items", [])
+                )
+            parsed.set_result(items)
+        except BaseException as exc:
+            parsed.set_exception(exc)
 
+    pool.submit(_parse_content, class_, content, codec).add_done_callback(done)
+    return parsed
 
-def _validate(raw_response: Response) -> None:
+
+def _stream_items(
+    page: BaseLinkableResp[C],
+    raw_response: Response,
+    parse_mode: ParseMode = ParseMode.VALIDATED,
+) -> Iterator[C]:
+    parser: ItemsParser = ItemsParser()
+    class_: Type[BaseLinkableResp[C]] = type(page)
+    try:
+        for chunk in raw_response.iter_content(CHUNK_SIZE):
+            yield from _parse_items(class_, parser.feed(chunk), parse_mode)
+        yield from _parse_items(
+            class_, parser.feed(b"", final=True), parse_mode
+        )
+    except json.JSONDecodeError as exc:
+        raise ParseModelError(class_.__name__, raw_response) from exc
+    finally:
+        raw_response.close()
+    _update_envelope(page, parser.envelope)
+
+
+def _parse_items(
+    class_: Type[BaseLinkableResp[C]],
+    items: List[Any],
+    parse_mode: ParseMode = ParseMode.VALIDATED,
+) -> List[C]:
+    items_type: Any = model_fields(class_)["items"].annotation
+    if parse_mode == ParseMode.RAW:
+        return items
+    if parse_mode == ParseMode.CONSTRUCT:
+        return list(_construct(items_type, items))
+    if parse_mode == ParseMode.LAZY:
+        return list(_lazy(items_type, items))
+    if not _has_tagged_items(class_):
+        return list(parse_obj_as(items_type, items))
+    return [_validate_member(items_type.__args__[0], item) for item in items]
+
+
+def _parse_tagged_page(class_: Type[R], body: Dict[str, Any]) -> R:
+    """Validates a page whose items are a union tagged by a field,
+    see :data:`DISCRIMINATORS`, the items are validated apart from
+    the envelope to select their model."""
+    envelope: Dict[str, Any] = dict(body)
+    items: List[Any] = envelope.pop("items", [])
+    item_type: Any = model_fields(class_)["items"].annotation.__args__[0]
+    page: R = parse_obj(class_, envelope)
+    setattr(
+        page, "items", [_validate_member(item_type, item) for item in items]
+    )
+    return page
+
+
+def _union_member(members: Tuple[Any, ...], data: Any) -> Any:
+    """Selects the model of a union tagged by ``data``, see
+    :data:`DISCRIMINATORS`, or else the first model whose required
+    fields are all present in ``data``."""
+    member: Any = _tagged_member(members, data)
+    if member is not None:
+        return member
+    keys: Set[str] = set(data) if isinstance(data, dict) else set()
+    return next(
+        (
+            member
+            for member in members
+            if _is_model(member)
+            and all(
+                field.alias in keys
+                for field in model_fields(member).values()
+                if field.required
+            )
+        ),
+        members[0],
+    )
+
+
+@lru_cache(maxsize=None)
+def _discriminator(
+    members: Tuple[Any, ...]
+) -> Optional[Tuple[str, Dict[str, Any]]]:
+    return DISCRIMINATORS.get(frozenset(members))
+
+
+@lru_cache(maxsize=None)
+def _has_tagged_items(class_: Type[BaseResponse]) -> bool:
+    if not issubclass(class_, BaseLinkableResp):
+        return False
+    item_type: Any = model_fields(class_)["items"].annotation.__args__[0]
+    return _discriminator(getattr(item_type, "__args__", ())) is not None
+
+
+def _tagged_member(members: Tuple[Any, ...], data: Any) -> Any:
+    discriminator: Optional[Tuple[str, Dict[str, Any]]] = _discriminator(
+        members
+    )
+    if discriminator is None or not isinstance(data, dict):
+        return None
+    alias, tags = discriminator
+    return tags.get(str(data.get(alias)))
+
+
+def _update_envelope(
+    page: BaseLinkableResp[C], envelope: Dict[str, Any]
+) -> None:
+    parsed: BaseLinkableResp[C] = parse_obj(
+        type(page), {**envelope, "items": []}
+    )
+    for name in fields_set(parsed) - {"items"}:
+        setattr(page, name, getattr(parsed, name))
+
+
+def _validate_member(type_: Any, data: Any) -> Any:
+    """Validates ``data`` against the model of a union tagged by
+    ``data`` instead of trying each model in turn."""
+    member: Any = _tagged_member(type_.__args__, data)
+    if member is None:
+        return parse_obj_as(type_, data)
+    return parse_obj(member, data)
+
+
+def _validate(raw_response: RawResponse, body: Any = None) -> None:
     log.debug("Validating response [%s]", raw_response)
     content_type: str = raw_response.headers.get("Content-Type", "")
     if "text/html" in content_type:
@@ -350,17 +1487,32 @@ def _validate(raw_response: Response) -> None:
             raw_response.status_code, _parse_html(raw_response.text)
         )
     if not _is_http_success([raw_response.status_code]):
-        if "application/json" in content_type:
-            error: Dict[str, Any] = raw_response.json().get("error")
+        if "application/json" in content_type and body is not None:
+            error: Dict[str, Any] = body.get("error")
             error["status"] = raw_response.status_code
             raise ServerJsonError(
-                Error.parse_obj(error),
+                parse_obj(Error, error),
             )
         raise ServerTextError(raw_response.status_code, raw_response.text)
     if raw_response.status_code == 207:
-        if not _is_http_success(
-            MsStatus.parse_obj(raw_response.json()).values()
-        ):
-            raise ServerMultiJsonError(
-                parse_obj_as(List[MsError], raw_response.json())
-            )
+        _validate_multi(body)
+
+
+def _validate_multi(items: List[Dict[str, Any]]) -> None:
+    if not _is_http_success(int(item.get("status", 500)) for item in items):
+        raise ServerMultiJsonError(parse_obj_as(List[MsError], items))
+
+
+def _verify_digest(
+    response: SubmitFileToSandboxResp, body: MultipartStream
+) -> None:
+    digest: Digest = response.digest
+    if (digest.sha1.lower(), digest.sha256.lower()) != (
+        body.sha1,
+        body.sha256,
+    ):
+        raise DigestMismatchError(
+            response.id,
+            f"sha1={body.sha1}, sha256={body.sha256}",
+            f"sha1={digest.sha1}, sha256={digest.sha256}",
+        )
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import List
+from typing import List, Union
 
+import httpx
 from requests import Response
 
 from .model.commons import Error, MsError
@@ -48,8 +49,30 @@ class ServerTextError(ServerCustError):
         )
 
 
+class DigestMismatchError(ServerCustError):
+    def __init__(self, task_id: str, expected: str, actual: str):
+        super().__init__(
+            500,
+            (
+                "Digest of the file received by Vision One does not match."
+                f" [Id={task_id}, Expected={expected}, Actual={actual}]"
+            ),
+        )
+        self.task_id = task_id
+
+
+class FileAccessError(ServerCustError):
+    def __init__(self, name: str, error: OSError):
+        super().__init__(
+            500,
+            f"Could not access local file. [File={name}, Error={error}]",
+        )
+
+
 class ParseModelError(ServerCustError):
-    def __init__(self, model: str, raw_response: Response):
+    def __init__(
+        self, model: str, raw_response: Union[Response, httpx.Response]
+    ):
         super().__init__(
             500,
             (
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, FrozenSet, Optional, Tuple, Type
+
+from pydantic import BaseModel as PydanticBaseModel
+
+from .compat import model_fields, parse_obj, validate_field
+
+
+class LazyRecord:
+    """Record wrapping the decoded JSON object of a model, see
+    :func:`lazy_type`.
+
+    Fields are read as attributes like on the model, each field is
+    validated the first time it is read and then cached, fields which
+    are never read are never validated. Other attributes and methods
+    (ie: ``dict()``) are read from the model validated as a whole.
+    """
+
+    __slots__ = ("_data", "_validated", "__dict__")
+
+    _model: ClassVar[Type[PydanticBaseModel]]
+    _fields: ClassVar[FrozenSet[str]]
+
+    def __init__(self, data: Dict[str, Any]):
+        self._data = data
+        self._validated: Optional[PydanticBaseModel] = None
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        if name in self._fields:
+            value: Any = validate_field(self._model, name, self._data)
+            self.__dict__[name] = value
+            return value
+        return getattr(self.to_model(), name)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyRecord):
+            return self.to_model() == other.to_model()
+        return self.to_model() == other
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return _rebuild, (self._model, self._data)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+    def to_model(self) -> PydanticBaseModel:
+        """Validates the whole record to its model, once.
+
+        :raises pydantic.ValidationError: If the record is invalid.
+        :rtype: PydanticBaseModel
+        """
+        if self._validated is None:
+            self._validated = parse_obj(self._model, self._data)
+        return self._validated
+
+
+@lru_cache(maxsize=None)
+def lazy_type(class_: Type[PydanticBaseModel]) -> Type[LazyRecord]:
+    """Creates the lazy record type of a model, one type is created
+    per model (ie: ``lazy_type(EndpointActivity)``).
+
+    :param class_: Model of the records.
+    :type class_: Type[PydanticBaseModel]
+    :rtype: Type[LazyRecord]
+    """
+    return type(
+        f"Lazy{class_.__name__}",
+        (LazyRecord,),
+        {
+            "__slots__": (),
+            "__module__": __name__,
+            "_model": class_,
+            "_fields": frozenset(model_fields(class_)),
+        },
+    )
+
+
+def _rebuild(
+    class_: Type[PydanticBaseModel], data: Dict[str, Any]
+) -> LazyRecord:
+    return lazy_type(class_)(data)
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import re
+from typing import Any, Callable, Dict, Optional, Pattern, Union
+
+_BEARER: Pattern[str] = re.compile("Bearer [^\\s'\"]+")
+
+
+class LazyStr:
+    """Defers the formatting of a log argument until a record is
+    actually emitted by a handler."""
+
+    __slots__ = ("_func", "_args")
+
+    def __init__(self, func: Callable[..., str], *args: Any):
+        self._func = func
+        self._args = args
+
+    def __str__(self) -> str:
+        return self._func(*self._args)
+
+    __repr__ = __str__
+
+
+def fields(
+    method: Optional[str],
+    url: Any,
+    status: Optional[int] = None,
+    elapsed: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Structured fields attached to the HTTP log records,
+    available to handlers and formatters as record attributes."""
+    extra: Dict[str, Any] = {"http_method": method, "http_url": str(url)}
+    if status is not None:
+        extra["http_status"] = status
+    if elapsed is not None:
+        extra["http_elapsed"] = elapsed
+    return extra
+
+
+def mask_headers(headers: Any) -> str:
+    return _BEARER.sub("*****", str(headers))
+
+
+def truncate(content: Union[bytes, str], max_body: Optional[int]) -> str:
+    """Decodes at most ``max_body`` bytes of a body,
+    the whole body is decoded if not set."""
+    head: Union[bytes, str] = (
+        content if max_body is None else content[:max_body]
+    )
+    text: str = (
+        head.decode("utf-8", "replace") if isinstance(head, bytes) else head
+    )
+    if max_body is None or len(content) <= max_body:
+        return text
+    return f"{text}...[Truncated={len(content) - max_body}]"
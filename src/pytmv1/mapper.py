@@ -1,7 +1,6 @@
 from typing import Dict, List
 
-from pydantic.utils import to_lower_camel
-
+from .compat import to_lower_camel
 from .model.commons import (
     Alert,
     Entity,
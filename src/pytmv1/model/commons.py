@@ -4,8 +4,8 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 
 from pydantic import BaseModel as PydanticBaseModel
 from pydantic import Field
-from pydantic.utils import to_lower_camel
 
+from ..compat import PYDANTIC_V2, pre_validator, to_lower_camel
 from .enums import (
     EntityType,
     EventID,
@@ -25,15 +25,30 @@ from .enums import (
 
 
 class BaseModel(PydanticBaseModel):
-    class Config:
-        alias_generator = to_lower_camel
-        allow_population_by_field_name = True
+    if PYDANTIC_V2:
+        model_config = {
+            "alias_generator": to_lower_camel,
+            "populate_by_name": True,
+        }
+    else:
+
+        class Config:
+            alias_generator = to_lower_camel
+            allow_population_by_field_name = True
 
 
 class BaseConsumable(BaseModel):
     ...
 
 
+def _object(data: Dict[str, Any]) -> Tuple[str, str]:
+    return {
+        (k, v)
+        for k, v in data.items()
+        if k in map(lambda ot: ot.value, ObjectType)
+    }.pop()
+
+
 def _get_task_id(headers: List[Dict[str, str]]) -> Optional[str]:
     task_id: str = next(
         (
@@ -197,17 +212,14 @@ class ExceptionObject(BaseConsumable):
     value: str
     type: ObjectType
     last_modified_date_time: str
-    description: Optional[str]
-
-    def __init__(self, **data: str) -> None:
-        super().__init__(value=self._obj_value(data), **data)
+    description: Optional[str] = None
 
-    @staticmethod
-    def _obj_value(args: Dict[str, str]) -> str:
-        obj_value: Optional[str] = args.get(args.get("type", ""))
+    @pre_validator
+    def map_value(cls, data: Dict[str, Any]) -> Dict[str, Any]:
+        obj_value: Optional[str] = data.get(data.get("type", ""))
         if obj_value is None:
             raise ValueError("Object value not found")
-        return obj_value
+        return {**data, "value": obj_value}
 
 
 class ImpactScope(BaseModel):
@@ -257,47 +269,35 @@ class MsData(BaseModel):
     status: int
     task_id: Optional[str] = None
 
-    def __init__(self, **data: Any):
-        super().__init__(
-            taskId=_get_task_id(data.pop("headers", {})),
-            **data,
-        )
+    @pre_validator
+    def map_task_id(cls, data: Dict[str, Any]) -> Dict[str, Any]:
+        data = dict(data)
+        return {**data, "taskId": _get_task_id(data.pop("headers", {}))}
 
 
 class MsDataUrl(MsData):
     url: str
-    id: Optional[str]
-    digest: Optional[Digest]
+    id: Optional[str] = None
+    digest: Optional[Digest] = None
 
-    def __init__(self, **data: Any):
-        data.update(data.pop("body", {}))
-        super().__init__(**data)
+    @pre_validator
+    def map_body(cls, data: Dict[str, Any]) -> Dict[str, Any]:
+        return {**data, **data.get("body", {})}
 
 
 class MsError(Error):
     extra: Dict[str, str] = {}
-    task_id: Optional[str]
+    task_id: Optional[str] = None
 
-    def __init__(self, **data: Any):
-        data.update(data.pop("body", {}))
+    @pre_validator
+    def map_error(cls, data: Dict[str, Any]) -> Dict[str, Any]:
+        data = {**data, **data.get("body", {})}
         data.update(data.pop("error", {}))
-        super().__init__(
-            extra={"url": data.pop("url", "")},
-            taskId=_get_task_id(data.pop("headers", {})),
+        return {
             **data,
-        )
-
-
-class MsStatus(BaseModel):
-    __root__: List[int]
-
-    def __init__(self, **data: Any):
-        super().__init__(
-            root=[int(d.get("status", 500)) for d in data.get("__root__", [])]
-        )
-
-    def values(self) -> List[int]:
-        return self.__root__
+            "extra": {"url": data.pop("url", "")},
+            "taskId": _get_task_id(data.pop("headers", {})),
+        }
 
 
 class SaeAlert(Alert):
@@ -318,17 +318,10 @@ class SandboxSuspiciousObject(BaseModel):
     type: ObjectType
     value: str
 
-    def __init__(self, **data: str) -> None:
-        obj: Tuple[str, str] = self._map(data)
-        super().__init__(type=obj[0], value=obj[1], **data)
-
-    @staticmethod
-    def _map(args: Dict[str, str]) -> Tuple[str, str]:
-        return {
-            (k, v)
-            for k, v in args.items()
-            if k in map(lambda ot: ot.value, ObjectType)
-        }.pop()
+    @pre_validator
+    def map_object(cls, data: Dict[str, Any]) -> Dict[str, Any]:
+        obj: Tuple[str, str] = _object(data)
+        return {**data, "type": obj[0], "value": obj[1]}
 
 
 class SuspiciousObject(ExceptionObject):
@@ -339,9 +332,9 @@ class SuspiciousObject(ExceptionObject):
 
 
 class TiAlert(Alert):
-    campaign: Optional[str]
-    industry: Optional[str]
-    region_and_country: Optional[str]
+    campaign: Optional[str] = None
+    industry: Optional[str] = None
+    region_and_country: Optional[str] = None
     created_by: str
     total_indicator_count: int
     matched_indicator_count: int
@@ -168,6 +168,13 @@ class OperatingSystem(str, Enum):
     MACOSX = "macOSX"
 
 
+class ParseMode(str, Enum):
+    VALIDATED = "validated"
+    LAZY = "lazy"
+    CONSTRUCT = "construct"
+    RAW = "raw"
+
+
 class ProductCode(str, Enum):
     SAO = "sao"
     SDS = "sds"
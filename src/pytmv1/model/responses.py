@@ -1,8 +1,8 @@
 from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar, Union
 
 from pydantic import Field
-from pydantic.generics import GenericModel
 
+from ..compat import GenericModel, pre_validator
 from .commons import (
     Account,
     BaseConsumable,
@@ -12,6 +12,7 @@ from .commons import (
     EmailMessage,
     Endpoint,
     EndpointActivity,
+    Error,
     ExceptionObject,
     MsData,
     MsDataUrl,
@@ -19,6 +20,7 @@ from .commons import (
     SandboxSuspiciousObject,
     SuspiciousObject,
     TiAlert,
+    _object,
 )
 from .enums import (
     ObjectType,
@@ -42,6 +44,10 @@ class BaseLinkableResp(BaseResponse, GenericModel, Generic[C]):
     items: List[C] = []
 
 
+class BaseActivityCountResp(BaseResponse):
+    total_count: int
+
+
 class BaseMultiResponse(BaseResponse, GenericModel, Generic[M]):
     items: List[M] = []
 
@@ -79,17 +85,10 @@ class BlockListTaskResp(BaseTaskResp):
     type: ObjectType
     value: str
 
-    def __init__(self, **data: str) -> None:
-        obj: Tuple[str, str] = self._map(data)
-        super().__init__(type=obj[0], value=obj[1], **data)
-
-    @staticmethod
-    def _map(args: Dict[str, str]) -> Tuple[str, str]:
-        return {
-            (k, v)
-            for k, v in args.items()
-            if k in map(lambda ot: ot.value, ObjectType)
-        }.pop()
+    @pre_validator
+    def map_object(cls, data: Dict[str, Any]) -> Dict[str, Any]:
+        obj: Tuple[str, str] = _object(data)
+        return {**data, "type": obj[0], "value": obj[1]}
 
 
 class BytesResp(BaseResponse):
@@ -114,6 +113,8 @@ class ConnectivityResp(BaseResponse):
 
 class ConsumeLinkableResp(BaseResponse, alias_generator=None):
     total_consumed: int
+    total_failed: int = 0
+    errors: List[Error] = []
 
 
 class EndpointTaskResp(BaseTaskResp):
@@ -135,16 +136,16 @@ class GetEndpointActivityDataResp(BaseLinkableResp[EndpointActivity]):
     progress_rate: int
 
 
-class GetEndpointActivityDataCountResp(BaseResponse):
-    total_count: int
+class GetEndpointActivityDataCountResp(BaseActivityCountResp):
+    ...
 
 
 class GetEmailActivityDataResp(BaseLinkableResp[EmailActivity]):
     progress_rate: int
 
 
-class GetEmailActivityDataCountResp(BaseResponse):
-    total_count: int
+class GetEmailActivityDataCountResp(BaseActivityCountResp):
+    ...
 
 
 class GetEndpointDataResp(BaseLinkableResp[Endpoint]):
@@ -220,6 +221,13 @@ class SandboxSubmitUrlTaskResp(BaseTaskResp):
     sandbox_task_id: str
 
 
+class SaveFileResp(BaseResponse):
+    path: Optional[str] = None
+    size: int
+    elapsed_time: float
+    throughput: float
+
+
 class TerminateProcessTaskResp(BaseTaskResp):
     agent_guid: str
     endpoint_name: str
@@ -0,0 +1,542 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import inspect
+import logging
+import threading
+from concurrent.futures import Future
+from contextlib import asynccontextmanager, nullcontext
+from logging import Logger
+from queue import Empty, Full, Queue, SimpleQueue
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    ContextManager,
+    Generator,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from .model.responses import BaseLinkableResp, C
+from .spool import SpooledItems
+
+T = TypeVar("T")
+
+log: Logger = logging.getLogger(__name__)
+
+
+class Paginator(Generic[C]):
+    """Lazily iterates over the records of a paginated Vision One API.
+
+    Iterating over the paginator yields records, :meth:`pages` yields the
+    raw pages instead. Pages are fetched one at a time by following their
+    ``nextLink``, only one page is held in memory at any time unless
+    ``prefetch`` is set, in which case up to ``prefetch`` pages are fetched
+    by a background thread while the current page is consumed.
+    Exceptions raised while fetching a page are propagated to the caller.
+    Every iteration runs in ``scope``, which is exited once the iteration
+    ends, fails or is closed.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[Optional[BaseLinkableResp[C]]], BaseLinkableResp[C]],
+        max_items: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        prefetch: int = 0,
+        scope: Callable[[], ContextManager[Any]] = nullcontext,
+    ):
+        self._fetch = fetch
+        self._max_items = max_items
+        self._max_pages = max_pages
+        self._prefetch = prefetch
+        self._scope = scope
+
+    def __iter__(self) -> Iterator[C]:
+        count: int = 0
+        if _is_limit_reached(count, self._max_items):
+            return
+        for page in self.pages():
+            for item in page.items:
+                yield item
+                count += 1
+                if _is_limit_reached(count, self._max_items):
+                    log.debug("Maximum items reached [Total=%s]", count)
+                    return
+
+    def pages(self) -> Iterator[BaseLinkableResp[C]]:
+        """Iterates over the pages, following ``nextLink`` until
+        the last page or ``max_pages`` is reached.
+
+        :rtype: Iterator[BaseLinkableResp[C]]
+        """
+        with self._scope():
+            if self._prefetch > 0:
+                yield from _prefetch(self._pages(), self._prefetch)
+            else:
+                yield from self._pages()
+
+    def _pages(self) -> Iterator[BaseLinkableResp[C]]:
+        count: int = 0
+        page: Optional[BaseLinkableResp[C]] = None
+        while not _is_limit_reached(count, self._max_pages):
+            page = self._fetch(page)
+            count += 1
+            yield page
+            if isinstance(page.items, Iterator):
+                for _ in page.items:
+                    pass
+            if not page.next_link:
+                return
+            log.debug("Found nextLink")
+
+
+class PendingItems(Sequence[C]):
+    """Records of a page validated by a worker process, see
+    :class:`~pytmv1.ParsePolicy`. Reading the records waits for the
+    worker and raises the error of the validation if any.
+    """
+
+    __slots__ = ("_future",)
+
+    def __init__(self, future: Future[List[C]]):
+        self._future = future
+
+    @overload
+    def __getitem__(self, index: int) -> C:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[C]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[C, Sequence[C]]:
+        return self.result()[index]
+
+    def __iter__(self) -> Iterator[C]:
+        return iter(self.result())
+
+    def __len__(self) -> int:
+        return len(self.result())
+
+    def __eq__(self, other: object) -> bool:
+        return self.result() == (
+            other.result() if isinstance(other, PendingItems) else other
+        )
+
+    def __repr__(self) -> str:
+        if not self._future.done():
+            return f"{type(self).__name__}(<pending>)"
+        return f"{type(self).__name__}({self.result()!r})"
+
+    def result(self) -> List[C]:
+        """Waits for the worker and returns the records.
+
+        :raises pydantic.ValidationError: If a record is invalid.
+        :rtype: List[C]
+        """
+        return self._future.result()
+
+
+@asynccontextmanager
+async def _no_scope() -> AsyncIterator[None]:
+    yield
+
+
+class AsyncPaginator(Generic[C]):
+    """Asynchronous counterpart of :class:`Paginator`."""
+
+    def __init__(
+        self,
+        fetch: Callable[
+            [Optional[BaseLinkableResp[C]]], Awaitable[BaseLinkableResp[C]]
+        ],
+        max_items: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        prefetch: int = 0,
+        scope: Callable[[], AsyncContextManager[Any]] = _no_scope,
+    ):
+        self._fetch = fetch
+        self._max_items = max_items
+        self._max_pages = max_pages
+        self._prefetch = prefetch
+        self._scope = scope
+
+    async def __aiter__(self) -> AsyncIterator[C]:
+        count: int = 0
+        if _is_limit_reached(count, self._max_items):
+            return
+        async for page in self.pages():
+            async for item in _aiter_items(page):
+                yield item
+                count += 1
+                if _is_limit_reached(count, self._max_items):
+                    log.debug("Maximum items reached [Total=%s]", count)
+                    return
+
+    async def pages(self) -> AsyncIterator[BaseLinkableResp[C]]:
+        """Iterates over the pages, following ``nextLink`` until
+        the last page or ``max_pages`` is reached.
+
+        :rtype: AsyncIterator[BaseLinkableResp[C]]
+        """
+        async with self._scope():
+            pages: AsyncGenerator[BaseLinkableResp[C], None] = (
+                _async_prefetch(self._pages(), self._prefetch)
+                if self._prefetch > 0
+                else self._pages()
+            )
+            try:
+                async for page in pages:
+                    yield page
+            finally:
+                await pages.aclose()
+
+    async def _pages(self) -> AsyncGenerator[BaseLinkableResp[C], None]:
+        count: int = 0
+        page: Optional[BaseLinkableResp[C]] = None
+        while not _is_limit_reached(count, self._max_pages):
+            page = await self._fetch(page)
+            count += 1
+            yield page
+            if isinstance(page.items, AsyncIterator):
+                async for _ in page.items:
+                    pass
+            if not page.next_link:
+                return
+            log.debug("Found nextLink")
+
+
+async def _aiter_items(page: BaseLinkableResp[C]) -> AsyncIterator[C]:
+    """Iterates over the items of a page, streamed pages hold
+    an asynchronous iterator instead of a list. Spooled records are
+    read back from disk and parsed in a thread."""
+    items: Any = page.items
+    if isinstance(items, AsyncIterator):
+        async for item in items:
+            yield item
+    elif isinstance(items, PendingItems):
+        for item in await asyncio.wrap_future(items._future):
+            yield item
+    elif isinstance(items, SpooledItems):
+        loop = asyncio.get_running_loop()
+        for item in await loop.run_in_executor(None, items.result):
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+def _consume_pooled(
+    items: Iterable[T],
+    consumer: Callable[[T], None],
+    workers: int,
+    queue_size: int,
+    ordered: bool = False,
+) -> Tuple[int, List[Exception]]:
+    """Hands ``items`` to consumer threads through a queue of at most
+    ``queue_size`` items, iterating ``items`` blocks while the queue is
+    full. Items are consumed by a single thread if ``ordered`` is set.
+    Exceptions raised by ``consumer`` are collected instead of stopping
+    the consumption, the number of consumed items is returned along."""
+    tasks: Queue[Any] = Queue(max(1, queue_size))
+    errors: List[Exception] = []
+    counts: List[int] = []
+
+    def consume() -> None:
+        count: int = 0
+        while True:
+            item = tasks.get()
+            if item is _END:
+                counts.append(count)
+                return
+            try:
+                consumer(item)
+                count += 1
+            except Exception as exc:
+                log.debug("Consumer failed [Error=%s]", exc)
+                errors.append(exc)
+
+    threads: List[threading.Thread] = [
+        threading.Thread(
+            target=contextvars.copy_context().run,
+            args=(consume,),
+            name="pytmv1-consumer",
+            daemon=True,
+        )
+        for _ in range(1 if ordered else max(1, workers))
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        for item in items:
+            tasks.put(item)
+    finally:
+        for _ in threads:
+            tasks.put(_END)
+        for thread in threads:
+            thread.join()
+    return sum(counts), errors
+
+
+async def _async_consume_pooled(
+    items: AsyncIterable[T],
+    consumer: Callable[[T], Optional[Awaitable[None]]],
+    workers: int,
+    queue_size: int,
+    ordered: bool = False,
+) -> Tuple[int, List[Exception]]:
+    """Asynchronous counterpart of :func:`_consume_pooled`,
+    items are consumed by tasks."""
+    tasks: asyncio.Queue[Any] = asyncio.Queue(max(1, queue_size))
+    errors: List[Exception] = []
+
+    async def consume() -> int:
+        count: int = 0
+        while True:
+            item = await tasks.get()
+            if item is _END:
+                return count
+            try:
+                consumed = consumer(item)
+                if inspect.isawaitable(consumed):
+                    await consumed
+                count += 1
+            except Exception as exc:
+                log.debug("Consumer failed [Error=%s]", exc)
+                errors.append(exc)
+
+    runners: List[asyncio.Future[int]] = [
+        asyncio.ensure_future(consume())
+        for _ in range(1 if ordered else max(1, workers))
+    ]
+    try:
+        async for item in items:
+            await tasks.put(item)
+    finally:
+        for _ in runners:
+            await tasks.put(_END)
+        counts: List[int] = await asyncio.gather(*runners)
+    return sum(counts), errors
+
+
+def _merge(
+    sources: Sequence[Iterator[T]],
+    workers: int,
+    depth: int,
+    ordered: bool = False,
+) -> Generator[T, None, None]:
+    """Runs the ``sources`` iterators in at most ``workers`` threads,
+    at most ``depth`` items of an iterator are buffered ahead of the
+    consumer. Items of an iterator are yielded in their order, after
+    the items of the previous iterators if ``ordered`` is set and as soon
+    as produced otherwise. Iterators are started in their order so that
+    the ordered merge never waits for an iterator which is not started,
+    the first exception raised by an iterator is propagated."""
+    size: int = max(1, depth)
+    buffers: List[Queue[Tuple[Any, Optional[BaseException]]]] = (
+        [Queue(size) for _ in sources]
+        if ordered
+        else [Queue(size * max(1, workers))] * len(sources)
+    )
+    pending: SimpleQueue[Tuple[Iterator[T], Queue[Any]]] = SimpleQueue()
+    for source, buffer in zip(sources, buffers):
+        pending.put((source, buffer))
+    stop = threading.Event()
+    for _ in range(min(max(1, workers), len(sources))):
+        threading.Thread(
+            target=contextvars.copy_context().run,
+            args=(_produce, pending, stop),
+            name="pytmv1-shard",
+            daemon=True,
+        ).start()
+    try:
+        index: int = 0
+        while index < len(buffers):
+            item, exc = buffers[index].get()
+            if exc:
+                raise exc
+            if item is _END:
+                index += 1
+                continue
+            yield item
+    finally:
+        stop.set()
+
+
+async def _async_merge(
+    sources: Sequence[AsyncIterator[T]],
+    workers: int,
+    depth: int,
+    ordered: bool = False,
+) -> AsyncGenerator[T, None]:
+    """Asynchronous counterpart of :func:`_merge`,
+    iterators are run by tasks."""
+    size: int = max(1, depth)
+    buffers: List[asyncio.Queue[Tuple[Any, Optional[BaseException]]]] = (
+        [asyncio.Queue(size) for _ in sources]
+        if ordered
+        else [asyncio.Queue(size * max(1, workers))] * len(sources)
+    )
+    pending: Iterator[
+        Tuple[
+            AsyncIterator[T],
+            asyncio.Queue[Tuple[Any, Optional[BaseException]]],
+        ]
+    ] = zip(sources, buffers)
+
+    async def produce() -> None:
+        for source, buffer in pending:
+            try:
+                async for item in source:
+                    await buffer.put((item, None))
+                await buffer.put((_END, None))
+            except Exception as exc:
+                await buffer.put((_END, exc))
+
+    runners: List[asyncio.Future[None]] = [
+        asyncio.ensure_future(produce())
+        for _ in range(min(max(1, workers), len(sources)))
+    ]
+    try:
+        index: int = 0
+        while index < len(buffers):
+            item, exc = await buffers[index].get()
+            if exc:
+                raise exc
+            if item is _END:
+                index += 1
+                continue
+            yield item
+    finally:
+        for runner in runners:
+            runner.cancel()
+
+
+def _is_limit_reached(count: int, limit: Optional[int]) -> bool:
+    return limit is not None and count >= limit
+
+
+def _prefetch(pages: Iterator[T], depth: int) -> Iterator[T]:
+    """Runs ``pages`` in a background thread, at most ``depth`` pages
+    are fetched ahead of the page currently consumed."""
+    buffer: SimpleQueue[Tuple[Any, Optional[BaseException]]] = SimpleQueue()
+    slots = threading.Semaphore(depth + 1)
+    stop = threading.Event()
+
+    def produce() -> None:
+        try:
+            while _acquire(slots, stop):
+                page = next(pages, _END)
+                buffer.put((page, None))
+                if page is _END:
+                    return
+        except BaseException as exc:
+            buffer.put((_END, exc))
+
+    threading.Thread(
+        target=contextvars.copy_context().run,
+        args=(produce,),
+        name="pytmv1-prefetch",
+        daemon=True,
+    ).start()
+    try:
+        while True:
+            page, exc = buffer.get()
+            if exc:
+                raise exc
+            if page is _END:
+                return
+            yield page
+            slots.release()
+    finally:
+        stop.set()
+
+
+async def _async_prefetch(
+    pages: AsyncIterator[T], depth: int
+) -> AsyncGenerator[T, None]:
+    """Asynchronous counterpart of :func:`_prefetch`,
+    pages are fetched by a background task."""
+    buffer: asyncio.Queue[Tuple[Any, Optional[BaseException]]] = (
+        asyncio.Queue()
+    )
+    slots = asyncio.Semaphore(depth + 1)
+
+    async def produce() -> None:
+        try:
+            while True:
+                await slots.acquire()
+                page = await pages.__anext__()
+                buffer.put_nowait((page, None))
+        except StopAsyncIteration:
+            buffer.put_nowait((_END, None))
+        except Exception as exc:
+            buffer.put_nowait((_END, exc))
+
+    task = asyncio.ensure_future(produce())
+    try:
+        while True:
+            page, exc = await buffer.get()
+            if exc:
+                raise exc
+            if page is _END:
+                return
+            yield page
+            slots.release()
+    finally:
+        task.cancel()
+
+
+def _produce(
+    pending: SimpleQueue[Tuple[Iterator[Any], Queue[Any]]],
+    stop: threading.Event,
+) -> None:
+    """Runs the pending iterators one after the other until none is left,
+    their items are put in their buffer followed by :data:`_END`."""
+    while not stop.is_set():
+        try:
+            source, buffer = pending.get_nowait()
+        except Empty:
+            return
+        try:
+            for item in source:
+                if not _put(buffer, (item, None), stop):
+                    return
+            _put(buffer, (_END, None), stop)
+        except BaseException as exc:
+            _put(buffer, (_END, exc), stop)
+
+
+def _put(queue: Queue[Any], item: Any, stop: threading.Event) -> bool:
+    while not stop.is_set():
+        try:
+            queue.put(item, timeout=0.1)
+            return True
+        except Full:
+            pass
+    return False
+
+
+def _acquire(slots: threading.Semaphore, stop: threading.Event) -> bool:
+    while not stop.is_set():
+        if slots.acquire(timeout=0.1):
+            return not stop.is_set()
+    return False
+
+
+_END: Any = object()
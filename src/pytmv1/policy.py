@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import random
+import re
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from fnmatch import fnmatchcase
+from typing import FrozenSet, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .model.enums import HttpMethod
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry policy applied to every HTTP request sent to Vision One.
+
+    :param max_retries: Maximum number of retries of a single request.
+    :type max_retries: int
+    :param budget: Maximum number of retries shared by all requests
+     sent during one client call (ie: all pages of a consume call),
+     unlimited if not set.
+    :type budget: Optional[int]
+    :param backoff_factor: Delay in seconds before the first retry,
+     doubled on every subsequent retry.
+    :type backoff_factor: float
+    :param backoff_max: Maximum delay in seconds between two retries.
+    :type backoff_max: float
+    :param jitter: Randomize delays between 0 and the computed backoff.
+    :type jitter: bool
+    :param respect_retry_after: Wait at least the delay requested by
+     the server in the ``Retry-After`` header.
+    :type respect_retry_after: bool
+    :param retry_after_max: Maximum delay in seconds taken from the
+     ``Retry-After`` header.
+    :type retry_after_max: float
+    :param status_codes: Response status codes which trigger a retry.
+    :type status_codes: FrozenSet[int]
+    :param methods: HTTP methods which can be retried, non-idempotent
+     methods are excluded by default.
+    :type methods: FrozenSet[HttpMethod]
+    """
+
+    max_retries: int = 3
+    budget: Optional[int] = None
+    backoff_factor: float = 0.5
+    backoff_max: float = 30
+    jitter: bool = True
+    respect_retry_after: bool = True
+    retry_after_max: float = 120
+    status_codes: FrozenSet[int] = field(
+        default=frozenset({429, 500, 502, 503, 504})
+    )
+    methods: FrozenSet[HttpMethod] = field(
+        default=frozenset({HttpMethod.GET, HttpMethod.PUT, HttpMethod.DELETE})
+    )
+
+    def can_retry(
+        self, method: Optional[str], retries: int, spent: int
+    ) -> bool:
+        """Checks if a request can be retried.
+
+        :param method: HTTP method of the request.
+        :type method: Optional[str]
+        :param retries: Number of retries already done for this request.
+        :type retries: int
+        :param spent: Number of retries already done during this call.
+        :type spent: int
+        :rtype: bool
+        """
+        return (
+            retries < self.max_retries
+            and (self.budget is None or spent < self.budget)
+            and method in {m.value for m in self.methods}
+        )
+
+    def delay(self, retries: int, retry_after: Optional[str] = None) -> float:
+        """Computes the delay in seconds before the next retry.
+
+        :param retries: Number of retries already done for this request.
+        :type retries: int
+        :param retry_after: Value of the ``Retry-After`` response header.
+        :type retry_after: Optional[str]
+        :rtype: float
+        """
+        backoff: float = min(
+            self.backoff_max, self.backoff_factor * (2**retries)
+        )
+        if self.jitter:
+            backoff = random.uniform(0, backoff)
+        if self.respect_retry_after and retry_after:
+            backoff = max(
+                backoff,
+                min(self.retry_after_max, _parse_retry_after(retry_after)),
+            )
+        return backoff
+
+
+@dataclass(frozen=True)
+class PollPolicy:
+    """Schedule of the status requests sent while waiting for a task
+    or a sandbox submission to complete.
+
+    :param initial_interval: Delay in seconds before the second poll.
+    :type initial_interval: float
+    :param factor: Growth factor applied to the delay after every poll.
+    :type factor: float
+    :param max_interval: Maximum delay in seconds between two polls.
+    :type max_interval: float
+    :param jitter: Fraction of the delay randomly added or removed,
+     spreads the polls of concurrent waits.
+    :type jitter: float
+    """
+
+    initial_interval: float = 1
+    factor: float = 1.5
+    max_interval: float = 30
+    jitter: float = 0.1
+
+    def delay(self, polls: int) -> float:
+        """Computes the delay in seconds before the next poll.
+
+        :param polls: Number of polls already done.
+        :type polls: int
+        :rtype: float
+        """
+        try:
+            interval: float = min(
+                self.max_interval,
+                self.initial_interval * (self.factor ** max(0, polls - 1)),
+            )
+        except OverflowError:
+            interval = self.max_interval
+        if self.jitter:
+            interval *= 1 + random.uniform(-self.jitter, self.jitter)
+        return max(0.0, interval)
+
+
+@dataclass(frozen=True)
+class BulkPolicy:
+    """Splitting of bulk requests (ie: isolate_endpoint) in chunks
+    sent concurrently, the results are merged back in input order.
+
+    :param max_items: Maximum number of items sent in a single request.
+    :type max_items: int
+    :param max_bytes: Maximum size in bytes of the JSON body of a single
+     request, a single item larger than this limit is sent alone.
+    :type max_bytes: int
+    :param workers: Maximum number of chunks sent concurrently, the sync
+     client sends at most ``pool_maxsize`` chunks at once.
+    :type workers: int
+    """
+
+    max_items: int = 100
+    max_bytes: int = 1_000_000
+    workers: int = 4
+
+
+@dataclass(frozen=True)
+class LogPolicy:
+    """Logging of the HTTP requests sent to Vision One and of their
+    responses, nothing is formatted unless the INFO level is enabled.
+
+    :param max_body: Maximum number of bytes of a body written to the
+     logs, bodies are written in full if not set.
+    :type max_body: Optional[int]
+    :param sample_rate: Fraction of the requests logged, responses with
+     an error status are always logged.
+    :type sample_rate: float
+    :param sampling: Sample rates overriding ``sample_rate`` for the
+     requests whose URL path ends with an API path
+     (ie: ``Api.GET_ALERT_LIST``), placeholders match any value.
+    :type sampling: FrozenSet[Tuple[str, float]]
+    """
+
+    max_body: Optional[int] = 1024
+    sample_rate: float = 1.0
+    sampling: FrozenSet[Tuple[str, float]] = field(default=frozenset())
+
+    def sampled(self, url: str) -> bool:
+        """Checks if a request is logged.
+
+        :param url: URL of the request.
+        :type url: str
+        :rtype: bool
+        """
+        rate: float = self.sample_rate
+        if self.sampling:
+            path: str = urlsplit(url).path
+            matches: List[Tuple[int, float]] = [
+                (len(api), api_rate)
+                for api, api_rate in self.sampling
+                if fnmatchcase(path, "*" + re.sub("\\{\\d*\\}", "*", api))
+            ]
+            if matches:
+                rate = max(matches)[1]
+        return rate >= 1 or random.random() < rate
+
+
+@dataclass(frozen=True)
+class ParsePolicy:
+    """Validation of large pages in worker processes, so that pages are
+    validated on several cores while the next pages are fetched.
+
+    Pages are decoded by the fetching thread to follow their nextLink,
+    their body is sent to a worker which validates the records, reading
+    the records of the page waits for the worker. Only applies to
+    validated records of paginated APIs when not streamed, the models
+    and the codec must be picklable. Workers are spawned, not forked,
+    and import the models and the codec on their first page. They are
+    started by the first large page of a call and shut down once the
+    call, or the iteration of its paginator, ends.
+
+    :param processes: Number of worker processes, pages are validated
+     by the fetching thread if 0. At least this number of pages are
+     prefetched.
+    :type processes: int
+    :param min_bytes: Minimum size in bytes of a page sent to a worker,
+     smaller pages are validated by the fetching thread.
+    :type min_bytes: int
+    """
+
+    processes: int = 0
+    min_bytes: int = 1_000_000
+
+
+@dataclass(frozen=True)
+class SpoolPolicy:
+    """Buffering on disk of the pages fetched by consume calls, so that
+    pages are fetched at network speed with constant memory whatever the
+    pace of the consumer.
+
+    The body of every page is written to a length-prefixed record of a
+    memory-mapped segment file, the records of a page are read back and
+    parsed when the consumer reaches the page. A segment file is deleted
+    once all its records are read. Only applies to consume calls when
+    records are not streamed.
+
+    :param directory: Directory of the segment files, temporary directory
+     of the system if not set.
+    :type directory: Optional[str]
+    :param segment_bytes: Size in bytes of a segment file, a larger page
+     is written to a segment of its own.
+    :type segment_bytes: int
+    """
+
+    directory: Optional[str] = None
+    segment_bytes: int = 64 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ShardPolicy:
+    """Splitting of an activity search in time windows of roughly equal
+    volume, fetched concurrently by consume calls.
+
+    The range of the search is split in two until every window holds at
+    most ``1/shards`` of the records, the records of a window are
+    counted with a ``countOnly`` search. Windows share their boundary
+    second. The windows are fetched by threads (tasks for the async
+    client) sharing the connections of the client, the sync client uses
+    at most ``pool_maxsize`` threads.
+
+    :param shards: Number of windows of equal volume the range is split
+     in, windows without record are skipped.
+    :type shards: int
+    :param max_records: Maximum number of records of a window, denser
+     windows are split again, only ``shards`` applies if not set.
+    :type max_records: Optional[int]
+    :param min_seconds: Minimum duration in seconds of a window, shorter
+     windows are not split whatever their number of records.
+    :type min_seconds: int
+    :param workers: Maximum number of windows fetched concurrently.
+    :type workers: int
+    """
+
+    shards: int = 8
+    max_records: Optional[int] = None
+    min_seconds: int = 60
+    workers: int = 4
+
+    def limit(self, total: int) -> int:
+        """Computes the maximum number of records of a window.
+
+        :param total: Number of records of the whole range.
+        :type total: int
+        :rtype: int
+        """
+        limit: int = max(1, -(-total // max(1, self.shards)))
+        if self.max_records is not None:
+            limit = min(limit, max(1, self.max_records))
+        return limit
+
+
+NO_RETRY: RetryPolicy = RetryPolicy(max_retries=0)
+DEFAULT_BULK: BulkPolicy = BulkPolicy()
+DEFAULT_LOG: LogPolicy = LogPolicy()
+DEFAULT_PARSE: ParsePolicy = ParsePolicy()
+DEFAULT_POLL: PollPolicy = PollPolicy()
+
+
+def _parse_retry_after(retry_after: str) -> float:
+    if retry_after.strip().isdigit():
+        return float(retry_after)
+    try:
+        return max(
+            0.0, parsedate_to_datetime(retry_after).timestamp() - time.time()
+        )
+    except (TypeError, ValueError):
+        return 0.0
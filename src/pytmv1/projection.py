@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+)
+
+from pydantic import create_model
+
+from .compat import has_pre_validators, model_fields, subset_model
+from .model.commons import BaseConsumable
+from .model.responses import BaseLinkableResp
+
+L = TypeVar("L", bound="BaseLinkableResp[Any]")
+
+
+def select_fields(
+    class_: Type[BaseConsumable], select: Optional[Iterable[str]]
+) -> Optional[List[str]]:
+    """Maps the fields selected by name (ie: ``endpoint_guid``) or by API
+    name (ie: ``endpointGuid``) to the API names of the ``select`` query,
+    unknown names are sent as is.
+
+    :param class_: Model of the records.
+    :type class_: Type[BaseConsumable]
+    :param select: Names of the fields.
+    :type select: Optional[Iterable[str]]
+    :rtype: Optional[List[str]]
+    """
+    if not select:
+        return None
+    aliases: Dict[str, str] = _aliases(class_)
+    return list(dict.fromkeys(aliases.get(name, name) for name in select))
+
+
+def project(
+    class_: Type[BaseConsumable], select: Optional[Iterable[str]]
+) -> Type[BaseConsumable]:
+    """Creates the model of the records returned for a ``select`` query,
+    it only declares the selected fields so that records skip the
+    validation of the missing ones. One model is created per selection,
+    the model itself is returned if all or none of its fields are
+    selected or if it maps its input before validation.
+
+    :param class_: Model of the records.
+    :type class_: Type[BaseConsumable]
+    :param select: Names or API names of the fields.
+    :type select: Optional[Iterable[str]]
+    :rtype: Type[BaseConsumable]
+    """
+    selected: FrozenSet[str] = frozenset(select_fields(class_, select) or ())
+    names: FrozenSet[str] = frozenset(
+        name
+        for name, field in model_fields(class_).items()
+        if field.alias in selected
+    )
+    if (
+        not names
+        or len(names) == len(model_fields(class_))
+        or has_pre_validators(class_)
+    ):
+        return class_
+    return _project(class_, names)
+
+
+def project_linkable(
+    class_: Type[L], select: Optional[Iterable[str]]
+) -> Type[L]:
+    """Creates the response of a ``select`` query, its items are records
+    of the model created by :func:`project`.
+
+    :param class_: Response holding the records.
+    :type class_: Type[BaseLinkableResp]
+    :param select: Names or API names of the fields.
+    :type select: Optional[Iterable[str]]
+    :rtype: Type[BaseLinkableResp]
+    """
+    record_type: Type[BaseConsumable] = model_fields(class_)[
+        "items"
+    ].annotation.__args__[0]
+    projected: Type[BaseConsumable] = project(record_type, select)
+    if projected is record_type:
+        return class_
+    return _project_linkable(class_, projected)
+
+
+@lru_cache(maxsize=None)
+def _aliases(class_: Type[BaseConsumable]) -> Dict[str, str]:
+    aliases: Dict[str, str] = {
+        name: field.alias for name, field in model_fields(class_).items()
+    }
+    aliases.update({alias: alias for alias in aliases.values()})
+    return aliases
+
+
+@lru_cache(maxsize=None)
+def _project(
+    class_: Type[BaseConsumable], names: FrozenSet[str]
+) -> Type[BaseConsumable]:
+    return subset_model(
+        BaseConsumable,
+        class_,
+        [name for name in model_fields(class_) if name in names],
+    )
+
+
+@lru_cache(maxsize=None)
+def _project_linkable(
+    class_: Type[L], record_type: Type[BaseConsumable]
+) -> Type[L]:
+    list_type: Any = List
+    return create_model(
+        class_.__name__,
+        __base__=class_,
+        __module__=class_.__module__,
+        items=(list_type[record_type], []),
+    )
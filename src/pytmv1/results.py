@@ -2,14 +2,28 @@ from __future__ import annotations
 
 import logging
 import time
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from enum import Enum
 from functools import wraps
+from json import JSONDecodeError
 from logging import Logger
-from typing import Any, Callable, Generic, List, Optional, TypeVar
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
+from httpx import HTTPError
 from pydantic import ValidationError
 from requests import RequestException
+from urllib3.exceptions import HTTPError as UrllibError
 
 from .exceptions import ServerCustError, ServerJsonError, ServerMultiJsonError
 from .model.commons import Error, MsError
@@ -20,15 +34,50 @@ F = TypeVar("F", bound=Callable[..., Any])
 
 log: Logger = logging.getLogger(__name__)
 
+HANDLED_ERRORS: Tuple[Type[Exception], ...] = (
+    ServerCustError,
+    ServerJsonError,
+    ServerMultiJsonError,
+    ValidationError,
+    RequestException,
+    HTTPError,
+    UrllibError,
+    JSONDecodeError,
+    RuntimeError,
+)
+
+
+@dataclass
+class CallStats:
+    retries: int = 0
+    polls: int = 0
+
+
+_call_stats: ContextVar[Optional[CallStats]] = ContextVar(
+    "call_stats", default=None
+)
+
+
+def call_stats() -> CallStats:
+    """Statistics of the client call running in the current context,
+    a detached instance is returned outside a client call."""
+    stats: Optional[CallStats] = _call_stats.get()
+    return stats if stats else CallStats()
+
 
 def multi_result(func: F) -> Callable[..., MultiResult[MR]]:
     @wraps(func)
     def _multi_result(*args: Any, **kwargs: Any) -> MultiResult[MR]:
-        obj: MR | Exception = _wrapper(func, *args, **kwargs)
+        stats: CallStats = CallStats()
+        token = _call_stats.set(stats)
+        try:
+            obj: MR | Exception = _wrapper(func, *args, **kwargs)
+        finally:
+            _call_stats.reset(token)
         return (
-            MultiResult.success(obj)
+            MultiResult.success(obj, stats)
             if not isinstance(obj, Exception)
-            else MultiResult.failed(obj)
+            else MultiResult.failed(obj, stats)
         )
 
     return _multi_result
@@ -37,16 +86,83 @@ def multi_result(func: F) -> Callable[..., MultiResult[MR]]:
 def result(func: F) -> Callable[..., Result[R]]:
     @wraps(func)
     def _result(*args: Any, **kwargs: Any) -> Result[R]:
-        obj: R | Exception = _wrapper(func, *args, **kwargs)
+        stats: CallStats = CallStats()
+        token = _call_stats.set(stats)
+        try:
+            obj: R | Exception = _wrapper(func, *args, **kwargs)
+        finally:
+            _call_stats.reset(token)
+        return (
+            Result.success(obj, stats)
+            if not isinstance(obj, Exception)
+            else Result.failed(obj, stats)
+        )
+
+    return _result
+
+
+def async_multi_result(
+    func: F,
+) -> Callable[..., Awaitable[MultiResult[MR]]]:
+    @wraps(func)
+    async def _multi_result(*args: Any, **kwargs: Any) -> MultiResult[MR]:
+        stats: CallStats = CallStats()
+        token = _call_stats.set(stats)
+        try:
+            obj: MR | Exception = await _async_wrapper(func, *args, **kwargs)
+        finally:
+            _call_stats.reset(token)
+        return (
+            MultiResult.success(obj, stats)
+            if not isinstance(obj, Exception)
+            else MultiResult.failed(obj, stats)
+        )
+
+    return _multi_result
+
+
+def async_result(func: F) -> Callable[..., Awaitable[Result[R]]]:
+    @wraps(func)
+    async def _result(*args: Any, **kwargs: Any) -> Result[R]:
+        stats: CallStats = CallStats()
+        token = _call_stats.set(stats)
+        try:
+            obj: R | Exception = await _async_wrapper(func, *args, **kwargs)
+        finally:
+            _call_stats.reset(token)
         return (
-            Result.success(obj)
+            Result.success(obj, stats)
             if not isinstance(obj, Exception)
-            else Result.failed(obj)
+            else Result.failed(obj, stats)
         )
 
     return _result
 
 
+async def _async_wrapper(func: F, *args: Any, **kwargs: Any) -> R | Exception:
+    try:
+        start_time: float = time.time()
+        log.debug(
+            "Execution started [%s, %s]",
+            args,
+            kwargs,
+        )
+        response: R = await func(*args, **kwargs)
+        log.debug(
+            "Execution finished [Elapsed=%s, %s]",
+            time.time() - start_time,
+            response,
+        )
+        return response
+    except HANDLED_ERRORS as exc:
+        log.error(
+            "Unexpected issue occurred [%s]",
+            exc,
+            exc_info=log.isEnabledFor(logging.DEBUG),
+        )
+        return exc
+
+
 def _wrapper(func: F, *args: Any, **kwargs: Any) -> R | Exception:
     try:
         start_time: float = time.time()
@@ -62,15 +178,12 @@ def _wrapper(func: F, *args: Any, **kwargs: Any) -> R | Exception:
             response,
         )
         return response
-    except (
-        ServerCustError,
-        ServerJsonError,
-        ServerMultiJsonError,
-        ValidationError,
-        RequestException,
-        RuntimeError,
-    ) as exc:
-        log.exception("Unexpected issue occurred [%s]", exc)
+    except HANDLED_ERRORS as exc:
+        log.error(
+            "Unexpected issue occurred [%s]",
+            exc,
+            exc_info=log.isEnabledFor(logging.DEBUG),
+        )
         return exc
 
 
@@ -112,34 +225,57 @@ class BaseResult(Generic[R]):
 @dataclass
 class Result(BaseResult[R]):
     error: Optional[Error] = None
+    retries: int = 0
+    polls: int = 0
 
     @classmethod
-    def success(cls, response: R) -> Result[R]:
-        return cls(ResultCode.SUCCESS, response)
+    def success(
+        cls, response: R, stats: Optional[CallStats] = None
+    ) -> Result[R]:
+        return cls(
+            ResultCode.SUCCESS,
+            response,
+            retries=stats.retries if stats else 0,
+            polls=stats.polls if stats else 0,
+        )
 
     @classmethod
-    def failed(cls, exc: Exception) -> Result[R]:
+    def failed(
+        cls, exc: Exception, stats: Optional[CallStats] = None
+    ) -> Result[R]:
         return cls(
             ResultCode.ERROR,
             None,
             _error(exc),
+            retries=stats.retries if stats else 0,
+            polls=stats.polls if stats else 0,
         )
 
 
 @dataclass
 class MultiResult(BaseResult[MR]):
     errors: List[MsError] = field(default_factory=list)
+    retries: int = 0
 
     @classmethod
-    def success(cls, response: MR) -> MultiResult[MR]:
-        return cls(ResultCode.SUCCESS, response)
+    def success(
+        cls, response: MR, stats: Optional[CallStats] = None
+    ) -> MultiResult[MR]:
+        return cls(
+            ResultCode.SUCCESS,
+            response,
+            retries=stats.retries if stats else 0,
+        )
 
     @classmethod
-    def failed(cls, exc: Exception) -> MultiResult[MR]:
+    def failed(
+        cls, exc: Exception, stats: Optional[CallStats] = None
+    ) -> MultiResult[MR]:
         return cls(
             ResultCode.ERROR,
             None,
             _errors(exc),
+            retries=stats.retries if stats else 0,
         )
 
 
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Tuple
+
+from .compat import parse_obj_as
+from .policy import ShardPolicy
+
+TIME_FORMAT: str = "%Y-%m-%dT%H:%M:%SZ"
+DEFAULT_RANGE: timedelta = timedelta(hours=24)
+
+
+@dataclass(frozen=True)
+class TimeWindow:
+    """Time range of an activity search, see :class:`~pytmv1.ShardPolicy`.
+    Both bounds are included as the ``startDateTime`` and ``endDateTime``
+    of the search, to the second.
+
+    :param start: Start of the range, included.
+    :type start: datetime
+    :param end: End of the range, included.
+    :type end: datetime
+    :param count: Number of records of the range.
+    :type count: int
+    """
+
+    start: datetime
+    end: datetime
+    count: int = 0
+
+    @classmethod
+    def from_params(cls, params: Dict[str, Any]) -> TimeWindow:
+        """Reads the range of the query parameters of a search, the API
+        defaults apply to the missing bounds (ie: last 24 hours). Bounds
+        are ISO 8601 times, in UTC if they have no offset.
+
+        :param params: Query parameters of the search.
+        :type params: Dict[str, Any]
+        :raises pydantic.ValidationError: If a bound is not a valid time.
+        :rtype: TimeWindow
+        """
+        end: datetime = (
+            _parse_time(params["endDateTime"])
+            if params.get("endDateTime")
+            else datetime.now(timezone.utc).replace(microsecond=0)
+        )
+        start: datetime = (
+            _parse_time(params["startDateTime"])
+            if params.get("startDateTime")
+            else end - DEFAULT_RANGE
+        )
+        return cls(start, end)
+
+    @property
+    def seconds(self) -> int:
+        """Duration of the range in seconds.
+
+        :rtype: int
+        """
+        return int((self.end - self.start).total_seconds())
+
+    def halves(self) -> Tuple[TimeWindow, TimeWindow]:
+        """Splits the range in two at the second in its middle, the
+        second half starts one second after the end of the first one so
+        that no record falls in both. The records are not counted.
+
+        :rtype: Tuple[TimeWindow, TimeWindow]
+        """
+        middle: datetime = self.start + timedelta(seconds=self.seconds // 2)
+        return TimeWindow(self.start, middle), TimeWindow(
+            middle + timedelta(seconds=1), self.end
+        )
+
+    def params(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Copies the query parameters of a search to this range.
+
+        :param params: Query parameters of the search.
+        :type params: Dict[str, Any]
+        :rtype: Dict[str, Any]
+        """
+        return {
+            **params,
+            "startDateTime": self.start.strftime(TIME_FORMAT),
+            "endDateTime": self.end.strftime(TIME_FORMAT),
+        }
+
+
+class ShardPlanner:
+    """Splits a :class:`TimeWindow` in two until its windows hold at
+    most :meth:`~pytmv1.ShardPolicy.limit` records.
+
+    Every round splits the dense windows in halves, :meth:`pending`
+    returns the first halves to count and :meth:`update` takes their
+    counts, the count of the second half is deduced from its parent.
+    Rounds go on until :attr:`done`, the counts of a round are
+    independent so that they can be sent concurrently.
+
+    :param window: Whole range, with its number of records.
+    :type window: TimeWindow
+    :param policy: Splitting of the range.
+    :type policy: ShardPolicy
+    """
+
+    def __init__(self, window: TimeWindow, policy: ShardPolicy):
+        self._policy = policy
+        self._limit: int = policy.limit(window.count)
+        self._windows: List[TimeWindow] = []
+        self._dense: List[TimeWindow] = []
+        self._add(window)
+
+    @property
+    def done(self) -> bool:
+        """Checks if no window needs to be split.
+
+        :rtype: bool
+        """
+        return not self._dense
+
+    def pending(self) -> List[TimeWindow]:
+        """Windows to count in this round.
+
+        :rtype: List[TimeWindow]
+        """
+        return [window.halves()[0] for window in self._dense]
+
+    def update(self, counts: List[int]) -> None:
+        """Splits the dense windows with the counts of :meth:`pending`.
+
+        :param counts: Number of records of the pending windows.
+        :type counts: List[int]
+        """
+        dense, self._dense = self._dense, []
+        for parent, count in zip(dense, counts):
+            first, second = parent.halves()
+            count = min(count, parent.count)
+            self._add(replace(first, count=count))
+            self._add(replace(second, count=parent.count - count))
+
+    def windows(self) -> List[TimeWindow]:
+        """Windows holding records, from the oldest to the latest.
+
+        :rtype: List[TimeWindow]
+        """
+        return sorted(
+            self._windows + self._dense, key=lambda window: window.start
+        )
+
+    def _add(self, window: TimeWindow) -> None:
+        if window.count <= 0:
+            return
+        if window.count > self._limit and window.seconds >= 2 * max(
+            1, self._policy.min_seconds
+        ):
+            self._dense.append(window)
+        else:
+            self._windows.append(window)
+
+
+def _parse_time(value: str) -> datetime:
+    parsed: datetime = parse_obj_as(datetime, value)
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc, microsecond=0)
+    return parsed.astimezone(timezone.utc).replace(microsecond=0)
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+import threading
+from contextlib import nullcontext
+from functools import partial
+from logging import Logger
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+    overload,
+)
+
+from .model.responses import C
+from .policy import SpoolPolicy
+
+log: Logger = logging.getLogger(__name__)
+
+_HEADER: struct.Struct = struct.Struct("<Q")
+
+
+class Spool:
+    """Page bodies written to length-prefixed records of memory-mapped
+    segment files, see :class:`~pytmv1.SpoolPolicy`.
+
+    Records are appended by the fetching thread and read once by the
+    consumer, in any thread. A segment is deleted as soon as it is full
+    and all its records are read, the remaining segments are deleted
+    when the spool is closed.
+    """
+
+    def __init__(self, policy: SpoolPolicy):
+        self._policy = policy
+        self._directory: str = tempfile.mkdtemp(
+            prefix="pytmv1-spool-", dir=policy.directory
+        )
+        self._lock = threading.Lock()
+        self._segments: List[_Segment] = []
+        self._count: int = 0
+
+    def __enter__(self) -> Spool:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            segments, self._segments = self._segments, []
+        for segment in segments:
+            segment.close()
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+    def write(self, data: bytes) -> Callable[[], bytes]:
+        """Appends a record to the current segment, a new segment is
+        started if the record does not fit.
+
+        :param data: Content of the record.
+        :type data: bytes
+        :return: Function reading the record once.
+        :rtype: Callable[[], bytes]
+        """
+        size: int = _HEADER.size + len(data)
+        with self._lock:
+            if not self._segments or not self._segments[-1].fits(size):
+                if self._segments:
+                    self._segments[-1].seal()
+                self._segments = [
+                    segment for segment in self._segments if not segment.closed
+                ]
+                self._segments.append(
+                    _Segment(
+                        os.path.join(self._directory, f"{self._count}.seg"),
+                        max(self._policy.segment_bytes, size),
+                    )
+                )
+                self._count += 1
+            return self._segments[-1].append(data)
+
+
+class SpooledItems(Sequence[C]):
+    """Records of a page written to disk, see
+    :class:`~pytmv1.SpoolPolicy`. The page is read back and its records
+    parsed the first time they are accessed.
+    """
+
+    __slots__ = ("_load", "_items")
+
+    def __init__(self, load: Callable[[], List[C]]):
+        self._load = load
+        self._items: Optional[List[C]] = None
+
+    @overload
+    def __getitem__(self, index: int) -> C:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[C]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[C, Sequence[C]]:
+        return self.result()[index]
+
+    def __iter__(self) -> Iterator[C]:
+        return iter(self.result())
+
+    def __len__(self) -> int:
+        return len(self.result())
+
+    def __eq__(self, other: object) -> bool:
+        return self.result() == (
+            other.result() if isinstance(other, SpooledItems) else other
+        )
+
+    def __repr__(self) -> str:
+        if self._items is None:
+            return f"{type(self).__name__}(<spooled>)"
+        return f"{type(self).__name__}({self._items!r})"
+
+    def result(self) -> List[C]:
+        """Reads and parses the records, once.
+
+        :raises pydantic.ValidationError: If a record is invalid.
+        :rtype: List[C]
+        """
+        if self._items is None:
+            self._items = self._load()
+        return self._items
+
+
+def open_spool(
+    policy: Optional[SpoolPolicy],
+) -> ContextManager[Optional[Spool]]:
+    """Opens a spool closed on exit, nothing is opened if not set.
+
+    :param policy: Spool policy.
+    :type policy: Optional[SpoolPolicy]
+    :rtype: ContextManager[Optional[Spool]]
+    """
+    if policy is None:
+        return nullcontext()
+    return Spool(policy)
+
+
+class _Segment:
+    __slots__ = (
+        "_path",
+        "_file",
+        "_map",
+        "_size",
+        "_unread",
+        "_sealed",
+        "_lock",
+    )
+
+    def __init__(self, path: str, capacity: int):
+        log.debug("Opening spool segment [Path=%s, Size=%s]", path, capacity)
+        self._path = path
+        self._file = open(path, "w+b")
+        self._file.truncate(capacity)
+        self._map: mmap.mmap = mmap.mmap(self._file.fileno(), capacity)
+        self._size: int = 0
+        self._unread: int = 0
+        self._sealed: bool = False
+        self._lock = threading.Lock()
+
+    @property
+    def closed(self) -> bool:
+        return self._map.closed
+
+    def append(self, data: bytes) -> Callable[[], bytes]:
+        offset: int = self._size
+        _HEADER.pack_into(self._map, offset, len(data))
+        start: int = offset + _HEADER.size
+        end: int = start + len(data)
+        self._map[start:end] = data
+        self._size = end
+        with self._lock:
+            self._unread += 1
+        return partial(self.read, offset)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._map.closed:
+                return
+            self._map.close()
+            self._file.close()
+        log.debug("Deleting spool segment [Path=%s]", self._path)
+        try:
+            os.remove(self._path)
+        except OSError:
+            pass
+
+    def fits(self, size: int) -> bool:
+        return self._size + size <= len(self._map)
+
+    def read(self, offset: int) -> bytes:
+        length: int = _HEADER.unpack_from(self._map, offset)[0]
+        start: int = offset + _HEADER.size
+        end: int = start + length
+        data: bytes = self._map[start:end]
+        with self._lock:
+            self._unread -= 1
+            done: bool = self._sealed and not self._unread
+        if done:
+            self.close()
+        return data
+
+    def seal(self) -> None:
+        with self._lock:
+            self._sealed = True
+            done: bool = not self._unread
+        if done:
+            self.close()
@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+import codecs
+import hashlib
+import io
+import json
+import os
+import re
+import time
+import uuid
+from contextlib import contextmanager, suppress
+from types import TracebackType
+from typing import (
+    IO,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Type,
+    Union,
+)
+
+from .exceptions import FileAccessError
+from .model.responses import SaveFileResp
+
+CHUNK_SIZE: int = 64 * 1024
+
+_WHITESPACE: Pattern[str] = re.compile(r"[ \t\n\r]*")
+
+Destination = Union[str, "os.PathLike[str]", IO[bytes]]
+Upload = Union[bytes, str, "os.PathLike[str]", IO[bytes]]
+
+_OBJECT, _MEMBER, _COLON, _VALUE, _ARRAY, _ITEM, _END = range(7)
+
+
+class ItemsParser:
+    """Incremental parser of a JSON object received in chunks.
+
+    Elements of the ``items`` array are returned by :meth:`feed` as soon as
+    they are complete, other members of the object are kept in
+    :attr:`envelope`. Only the element being received is buffered, the
+    whole document is never held in memory.
+    """
+
+    def __init__(self, key: str = "items"):
+        self.envelope: Dict[str, Any] = {}
+        self._key = key
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer: str = ""
+        self._pos: int = 0
+        self._state: int = _OBJECT
+        self._member: str = ""
+
+    def feed(self, data: bytes, final: bool = False) -> List[Any]:
+        """Parses a chunk of the document.
+
+        :param data: Next chunk of the document.
+        :type data: bytes
+        :param final: Whether this is the last chunk of the document.
+        :type final: bool
+        :raises json.JSONDecodeError: If the document is malformed
+         or incomplete.
+        :rtype: List[Any]
+        """
+        start: int = self._pos
+        self._buffer = self._buffer[start:] + self._text.decode(data, final)
+        self._pos = 0
+        items: List[Any] = []
+        while self._step(items, final):
+            pass
+        if final and self._state != _END:
+            raise json.JSONDecodeError(
+                "Unexpected end of document", self._buffer, self._pos
+            )
+        return items
+
+    def _step(self, items: List[Any], final: bool) -> bool:
+        whitespace = _WHITESPACE.match(self._buffer, self._pos)
+        self._pos = whitespace.end() if whitespace else self._pos
+        if self._pos >= len(self._buffer):
+            return False
+        char: str = self._buffer[self._pos]
+        if self._state == _OBJECT:
+            return self._expect("{", _MEMBER)
+        if self._state == _COLON:
+            return self._expect(
+                ":", _ARRAY if self._member == self._key else _VALUE
+            )
+        if self._state == _ARRAY:
+            return self._expect("[", _ITEM)
+        if self._state == _MEMBER:
+            return self._next_member(char, final)
+        if self._state == _VALUE:
+            return self._next_value(final)
+        if self._state == _ITEM:
+            return self._next_item(char, items, final)
+        raise json.JSONDecodeError("Extra data", self._buffer, self._pos)
+
+    def _next_member(self, char: str, final: bool) -> bool:
+        if char == "}":
+            return self._expect("}", _END)
+        if char == ",":
+            return self._expect(",", _MEMBER)
+        done, self._member = self._decode(final)
+        if done:
+            self._state = _COLON
+        return done
+
+    def _next_value(self, final: bool) -> bool:
+        done, value = self._decode(final)
+        if done:
+            self.envelope[self._member] = value
+            self._state = _MEMBER
+        return done
+
+    def _next_item(self, char: str, items: List[Any], final: bool) -> bool:
+        if char == "]":
+            return self._expect("]", _MEMBER)
+        if char == ",":
+            return self._expect(",", _ITEM)
+        done, value = self._decode(final)
+        if done:
+            items.append(value)
+        return done
+
+    def _expect(self, char: str, state: int) -> bool:
+        if self._buffer[self._pos] != char:
+            raise json.JSONDecodeError(
+                f"Expecting '{char}'", self._buffer, self._pos
+            )
+        self._pos += 1
+        self._state = state
+        return True
+
+    def _decode(self, final: bool) -> Tuple[bool, Any]:
+        """Decodes the value at the current position, the value is
+        incomplete if it reaches the end of a non final buffer."""
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return False, None
+        if end == len(self._buffer) and not final:
+            return False, None
+        self._pos = end
+        return True, value
+
+
+class FileSink:
+    """Writes a downloaded body to a path or a binary file object.
+
+    Paths are first written to a ``.part`` file which is moved to its
+    final location once the download is complete, and removed if the
+    download fails. File objects are written as is and left open.
+    Errors of the file raise :class:`~pytmv1.exceptions.FileAccessError`.
+    """
+
+    def __init__(self, destination: Destination):
+        self._path: Optional[str] = None
+        self._file: Optional[IO[bytes]] = None
+        if isinstance(destination, (str, os.PathLike)):
+            self._path = os.fspath(destination)
+        else:
+            self._file = destination
+        self._start_time: float = 0
+        self.size: int = 0
+
+    def __enter__(self) -> FileSink:
+        self._start_time = time.time()
+        if self._path:
+            with _file_errors(self._path):
+                self._file = open(self._path + ".part", "wb")
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if not self._path or not self._file:
+            return
+        if exc_type:
+            # The error of the download prevails over a cleanup error
+            with suppress(OSError):
+                self._file.close()
+                os.remove(self._path + ".part")
+            return
+        with _file_errors(self._path):
+            self._file.close()
+            os.replace(self._path + ".part", self._path)
+
+    def write(self, chunk: bytes) -> None:
+        if self._file:
+            with _file_errors(self._path or _name(self._file)):
+                self._file.write(chunk)
+            self.size += len(chunk)
+
+    def response(self) -> SaveFileResp:
+        elapsed_time: float = time.time() - self._start_time
+        return SaveFileResp(
+            path=self._path,
+            size=self.size,
+            elapsed_time=elapsed_time,
+            throughput=self.size / elapsed_time if elapsed_time else 0,
+        )
+
+
+class MultipartStream:
+    """Multipart/form-data body streamed from a seekable file object.
+
+    The body is read in chunks while it is sent and its length is known
+    in advance. SHA-1 and SHA-256 of the file are computed while it is
+    read, every iteration restarts from the initial file position so the
+    body can be sent again.
+    """
+
+    def __init__(
+        self, file: IO[bytes], file_name: str, fields: Dict[str, str]
+    ):
+        self._file = file
+        with _file_errors(_name(file)):
+            self._start: int = file.tell()
+            self._size: int = file.seek(0, io.SEEK_END) - self._start
+            file.seek(self._start)
+        self._boundary: str = uuid.uuid4().hex
+        self._head: bytes = (
+            "".join(
+                self._part_header(f'name="{_quote(name)}"') + f"{value}\r\n"
+                for name, value in fields.items()
+            )
+            + self._part_header(
+                f'name="file"; filename="{_quote(file_name)}"',
+                "Content-Type: application/octet-stream\r\n",
+            )
+        ).encode("utf-8")
+        self._tail: bytes = f"\r\n--{self._boundary}--\r\n".encode("utf-8")
+        self._sha1 = hashlib.sha1()
+        self._sha256 = hashlib.sha256()
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self._boundary}"
+
+    @property
+    def sha1(self) -> str:
+        return self._sha1.hexdigest()
+
+    @property
+    def sha256(self) -> str:
+        return self._sha256.hexdigest()
+
+    def __len__(self) -> int:
+        return len(self._head) + self._size + len(self._tail)
+
+    def __iter__(self) -> Iterator[bytes]:
+        self._sha1 = hashlib.sha1()
+        self._sha256 = hashlib.sha256()
+        yield self._head
+        chunk: bytes = self._read(True)
+        while chunk:
+            self._sha1.update(chunk)
+            self._sha256.update(chunk)
+            yield chunk
+            chunk = self._read()
+        yield self._tail
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self:
+            yield chunk
+
+    def _read(self, rewind: bool = False) -> bytes:
+        with _file_errors(_name(self._file)):
+            if rewind:
+                self._file.seek(self._start)
+            return self._file.read(CHUNK_SIZE)
+
+    def _part_header(self, disposition: str, extra: str = "") -> str:
+        return (
+            f"--{self._boundary}\r\n"
+            f"Content-Disposition: form-data; {disposition}\r\n"
+            f"{extra}\r\n"
+        )
+
+
+@contextmanager
+def open_upload(file: Upload) -> Iterator[IO[bytes]]:
+    """Opens the file to upload, paths are closed on exit
+    while file objects are left open.
+
+    :raises FileAccessError: If the path can't be opened.
+    """
+    if isinstance(file, bytes):
+        yield io.BytesIO(file)
+    elif isinstance(file, (str, os.PathLike)):
+        with _file_errors(os.fspath(file)):
+            opened: IO[bytes] = open(file, "rb")
+        with opened:
+            yield opened
+    else:
+        yield file
+
+
+@contextmanager
+def _file_errors(name: str) -> Iterator[None]:
+    try:
+        yield
+    except OSError as exc:
+        raise FileAccessError(name, exc) from exc
+
+
+def _name(file: IO[Any]) -> str:
+    return str(getattr(file, "name", type(file).__name__))
+
+
+def _quote(value: str) -> str:
+    return value.replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
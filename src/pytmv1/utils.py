@@ -1,9 +1,8 @@
 import base64
+import ipaddress
 import re
 from typing import Any, Dict, List, Optional, Pattern, Tuple
 
-from pydantic import IPvAnyAddress, IPvAnyAddressError
-
 from .model.enums import (
     OperatingSystem,
     ProductCode,
@@ -130,6 +129,6 @@ def _b64_encode(value: Optional[str]) -> Optional[str]:
 
 def _is_ip_address(endpoint_value: str) -> bool:
     try:
-        return bool(IPvAnyAddress.validate(endpoint_value))
-    except IPvAnyAddressError:
+        return bool(ipaddress.ip_address(endpoint_value))
+    except ValueError:
         return False
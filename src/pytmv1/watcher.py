@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from dataclasses import dataclass, field
+from logging import Logger
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from .model.commons import MsDataUrl
+from .model.enums import Api, Status
+from .model.responses import (
+    BaseStatusResponse,
+    BaseTaskResp,
+    MultiResp,
+    MultiUrlResp,
+    SandboxSubmissionStatusResp,
+)
+from .policy import DEFAULT_POLL, PollPolicy
+from .results import MultiResult, Result
+
+if TYPE_CHECKING:
+    from .async_core import AsyncCore
+    from .core import Core
+
+log: Logger = logging.getLogger(__name__)
+
+Watchable = Union[str, MultiResult[MultiResp], MultiResult[MultiUrlResp]]
+WatchResult = Tuple[str, Result[BaseStatusResponse]]
+
+
+@dataclass(order=True)
+class _Watch:
+    due: float
+    id: str = field(compare=False)
+    class_: Type[BaseStatusResponse] = field(compare=False)
+    uri: str = field(compare=False)
+    deadline: float = field(compare=False)
+    polls: int = field(default=0, compare=False)
+
+
+class _BaseWatcher:
+    def __init__(
+        self,
+        workers: int = 4,
+        poll_time_sec: float = 1800,
+        polling: Optional[PollPolicy] = None,
+    ):
+        self._workers = max(1, workers)
+        self._poll_time_sec = poll_time_sec
+        self._polling = polling or DEFAULT_POLL
+        self._watches: List[_Watch] = []
+
+    def add_task(
+        self, task_id: str, class_: Type[BaseTaskResp] = BaseTaskResp
+    ) -> None:
+        """Watches a response task until it is finished.
+
+        :param task_id: Task id.
+        :type task_id: str
+        :param class_: Expected task result class.
+        :type class_: Type[BaseTaskResp]
+        """
+        self._add(task_id, class_, Api.GET_TASK_RESULT.value.format(task_id))
+
+    def add_submission(self, submit_id: str) -> None:
+        """Watches a sandbox submission until its analysis is finished.
+
+        :param submit_id: Sandbox submission id.
+        :type submit_id: str
+        """
+        self._add(
+            submit_id,
+            SandboxSubmissionStatusResp,
+            Api.GET_SANDBOX_SUBMISSION_STATUS.value.format(submit_id),
+        )
+
+    def add(
+        self, *items: Watchable, class_: Type[BaseTaskResp] = BaseTaskResp
+    ) -> None:
+        """Watches task ids or the tasks and sandbox submissions
+        created by a multi status call, failed items are ignored.
+
+        :param items: Task ids or results of a multi status call.
+        :type items: Union[str, MultiResult[MultiResp],
+         MultiResult[MultiUrlResp]]
+        :param class_: Expected task result class.
+        :type class_: Type[BaseTaskResp]
+        """
+        for item in items:
+            if isinstance(item, str):
+                self.add_task(item, class_)
+            elif item.response:
+                for data in item.response.items:
+                    if isinstance(data, MsDataUrl) and data.id:
+                        self.add_submission(data.id)
+                    elif data.task_id:
+                        self.add_task(data.task_id, class_)
+
+    def __len__(self) -> int:
+        return len(self._watches)
+
+    def _add(
+        self, id_: str, class_: Type[BaseStatusResponse], uri: str
+    ) -> None:
+        self._watches.append(
+            _Watch(0, id_, class_, uri, time.time() + self._poll_time_sec)
+        )
+
+    def _next(
+        self, watch: _Watch, result: Result[BaseStatusResponse]
+    ) -> Optional[_Watch]:
+        """Reschedules ``watch`` if its status is still pending."""
+        watch.polls += 1
+        result.polls = watch.polls
+        now: float = time.time()
+        if (
+            result.response
+            and result.response.status in _PENDING
+            and now < watch.deadline
+        ):
+            watch.due = min(
+                watch.deadline, now + self._polling.delay(watch.polls)
+            )
+            return watch
+        log.debug(
+            "Watch finished [Id=%s, Result=%s, Polls=%s]",
+            watch.id,
+            result.result_code,
+            watch.polls,
+        )
+        return None
+
+
+class TaskWatcher(_BaseWatcher):
+    """Waits for many response tasks and sandbox submissions at once.
+
+    A single scheduler polls the status of every watched item with at
+    most ``workers`` requests in flight, following the intervals of the
+    :class:`PollPolicy`. Iterating over the watcher yields ``(id, result)``
+    as soon as an item reaches a terminal status, fails, or is still
+    pending after ``poll_time_sec``.
+    """
+
+    def __init__(
+        self,
+        core: Core,
+        workers: int = 4,
+        poll_time_sec: float = 1800,
+        polling: Optional[PollPolicy] = None,
+    ):
+        super().__init__(workers, poll_time_sec, polling)
+        self._core = core
+
+    def __iter__(self) -> Iterator[WatchResult]:
+        queue, self._watches = self._watches, []
+        heapq.heapify(queue)
+        running: Dict[Future[Result[BaseStatusResponse]], _Watch] = {}
+        with ThreadPoolExecutor(
+            self._workers, thread_name_prefix="pytmv1-watcher"
+        ) as executor:
+            while queue or running:
+                while (
+                    queue
+                    and len(running) < self._workers
+                    and queue[0].due <= time.time()
+                ):
+                    watch = heapq.heappop(queue)
+                    running[
+                        executor.submit(
+                            self._core.send, watch.class_, watch.uri
+                        )
+                    ] = watch
+                timeout: Optional[float] = (
+                    max(0.0, queue[0].due - time.time())
+                    if queue and len(running) < self._workers
+                    else None
+                )
+                if not running:
+                    time.sleep(timeout or 0)
+                    continue
+                done, _ = wait_futures(
+                    running, timeout, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    watch = running.pop(future)
+                    result: Result[BaseStatusResponse] = future.result()
+                    if self._next(watch, result):
+                        heapq.heappush(queue, watch)
+                    else:
+                        yield watch.id, result
+
+
+class AsyncTaskWatcher(_BaseWatcher):
+    """Asynchronous counterpart of :class:`TaskWatcher`."""
+
+    def __init__(
+        self,
+        core: AsyncCore,
+        workers: int = 4,
+        poll_time_sec: float = 1800,
+        polling: Optional[PollPolicy] = None,
+    ):
+        super().__init__(workers, poll_time_sec, polling)
+        self._core = core
+
+    async def __aiter__(self) -> AsyncIterator[WatchResult]:
+        watches, self._watches = self._watches, []
+        slots = asyncio.Semaphore(self._workers)
+
+        async def watch_until_done(watch: _Watch) -> WatchResult:
+            while True:
+                async with slots:
+                    result: Result[BaseStatusResponse] = await self._core.send(
+                        watch.class_, watch.uri
+                    )
+                if not self._next(watch, result):
+                    return watch.id, result
+                await asyncio.sleep(max(0.0, watch.due - time.time()))
+
+        tasks = [
+            asyncio.ensure_future(watch_until_done(watch)) for watch in watches
+        ]
+        try:
+            for done in asyncio.as_completed(tasks):
+                yield await done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+_PENDING: Tuple[Status, ...] = (Status.QUEUED, Status.RUNNING)
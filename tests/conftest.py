@@ -1,6 +1,7 @@
 import pytest
 
 import pytmv1
+from pytmv1.async_core import AsyncCore
 from pytmv1.core import Core
 
 
@@ -40,3 +41,16 @@ def core(pytestconfig, url):
         30,
         30,
     )
+
+
+@pytest.fixture
+def async_core(pytestconfig, url):
+    return AsyncCore(
+        "appname",
+        "token",
+        url,
+        0,
+        0,
+        30,
+        30,
+    )
@@ -1,3 +1,10 @@
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
 from requests import Response
 
 from pytmv1 import (
@@ -13,6 +20,8 @@ from pytmv1 import (
     Severity,
     TiAlert,
 )
+from pytmv1.compat import parse_obj
+from pytmv1.model.enums import SearchMode
 
 
 class TextResponse(Response):
@@ -29,6 +38,151 @@ class TextResponse(Response):
         return self.value
 
 
+class LocalServer:
+    """HTTP/1.1 server answering from a background thread on a local
+    port, ``handle(method, path, body)`` returns the status code and the
+    JSON document of every response. The body of a response is sent
+    ``delay`` seconds after its headers so that concurrent requests
+    overlap while their bodies are read."""
+
+    def __init__(self, handle, delay=0.0):
+        self.handle = handle
+        self.delay = delay
+        self.url = ""
+        self._server = None
+
+    def __enter__(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                self._answer()
+
+            def do_POST(self):
+                self._answer()
+
+            def log_message(self, *args):
+                pass
+
+            def _answer(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length) if length else b""
+                status, document = server.handle(
+                    self.command, self.path, json.loads(body or "null")
+                )
+                content = json.dumps(document).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.flush()
+                time.sleep(server.delay)
+                self.wfile.write(content)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_port}"
+        threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        ).start()
+        return self
+
+    def __exit__(self, *args):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class ActivitySearch:
+    """Fake endpoint activity search answering the ``_process`` calls
+    (or the ``_send_internal`` calls with :meth:`send`) of a core,
+    records are returned by event time, ``page_size`` at a time. Ranges
+    include both bounds, like the API."""
+
+    START = "2024-01-01T00:00:00Z"
+    END = "2024-01-02T00:00:00Z"
+
+    def __init__(self, times, page_size=2, url="https://host"):
+        self.times = sorted(times)
+        self.page_size = page_size
+        self.url = url
+        self.counts = 0
+        self.pages = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, class_, uri, method=None, **kwargs):
+        return parse_obj(class_, self._body(uri, kwargs.get("params")))
+
+    def handle(self, method, path, body):
+        """Answers the requests of a :class:`LocalServer`."""
+        query = parse_qs(urlsplit(path).query)
+        params = {name: values[0] for name, values in query.items()}
+        return 200, self._body(
+            path, params if "startDateTime" in params else None
+        )
+
+    def send(self, request, *args, **kwargs):
+        query = parse_qs(urlsplit(request.url).query)
+        params = {name: values[0] for name, values in query.items()}
+        response = TextResponse(
+            json.dumps(
+                self._body(
+                    request.url, params if "startDateTime" in params else None
+                )
+            )
+        )
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        return response
+
+    def _body(self, uri, params):
+        if params:
+            start, end = _epoch_range(params)
+            skip = 0
+        else:
+            query = parse_qs(urlsplit(uri).query)
+            start, end, skip = (
+                int(query[name][0]) for name in ("start", "end", "skip")
+            )
+        records = [t for t in self.times if start <= t <= end]
+        with self._lock:
+            if params and params.get("mode") == SearchMode.COUNT_ONLY:
+                self.counts += 1
+                return {"totalCount": len(records)}
+            self.pages += 1
+        last = skip + self.page_size
+        body = {
+            "items": [{"eventTime": t} for t in records[skip:last]],
+            "progressRate": 100,
+        }
+        if last < len(records):
+            body["nextLink"] = (
+                f"{self.url}/v3.0/search/endpointActivities"
+                f"?start={start}&end={end}&skip={last}"
+            )
+        return body
+
+
+def activity_times():
+    start = _epoch(ActivitySearch.START)
+    return [start + i * 600 for i in range(144)] + [
+        start + 5 * 3600 + i * 10 for i in range(100)
+    ]
+
+
+def _epoch(value):
+    return int(
+        datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ")
+        .replace(tzinfo=timezone.utc)
+        .timestamp()
+    )
+
+
+def _epoch_range(params):
+    return _epoch(params["startDateTime"]), _epoch(params["endDateTime"])
+
+
 def sae_alert():
     return SaeAlert.construct(
         id="1",
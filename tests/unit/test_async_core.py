@@ -0,0 +1,812 @@
+import asyncio
+import json
+import os
+import threading
+
+import httpx
+import pytest
+
+from pytmv1 import (
+    BulkPolicy,
+    Checkpoint,
+    CollectFileTaskResp,
+    ExceptionObject,
+    FileCheckpointStore,
+    GetEndpointActivityDataCountResp,
+    GetEndpointActivityDataResp,
+    GetExceptionListResp,
+    MultiResp,
+    NoContentResp,
+    ParseMode,
+    ParsePolicy,
+    PendingItems,
+    ResultCode,
+    SandboxAnalysisResultResp,
+    ShardPolicy,
+    SpoolPolicy,
+    Status,
+)
+from pytmv1 import async_core as core_m
+from pytmv1.async_core import AsyncCore
+from pytmv1.codec import JsonCodec, OrjsonCodec
+from pytmv1.exceptions import ServerCustError
+from pytmv1.model.enums import Api, HttpMethod
+from pytmv1.model.responses import BaseStatusResponse
+from pytmv1.spool import Spool
+from tests.data import ActivitySearch, activity_times
+
+
+def _async(value=None, side_effect=None):
+    async def _call(*args, **kwargs):
+        if side_effect:
+            raise side_effect
+        return value() if callable(value) else value
+
+    return _call
+
+
+def test_consume_linkable_with_next_link(mocker, async_core):
+    responses = iter(
+        [
+            GetExceptionListResp(
+                nextLink="https://host/api/path?skipToken=c2tpcFRva2Vu",
+                items=[ExceptionObject.construct()],
+            ),
+            GetExceptionListResp(
+                items=[
+                    ExceptionObject.construct(),
+                    ExceptionObject.construct(),
+                ]
+            ),
+        ]
+    )
+    mock_process = mocker.patch.object(
+        async_core, "_process", side_effect=_async(lambda: next(responses))
+    )
+    consumed = []
+
+    async def consumer(item):
+        consumed.append(item)
+
+    total = asyncio.run(
+        async_core._consume_linkable(
+            lambda: async_core._process(
+                GetExceptionListResp, Api.GET_EXCEPTION_LIST
+            ),
+            consumer,
+            {},
+        )
+    )
+    assert mock_process.call_count == 2
+    assert total == 3
+    assert len(consumed) == 3
+
+
+def test_consume_linkable_with_sync_consumer(mocker, async_core):
+    mocker.patch.object(
+        async_core,
+        "_process",
+        side_effect=_async(
+            GetExceptionListResp(items=[ExceptionObject.construct()])
+        ),
+    )
+    consumed = []
+    total = asyncio.run(
+        async_core._consume_linkable(
+            lambda: async_core._process(
+                GetExceptionListResp, Api.GET_EXCEPTION_LIST
+            ),
+            consumed.append,
+            {},
+        )
+    )
+    assert total == 1
+    assert len(consumed) == 1
+
+
+def test_consume_linkable_pooled(mocker, async_core):
+    responses = iter(
+        [
+            GetExceptionListResp(
+                nextLink="https://host/api/path?skipToken=c2tpcFRva2Vu",
+                items=[ExceptionObject.construct(value="1")] * 2,
+            ),
+            GetExceptionListResp(
+                items=[ExceptionObject.construct(value="2")] * 2
+            ),
+        ]
+    )
+    mocker.patch.object(
+        async_core, "_process", side_effect=_async(lambda: next(responses))
+    )
+    consumed = []
+
+    async def consumer(item):
+        await asyncio.sleep(0)
+        if item.value == "2" and "2" in consumed:
+            raise ValueError("duplicate")
+        consumed.append(item.value)
+
+    response = asyncio.run(
+        async_core._consume_linkable_pooled(
+            lambda: async_core._process(
+                GetExceptionListResp, Api.GET_EXCEPTION_LIST
+            ),
+            consumer,
+            {},
+            workers=2,
+            queue_size=1,
+        )
+    )
+    assert response.total_consumed == 3
+    assert response.total_failed == 1
+    assert response.errors[0].code == "ValueError"
+    assert sorted(consumed) == ["1", "1", "2"]
+
+
+def test_iter_linkable_with_max_items(mocker, async_core):
+    responses = iter(
+        [
+            GetExceptionListResp(
+                nextLink="https://host/v3.0/path?skipToken=c2tpcFRva2Vu",
+                items=[ExceptionObject.construct()] * 2,
+            ),
+            GetExceptionListResp(items=[ExceptionObject.construct()] * 2),
+        ]
+    )
+    mock_process = mocker.patch.object(
+        async_core, "_process", side_effect=_async(lambda: next(responses))
+    )
+
+    async def collect():
+        return [
+            item
+            async for item in async_core.iter_linkable(
+                GetExceptionListResp, "/path", max_items=2
+            )
+        ]
+
+    assert len(asyncio.run(collect())) == 2
+    assert mock_process.call_count == 1
+
+
+def test_iter_linkable_with_prefetch(mocker, async_core):
+    responses = iter(
+        [
+            GetExceptionListResp(
+                nextLink="https://host/v3.0/path?skipToken=c2tpcFRva2Vu",
+                items=[ExceptionObject.construct()] * 2,
+            ),
+            GetExceptionListResp(items=[ExceptionObject.construct()] * 2),
+        ]
+    )
+    mocker.patch.object(
+        async_core, "_process", side_effect=_async(lambda: next(responses))
+    )
+
+    async def collect():
+        return [
+            page
+            async for page in async_core.iter_linkable(
+                GetExceptionListResp, "/path", prefetch=1
+            ).pages()
+        ]
+
+    assert len(asyncio.run(collect())) == 2
+
+
+def _exception_object(value):
+    return {"type": "ip", "ip": value, "lastModifiedDateTime": ""}
+
+
+def test_iter_linkable_with_stream(mocker, async_core):
+    responses = iter(
+        [
+            httpx.Response(
+                200,
+                json={
+                    "items": [_exception_object("1")] * 2,
+                    "nextLink": "https://host/v3.0/path?skipToken=abc",
+                },
+            ),
+            httpx.Response(200, json={"items": [_exception_object("2")]}),
+        ]
+    )
+    mock_send = mocker.patch.object(
+        async_core,
+        "_send_internal",
+        side_effect=_async(lambda: next(responses)),
+    )
+
+    async def collect():
+        return [
+            item.value
+            async for item in async_core.iter_linkable(
+                GetExceptionListResp, "/path", stream=True
+            )
+        ]
+
+    assert asyncio.run(collect()) == ["1", "1", "2"]
+    assert mock_send.call_count == 2
+
+
+def test_iter_linkable_with_parse_workers(mocker):
+    shutdown = mocker.spy(core_m.ProcessPoolExecutor, "shutdown")
+    pool_core = AsyncCore(
+        "appname",
+        "token",
+        "https://dummy.com",
+        0,
+        0,
+        30,
+        30,
+        parsing=ParsePolicy(processes=1, min_bytes=0),
+    )
+    mocker.patch.object(
+        pool_core,
+        "_send_internal",
+        side_effect=_async(
+            lambda: httpx.Response(
+                200, json={"items": [{"dpt": "443"}], "progressRate": 100}
+            )
+        ),
+    )
+
+    async def collect():
+        try:
+            async for page in pool_core.iter_linkable(
+                GetEndpointActivityDataResp, "/path"
+            ).pages():
+                assert isinstance(page.items, PendingItems)
+            return [
+                item.dpt
+                async for item in pool_core.iter_linkable(
+                    GetEndpointActivityDataResp, "/path"
+                )
+            ]
+        finally:
+            await pool_core.close()
+
+    assert asyncio.run(collect()) == [443]
+    assert shutdown.call_count == 2
+    assert pool_core._parse_pool is None
+
+
+def test_send_linkable_with_spooling(mocker, tmp_path):
+    spool_core = AsyncCore(
+        "appname",
+        "token",
+        "https://dummy.com",
+        0,
+        0,
+        30,
+        30,
+        spooling=SpoolPolicy(str(tmp_path)),
+    )
+    responses = iter(
+        [
+            httpx.Response(
+                200,
+                json={
+                    "items": [_exception_object("1")] * 2,
+                    "nextLink": "https://host/v3.0/path?skipToken=abc",
+                },
+            ),
+            httpx.Response(200, json={"items": [_exception_object("2")]}),
+        ]
+    )
+    mocker.patch.object(
+        spool_core,
+        "_send_internal",
+        side_effect=_async(lambda: next(responses)),
+    )
+    threads = []
+    write = Spool.write
+    read_items = core_m._read_items
+
+    def write_in_thread(spool, data):
+        threads.append(threading.current_thread())
+        return write(spool, data)
+
+    def read_in_thread(*args):
+        threads.append(threading.current_thread())
+        return read_items(*args)
+
+    mocker.patch.object(Spool, "write", write_in_thread)
+    mocker.patch.object(core_m, "_read_items", read_in_thread)
+    consumed = []
+    result = asyncio.run(
+        spool_core.send_linkable(
+            GetExceptionListResp,
+            "/path",
+            lambda item: consumed.append(item.value),
+        )
+    )
+    assert result.response.total_consumed == 3
+    assert consumed == ["1", "1", "2"]
+    assert os.listdir(tmp_path) == []
+    assert len(threads) == 4
+    assert threading.main_thread() not in threads
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_send_linkable_with_checkpoint(mocker, async_core, tmp_path, workers):
+    store = FileCheckpointStore(tmp_path / "export.json")
+    responses = iter(
+        [
+            httpx.Response(200, json={"items": [_exception_object("2")]}),
+        ]
+    )
+    mock_send = mocker.patch.object(
+        async_core,
+        "_send_internal",
+        side_effect=_async(lambda: next(responses)),
+    )
+    consumed = []
+    result = asyncio.run(
+        async_core.send_linkable(
+            GetExceptionListResp,
+            "/path",
+            lambda item: consumed.append(item.value),
+            workers=workers,
+            checkpoint=store,
+            resume_from=Checkpoint("https://host/v3.0/path?skipToken=abc", 2),
+        )
+    )
+    assert result.response.total_consumed == 1
+    assert consumed == ["2"]
+    assert store.load() == Checkpoint(None, 3)
+    assert str(mock_send.call_args[0][0].url).endswith("?skipToken=abc")
+
+
+def test_iter_linkable_with_raw_mode(mocker, async_core):
+    mocker.patch.object(
+        async_core,
+        "_send_internal",
+        side_effect=_async(
+            lambda: httpx.Response(
+                200, json={"items": [_exception_object("1")]}
+            )
+        ),
+    )
+
+    async def collect():
+        return [
+            item
+            async for item in async_core.iter_linkable(
+                GetExceptionListResp, "/path", parse_mode=ParseMode.RAW
+            )
+        ]
+
+    assert asyncio.run(collect()) == [_exception_object("1")]
+
+
+def test_iter_batches(mocker, async_core):
+    mocker.patch.object(
+        async_core,
+        "_send_internal",
+        side_effect=_async(
+            lambda: httpx.Response(
+                200, json={"items": [{"dpt": 443}], "progressRate": 100}
+            )
+        ),
+    )
+
+    async def collect():
+        return [
+            batch.to_pydict()
+            async for batch in async_core.iter_batches(
+                GetEndpointActivityDataResp, "/path", ["dpt"], stream=True
+            )
+        ]
+
+    assert asyncio.run(collect()) == [{"dpt": [443]}]
+
+
+def test_hide_binary():
+    raw_response = httpx.Response(
+        200, headers={"Content-Type": "application/pdf"}, content=b"raw"
+    )
+    assert core_m._hide_binary(raw_response) == "***binary content***"
+    raw_response = httpx.Response(
+        200,
+        headers={"Content-Type": "application/json"},
+        content=b'{"key":"value"}',
+    )
+    assert core_m._hide_binary(raw_response) == '{"key":"value"}'
+
+
+def test_prepare_with_json(async_core):
+    request = async_core._prepare(
+        "/path", HttpMethod.POST, json={"key": "value"}
+    )
+    assert request.content == b'{"key":"value"}'
+    assert request.headers["Content-Type"] == "application/json"
+
+
+def test_poll_status_with_succeeded_status():
+    calls = []
+
+    async def status_call():
+        calls.append(1)
+        return BaseStatusResponse.construct(status=Status.SUCCEEDED)
+
+    asyncio.run(core_m._poll_status(status_call, 20))
+    assert len(calls) == 1
+
+
+def test_send(async_core, mocker):
+    mock_request = mocker.patch.object(
+        async_core,
+        "_send_internal",
+        side_effect=_async(httpx.Response(204)),
+    )
+    result = asyncio.run(async_core.send(NoContentResp, Api.EDIT_ALERT_STATUS))
+    mock_request.assert_called()
+    assert result.result_code == ResultCode.SUCCESS
+
+
+def test_send_multi(async_core, mocker):
+    mocker.patch.object(
+        async_core,
+        "_send_internal",
+        side_effect=_async(
+            httpx.Response(
+                207,
+                json=[
+                    {
+                        "status": 202,
+                        "headers": [
+                            {
+                                "name": "Operation-Location",
+                                "value": "https://dummy/tasks/000001",
+                            }
+                        ],
+                    }
+                ],
+            )
+        ),
+    )
+    result = asyncio.run(
+        async_core.send_multi(MultiResp, Api.ISOLATE_ENDPOINT, json=[{}])
+    )
+    assert result.result_code == ResultCode.SUCCESS
+    assert result.response.items[0].task_id == "000001"
+
+
+def test_send_multi_with_chunks(mocker):
+    bulk_core = core_m.AsyncCore(
+        "appname",
+        "token",
+        "https://dummy.com",
+        0,
+        0,
+        30,
+        30,
+        bulk=BulkPolicy(max_items=2),
+    )
+
+    async def send(request, *args):
+        return httpx.Response(
+            207,
+            json=[
+                {
+                    "status": 202,
+                    "headers": [
+                        {
+                            "name": "Operation-Location",
+                            "value": f"https://dummy/tasks/{item}",
+                        }
+                    ],
+                }
+                for item in json.loads(request.content)
+            ],
+        )
+
+    mock_send = mocker.patch.object(
+        bulk_core, "_send_internal", side_effect=send
+    )
+    result = asyncio.run(
+        bulk_core.send_multi(
+            MultiResp, Api.ISOLATE_ENDPOINT, json=list(range(5))
+        )
+    )
+    assert mock_send.call_count == 3
+    assert [item.task_id for item in result.response.items] == [
+        str(i) for i in range(5)
+    ]
+
+
+def test_send_multi_with_chunk_not_a_list(mocker):
+    bulk_core = core_m.AsyncCore(
+        "appname",
+        "token",
+        "https://dummy.com",
+        0,
+        0,
+        30,
+        30,
+        bulk=BulkPolicy(max_items=2),
+    )
+
+    async def send(request, *args):
+        items = json.loads(request.content)
+        if items == [2, 3]:
+            return httpx.Response(207, json={"status": 202})
+        return httpx.Response(
+            207,
+            json=[
+                {
+                    "status": 202,
+                    "headers": [
+                        {
+                            "name": "Operation-Location",
+                            "value": f"https://dummy/tasks/{item}",
+                        }
+                    ],
+                }
+                for item in items
+            ],
+        )
+
+    mocker.patch.object(bulk_core, "_send_internal", side_effect=send)
+    result = asyncio.run(
+        bulk_core.send_multi(
+            MultiResp, Api.ISOLATE_ENDPOINT, json=list(range(4))
+        )
+    )
+    assert result.result_code == ResultCode.ERROR
+    assert [error.code for error in result.errors[2:]] == [
+        "ParseModelError",
+        "ParseModelError",
+    ]
+
+
+def test_send_sandbox_file(async_core, mocker, tmp_path):
+    mocker.patch.object(
+        async_core,
+        "_send_internal",
+        side_effect=_async(
+            httpx.Response(
+                200,
+                headers={"Content-Type": "application/pdf"},
+                content=b"pdf",
+            )
+        ),
+    )
+    write = core_m.FileSink.write
+    threads = []
+
+    def write_in_thread(sink, chunk):
+        threads.append(threading.current_thread())
+        write(sink, chunk)
+
+    mocker.patch.object(core_m.FileSink, "write", write_in_thread)
+    path = tmp_path / "report.pdf"
+    result = asyncio.run(
+        async_core.send_sandbox_file(
+            Api.DOWNLOAD_SANDBOX_ANALYSIS_RESULT, "123", path, False, 0
+        )
+    )
+    assert result.result_code == ResultCode.SUCCESS
+    assert result.response.size == 3
+    assert path.read_bytes() == b"pdf"
+    assert threads and threading.main_thread() not in threads
+
+
+def test_send_sandbox_file_with_missing_directory_is_failed(
+    async_core, mocker, tmp_path
+):
+    mocker.patch.object(
+        async_core,
+        "_send_internal",
+        side_effect=_async(
+            httpx.Response(
+                200,
+                headers={"Content-Type": "application/pdf"},
+                content=b"pdf",
+            )
+        ),
+    )
+    result = asyncio.run(
+        async_core.send_sandbox_file(
+            Api.DOWNLOAD_SANDBOX_ANALYSIS_RESULT,
+            "123",
+            tmp_path / "missing" / "report.pdf",
+            False,
+            0,
+        )
+    )
+    assert result.result_code == ResultCode.ERROR
+    assert result.error.code == "FileAccessError"
+
+
+def test_send_file_with_missing_path_is_failed(async_core, tmp_path):
+    result = asyncio.run(
+        async_core.send_file(
+            Api.SUBMIT_FILE_TO_SANDBOX, tmp_path / "missing.exe", "name", {}
+        )
+    )
+    assert result.result_code == ResultCode.ERROR
+    assert result.error.code == "FileAccessError"
+
+
+def test_send_sandbox_result_without_polling(async_core, mocker):
+    mock_poll = mocker.patch.object(core_m, "_poll_status")
+    mock_send = mocker.patch.object(
+        async_core, "_process", side_effect=_async()
+    )
+    result = asyncio.run(
+        async_core.send_sandbox_result(
+            SandboxAnalysisResultResp,
+            Api.GET_SANDBOX_ANALYSIS_RESULT,
+            "123",
+            False,
+            0,
+        )
+    )
+    mock_poll.assert_not_called()
+    mock_send.assert_called()
+    assert result.result_code == ResultCode.SUCCESS
+
+
+def _send_sharded(async_core, consumer, policy, **kwargs):
+    return asyncio.run(
+        async_core.send_sharded(
+            GetEndpointActivityDataResp,
+            GetEndpointActivityDataCountResp,
+            Api.GET_ENDPOINT_ACTIVITY_DATA,
+            consumer,
+            policy,
+            params={
+                "startDateTime": ActivitySearch.START,
+                "endDateTime": ActivitySearch.END,
+            },
+            **kwargs,
+        )
+    )
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_send_sharded(async_core, mocker, workers):
+    search = ActivitySearch(activity_times())
+
+    async def process(*args, **kwargs):
+        await asyncio.sleep(0)
+        return search(*args, **kwargs)
+
+    mocker.patch.object(async_core, "_process", side_effect=process)
+    consumed = []
+
+    async def consumer(item):
+        consumed.append(item.event_time)
+
+    result = _send_sharded(
+        async_core,
+        consumer,
+        ShardPolicy(shards=4, min_seconds=60, workers=3),
+        workers=workers,
+    )
+    assert result.response.total_consumed == 244
+    assert sorted(consumed) == search.times
+    assert search.counts > 1
+
+
+def test_send_sharded_with_ordered(async_core, mocker):
+    search = ActivitySearch(activity_times(), page_size=5)
+
+    async def process(*args, **kwargs):
+        return search(*args, **kwargs)
+
+    mocker.patch.object(async_core, "_process", side_effect=process)
+    consumed = []
+    result = _send_sharded(
+        async_core,
+        lambda item: consumed.append(item.event_time),
+        ShardPolicy(shards=8, min_seconds=1, workers=4),
+        ordered=True,
+    )
+    assert result.response.total_consumed == 244
+    assert consumed == search.times
+
+
+def test_send_sharded_is_failed(async_core, mocker):
+    search = ActivitySearch(activity_times())
+
+    async def process(class_, uri, method=None, **kwargs):
+        if search.pages == 3:
+            raise ServerCustError(500, "err")
+        return search(class_, uri, method, **kwargs)
+
+    mocker.patch.object(async_core, "_process", side_effect=process)
+    result = _send_sharded(async_core, lambda item: None, ShardPolicy())
+    assert result.result_code == ResultCode.ERROR
+    assert result.error.status == 500
+
+
+def test_send_task_result_is_failed(async_core, mocker):
+    mocker.patch.object(
+        async_core,
+        "_process",
+        side_effect=_async(side_effect=httpx.ConnectError("error")),
+    )
+    result = asyncio.run(
+        async_core.send_task_result(CollectFileTaskResp, "123", False, 0)
+    )
+    assert result.result_code == ResultCode.ERROR
+    assert result.error.status == 500
+    assert result.error.code == "ConnectError"
+
+
+@pytest.mark.parametrize("codec", [JsonCodec(), OrjsonCodec()])
+@pytest.mark.parametrize(
+    "status, content, code",
+    [
+        (200, b'{"items": [', "JSONDecodeError"),
+        (400, b'{"error": ', "JSONDecodeError"),
+        (207, b"", "JSONDecodeError"),
+        (400, b"", "ServerTextError"),
+    ],
+)
+def test_send_with_malformed_body_is_failed(
+    mocker, codec, status, content, code
+):
+    codec_core = AsyncCore(
+        "appname", "token", "https://dummy.com", 0, 0, 30, 30, codec=codec
+    )
+    mocker.patch.object(
+        codec_core,
+        "_send_internal",
+        side_effect=_async(
+            lambda: httpx.Response(
+                status,
+                headers={"Content-Type": "application/json"},
+                content=content,
+            )
+        ),
+    )
+    result = asyncio.run(
+        codec_core.send(GetExceptionListResp, Api.GET_EXCEPTION_LIST)
+    )
+    multi_result = asyncio.run(
+        codec_core.send_multi(MultiResp, Api.ISOLATE_ENDPOINT, json=[{}])
+    )
+    linkable_result = asyncio.run(
+        codec_core.send_linkable(
+            GetExceptionListResp, "/path", lambda item: None
+        )
+    )
+    assert result.result_code == ResultCode.ERROR
+    assert result.error.code == code
+    assert multi_result.result_code == ResultCode.ERROR
+    assert multi_result.errors[0].code == code
+    assert linkable_result.result_code == ResultCode.ERROR
+
+
+@pytest.mark.parametrize(
+    "status, content_type",
+    [(500, "application/json"), (400, "text/plain")],
+)
+def test_send_with_server_error_is_failed(
+    async_core, mocker, status, content_type
+):
+    mocker.patch.object(
+        async_core,
+        "_send_internal",
+        side_effect=_async(
+            httpx.Response(
+                status,
+                headers={"Content-Type": content_type},
+                content=(
+                    b'{"error": {"code": "CODE", "message": "error"}}'
+                    if "json" in content_type
+                    else b"error"
+                ),
+            )
+        ),
+    )
+    result = asyncio.run(
+        async_core.send(GetExceptionListResp, Api.GET_EXCEPTION_LIST)
+    )
+    assert result.result_code == ResultCode.ERROR
+    assert result.error.status == status
@@ -0,0 +1,80 @@
+from array import array
+
+import pytest
+
+from pytmv1 import (
+    Column,
+    DictionaryColumn,
+    EmailActivity,
+    EndpointActivity,
+    ListColumn,
+    PrimitiveColumn,
+    StringColumn,
+)
+from pytmv1.batch import build_batch
+
+RECORDS = [
+    {
+        "dpt": 443,
+        "endpointHostName": "host1",
+        "endpointIp": ["10.0.0.1", "fe80::1"],
+        "eventId": "3",
+        "eventTime": 1704067200000,
+        "os": "Windows",
+        "objectSignerValid": [True, False],
+        "tags": ["MITREV9.T1059", "XSAE.F1234"],
+    },
+    {
+        "endpointHostName": "host2",
+        "eventId": "1",
+        "os": "Windows",
+        "tags": ["XSAE.F1234"],
+    },
+    {"dpt": 80, "eventId": "3", "os": None},
+]
+
+
+def test_build_batch():
+    batch = build_batch(EndpointActivity, RECORDS)
+    assert len(batch) == 3
+    assert isinstance(batch["dpt"], PrimitiveColumn)
+    assert batch["dpt"].values == array("q", [443, 0, 80])
+    assert batch["dpt"].validity == bytearray([1, 0, 1])
+    assert batch["dpt"].null_count == 1
+    assert isinstance(batch["endpoint_host_name"], StringColumn)
+    assert batch["endpoint_host_name"].values == ["host1", "host2", None]
+    assert isinstance(batch["event_id"], DictionaryColumn)
+    assert batch["event_id"].indices == array("i", [0, 1, 0])
+    assert batch["event_id"].dictionary == ["3", "1"]
+    assert isinstance(batch["os"], DictionaryColumn)
+    assert batch["os"].indices == array("i", [0, 0, -1])
+    assert isinstance(batch["tags"], ListColumn)
+    assert batch["tags"].offsets == array("q", [0, 2, 3, 3])
+    assert isinstance(batch["tags"].values, DictionaryColumn)
+    assert batch["tags"].values.dictionary == ["MITREV9.T1059", "XSAE.F1234"]
+    assert batch["object_signer_valid"].values.values == array("b", [1, 0])
+
+
+def test_build_batch_with_select():
+    batch = build_batch(EmailActivity, [{"mailbox": "a"}], ["mailbox"])
+    assert list(batch.columns) == ["mailbox"]
+
+
+def test_column_is_abstract():
+    class Partial(Column):
+        def __len__(self):
+            return 0
+
+    with pytest.raises(TypeError):
+        Partial()
+
+
+def test_to_pydict():
+    batch = build_batch(EndpointActivity, RECORDS, ["dpt", "tags", "os"])
+    assert batch.to_pydict() == {
+        "dpt": [443, None, 80],
+        "os": ["Windows", "Windows", None],
+        "tags": [["MITREV9.T1059", "XSAE.F1234"], ["XSAE.F1234"], []],
+    }
+    batch = build_batch(EndpointActivity, RECORDS[:1], ["objectSignerValid"])
+    assert batch.to_pydict() == {"object_signer_valid": [[True, False]]}
@@ -1,3 +1,7 @@
+import asyncio
+
+import httpx
+
 import pytmv1
 from pytmv1.core import API_VERSION
 
@@ -7,3 +11,60 @@ def test_client():
     assert client._core._appname == "dummy_name"
     assert client._core._token == "dummy_token"
     assert client._core._url == "https://dummy.com/" + API_VERSION
+
+
+def test_async_client():
+    client = pytmv1.async_client(
+        "dummy_name", "dummy_token", "https://dummy.com"
+    )
+    assert isinstance(client, pytmv1.AsyncClient)
+    assert client._core._appname == "dummy_name"
+    assert client._core._token == "dummy_token"
+    assert client._core._url == "https://dummy.com/" + API_VERSION
+    asyncio.run(client.close())
+
+
+def test_async_client_with_pool(mocker):
+    limits = mocker.spy(httpx, "Limits")
+    timeout = mocker.spy(httpx, "Timeout")
+    client = pytmv1.async_client(
+        "dummy_name",
+        "dummy_token",
+        "https://dummy.com",
+        pool_connections=2,
+        pool_maxsize=10,
+        connect_timeout=5,
+        read_timeout=60,
+    )
+    limits.assert_called_once_with(
+        max_connections=10, max_keepalive_connections=10
+    )
+    timeout.assert_called_once_with(60, connect=5)
+    asyncio.run(client.close())
+
+
+def test_consume_endpoint_activity_data_with_shards(mocker):
+    client = pytmv1.client("dummy_name", "dummy_token", "https://dummy.com")
+    send_sharded = mocker.patch.object(client._core, "send_sharded")
+    send_linkable = mocker.patch.object(client._core, "send_linkable")
+    policy = pytmv1.ShardPolicy(shards=2)
+    client.consume_endpoint_activity_data(
+        print,
+        "2024-01-01T00:00:00Z",
+        "2024-01-02T00:00:00Z",
+        shards=policy,
+        dpt="443",
+    )
+    args, kwargs = send_sharded.call_args
+    assert args[1] is pytmv1.GetEndpointActivityDataCountResp
+    assert args[4] is policy
+    assert kwargs["params"]["startDateTime"] == "2024-01-01T00:00:00Z"
+    assert kwargs["headers"] == {"TMV1-Query": 'dpt:"443"'}
+    assert not send_linkable.called
+
+
+def test_wait_all():
+    client = pytmv1.client("dummy_name", "dummy_token", "https://dummy.com")
+    watcher = client.wait_all("1", submit_ids=["2"], workers=2)
+    assert isinstance(watcher, pytmv1.TaskWatcher)
+    assert [w.id for w in watcher._watches] == ["1", "2"]
@@ -0,0 +1,107 @@
+import pytest
+
+from pytmv1 import (
+    Checkpoint,
+    CheckpointStore,
+    ExceptionObject,
+    FileCheckpointStore,
+    GetExceptionListResp,
+    SqliteCheckpointStore,
+)
+from pytmv1.checkpoint import PageTracker
+
+
+class _MemoryStore(CheckpointStore):
+    def __init__(self):
+        self.saved = []
+
+    def load(self):
+        return self.saved[-1] if self.saved else None
+
+    def save(self, checkpoint):
+        self.saved.append(checkpoint)
+
+    def clear(self):
+        self.saved.clear()
+
+
+def _page(next_link, size):
+    return GetExceptionListResp(
+        nextLink=next_link, items=[ExceptionObject.construct()] * size
+    )
+
+
+def test_file_store(tmp_path):
+    store = FileCheckpointStore(tmp_path / "export.json")
+    assert store.load() is None
+    store.save(Checkpoint("https://host/v3.0/path?skipToken=abc", 10))
+    store.save(Checkpoint(None, 12))
+    assert store.load() == Checkpoint(None, 12)
+    assert store.load().completed
+    store.clear()
+    store.clear()
+    assert store.load() is None
+
+
+def test_sqlite_store(tmp_path):
+    first = SqliteCheckpointStore(tmp_path / "exports.db", "first")
+    second = SqliteCheckpointStore(tmp_path / "exports.db", "second")
+    first.save(Checkpoint("https://host/v3.0/path?skipToken=abc", 10))
+    first.save(Checkpoint("https://host/v3.0/path?skipToken=def", 20))
+    second.save(Checkpoint(None, 5))
+    assert first.load() == Checkpoint(
+        "https://host/v3.0/path?skipToken=def", 20
+    )
+    assert second.load() == Checkpoint(None, 5)
+    first.clear()
+    assert first.load() is None
+    assert second.load() == Checkpoint(None, 5)
+
+
+def test_checkpoint_store_is_abstract():
+    class Partial(CheckpointStore):
+        def save(self, checkpoint):
+            pass
+
+    with pytest.raises(TypeError):
+        Partial()
+
+
+def test_page_tracker_with_unordered_acks():
+    store = _MemoryStore()
+    tracker = PageTracker(store, 100)
+    entries = list(
+        tracker.entries([_page("link1", 2), _page("link2", 1), _page(None, 0)])
+    )
+    assert len(entries) == 3
+    entries[2][1]()
+    entries[0][1]()
+    assert store.saved == []
+    entries[1][1]()
+    assert store.saved == [Checkpoint(None, 103)]
+
+
+def test_page_tracker_items():
+    store = _MemoryStore()
+    tracker = PageTracker(store)
+    items = tracker.items([_page("link1", 2), _page(None, 1)])
+    next(items)
+    next(items)
+    assert store.saved == []
+    next(items)
+    assert store.saved == [Checkpoint("link1", 2)]
+    assert list(items) == []
+    assert store.saved == [Checkpoint("link1", 2), Checkpoint(None, 3)]
+
+
+def test_page_tracker_wrap_is_failed():
+    store = _MemoryStore()
+    tracker = PageTracker(store)
+    consume = tracker.wrap(lambda item: 1 / 0)
+    entries = tracker.entries([_page(None, 1)])
+    try:
+        consume(next(entries))
+    except ZeroDivisionError:
+        pass
+    assert list(entries) == []
+    assert store.saved == [Checkpoint(None, 1)]
@@ -0,0 +1,32 @@
+import json
+import sys
+
+import pytest
+
+from pytmv1.codec import JsonCodec, OrjsonCodec, default_codec
+
+DOCUMENT = {"items": [{"id": 1, "name": "é"}], "nextLink": None}
+
+
+@pytest.mark.parametrize("codec", [JsonCodec(), OrjsonCodec()])
+def test_codec(codec):
+    data = codec.dumps(DOCUMENT)
+    assert isinstance(data, bytes)
+    assert json.loads(data) == DOCUMENT
+    assert codec.loads(data) == DOCUMENT
+    assert codec.loads(data.decode("utf-8")) == DOCUMENT
+
+
+@pytest.mark.parametrize("codec", [JsonCodec(), OrjsonCodec()])
+def test_codec_is_failed(codec):
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads(b'{"items": [')
+
+
+def test_default_codec():
+    assert isinstance(default_codec(), OrjsonCodec)
+
+
+def test_default_codec_without_orjson(monkeypatch):
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    assert type(default_codec()) is JsonCodec
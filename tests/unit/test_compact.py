@@ -0,0 +1,82 @@
+import pickle
+
+import pytest
+
+from pytmv1 import (
+    Endpoint,
+    EndpointActivity,
+    EndpointActivityRecord,
+    EndpointRecord,
+    Entity,
+    EventID,
+    compact,
+    compact_type,
+)
+from pytmv1.compat import parse_obj
+
+ENDPOINT = {
+    "agentGuid": "35fa11da-a24e-40cf-8b56-baf8828cc151",
+    "loginAccount": {"updatedDateTime": "", "value": ["MSEDGEWIN10\\Admin"]},
+    "endpointName": {"updatedDateTime": "", "value": "MSEDGEWIN10"},
+    "macAddress": {"updatedDateTime": "", "value": []},
+    "ip": {"updatedDateTime": "", "value": ["10.0.0.1"]},
+    "osName": "Windows",
+    "osVersion": "10.0.19044",
+    "osDescription": "Windows 10 Enterprise",
+    "productCode": "xes",
+    "installedProductCodes": ["xes"],
+}
+
+
+def test_compact():
+    activity = EndpointActivity(dpt=443, eventId="3", tags=["XSAE.F1234"])
+    record = compact(activity)
+    assert type(record) is EndpointActivityRecord
+    assert compact_type(EndpointActivity) is EndpointActivityRecord
+    assert not hasattr(record, "__dict__")
+    assert record.dpt == 443
+    assert record.event_id == EventID.EVENT_CONNECTIO
+    assert record.tags == ("XSAE.F1234",)
+    assert record.endpoint_ip == ()
+    assert record.to_model() == activity
+
+
+def test_compact_with_sub_models():
+    endpoint = parse_obj(Endpoint, ENDPOINT)
+    record = EndpointRecord.from_model(endpoint)
+    assert record.login_account.value == ("MSEDGEWIN10\\Admin",)
+    assert type(record.endpoint_name).__name__ == "ValueRecord"
+    assert record.to_model() == endpoint
+
+
+def test_compact_with_union():
+    entity = parse_obj(
+        Entity,
+        {
+            "entityId": "1",
+            "entityType": "host",
+            "entityValue": {"name": "host", "ips": [], "guid": "123"},
+            "relatedEntities": [],
+            "relatedIndicatorIds": [1],
+            "provenance": ["Alert"],
+        },
+    )
+    record = compact(entity)
+    assert record.entity_value.name == "host"
+    assert record.to_model() == entity
+
+
+def test_pickle():
+    record = compact(parse_obj(Endpoint, ENDPOINT))
+    assert pickle.loads(pickle.dumps(record)) == record
+
+
+def test_repr():
+    record = compact(EndpointActivity(dpt=443))
+    assert (
+        repr(record)
+        == "EndpointActivityRecord(dpt=443, endpoint_ip=(), logon_user=(),"
+        " object_ips=(), object_signer=(), object_signer_valid=(), tags=())"
+    )
+    with pytest.raises(AttributeError, match="no attribute 'unknown'"):
+        record.unknown
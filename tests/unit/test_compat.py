@@ -0,0 +1,45 @@
+import pytest
+
+from pytmv1.compat import (
+    has_pre_validators,
+    model_fields,
+    parse_obj,
+    to_lower_camel,
+)
+from pytmv1.model.commons import ExceptionObject, MsError, Value
+from pytmv1.model.responses import GetExceptionListResp
+
+
+@pytest.mark.parametrize(
+    "name, alias",
+    [
+        ("id", "id"),
+        ("event_time_d_t", "eventTimeDT"),
+        ("next_link", "nextLink"),
+        ("sha256", "sha256"),
+    ],
+)
+def test_to_lower_camel(name, alias):
+    assert to_lower_camel(name) == alias
+
+
+def test_model_fields():
+    fields = model_fields(GetExceptionListResp)
+    assert fields["next_link"].alias == "nextLink"
+    assert not fields["next_link"].required
+    assert model_fields(ExceptionObject)["value"].required
+    assert fields["items"].annotation.__args__ == (ExceptionObject,)
+
+
+def test_pre_validator():
+    assert has_pre_validators(ExceptionObject)
+    assert not has_pre_validators(Value)
+    obj = parse_obj(
+        ExceptionObject,
+        {"type": "url", "url": "https://host", "lastModifiedDateTime": "x"},
+    )
+    assert obj.value == "https://host"
+    error = parse_obj(
+        MsError, {"status": 400, "error": {"code": "Bad", "message": "m"}}
+    )
+    assert error.code == "Bad"
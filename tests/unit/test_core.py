@@ -1,33 +1,65 @@
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
 import time
+from typing import Union
 
 import pytest
 from pydantic import ValidationError
-from requests import RequestException, Response
+from requests import Request, RequestException, Response
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from urllib3.exceptions import EmptyPoolError
 
 from pytmv1 import (
     AddAlertNoteResp,
+    BulkPolicy,
     BytesResp,
+    Checkpoint,
     CollectFileTaskResp,
+    EndpointActivity,
+    Entity,
     Error,
     ExceptionObject,
+    FileCheckpointStore,
+    GetAlertListResp,
+    GetEndpointActivityDataCountResp,
+    GetEndpointActivityDataResp,
     GetExceptionListResp,
+    HostInfo,
+    LogPolicy,
     MsData,
     MsError,
     MultiResp,
     NoContentResp,
+    ParseMode,
+    ParsePolicy,
+    PendingItems,
+    PollPolicy,
     ResultCode,
+    RetryPolicy,
+    SaeAlert,
     SandboxAnalysisResultResp,
     SandboxSubmissionStatusResp,
     SandboxSuspiciousListResp,
     SandboxSuspiciousObject,
+    ShardPolicy,
+    SpoolPolicy,
+    SqliteCheckpointStore,
     Status,
+    TiAlert,
     __version__,
 )
 from pytmv1 import core as core_m
 from pytmv1 import results
+from pytmv1.codec import JsonCodec, OrjsonCodec
+from pytmv1.compat import parse_obj
 from pytmv1.core import API_VERSION, USERAGENT_SUFFIX, Core
 from pytmv1.exceptions import (
     ParseModelError,
+    ServerCustError,
     ServerHtmlError,
     ServerJsonError,
     ServerMultiJsonError,
@@ -35,11 +67,28 @@ from pytmv1.exceptions import (
 )
 from pytmv1.model.enums import Api, RiskLevel
 from pytmv1.model.responses import BaseStatusResponse
-from tests.data import TextResponse
+from pytmv1.projection import project_linkable
+from tests.data import (
+    ActivitySearch,
+    LocalServer,
+    TextResponse,
+    activity_times,
+)
 
 API_URL = "https://dummy.com/v3.0"
 
 
+def test_chunk():
+    policy = BulkPolicy(max_items=2, max_bytes=30)
+    assert core_m._chunk([], policy) == []
+    assert core_m._chunk([1, 2, 3], policy) == [[1, 2], [3]]
+    assert core_m._chunk(["a" * 15, "b" * 15, "c" * 50], policy) == [
+        ["a" * 15],
+        ["b" * 15],
+        ["c" * 50],
+    ]
+
+
 def test_consume_linkable_with_next_link_multiple_items(mocker, core):
     mock_process = mocker.patch.object(
         core,
@@ -103,183 +152,1607 @@ def test_consume_linkable_without_next_link(mocker, core):
     assert total == 0
 
 
-def test_error():
-    error = results._error(
-        ServerJsonError(
-            Error(status=500, code="X12", message="error", number=123)
+def test_consume_linkable_with_many_pages_is_not_recursive(mocker, core):
+    pages = 5000
+    mocker.patch.object(
+        core,
+        "_process",
+        side_effect=[
+            GetExceptionListResp(
+                nextLink="https://host/v3.0/path?skipToken=c2tpcFRva2Vu",
+                items=[ExceptionObject.construct()],
+            )
+            for _ in range(pages - 1)
+        ]
+        + [GetExceptionListResp(items=[ExceptionObject.construct()])],
+    )
+    total = core._consume_linkable(
+        lambda: core._process(GetExceptionListResp, Api.GET_EXCEPTION_LIST),
+        lambda x: None,
+        {},
+    )
+    assert total == pages
+
+
+def _numbered_pages(count, size):
+    return [
+        GetExceptionListResp(
+            nextLink=(
+                "https://host/v3.0/path?skipToken=c2tpcFRva2Vu"
+                if i < count - 1
+                else None
+            ),
+            items=[
+                ExceptionObject.construct(value=str(i * size + j))
+                for j in range(size)
+            ],
+        )
+        for i in range(count)
+    ]
+
+
+def test_consume_linkable_pooled(mocker, core):
+    mocker.patch.object(core, "_process", side_effect=_numbered_pages(3, 4))
+    consumed = []
+
+    def consumer(item):
+        if item.value == "5":
+            raise ValueError("invalid record")
+        consumed.append(item.value)
+
+    response = core._consume_linkable_pooled(
+        lambda: core._process(GetExceptionListResp, Api.GET_EXCEPTION_LIST),
+        consumer,
+        {},
+        workers=3,
+        queue_size=2,
+    )
+    assert response.total_consumed == 11
+    assert response.total_failed == 1
+    assert response.errors[0].code == "ValueError"
+    assert response.errors[0].message == "invalid record"
+    assert sorted(consumed, key=int) == [str(i) for i in range(12) if i != 5]
+
+
+def test_consume_linkable_pooled_with_ordered(mocker, core):
+    mocker.patch.object(core, "_process", side_effect=_numbered_pages(3, 4))
+    consumed = []
+    response = core._consume_linkable_pooled(
+        lambda: core._process(GetExceptionListResp, Api.GET_EXCEPTION_LIST),
+        lambda item: consumed.append(item.value),
+        {},
+        workers=3,
+        queue_size=1,
+        ordered=True,
+    )
+    assert response.total_consumed == 12
+    assert consumed == [str(i) for i in range(12)]
+
+
+def test_send_linkable_with_workers_is_failed(mocker, core):
+    mocker.patch.object(
+        core,
+        "_process",
+        side_effect=[_numbered_pages(2, 2)[0], ServerCustError(500, "err")],
+    )
+    consumed = []
+    result = core.send_linkable(
+        GetExceptionListResp,
+        "/path",
+        lambda item: consumed.append(item.value),
+        workers=2,
+    )
+    assert result.result_code == ResultCode.ERROR
+    assert sorted(consumed) == ["0", "1"]
+
+
+def _linkable_pages(count, size):
+    return [
+        GetExceptionListResp(
+            nextLink=(
+                "https://host/v3.0/path?skipToken=c2tpcFRva2Vu"
+                if i < count - 1
+                else None
+            ),
+            items=[ExceptionObject.construct() for _ in range(size)],
         )
+        for i in range(count)
+    ]
+
+
+def test_iter_linkable(mocker, core):
+    mock_process = mocker.patch.object(
+        core, "_process", side_effect=_linkable_pages(3, 2)
     )
-    assert error.status == 500
-    assert error.code == "X12"
-    assert error.message == "error"
-    assert error.number == 123
+    items = list(core.iter_linkable(GetExceptionListResp, "/path"))
+    assert len(items) == 6
+    assert mock_process.call_count == 3
+    assert mock_process.call_args[0][1] == "/path?skipToken=c2tpcFRva2Vu"
+
+
+def test_iter_linkable_with_max_items(mocker, core):
+    mock_process = mocker.patch.object(
+        core, "_process", side_effect=_linkable_pages(3, 2)
+    )
+    items = list(
+        core.iter_linkable(GetExceptionListResp, "/path", max_items=4)
+    )
+    assert len(items) == 4
+    assert mock_process.call_count == 2
+
+
+def test_iter_linkable_with_max_pages(mocker, core):
+    mock_process = mocker.patch.object(
+        core, "_process", side_effect=_linkable_pages(3, 2)
+    )
+    pages = list(
+        core.iter_linkable(GetExceptionListResp, "/path", max_pages=2).pages()
+    )
+    assert len(pages) == 2
+    assert mock_process.call_count == 2
+
+
+def test_iter_linkable_is_lazy(mocker, core):
+    mock_process = mocker.patch.object(
+        core, "_process", side_effect=_linkable_pages(3, 2)
+    )
+    paginator = core.iter_linkable(GetExceptionListResp, "/path")
+    mock_process.assert_not_called()
+    next(iter(paginator))
+    assert mock_process.call_count == 1
+
+
+def test_iter_linkable_with_prefetch_overlaps_consumer(mocker, core):
+    fetched = threading.Event()
+    pages = _linkable_pages(2, 1)
+
+    def process(*args, **kwargs):
+        if pages[0].next_link is None:
+            fetched.set()
+        return pages.pop(0)
+
+    mocker.patch.object(core, "_process", side_effect=process)
+    paginator = core.iter_linkable(GetExceptionListResp, "/path", prefetch=1)
+    overlapped = [fetched.wait(5) for _ in paginator]
+    assert overlapped == [True, True]
+
+
+def test_iter_linkable_with_prefetch_and_max_items(mocker, core):
+    mock_process = mocker.patch.object(
+        core, "_process", side_effect=_linkable_pages(10, 2)
+    )
+    items = list(
+        core.iter_linkable(
+            GetExceptionListResp, "/path", max_items=3, prefetch=2
+        )
+    )
+    assert len(items) == 3
+    assert mock_process.call_count <= 5
+
+
+def test_iter_linkable_with_prefetch_is_failed(mocker, core):
+    mocker.patch.object(
+        core,
+        "_process",
+        side_effect=_linkable_pages(2, 1)[:1] + [RequestException()],
+    )
+    items = []
+    with pytest.raises(RequestException):
+        for item in core.iter_linkable(
+            GetExceptionListResp, "/path", prefetch=1
+        ):
+            items.append(item)
+    assert len(items) == 1
+
+
+def test_send_linkable_with_prefetch(mocker, core):
+    mocker.patch.object(core, "_process", side_effect=_linkable_pages(4, 3))
+    result = core.send_linkable(
+        GetExceptionListResp,
+        Api.GET_EXCEPTION_LIST,
+        lambda x: None,
+        prefetch=2,
+    )
+    assert result.result_code == ResultCode.SUCCESS
+    assert result.response.total_consumed == 12
+
+
+def _exception_object(value):
+    return {"type": "ip", "ip": value, "lastModifiedDateTime": ""}
+
+
+def _streamed_response(body):
+    raw_response = Response()
+    raw_response.status_code = 200
+    raw_response.headers = {"Content-Type": "application/json"}
+    raw_response.raw = io.BytesIO(json.dumps(body).encode("utf-8"))
+    return raw_response
+
+
+def test_iter_linkable_with_stream(mocker, core):
+    mock_send = mocker.patch.object(
+        core,
+        "_send_internal",
+        side_effect=[
+            _streamed_response(
+                {
+                    "items": [_exception_object("1")] * 3,
+                    "nextLink": "https://host/v3.0/path?skipToken=abc",
+                }
+            ),
+            _streamed_response({"items": [_exception_object("2")]}),
+        ],
+    )
+    items = list(
+        core.iter_linkable(GetExceptionListResp, "/path", stream=True)
+    )
+    assert [item.value for item in items] == ["1", "1", "1", "2"]
+    assert isinstance(items[0], ExceptionObject)
+    assert mock_send.call_count == 2
+    assert all(call[0][1] for call in mock_send.call_args_list)
+
+
+def test_iter_linkable_with_stream_sets_next_link(mocker, core):
+    mocker.patch.object(
+        core,
+        "_send_internal",
+        return_value=_streamed_response(
+            {
+                "nextLink": "https://host/v3.0/path?skipToken=abc",
+                "items": [_exception_object("1")],
+            }
+        ),
+    )
+    page = next(
+        core.iter_linkable(GetExceptionListResp, "/path", stream=True).pages()
+    )
+    assert page.next_link is None
+    assert len(list(page.items)) == 1
+    assert page.next_link == "https://host/v3.0/path?skipToken=abc"
+
+
+def test_send_linkable_with_stream_is_failed(mocker, core):
+    raw_response = _streamed_response({})
+    raw_response.raw = io.BytesIO(
+        b'{"items": [{"type": "ip", "ip": "1", "lastModifiedDateTime": ""},'
+    )
+    mocker.patch.object(core, "_send_internal", return_value=raw_response)
+    consumed = []
+    result = core.send_linkable(
+        GetExceptionListResp, "/path", consumed.append, stream=True
+    )
+    assert len(consumed) == 1
+    assert result.result_code == ResultCode.ERROR
+    assert result.error.code == "ParseModelError"
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_iter_linkable_with_raw_mode(mocker, core, stream):
+    mocker.patch.object(
+        core,
+        "_send_internal",
+        side_effect=[
+            _streamed_response(
+                {
+                    "items": [_exception_object("1")],
+                    "nextLink": "https://host/v3.0/path?skipToken=abc",
+                }
+            ),
+            _streamed_response({"items": [_exception_object("2")]}),
+        ],
+    )
+    items = list(
+        core.iter_linkable(
+            GetExceptionListResp,
+            "/path",
+            stream=stream,
+            parse_mode=ParseMode.RAW,
+        )
+    )
+    assert items == [_exception_object("1"), _exception_object("2")]
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_iter_batches(mocker, core, stream):
+    mocker.patch.object(
+        core,
+        "_send_internal",
+        side_effect=[
+            _streamed_response(
+                {
+                    "items": [{"dpt": 443, "os": "Linux"}] * 2,
+                    "progressRate": 100,
+                    "nextLink": "https://host/v3.0/path?skipToken=abc",
+                }
+            ),
+            _streamed_response({"items": [{"dpt": 80}], "progressRate": 100}),
+        ],
+    )
+    batches = list(
+        core.iter_batches(
+            GetEndpointActivityDataResp, "/path", ["dpt"], stream=stream
+        )
+    )
+    assert [batch.to_pydict() for batch in batches] == [
+        {"dpt": [443, 443]},
+        {"dpt": [80]},
+    ]
+
+
+@pytest.fixture
+def pool_core():
+    return Core(
+        "appname",
+        "token",
+        "https://dummy.com",
+        0,
+        0,
+        30,
+        30,
+        parsing=ParsePolicy(processes=1, min_bytes=0),
+    )
+
+
+def test_iter_linkable_with_parse_workers(mocker, pool_core):
+    mock_send = mocker.patch.object(
+        pool_core,
+        "_send_internal",
+        side_effect=[
+            _json_response(
+                200,
+                {
+                    "items": [{"dpt": "443"}] * 2,
+                    "progressRate": 100,
+                    "nextLink": "https://host/v3.0/path?skipToken=abc",
+                },
+            ),
+            _json_response(200, {"items": [{"dpt": 80}], "progressRate": 50}),
+        ],
+    )
+    pages = list(
+        pool_core.iter_linkable(GetEndpointActivityDataResp, "/path").pages()
+    )
+    assert mock_send.call_count == 2
+    assert all(isinstance(page.items, PendingItems) for page in pages)
+    assert [item.dpt for page in pages for item in page.items] == [
+        443,
+        443,
+        80,
+    ]
+    assert isinstance(pages[0].items[0], EndpointActivity)
+    assert pages[1].progress_rate == 50
+
+
+def test_iter_linkable_with_parse_workers_spawned(mocker, pool_core):
+    get_context = mocker.spy(core_m.multiprocessing, "get_context")
+    with pool_core._parse_scope():
+        pool_core._pool()
+    get_context.assert_called_once_with("spawn")
+
+
+def test_iter_linkable_with_parse_workers_shut_down(mocker, pool_core):
+    shutdown = mocker.spy(core_m.ProcessPoolExecutor, "shutdown")
+    mocker.patch.object(
+        pool_core,
+        "_send_internal",
+        side_effect=lambda *args: _json_response(
+            200,
+            {
+                "items": [{"dpt": 443}],
+                "progressRate": 100,
+                "nextLink": "https://host/v3.0/path?skipToken=abc",
+            },
+        ),
+    )
+    pages = pool_core.iter_linkable(
+        GetEndpointActivityDataResp, "/path"
+    ).pages()
+    page = next(pages)
+    assert pool_core._parse_pool is not None
+    pages.close()
+    shutdown.assert_called_once()
+    assert pool_core._parse_pool is None
+    assert page.items[0].dpt == 443
+    with pytest.raises(RuntimeError):
+        pool_core._pool()
+
+
+def test_send_linkable_with_parse_workers(mocker, pool_core):
+    shutdown = mocker.spy(core_m.ProcessPoolExecutor, "shutdown")
+    mocker.patch.object(
+        pool_core,
+        "_send_internal",
+        return_value=_json_response(
+            200, {"items": [{"dpt": 443}] * 3, "progressRate": 100}
+        ),
+    )
+    consumed = []
+    result = pool_core.send_linkable(
+        GetEndpointActivityDataResp,
+        "/path",
+        lambda item: consumed.append(item.dpt),
+    )
+    assert result.response.total_consumed == 3
+    assert consumed == [443] * 3
+    shutdown.assert_called_once()
+    assert pool_core._parse_pool is None
+
+
+def test_iter_linkable_with_parse_workers_is_failed(mocker, pool_core):
+    mocker.patch.object(
+        pool_core,
+        "_send_internal",
+        return_value=_json_response(
+            200, {"items": [{"dpt": "port"}], "progressRate": 100}
+        ),
+    )
+    with pytest.raises(ValidationError):
+        list(pool_core.iter_linkable(GetEndpointActivityDataResp, "/path"))
+    assert pool_core._parse_pool is None
+
+
+def test_iter_linkable_with_parse_workers_after_invalid_page(pool_core):
+    with pool_core._parse_scope():
+        invalid = core_m._submit_page(
+            pool_core._pool(),
+            GetEndpointActivityDataResp,
+            b'{"items": [{"dpt": "port"}]}',
+            JsonCodec(),
+        )
+        with pytest.raises(ValidationError):
+            invalid.result()
+        valid = core_m._submit_page(
+            pool_core._pool(),
+            GetEndpointActivityDataResp,
+            b'{"items": [{"dpt": 443}]}',
+            JsonCodec(),
+        )
+        assert valid.result()[0].dpt == 443
+
+
+def test_iter_linkable_with_parse_workers_and_runtime_model(mocker, pool_core):
+    mocker.patch.object(
+        pool_core,
+        "_send_internal",
+        return_value=_json_response(
+            200, {"items": [{"dpt": 443}], "progressRate": 100}
+        ),
+    )
+    page = next(
+        pool_core.iter_linkable(
+            project_linkable(GetEndpointActivityDataResp, ["dpt"]), "/path"
+        ).pages()
+    )
+    assert isinstance(page.items, list)
+    assert page.items[0].dpt == 443
+
+
+def test_iter_linkable_with_parse_workers_and_small_page(mocker):
+    small_core = Core(
+        "appname",
+        "token",
+        "https://dummy.com",
+        0,
+        0,
+        30,
+        30,
+        parsing=ParsePolicy(processes=1),
+    )
+    mocker.patch.object(
+        small_core,
+        "_send_internal",
+        return_value=_json_response(
+            200, {"items": [{"dpt": 443}], "progressRate": 100}
+        ),
+    )
+    page = next(
+        small_core.iter_linkable(GetEndpointActivityDataResp, "/path").pages()
+    )
+    assert isinstance(page.items, list)
+    assert small_core._parse_pool is None
+
+
+def _activity_pages():
+    return [
+        _json_response(
+            200,
+            {
+                "items": [{"dpt": "443"}] * 2,
+                "progressRate": 100,
+                "nextLink": "https://host/v3.0/path?skipToken=abc",
+            },
+        ),
+        _json_response(200, {"items": [{"dpt": 80}], "progressRate": 100}),
+    ]
+
+
+@pytest.mark.parametrize(
+    "parse_mode, workers, expected",
+    [
+        (ParseMode.VALIDATED, 0, [443, 443, 80]),
+        (ParseMode.RAW, 2, ["443", "443", 80]),
+    ],
+)
+def test_send_linkable_with_spooling(
+    mocker, tmp_path, parse_mode, workers, expected
+):
+    spool_core = Core(
+        "appname",
+        "token",
+        "https://dummy.com",
+        0,
+        0,
+        30,
+        30,
+        spooling=SpoolPolicy(str(tmp_path)),
+    )
+    mocker.patch.object(
+        spool_core, "_send_internal", side_effect=_activity_pages()
+    )
+    consumed = []
+    result = spool_core.send_linkable(
+        GetEndpointActivityDataResp,
+        "/path",
+        lambda item: consumed.append(
+            item["dpt"] if isinstance(item, dict) else item.dpt
+        ),
+        parse_mode=parse_mode,
+        workers=workers,
+        ordered=True,
+    )
+    assert result.response.total_consumed == 3
+    assert consumed == expected
+    assert os.listdir(tmp_path) == []
+
+
+def test_send_linkable_with_spooling_is_failed(mocker, tmp_path):
+    spool_core = Core(
+        "appname",
+        "token",
+        "https://dummy.com",
+        0,
+        0,
+        30,
+        30,
+        spooling=SpoolPolicy(str(tmp_path)),
+    )
+    mocker.patch.object(
+        spool_core,
+        "_send_internal",
+        return_value=_json_response(
+            200, {"items": [{"dpt": "port"}], "progressRate": 100}
+        ),
+    )
+    result = spool_core.send_linkable(
+        GetEndpointActivityDataResp, "/path", lambda item: None
+    )
+    assert result.result_code == ResultCode.ERROR
+    assert os.listdir(tmp_path) == []
+
+
+def test_send_linkable_with_checkpoint(mocker, core, tmp_path):
+    store = FileCheckpointStore(tmp_path / "export.json")
+    mocker.patch.object(core, "_process", side_effect=_numbered_pages(3, 2))
+    consumed = []
+
+    def consumer(item):
+        if item.value == "3":
+            raise ValueError("sink is down")
+        consumed.append(item.value)
+
+    with pytest.raises(ValueError):
+        core.send_linkable(
+            GetExceptionListResp, "/path", consumer, checkpoint=store
+        )
+    assert consumed == ["0", "1", "2"]
+    assert store.load() == Checkpoint(
+        "https://host/v3.0/path?skipToken=c2tpcFRva2Vu", 2
+    )
+    mock_process = mocker.patch.object(
+        core, "_process", side_effect=_numbered_pages(3, 2)[1:]
+    )
+    result = core.send_linkable(
+        GetExceptionListResp,
+        "/path",
+        consumed.append,
+        checkpoint=store,
+        resume_from=store.load(),
+        headers={"TMV1-Query": "dpt:443"},
+        params={"top": 10},
+    )
+    assert result.response.total_consumed == 4
+    assert store.load() == Checkpoint(None, 6)
+    assert (
+        mock_process.call_args_list[0][0][1] == "/path?skipToken=c2tpcFRva2Vu"
+    )
+    assert mock_process.call_args_list[0][1] == {
+        "headers": {"TMV1-Query": "dpt:443"}
+    }
+
+
+def test_send_linkable_with_completed_checkpoint(mocker, core):
+    mock_process = mocker.patch.object(core, "_process")
+    result = core.send_linkable(
+        GetExceptionListResp,
+        "/path",
+        lambda item: None,
+        resume_from=Checkpoint(None, 6),
+    )
+    assert result.response.total_consumed == 0
+    mock_process.assert_not_called()
+
+
+def test_send_linkable_with_checkpoint_and_workers(mocker, core, tmp_path):
+    store = SqliteCheckpointStore(tmp_path / "exports.db")
+    mocker.patch.object(core, "_process", side_effect=_numbered_pages(3, 4))
+    result = core.send_linkable(
+        GetExceptionListResp,
+        "/path",
+        lambda item: None,
+        workers=3,
+        checkpoint=store,
+    )
+    assert result.response.total_consumed == 12
+    assert store.load() == Checkpoint(None, 12)
+
+
+def test_send_linkable_with_stream_and_checkpoint(mocker, core, tmp_path):
+    store = FileCheckpointStore(tmp_path / "export.json")
+    link = "https://host/v3.0/path?skipToken=abc"
+    mocker.patch.object(
+        core,
+        "_send_internal",
+        side_effect=[
+            _streamed_response(
+                {"items": [_exception_object("1")] * 2, "nextLink": link}
+            ),
+            _streamed_response({"items": [_exception_object("2")]}),
+        ],
+    )
+    saved = []
+    mocker.patch.object(store, "save", side_effect=saved.append)
+
+    def consumer(item):
+        if item.value == "2":
+            raise ValueError("sink is down")
+
+    with pytest.raises(ValueError):
+        core.send_linkable(
+            GetExceptionListResp,
+            "/path",
+            consumer,
+            stream=True,
+            checkpoint=store,
+        )
+    assert saved == [Checkpoint(link, 2)]
+    mock_send = mocker.patch.object(
+        core,
+        "_send_internal",
+        return_value=_streamed_response({"items": [_exception_object("2")]}),
+    )
+    consumed = []
+    result = core.send_linkable(
+        GetExceptionListResp,
+        "/path",
+        consumed.append,
+        stream=True,
+        checkpoint=store,
+        resume_from=saved[-1],
+    )
+    assert result.response.total_consumed == 1
+    assert [item.value for item in consumed] == ["2"]
+    assert saved[-1] == Checkpoint(None, 3)
+    assert mock_send.call_args[0][0].url.endswith("skipToken=abc")
+
+
+def test_send_linkable_with_construct_mode(mocker, core):
+    mocker.patch.object(
+        core,
+        "_send_internal",
+        return_value=_streamed_response(
+            {
+                "progressRate": 100,
+                "items": [
+                    {"objectIntegrityLevel": 4096, "endpointIp": ["ip"]}
+                ],
+            }
+        ),
+    )
+    consumed = []
+    result = core.send_linkable(
+        GetEndpointActivityDataResp,
+        "/path",
+        consumed.append,
+        parse_mode=ParseMode.CONSTRUCT,
+    )
+    assert result.response.total_consumed == 1
+    assert isinstance(consumed[0], EndpointActivity)
+    assert type(consumed[0].object_integrity_level) is int
+    assert consumed[0].endpoint_ip == ["ip"]
+    assert consumed[0].event_id is None
+
+
+def test_construct_with_union():
+    data = {field.alias: "" for field in TiAlert.__fields__.values()}
+    data["impactScope"] = {
+        "entities": [
+            {"entityValue": {"name": "host", "ips": [], "guid": "123"}},
+            {"entityValue": "user"},
+        ]
+    }
+    alert = core_m._construct(Union[SaeAlert, TiAlert], data)
+    assert isinstance(alert, TiAlert)
+    assert isinstance(alert.impact_scope.entities[0], Entity)
+    assert isinstance(alert.impact_scope.entities[0].entity_value, HostInfo)
+    assert alert.impact_scope.entities[1].entity_value == "user"
+
+
+@pytest.mark.parametrize(
+    "provider, class_", [("SAE", SaeAlert), ("TI", TiAlert)]
+)
+def test_construct_with_tagged_union(provider, class_):
+    data = {
+        field.alias: ""
+        for alert in (SaeAlert, TiAlert)
+        for field in alert.__fields__.values()
+    }
+    data["alertProvider"] = provider
+    alert = core_m._construct(Union[SaeAlert, TiAlert], data)
+    assert type(alert) is class_
+
+
+def test_parse_items_with_tagged_union_is_failed():
+    with pytest.raises(ValidationError) as exc:
+        core_m._parse_items(GetAlertListResp, [{"alertProvider": "TI"}])
+    assert "for TiAlert" in str(exc.value)
+    assert "SaeAlert" not in str(exc.value)
+
+
+def test_parse_items_with_untagged_union_is_failed():
+    with pytest.raises(ValidationError) as exc:
+        core_m._parse_items(GetAlertListResp, [{"alertProvider": "?"}])
+    assert "SaeAlert" in str(exc.value)
+
+
+def test_construct_with_custom_init():
+    exception = core_m._construct(ExceptionObject, _exception_object("1"))
+    assert exception.value == "1"
+
+
+def test_error():
+    error = results._error(
+        ServerJsonError(
+            Error(status=500, code="X12", message="error", number=123)
+        )
+    )
+    assert error.status == 500
+    assert error.code == "X12"
+    assert error.message == "error"
+    assert error.number == 123
+
+
+def test_errors():
+    errors = results._errors(
+        ServerMultiJsonError(
+            [
+                MsError(status=123, code="code", message="message"),
+                MsError(status=456, code="code2", message="message2"),
+            ]
+        )
+    )
+    assert errors[0].status == 123
+    assert errors[0].code == "code"
+    assert errors[0].message == "message"
+    assert errors[1].status == 456
+    assert errors[1].code == "code2"
+    assert errors[1].message == "message2"
+
+
+def test_headers(core):
+    assert core._headers["Authorization"] == "Bearer token"
+    assert core._headers["User-Agent"] == "appname-{}/{}".format(
+        USERAGENT_SUFFIX, __version__
+    )
+
+
+def test_hide_binary():
+    raw_response = Response()
+    raw_response.headers = {"Content-Type": "application/pdf"}
+    assert core_m._hide_binary(raw_response) == "***binary content***"
+    raw_response.headers = {"Content-Type": "application/zip"}
+    assert core_m._hide_binary(raw_response) == "***binary content***"
+    raw_response.headers = {"Content-Type": "application/octet-stream"}
+    assert core_m._hide_binary(raw_response) == "***binary content***"
+
+
+def test_is_http_success():
+    assert core_m._is_http_success([200, 400, 600, 500]) is False
+    assert core_m._is_http_success([199, 400, 600, 500]) is False
+    assert core_m._is_http_success([400]) is False
+    assert core_m._is_http_success([200, 300, 398, 204]) is True
+    assert core_m._is_http_success([200]) is True
+
+
+def test_parse_data_with_bytes():
+    raw_response = TextResponse("raw")
+    raw_response.headers = {"Content-Type": "application/pdf"}
+    response = core_m._parse_data(raw_response, BytesResp)
+    assert response.content == raw_response.content
+
+
+def test_parse_data_with_html_is_failed():
+    raw_response = Response()
+    raw_response.headers = {"Content-Type": "text/html"}
+    with pytest.raises(ParseModelError):
+        core_m._parse_data(raw_response, NoContentResp)
+
+
+def test_parse_data_with_json():
+    raw_response = Response()
+    raw_response.headers = {"Content-Type": "application/json"}
+    body = SandboxSuspiciousListResp(
+        items=[
+            SandboxSuspiciousObject(
+                riskLevel=RiskLevel.HIGH,
+                analysisCompletionDateTime="2021-05-07T03:08:40",
+                expiredDateTime="2021-06-07T03:08:40Z",
+                rootSha1="fb5608fa03de204a12fe1e9e5275e4a682107471",
+                ip="6.6.6.6",
+            )
+        ]
+    )
+    response = core_m._parse_data(
+        raw_response, SandboxSuspiciousListResp, body
+    )
+    assert response.items[0].risk_level == "high"
+    assert (
+        response.items[0].analysis_completion_date_time
+        == "2021-05-07T03:08:40"
+    )
+    assert response.items[0].expired_date_time == "2021-06-07T03:08:40Z"
+    assert (
+        response.items[0].root_sha1
+        == "fb5608fa03de204a12fe1e9e5275e4a682107471"
+    )
+    assert response.items[0].type == "ip"
+    assert response.items[0].value == "6.6.6.6"
+
+
+def test_parse_data_with_tagged_items_is_failed():
+    raw_response = Response()
+    raw_response.headers = {"Content-Type": "application/json"}
+    with pytest.raises(ValidationError) as exc:
+        core_m._parse_data(
+            raw_response,
+            GetAlertListResp,
+            {"count": 1, "totalCount": 1, "items": [{"alertProvider": "SAE"}]},
+        )
+    assert "for SaeAlert" in str(exc.value)
+    assert "TiAlert" not in str(exc.value)
+
+
+def test_parse_data_with_tagged_items_without_items():
+    raw_response = Response()
+    raw_response.headers = {"Content-Type": "application/json"}
+    response = core_m._parse_data(
+        raw_response, GetAlertListResp, {"count": 0, "totalCount": 0}
+    )
+    assert response.total_count == 0
+    assert response.items == []
+
+
+def test_parse_data_with_multi_and_wrong_model_is_failed():
+    raw_response = Response()
+    raw_response.headers = {"Content-Type": "application/json"}
+    raw_response.status_code = 207
+    body = MultiResp(items=[MsData(status=200)])
+    with pytest.raises(ValidationError):
+        core_m._parse_data(raw_response, AddAlertNoteResp, body)
+
+
+def test_parse_data_with_single_and_wrong_model_is_failed():
+    raw_response = Response()
+    raw_response.headers = {"Content-Type": "application/json"}
+    raw_response.status_code = 200
+    body = AddAlertNoteResp(location="test")
+    with pytest.raises(ValidationError):
+        core_m._parse_data(raw_response, MultiResp, body)
+
+
+def test_parse_data_without_content():
+    raw_response = Response()
+    raw_response.status_code = 204
+    response = core_m._parse_data(raw_response, NoContentResp)
+    assert isinstance(response, NoContentResp)
+
+
+def test_parse_html():
+    result = core_m._parse_html("<html><div><p>test</p></div></html>")
+    assert result == "test"
+
+
+def test_poll_status_with_rejected_status_is_not_polling():
+    start_time = time.time()
+    core_m._poll_status(
+        lambda: BaseStatusResponse.construct(status=Status.REJECTED),
+        20,
+    )
+    assert time.time() - start_time < 20
+
+
+def test_poll_status_with_running_status_is_polling():
+    start_time = time.time()
+    core_m._poll_status(
+        lambda: BaseStatusResponse.construct(status=Status.RUNNING),
+        2,
+    )
+    assert time.time() - start_time >= 2
+
+
+def test_poll_status_with_running_status_is_backing_off(mocker):
+    statuses = iter([Status.QUEUED, Status.RUNNING, Status.RUNNING])
+    mock_sleep = mocker.patch.object(core_m.time, "sleep")
+    polls = core_m._poll_status(
+        lambda: BaseStatusResponse.construct(
+            status=next(statuses, Status.SUCCEEDED)
+        ),
+        1800,
+        PollPolicy(initial_interval=2, factor=2, max_interval=5, jitter=0),
+    )
+    assert polls == 4
+    assert [c[0][0] for c in mock_sleep.call_args_list] == [2, 4, 5]
+
+
+def test_poll_status_with_succeeded_status():
+    start_time = time.time()
+    core_m._poll_status(
+        lambda: BaseStatusResponse.construct(status=Status.SUCCEEDED),
+        20,
+    )
+    assert time.time() - start_time < 20
+
+
+def test_send(core, mocker):
+    raw_response = Response()
+    raw_response.status_code = 204
+    mock_request = mocker.patch.object(core, "_send_internal")
+    mock_request.return_value = raw_response
+    result = core.send(NoContentResp, Api.EDIT_ALERT_STATUS)
+    mock_request.assert_called()
+    assert result.result_code == ResultCode.SUCCESS
+
+
+def _log_core(mocker, status, **kwargs):
+    log_core = Core(
+        "appname",
+        "token",
+        "https://dummy.com",
+        0,
+        0,
+        30,
+        30,
+        logs=LogPolicy(**kwargs),
+    )
+    raw_response = TextResponse('{"key": "value"}')
+    raw_response.status_code = status
+    raw_response.headers = {"Content-Type": "application/json"}
+    mocker.patch.object(log_core._adapter, "send", return_value=raw_response)
+    request = Request(
+        "GET",
+        API_URL + Api.GET_ALERT_LIST,
+        headers={"Authorization": "Bearer secret"},
+    ).prepare()
+    return log_core, request
+
+
+def test_send_internal_logs(mocker, caplog):
+    log_core, request = _log_core(mocker, 200, max_body=5)
+    with caplog.at_level(logging.INFO, logger=core_m.__name__):
+        log_core._send_internal(request)
+    sent, received = caplog.records
+    assert "secret" not in sent.getMessage()
+    assert sent.http_method == "GET"
+    assert sent.http_url == request.url
+    assert 'Body={"key...[Truncated=11]]' in received.getMessage()
+    assert received.http_status == 200
+    assert received.http_elapsed >= 0
+
+
+def test_send_internal_logs_nothing_if_disabled(mocker, caplog):
+    log_core, request = _log_core(mocker, 500)
+    mock_hide = mocker.patch.object(core_m, "_hide_binary")
+    mock_sampled = mocker.patch.object(LogPolicy, "sampled")
+    with caplog.at_level(logging.WARNING, logger=core_m.__name__):
+        log_core._send_internal(request)
+    assert not caplog.records
+    mock_hide.assert_not_called()
+    mock_sampled.assert_not_called()
+
+
+@pytest.mark.parametrize("status, logged", [(200, 0), (404, 1)])
+def test_send_internal_logs_with_sampling(mocker, caplog, status, logged):
+    log_core, request = _log_core(
+        mocker, status, sampling=frozenset({(Api.GET_ALERT_LIST, 0)})
+    )
+    with caplog.at_level(logging.INFO, logger=core_m.__name__):
+        log_core._send_internal(request)
+    assert len(caplog.records) == logged
+
+
+def test_send_linkable(mocker, core):
+    mock_process = mocker.patch.object(core, "_process")
+    mock_process.return_value = GetExceptionListResp(
+        items=[ExceptionObject.construct()]
+    )
+    result = core.send_linkable(
+        GetExceptionListResp,
+        Api.GET_EXCEPTION_LIST,
+        lambda x: None,
+    )
+    mock_process.assert_called()
+    assert result.result_code == ResultCode.SUCCESS
+    assert result.response.total_consumed == 1
+
+
+def _retry_core(**kwargs):
+    return Core(
+        "appname",
+        "token",
+        "https://dummy.com",
+        0,
+        0,
+        30,
+        30,
+        RetryPolicy(**kwargs),
+    )
+
+
+def _status_response(status, headers=None):
+    raw_response = TextResponse("error")
+    raw_response.status_code = status
+    raw_response.headers = headers or {}
+    return raw_response
+
+
+def test_send_with_retry(mocker):
+    retry_core = _retry_core(backoff_factor=0)
+    mock_sleep = mocker.patch.object(core_m.time, "sleep")
+    mock_send = mocker.patch.object(
+        retry_core,
+        "_send_internal",
+        side_effect=[
+            _status_response(503),
+            RequestsConnectionError(),
+            _status_response(204),
+        ],
+    )
+    result = retry_core.send(NoContentResp, Api.EDIT_ALERT_STATUS)
+    assert mock_send.call_count == 3
+    assert mock_sleep.call_count == 2
+    assert result.result_code == ResultCode.SUCCESS
+    assert result.retries == 2
+
+
+def test_send_with_retry_after(mocker):
+    retry_core = _retry_core(backoff_factor=0)
+    mock_sleep = mocker.patch.object(core_m.time, "sleep")
+    mocker.patch.object(
+        retry_core,
+        "_send_internal",
+        side_effect=[
+            _status_response(429, {"Retry-After": "7"}),
+            _status_response(204),
+        ],
+    )
+    result = retry_core.send(NoContentResp, Api.EDIT_ALERT_STATUS)
+    mock_sleep.assert_called_once_with(7.0)
+    assert result.retries == 1
+
+
+def test_send_with_retry_exhausted_is_failed(mocker):
+    retry_core = _retry_core(max_retries=2, backoff_factor=0)
+    mocker.patch.object(core_m.time, "sleep")
+    mock_send = mocker.patch.object(
+        retry_core, "_send_internal", return_value=_status_response(503)
+    )
+    result = retry_core.send(NoContentResp, Api.EDIT_ALERT_STATUS)
+    assert mock_send.call_count == 3
+    assert result.result_code == ResultCode.ERROR
+    assert result.error.status == 503
+    assert result.retries == 2
+
+
+def test_send_with_retry_budget_is_failed(mocker):
+    retry_core = _retry_core(max_retries=5, budget=1, backoff_factor=0)
+    mocker.patch.object(core_m.time, "sleep")
+    mocker.patch.object(
+        retry_core,
+        "_send_internal",
+        side_effect=[
+            _status_response(503),
+            _status_response(204),
+            _status_response(503),
+        ],
+    )
+    result = retry_core.send_task_result(CollectFileTaskResp, "1", True, 0)
+    assert result.result_code == ResultCode.ERROR
+    assert result.retries == 1
+
+
+def _bulk_core(**kwargs):
+    return Core(
+        "appname",
+        "token",
+        "https://dummy.com",
+        0,
+        0,
+        30,
+        30,
+        bulk=BulkPolicy(**kwargs),
+    )
+
+
+def _multi_response(request, *args):
+    raw_response = Response()
+    raw_response.status_code = 207
+    raw_response.headers = {"Content-Type": "application/json"}
+    raw_response._content = json.dumps(
+        [
+            {
+                "status": 202,
+                "headers": [
+                    {
+                        "name": "Operation-Location",
+                        "value": f"https://t/{item}",
+                    }
+                ],
+            }
+            for item in json.loads(request.body)
+        ]
+    ).encode("utf-8")
+    return raw_response
+
+
+def test_send_multi_with_chunks(mocker):
+    bulk_core = _bulk_core(max_items=3, workers=2)
+    mock_send = mocker.patch.object(
+        bulk_core, "_send_internal", side_effect=_multi_response
+    )
+    result = bulk_core.send_multi(
+        MultiResp, Api.ISOLATE_ENDPOINT, json=list(range(10))
+    )
+    assert mock_send.call_count == 4
+    assert result.result_code == ResultCode.SUCCESS
+    assert [item.task_id for item in result.response.items] == [
+        str(i) for i in range(10)
+    ]
+
+
+def _task_items(method, path, body):
+    return 207, [
+        {
+            "status": 202,
+            "headers": [
+                {"name": "Operation-Location", "value": f"https://t/{item}"}
+            ],
+        }
+        for item in body
+    ]
+
+
+def test_send_multi_with_concurrent_chunks():
+    with LocalServer(_task_items, delay=0.01) as server:
+        bulk_core = Core(
+            "appname",
+            "token",
+            server.url,
+            1,
+            10,
+            30,
+            30,
+            bulk=BulkPolicy(max_items=100, workers=10),
+        )
+        result = bulk_core.send_multi(
+            MultiResp, Api.ISOLATE_ENDPOINT, json=list(range(2000))
+        )
+    assert result.result_code == ResultCode.SUCCESS, result.errors[:1]
+    assert [item.task_id for item in result.response.items] == [
+        str(i) for i in range(2000)
+    ]
+
+
+def test_send_multi_with_failed_chunk(mocker):
+    bulk_core = _bulk_core(max_items=2)
+
+    def send(request, *args):
+        if json.loads(request.body) == [2, 3]:
+            raise RequestsConnectionError("error")
+        return _multi_response(request)
+
+    mocker.patch.object(bulk_core, "_send_internal", side_effect=send)
+    result = bulk_core.send_multi(
+        MultiResp, Api.ISOLATE_ENDPOINT, json=list(range(5))
+    )
+    assert result.result_code == ResultCode.ERROR
+    assert [error.status for error in result.errors] == [
+        202,
+        202,
+        500,
+        500,
+        202,
+    ]
+    assert result.errors[1].task_id == "1"
+    assert result.errors[2].code == "ConnectionError"
+
+
+@pytest.mark.parametrize(
+    "status, content_type, content",
+    [
+        (207, "application/json", b'{"status": 202}'),
+        (202, "text/plain", b""),
+    ],
+)
+def test_send_multi_with_chunk_not_a_list(
+    mocker, status, content_type, content
+):
+    bulk_core = _bulk_core(max_items=2)
+
+    def send(request, *args):
+        if json.loads(request.body) == [2, 3]:
+            raw_response = Response()
+            raw_response.status_code = status
+            raw_response.headers = {"Content-Type": content_type}
+            raw_response._content = content
+            return raw_response
+        return _multi_response(request)
+
+    mocker.patch.object(bulk_core, "_send_internal", side_effect=send)
+    result = bulk_core.send_multi(
+        MultiResp, Api.ISOLATE_ENDPOINT, json=list(range(4))
+    )
+    assert result.result_code == ResultCode.ERROR
+    assert [error.code for error in result.errors[2:]] == [
+        "ParseModelError",
+        "ParseModelError",
+    ]
 
 
-def test_errors():
-    errors = results._errors(
-        ServerMultiJsonError(
-            [
-                MsError(status=123, code="code", message="message"),
-                MsError(status=456, code="code2", message="message2"),
-            ]
-        )
+def test_send_multi_with_pool_smaller_than_workers(mocker):
+    bulk_core = Core(
+        "appname",
+        "token",
+        "https://dummy.com",
+        1,
+        2,
+        30,
+        30,
+        bulk=BulkPolicy(max_items=1, workers=4),
     )
-    assert errors[0].status == 123
-    assert errors[0].code == "code"
-    assert errors[0].message == "message"
-    assert errors[1].status == 456
-    assert errors[1].code == "code2"
-    assert errors[1].message == "message2"
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def send(request, *args):
+        with lock:
+            running.append(request)
+            peak.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(request)
+        return _multi_response(request)
+
+    mocker.patch.object(bulk_core, "_send_internal", side_effect=send)
+    result = bulk_core.send_multi(
+        MultiResp, Api.ISOLATE_ENDPOINT, json=list(range(8))
+    )
+    assert result.result_code == ResultCode.SUCCESS
+    assert max(peak) <= 2
 
 
-def test_headers(core):
-    assert core._headers["Authorization"] == "Bearer token"
-    assert core._headers["User-Agent"] == "appname-{}/{}".format(
-        USERAGENT_SUFFIX, __version__
+def test_send_multi_with_empty_pool(mocker):
+    bulk_core = _bulk_core(max_items=2)
+
+    def send(request, *args):
+        if json.loads(request.body) == [2, 3]:
+            raise EmptyPoolError(None, "Pool is empty.")
+        return _multi_response(request)
+
+    mocker.patch.object(bulk_core, "_send_internal", side_effect=send)
+    result = bulk_core.send_multi(
+        MultiResp, Api.ISOLATE_ENDPOINT, json=list(range(4))
     )
+    assert result.result_code == ResultCode.ERROR
+    assert [error.code for error in result.errors[2:]] == [
+        "EmptyPoolError",
+        "EmptyPoolError",
+    ]
 
 
-def test_hide_binary():
-    raw_response = Response()
-    raw_response.headers = {"Content-Type": "application/pdf"}
-    assert core_m._hide_binary(raw_response) == "***binary content***"
-    raw_response.headers = {"Content-Type": "application/zip"}
-    assert core_m._hide_binary(raw_response) == "***binary content***"
-    raw_response.headers = {"Content-Type": "application/octet-stream"}
-    assert core_m._hide_binary(raw_response) == "***binary content***"
+def test_send_multi_without_retry_is_failed(mocker):
+    retry_core = _retry_core(backoff_factor=0)
+    mock_send = mocker.patch.object(
+        retry_core, "_send_internal", return_value=_status_response(503)
+    )
+    result = retry_core.send_multi(MultiResp, Api.ISOLATE_ENDPOINT, json=[])
+    mock_send.assert_called_once()
+    assert result.result_code == ResultCode.ERROR
+    assert result.retries == 0
 
 
-def test_is_http_success():
-    assert core_m._is_http_success([200, 400, 600, 500]) is False
-    assert core_m._is_http_success([199, 400, 600, 500]) is False
-    assert core_m._is_http_success([400]) is False
-    assert core_m._is_http_success([200, 300, 398, 204]) is True
-    assert core_m._is_http_success([200]) is True
+class _CountingCodec(JsonCodec):
+    def __init__(self):
+        self.decoded = 0
+        self.encoded = 0
 
+    def dumps(self, obj):
+        self.encoded += 1
+        return super().dumps(obj)
 
-def test_parse_data_with_bytes():
-    raw_response = TextResponse("raw")
-    raw_response.headers = {"Content-Type": "application/pdf"}
-    response = core_m._parse_data(raw_response, BytesResp)
-    assert response.content == raw_response.content
+    def loads(self, data):
+        self.decoded += 1
+        return super().loads(data)
 
 
-def test_parse_data_with_html_is_failed():
-    raw_response = Response()
-    raw_response.headers = {"Content-Type": "text/html"}
-    with pytest.raises(ParseModelError):
-        core_m._parse_data(raw_response, NoContentResp)
+def test_send_multi_with_codec(mocker):
+    codec = _CountingCodec()
+    codec_core = Core(
+        "appname", "token", "https://dummy.com", 0, 0, 30, 30, codec=codec
+    )
+    mock_send = mocker.patch.object(
+        codec_core, "_send_internal", side_effect=_multi_response
+    )
+    result = codec_core.send_multi(
+        MultiResp, Api.ISOLATE_ENDPOINT, json=list(range(3))
+    )
+    request = mock_send.call_args[0][0]
+    assert request.headers["Content-Type"] == "application/json"
+    assert json.loads(request.body) == [0, 1, 2]
+    assert result.result_code == ResultCode.SUCCESS
+    assert len(result.response.items) == 3
+    assert codec.decoded == 1
 
 
-def test_parse_data_with_json():
+def _json_response(status_code, body):
     raw_response = Response()
+    raw_response.status_code = status_code
     raw_response.headers = {"Content-Type": "application/json"}
-    raw_response.json = lambda: SandboxSuspiciousListResp(
-        items=[
-            SandboxSuspiciousObject(
-                riskLevel=RiskLevel.HIGH,
-                analysisCompletionDateTime="2021-05-07T03:08:40",
-                expiredDateTime="2021-06-07T03:08:40Z",
-                rootSha1="fb5608fa03de204a12fe1e9e5275e4a682107471",
-                ip="6.6.6.6",
-            )
-        ]
+    raw_response._content = json.dumps(body).encode("utf-8")
+    return raw_response
+
+
+@pytest.mark.parametrize(
+    "raw_response",
+    [
+        _json_response(
+            207, [{"status": 400, "body": {"error": {"code": "Bad"}}}] * 2
+        ),
+        _json_response(400, {"error": {"code": "Bad", "message": "bad"}}),
+    ],
+)
+def test_send_multi_with_codec_is_failed(mocker, raw_response):
+    codec = _CountingCodec()
+    codec_core = Core(
+        "appname", "token", "https://dummy.com", 0, 0, 30, 30, codec=codec
     )
-    response = core_m._parse_data(raw_response, SandboxSuspiciousListResp)
-    assert response.items[0].risk_level == "high"
-    assert (
-        response.items[0].analysis_completion_date_time
-        == "2021-05-07T03:08:40"
+    mocker.patch.object(
+        codec_core, "_send_internal", return_value=raw_response
     )
-    assert response.items[0].expired_date_time == "2021-06-07T03:08:40Z"
-    assert (
-        response.items[0].root_sha1
-        == "fb5608fa03de204a12fe1e9e5275e4a682107471"
+    result = codec_core.send_multi(
+        MultiResp, Api.ISOLATE_ENDPOINT, json=list(range(2))
     )
-    assert response.items[0].type == "ip"
-    assert response.items[0].value == "6.6.6.6"
+    assert result.result_code == ResultCode.ERROR
+    assert result.errors[0].status == 400
+    assert codec.decoded == 1
+
+
+@pytest.mark.parametrize("codec", [JsonCodec(), OrjsonCodec()])
+@pytest.mark.parametrize(
+    "status, content, code",
+    [
+        (200, b'{"items": [', "JSONDecodeError"),
+        (400, b'{"error": ', "JSONDecodeError"),
+        (207, b"", "JSONDecodeError"),
+        (400, b"", "ServerTextError"),
+    ],
+)
+def test_send_with_malformed_body_is_failed(
+    mocker, codec, status, content, code
+):
+    codec_core = Core(
+        "appname", "token", "https://dummy.com", 0, 0, 30, 30, codec=codec
+    )
+    raw_response = _json_response(status, None)
+    raw_response._content = content
+    mocker.patch.object(
+        codec_core, "_send_internal", return_value=raw_response
+    )
+    result = codec_core.send(GetExceptionListResp, Api.GET_EXCEPTION_LIST)
+    multi_result = codec_core.send_multi(
+        MultiResp, Api.ISOLATE_ENDPOINT, json=[{}]
+    )
+    assert result.result_code == ResultCode.ERROR
+    assert result.error.code == code
+    assert multi_result.result_code == ResultCode.ERROR
+    assert multi_result.errors[0].code == code
 
 
-def test_parse_data_with_multi_and_wrong_model_is_failed():
-    raw_response = Response()
-    raw_response.headers = {"Content-Type": "application/json"}
-    raw_response.status_code = 207
-    raw_response.json = lambda: MultiResp(items=[MsData(status=200)])
-    with pytest.raises(ValidationError):
-        core_m._parse_data(raw_response, AddAlertNoteResp)
+def test_send_linkable_with_malformed_body_is_failed(mocker, core):
+    raw_response = _json_response(200, None)
+    raw_response._content = b'{"items": ['
+    mocker.patch.object(core, "_send_internal", return_value=raw_response)
+    result = core.send_linkable(
+        GetExceptionListResp, "/path", lambda item: None
+    )
+    assert result.result_code == ResultCode.ERROR
+    assert result.error.code == "JSONDecodeError"
 
 
-def test_parse_data_with_single_and_wrong_model_is_failed():
+def _binary_response(content, content_type="application/zip"):
     raw_response = Response()
-    raw_response.headers = {"Content-Type": "application/json"}
     raw_response.status_code = 200
-    raw_response.json = lambda: AddAlertNoteResp(location="test")
-    with pytest.raises(ValidationError):
-        core_m._parse_data(raw_response, MultiResp)
+    raw_response.headers = {"Content-Type": content_type}
+    raw_response.raw = io.BytesIO(content)
+    return raw_response
+
+
+def _submit_file_response(request, content):
+    uploaded = b"".join(request.body)
+    assert content in uploaded
+    assert int(request.headers["Content-Length"]) == len(uploaded)
+    raw_response = TextResponse(
+        json.dumps(
+            {
+                "id": "123",
+                "digest": {
+                    "md5": hashlib.md5(content).hexdigest(),
+                    "sha1": hashlib.sha1(content).hexdigest(),
+                    "sha256": hashlib.sha256(content).hexdigest().upper(),
+                },
+            }
+        )
+    )
+    raw_response.status_code = 202
+    raw_response.headers = {"Content-Type": "application/json"}
+    return raw_response
 
 
-def test_parse_data_without_content():
-    raw_response = Response()
-    raw_response.status_code = 204
-    response = core_m._parse_data(raw_response, NoContentResp)
-    assert isinstance(response, NoContentResp)
+def test_send_file(core, mocker, tmp_path):
+    path = tmp_path / "sample.exe"
+    path.write_bytes(b"x" * 100_000)
+    mocker.patch.object(
+        core,
+        "_send_internal",
+        side_effect=lambda request, *args: _submit_file_response(
+            request, b"x" * 100_000
+        ),
+    )
+    result = core.send_file(Api.SUBMIT_FILE_TO_SANDBOX, path, "sample.exe", {})
+    assert result.result_code == ResultCode.SUCCESS
+    assert result.response.id == "123"
 
 
-def test_parse_html():
-    result = core_m._parse_html("<html><div><p>test</p></div></html>")
-    assert result == "test"
+def test_send_file_with_missing_path_is_failed(core, mocker, tmp_path):
+    mock_send = mocker.patch.object(core, "_send_internal")
+    result = core.send_file(
+        Api.SUBMIT_FILE_TO_SANDBOX, tmp_path / "missing.exe", "name", {}
+    )
+    assert result.result_code == ResultCode.ERROR
+    assert result.error.code == "FileAccessError"
+    assert "missing.exe" in result.error.message
+    mock_send.assert_not_called()
 
 
-def test_poll_status_with_rejected_status_is_not_polling():
-    start_time = time.time()
-    core_m._poll_status(
-        lambda: BaseStatusResponse.construct(status=Status.REJECTED),
-        20,
+def test_send_file_with_digest_mismatch_is_failed(core, mocker):
+    mocker.patch.object(
+        core,
+        "_send_internal",
+        side_effect=lambda request, *args: _submit_file_response(
+            request, b"other"
+        ),
     )
-    assert time.time() - start_time < 20
+    result = core.send_file(
+        Api.SUBMIT_FILE_TO_SANDBOX, io.BytesIO(b"other sample"), "name", {}
+    )
+    assert result.result_code == ResultCode.ERROR
+    assert result.error.code == "DigestMismatchError"
+    assert "Id=123" in result.error.message
 
 
-def test_poll_status_with_running_status_is_polling():
-    start_time = time.time()
-    core_m._poll_status(
-        lambda: BaseStatusResponse.construct(status=Status.RUNNING),
-        2,
+def test_send_sandbox_file_to_path(core, mocker, tmp_path):
+    mock_poll = mocker.patch.object(core_m, "_poll_status")
+    mock_send = mocker.patch.object(
+        core, "_send_internal", return_value=_binary_response(b"x" * 100_000)
     )
-    assert time.time() - start_time >= 2
+    path = tmp_path / "package.zip"
+    result = core.send_sandbox_file(
+        Api.DOWNLOAD_SANDBOX_INVESTIGATION_PACKAGE, "123", path, True, 10
+    )
+    mock_poll.assert_called()
+    assert mock_send.call_args[0][1]
+    assert result.result_code == ResultCode.SUCCESS
+    assert result.response.size == 100_000
+    assert result.response.path == str(path)
+    assert path.read_bytes() == b"x" * 100_000
+    assert not (tmp_path / "package.zip.part").exists()
 
 
-def test_poll_status_with_succeeded_status():
-    start_time = time.time()
-    core_m._poll_status(
-        lambda: BaseStatusResponse.construct(status=Status.SUCCEEDED),
-        20,
+def test_send_sandbox_file_to_file_object(core, mocker):
+    mocker.patch.object(
+        core, "_send_internal", return_value=_binary_response(b"pdf")
     )
-    assert time.time() - start_time < 20
+    file = io.BytesIO()
+    result = core.send_sandbox_file(
+        Api.DOWNLOAD_SANDBOX_ANALYSIS_RESULT, "123", file, False, 0
+    )
+    assert result.response.path is None
+    assert result.response.size == 3
+    assert file.getvalue() == b"pdf"
 
 
-def test_send(core, mocker):
-    raw_response = Response()
-    raw_response.status_code = 204
-    mock_request = mocker.patch.object(core, "_send_internal")
-    mock_request.return_value = raw_response
-    result = core.send(NoContentResp, Api.EDIT_ALERT_STATUS)
-    mock_request.assert_called()
-    assert result.result_code == ResultCode.SUCCESS
+def test_send_sandbox_file_is_failed(core, mocker, tmp_path):
+    mocker.patch.object(
+        core,
+        "_send_internal",
+        return_value=_binary_response(b"zip"),
+    )
+    mocker.patch.object(
+        core_m.FileSink, "write", side_effect=RuntimeError("disk full")
+    )
+    path = tmp_path / "package.zip"
+    result = core.send_sandbox_file(
+        Api.DOWNLOAD_SANDBOX_INVESTIGATION_PACKAGE, "123", path, False, 0
+    )
+    assert result.result_code == ResultCode.ERROR
+    assert not path.exists()
+    assert not (tmp_path / "package.zip.part").exists()
 
 
-def test_send_linkable(mocker, core):
-    mock_process = mocker.patch.object(core, "_process")
-    mock_process.return_value = GetExceptionListResp(
-        items=[ExceptionObject.construct()]
+def test_send_sandbox_file_with_missing_directory_is_failed(
+    core, mocker, tmp_path
+):
+    mocker.patch.object(
+        core, "_send_internal", return_value=_binary_response(b"zip")
     )
-    result = core.send_linkable(
-        GetExceptionListResp,
-        Api.GET_EXCEPTION_LIST,
-        lambda x: None,
+    result = core.send_sandbox_file(
+        Api.DOWNLOAD_SANDBOX_INVESTIGATION_PACKAGE,
+        "123",
+        tmp_path / "missing" / "package.zip",
+        False,
+        0,
     )
-    mock_process.assert_called()
-    assert result.result_code == ResultCode.SUCCESS
-    assert result.response.total_consumed == 1
+    assert result.result_code == ResultCode.ERROR
+    assert result.error.code == "FileAccessError"
+
+
+def test_send_sandbox_file_with_write_error_is_failed(core, mocker):
+    mocker.patch.object(
+        core, "_send_internal", return_value=_binary_response(b"zip")
+    )
+    file = mocker.Mock(spec=io.BytesIO)
+    file.write.side_effect = OSError(28, "No space left on device")
+    result = core.send_sandbox_file(
+        Api.DOWNLOAD_SANDBOX_INVESTIGATION_PACKAGE, "123", file, False, 0
+    )
+    assert result.result_code == ResultCode.ERROR
+    assert result.error.code == "FileAccessError"
+
+
+def test_send_sandbox_file_with_text_is_failed(core, mocker, tmp_path):
+    mocker.patch.object(
+        core,
+        "_send_internal",
+        return_value=_binary_response(b"text", "text/plain"),
+    )
+    result = core.send_sandbox_file(
+        Api.DOWNLOAD_SANDBOX_INVESTIGATION_PACKAGE,
+        "123",
+        tmp_path / "package.zip",
+        False,
+        0,
+    )
+    assert result.result_code == ResultCode.ERROR
+    assert result.error.code == "ParseModelError"
+    assert not list(tmp_path.iterdir())
 
 
 def test_send_sandbox_result_with_polling(core, mocker):
@@ -353,6 +1826,157 @@ def test_send_sandbox_result_without_polling_is_failed(core, mocker):
     assert result.error.code == "RequestException"
 
 
+def _send_sharded(core, consumer, policy, **kwargs):
+    return core.send_sharded(
+        GetEndpointActivityDataResp,
+        GetEndpointActivityDataCountResp,
+        Api.GET_ENDPOINT_ACTIVITY_DATA,
+        consumer,
+        policy,
+        params={
+            "startDateTime": ActivitySearch.START,
+            "endDateTime": ActivitySearch.END,
+        },
+        headers={"TMV1-Query": 'dpt:"443"'},
+        **kwargs,
+    )
+
+
+def test_send_sharded(core, mocker):
+    search = ActivitySearch(activity_times())
+    threads = set()
+
+    def process(*args, **kwargs):
+        threads.add(threading.current_thread().name.split("_")[0])
+        return search(*args, **kwargs)
+
+    mock_process = mocker.patch.object(core, "_process", side_effect=process)
+    consumed = []
+    result = _send_sharded(
+        core,
+        lambda item: consumed.append(item.event_time),
+        ShardPolicy(shards=4, min_seconds=60, workers=3),
+    )
+    assert result.result_code == ResultCode.SUCCESS
+    assert result.response.total_consumed == 244
+    assert sorted(consumed) == search.times
+    assert search.counts > 1
+    assert search.pages >= 122
+    assert "pytmv1-shard" in threads
+    assert all(
+        call[1]["headers"] == {"TMV1-Query": 'dpt:"443"'}
+        for call in mock_process.call_args_list
+    )
+
+
+def test_send_sharded_with_ordered(core, mocker):
+    search = ActivitySearch(activity_times(), page_size=5)
+    mocker.patch.object(core, "_process", side_effect=search)
+    consumed = []
+    result = _send_sharded(
+        core,
+        lambda item: consumed.append(item.event_time),
+        ShardPolicy(shards=8, min_seconds=1, workers=4),
+        ordered=True,
+    )
+    assert result.response.total_consumed == 244
+    assert consumed == search.times
+
+
+def test_send_sharded_with_local_server():
+    search = ActivitySearch(activity_times(), page_size=20)
+    with LocalServer(search.handle, delay=0.01) as server:
+        search.url = server.url
+        consumed = []
+        result = _send_sharded(
+            Core("appname", "token", server.url, 1, 4, 30, 30),
+            lambda item: consumed.append(item.event_time),
+            ShardPolicy(shards=8, min_seconds=1, workers=4),
+            prefetch=2,
+        )
+    assert result.result_code == ResultCode.SUCCESS, result.error
+    assert sorted(consumed) == search.times
+    assert search.counts > 1
+
+
+def test_send_sharded_with_workers(core, mocker):
+    search = ActivitySearch(activity_times())
+    mocker.patch.object(core, "_process", side_effect=search)
+
+    def consumer(item):
+        if item.event_time == search.times[0]:
+            raise ValueError("invalid record")
+
+    result = _send_sharded(
+        core, consumer, ShardPolicy(shards=4, workers=2), workers=3
+    )
+    assert result.response.total_consumed == 243
+    assert result.response.total_failed == 1
+    assert result.response.errors[0].code == "ValueError"
+
+
+def test_send_sharded_with_spool(mocker, tmp_path):
+    core = Core(
+        "appname",
+        "token",
+        API_URL,
+        0,
+        0,
+        30,
+        30,
+        spooling=SpoolPolicy(str(tmp_path)),
+    )
+    search = ActivitySearch(activity_times())
+    mocker.patch.object(core, "_send_internal", side_effect=search.send)
+    consumed = []
+    result = _send_sharded(
+        core,
+        lambda item: consumed.append(item.event_time),
+        ShardPolicy(shards=2),
+    )
+    assert result.response.total_consumed == 244
+    assert sorted(consumed) == search.times
+    assert os.listdir(tmp_path) == []
+
+
+def test_send_sharded_without_records(core, mocker):
+    search = ActivitySearch([])
+    mocker.patch.object(core, "_process", side_effect=search)
+    result = _send_sharded(core, lambda item: None, ShardPolicy())
+    assert result.response.total_consumed == 0
+    assert search.counts == 1
+    assert search.pages == 0
+
+
+def test_send_sharded_is_failed(core, mocker):
+    search = ActivitySearch(activity_times())
+
+    def process(class_, uri, method=None, **kwargs):
+        if search.pages == 3:
+            raise ServerCustError(500, "err")
+        return search(class_, uri, method, **kwargs)
+
+    mocker.patch.object(core, "_process", side_effect=process)
+    result = _send_sharded(core, lambda item: None, ShardPolicy(workers=2))
+    assert result.result_code == ResultCode.ERROR
+    assert result.error.status == 500
+
+
+def test_send_sharded_with_invalid_time_is_failed(core, mocker):
+    mock_process = mocker.patch.object(core, "_process")
+    result = core.send_sharded(
+        GetEndpointActivityDataResp,
+        GetEndpointActivityDataCountResp,
+        Api.GET_ENDPOINT_ACTIVITY_DATA,
+        lambda item: None,
+        ShardPolicy(),
+        params={"startDateTime": "yesterday"},
+    )
+    assert result.result_code == ResultCode.ERROR
+    assert result.error.code == "ValidationError"
+    mock_process.assert_not_called()
+
+
 def test_send_task_result(core, mocker):
     mock_poll = mocker.patch.object(core_m, "_poll_status")
     mock_send = mocker.patch.object(core, "_process")
@@ -375,6 +1999,22 @@ def test_send_task_result_is_failed(core, mocker):
     assert result.error.code == "RequestException"
 
 
+def test_send_task_result_with_poll_counts_polls(core, mocker):
+    mocker.patch.object(core_m.time, "sleep")
+    mocker.patch.object(
+        core,
+        "_process",
+        side_effect=[
+            CollectFileTaskResp.construct(status=Status.RUNNING),
+            CollectFileTaskResp.construct(status=Status.SUCCEEDED),
+            CollectFileTaskResp.construct(status=Status.SUCCEEDED),
+        ],
+    )
+    result = core.send_task_result(CollectFileTaskResp, "123", True, 1800)
+    assert result.result_code == ResultCode.SUCCESS
+    assert result.polls == 2
+
+
 def test_send_task_result_with_poll(core, mocker):
     mock_poll = mocker.patch.object(core_m, "_poll_status")
     mock_send = mocker.patch.object(core, "_process")
@@ -413,11 +2053,17 @@ def test_send_with_runtime_error_is_failed(core, mocker):
     assert result.error.code == "RuntimeError"
 
 
+def _validation_error():
+    with pytest.raises(ValidationError) as exc_info:
+        parse_obj(Error, {})
+    return exc_info.value
+
+
 def test_send_with_validation_error_is_failed(core, mocker):
     mocker.patch.object(
         core,
         "_send_internal",
-        side_effect=ValidationError([], NoContentResp),
+        side_effect=_validation_error(),
     )
     result = core.send(GetExceptionListResp, Api.GET_EXCEPTION_LIST)
     assert result.result_code == ResultCode.ERROR
@@ -452,11 +2098,9 @@ def test_validate_with_json_error_is_failed():
     raw_response = Response()
     raw_response.headers = {"Content-Type": "application/json"}
     raw_response.status_code = 500
-    raw_response.json = lambda: {
-        "error": {"code": "CODE", "message": "some error", "number": 1}
-    }
+    body = {"error": {"code": "CODE", "message": "some error", "number": 1}}
     with pytest.raises(ServerJsonError, match="some error"):
-        core_m._validate(raw_response)
+        core_m._validate(raw_response, body)
 
 
 def test_validate_with_text_error_is_failed():
@@ -469,18 +2113,18 @@ def test_validate_with_text_error_is_failed():
 def test_validate_multi_with_multi_data_is_failed():
     raw_response = Response()
     raw_response.status_code = 207
-    raw_response.json = lambda: [
+    body = [
         {"status": "400", "code": "code", "message": "message"},
         {"status": "403", "code": "code", "message": "message"},
     ]
     with pytest.raises(ServerMultiJsonError, match="400.*403"):
-        core_m._validate(raw_response)
+        core_m._validate(raw_response, body)
 
 
 def test_validate_multi_with_single_data_is_failed():
     raw_response = Response()
     raw_response.status_code = 207
-    raw_response.json = lambda: [
+    body = [
         {
             "status": "400",
             "headers": [
@@ -494,4 +2138,4 @@ def test_validate_multi_with_single_data_is_failed():
         }
     ]
     with pytest.raises(ServerMultiJsonError, match="400"):
-        core_m._validate(raw_response)
+        core_m._validate(raw_response, body)
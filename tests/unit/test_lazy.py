@@ -0,0 +1,74 @@
+import pickle
+
+import pytest
+from pydantic import ValidationError
+
+from pytmv1 import (
+    EndpointActivity,
+    EventID,
+    ExceptionObject,
+    GetEndpointActivityDataResp,
+    GetExceptionListResp,
+    ParseMode,
+    SaeAlert,
+    lazy,
+)
+from pytmv1.core import _parse_items
+from pytmv1.lazy import LazyRecord, lazy_type
+
+
+def test_lazy_type():
+    record = lazy_type(EndpointActivity)({"dpt": "443", "eventId": "3"})
+    assert isinstance(record, LazyRecord)
+    assert type(record).__name__ == "LazyEndpointActivity"
+    assert record.dpt == 443
+    assert record.event_id == EventID.EVENT_CONNECTIO
+    assert record.tags == []
+    assert record.src is None
+
+
+def test_field_is_validated_once(mocker):
+    spy = mocker.spy(lazy, "validate_field")
+    record = lazy_type(EndpointActivity)({"dpt": 443})
+    assert record.dpt == 443
+    assert record.dpt == 443
+    spy.assert_called_once()
+
+
+def test_invalid_field_is_failed_on_access():
+    record = lazy_type(EndpointActivity)({"dpt": 443, "eventId": "unknown"})
+    assert record.dpt == 443
+    with pytest.raises(ValidationError):
+        record.event_id
+
+
+def test_missing_required_field_is_failed():
+    record = lazy_type(SaeAlert)({"id": "1"})
+    assert record.id == "1"
+    with pytest.raises(ValidationError):
+        record.score
+
+
+def test_to_model():
+    record = lazy_type(EndpointActivity)({"dpt": 443, "tags": ["T1"]})
+    model = record.to_model()
+    assert model == EndpointActivity(dpt=443, tags=["T1"])
+    assert record.to_model() is model
+    assert record == model
+    assert pickle.loads(pickle.dumps(record)) == record
+    with pytest.raises(AttributeError):
+        record._unknown
+
+
+def test_parse_items_with_lazy_mode():
+    items = _parse_items(
+        GetEndpointActivityDataResp, [{"dpt": 443}], ParseMode.LAZY
+    )
+    assert type(items[0]) is lazy_type(EndpointActivity)
+    items = _parse_items(
+        GetExceptionListResp,
+        [{"type": "ip", "ip": "1.1.1.1", "lastModifiedDateTime": ""}],
+        ParseMode.LAZY,
+    )
+    assert isinstance(items[0], ExceptionObject)
+    assert items[0].value == "1.1.1.1"
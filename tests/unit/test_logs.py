@@ -0,0 +1,23 @@
+from pytmv1.logs import LazyStr, mask_headers, truncate
+
+
+def test_lazy_str():
+    calls = []
+    lazy = LazyStr(lambda value: calls.append(value) or value, "text")
+    assert not calls
+    assert str(lazy) == "text"
+    assert calls == ["text"]
+
+
+def test_mask_headers():
+    assert (
+        mask_headers({"Authorization": "Bearer abc"})
+        == "{'Authorization': '*****'}"
+    )
+
+
+def test_truncate():
+    assert truncate(b"content", None) == "content"
+    assert truncate("content", 7) == "content"
+    assert truncate(b"content", 3) == "con...[Truncated=4]"
+    assert truncate("é".encode("utf-8"), 1) == "�...[Truncated=1]"
@@ -0,0 +1,97 @@
+import time
+from email.utils import formatdate
+
+from pytmv1 import LogPolicy, PollPolicy, RetryPolicy, ShardPolicy
+from pytmv1.model.enums import Api, HttpMethod
+
+
+def test_can_retry():
+    policy = RetryPolicy(max_retries=2)
+    assert policy.can_retry("GET", 0, 0)
+    assert policy.can_retry("GET", 1, 5)
+    assert not policy.can_retry("GET", 2, 0)
+
+
+def test_can_retry_with_budget():
+    policy = RetryPolicy(max_retries=5, budget=3)
+    assert policy.can_retry("GET", 0, 2)
+    assert not policy.can_retry("GET", 0, 3)
+
+
+def test_can_retry_with_non_idempotent_method():
+    assert not RetryPolicy().can_retry("POST", 0, 0)
+    assert RetryPolicy(methods=frozenset({HttpMethod.POST})).can_retry(
+        "POST", 0, 0
+    )
+
+
+def test_delay():
+    policy = RetryPolicy(backoff_factor=1, backoff_max=5, jitter=False)
+    assert policy.delay(0) == 1
+    assert policy.delay(1) == 2
+    assert policy.delay(2) == 4
+    assert policy.delay(3) == 5
+
+
+def test_delay_with_jitter():
+    policy = RetryPolicy(backoff_factor=1, backoff_max=5)
+    assert all(0 <= policy.delay(2) <= 4 for _ in range(100))
+
+
+def test_delay_with_retry_after():
+    policy = RetryPolicy(backoff_factor=1, jitter=False)
+    assert policy.delay(0, "10") == 10
+    assert policy.delay(0, "invalid") == 1
+
+
+def test_delay_with_retry_after_is_capped():
+    policy = RetryPolicy(backoff_factor=1, jitter=False, retry_after_max=60)
+    assert policy.delay(0, "86400") == 60
+    assert policy.delay(0, formatdate(time.time() + 86400)) == 60
+
+
+def test_delay_with_retry_after_date():
+    policy = RetryPolicy(backoff_factor=1, jitter=False)
+    assert 15 < policy.delay(0, formatdate(time.time() + 20)) <= 20
+
+
+def test_delay_without_retry_after():
+    policy = RetryPolicy(
+        backoff_factor=1, jitter=False, respect_retry_after=False
+    )
+    assert policy.delay(0, "10") == 1
+
+
+def test_poll_delay():
+    policy = PollPolicy(initial_interval=1, factor=3, max_interval=5, jitter=0)
+    assert [policy.delay(polls) for polls in range(1, 5)] == [1, 3, 5, 5]
+
+
+def test_poll_delay_with_jitter():
+    policy = PollPolicy(initial_interval=10, jitter=0.2)
+    assert all(8 <= policy.delay(1) <= 12 for _ in range(100))
+
+
+def test_poll_delay_is_capped():
+    policy = PollPolicy(max_interval=5, jitter=0)
+    assert policy.delay(10_000) == 5
+
+
+def test_sampled():
+    policy = LogPolicy(
+        sample_rate=0,
+        sampling=frozenset(
+            {(Api.GET_ALERT_DETAILS, 1), ("/workbench/alerts/{0}/notes", 0)}
+        ),
+    )
+    assert policy.sampled("https://host/v3.0/workbench/alerts/WB-1?top=1")
+    assert not policy.sampled("https://host/v3.0/workbench/alerts/WB-1/notes")
+    assert not policy.sampled("https://host/v3.0/workbench/alerts")
+    assert LogPolicy().sampled("https://host/v3.0/workbench/alerts")
+
+
+def test_shard_limit():
+    assert ShardPolicy(shards=4).limit(10) == 3
+    assert ShardPolicy(shards=4).limit(0) == 1
+    assert ShardPolicy(shards=4, max_records=2).limit(100) == 2
+    assert ShardPolicy(shards=0).limit(10) == 10
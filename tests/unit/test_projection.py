@@ -0,0 +1,103 @@
+import io
+import json
+
+from requests import Response
+
+import pytmv1
+from pytmv1 import (
+    EmailActivity,
+    EndpointActivity,
+    ExceptionObject,
+    GetEndpointActivityDataResp,
+    project,
+)
+from pytmv1.compat import model_fields, parse_obj
+from pytmv1.projection import project_linkable, select_fields
+
+
+def test_select_fields():
+    assert select_fields(
+        EndpointActivity, ["endpoint_guid", "objectIps", "dpt", "dpt", "x"]
+    ) == ["endpointGuid", "objectIps", "dpt", "x"]
+
+
+def test_select_fields_without_select():
+    assert select_fields(EndpointActivity, None) is None
+    assert select_fields(EndpointActivity, []) is None
+
+
+def test_project():
+    model = project(EndpointActivity, ["endpoint_guid", "objectIps"])
+    assert model.__name__ == "EndpointActivity"
+    assert list(model_fields(model)) == ["endpoint_guid", "object_ips"]
+    assert model is project(EndpointActivity, ["objectIps", "endpointGuid"])
+    record = parse_obj(model, {"endpointGuid": "guid", "dpt": 443})
+    assert record.endpoint_guid == "guid"
+    assert record.object_ips == []
+    assert not hasattr(record, "dpt")
+
+
+def test_project_returns_model():
+    assert project(EmailActivity, None) is EmailActivity
+    assert project(EmailActivity, ["unknown"]) is EmailActivity
+    assert (
+        project(EmailActivity, list(model_fields(EmailActivity)))
+        is EmailActivity
+    )
+
+
+def test_project_with_pre_validators():
+    assert project(ExceptionObject, ["type"]) is ExceptionObject
+
+
+def test_project_linkable():
+    class_ = project_linkable(GetEndpointActivityDataResp, ["dpt"])
+    assert issubclass(class_, GetEndpointActivityDataResp)
+    assert class_ is project_linkable(GetEndpointActivityDataResp, ["dpt"])
+    resp = parse_obj(
+        class_, {"items": [{"dpt": 443, "dst": "ip"}], "progressRate": 100}
+    )
+    assert resp.items[0].dpt == 443
+    assert not hasattr(resp.items[0], "dst")
+    assert (
+        project_linkable(GetEndpointActivityDataResp, None)
+        is GetEndpointActivityDataResp
+    )
+
+
+def _activity_response():
+    raw_response = Response()
+    raw_response.status_code = 200
+    raw_response.headers = {"Content-Type": "application/json"}
+    raw_response.raw = io.BytesIO(
+        json.dumps({"items": [{"dpt": 443}], "progressRate": 100}).encode()
+    )
+    return raw_response
+
+
+def test_iter_endpoint_activity_data_with_select(mocker):
+    client = pytmv1.client("dummy_name", "dummy_token", "https://dummy.com")
+    mock_send = mocker.patch.object(
+        client._core, "_send_internal", return_value=_activity_response()
+    )
+    records = list(
+        client.iter_endpoint_activity_data(select=["dpt", "endpoint_guid"])
+    )
+    assert "select=dpt%2CendpointGuid" in mock_send.call_args[0][0].url
+    assert type(records[0]) is EndpointActivity
+    assert records[0].dpt == 443
+    assert records[0].endpoint_host_name is None
+
+
+def test_iter_endpoint_activity_data_with_slim(mocker):
+    client = pytmv1.client("dummy_name", "dummy_token", "https://dummy.com")
+    mocker.patch.object(
+        client._core, "_send_internal", return_value=_activity_response()
+    )
+    records = list(
+        client.iter_endpoint_activity_data(
+            select=["dpt", "endpoint_guid"], slim=True
+        )
+    )
+    assert list(model_fields(type(records[0]))) == ["dpt", "endpoint_guid"]
+    assert records[0].dpt == 443
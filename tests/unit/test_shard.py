@@ -0,0 +1,139 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from pytmv1 import ShardPolicy
+from pytmv1.shard import ShardPlanner, TimeWindow
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _plan(times, policy, hours=24):
+    """Runs a planner over records at ``times`` (seconds from START)."""
+
+    def count(window):
+        return len(
+            [
+                t
+                for t in times
+                if window.start <= START + timedelta(seconds=t) <= window.end
+            ]
+        )
+
+    whole = TimeWindow(START, START + timedelta(hours=hours))
+    planner = ShardPlanner(
+        TimeWindow(whole.start, whole.end, count(whole)), policy
+    )
+    rounds = 0
+    while not planner.done:
+        planner.update([count(window) for window in planner.pending()])
+        rounds += 1
+    return planner.windows(), rounds
+
+
+def test_from_params():
+    window = TimeWindow.from_params(
+        {
+            "startDateTime": "2024-01-01T00:00:00Z",
+            "endDateTime": "2024-01-03T12:00:00Z",
+        }
+    )
+    assert window.start == START
+    assert window.seconds == 60 * 3600
+
+
+def test_from_params_with_defaults():
+    window = TimeWindow.from_params({"endDateTime": "2024-01-02T00:00:00Z"})
+    assert window.start == START
+    window = TimeWindow.from_params({})
+    assert window.seconds == 24 * 3600
+    assert window.end.tzinfo == timezone.utc
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2024-01-01T00:00:00Z",
+        "2024-01-01T00:00:00",
+        "2024-01-01T00:00:00.250Z",
+        "2024-01-01T01:00:00+01:00",
+    ],
+)
+def test_from_params_with_iso_times(value):
+    window = TimeWindow.from_params(
+        {"startDateTime": value, "endDateTime": value}
+    )
+    assert window.start == START
+    assert window.end == START
+
+
+def test_from_params_is_failed():
+    with pytest.raises(ValidationError):
+        TimeWindow.from_params({"startDateTime": "yesterday"})
+
+
+def test_halves():
+    first, second = TimeWindow(START, START + timedelta(seconds=5)).halves()
+    assert first == TimeWindow(START, START + timedelta(seconds=2))
+    assert second == TimeWindow(
+        START + timedelta(seconds=3), START + timedelta(seconds=5)
+    )
+
+
+def test_params():
+    params = TimeWindow(START, START + timedelta(hours=1)).params(
+        {"startDateTime": "x", "top": 500}
+    )
+    assert params == {
+        "startDateTime": "2024-01-01T00:00:00Z",
+        "endDateTime": "2024-01-01T01:00:00Z",
+        "top": 500,
+    }
+
+
+def test_planner_with_uniform_records():
+    windows, rounds = _plan(range(30, 86400, 60), ShardPolicy(shards=4))
+    assert [window.count for window in windows] == [360] * 4
+    assert [window.seconds for window in windows] == [21600] + [21599] * 3
+    assert rounds == 2
+
+
+def test_planner_with_dense_records():
+    times = list(range(0, 86400, 3600)) + list(range(3600, 3660))
+    windows, _ = _plan(times, ShardPolicy(shards=4, min_seconds=1))
+    assert sum(window.count for window in windows) == len(times)
+    assert max(window.count for window in windows) <= 21
+    assert min(window.seconds for window in windows) < 3600
+    assert windows == sorted(windows, key=lambda window: window.start)
+    assert all(
+        previous.end < window.start
+        for previous, window in zip(windows, windows[1:])
+    )
+
+
+def test_planner_with_max_records():
+    windows, _ = _plan(
+        range(0, 86400, 60), ShardPolicy(shards=1, max_records=200)
+    )
+    assert max(window.count for window in windows) <= 200
+    assert sum(window.count for window in windows) == 1440
+
+
+def test_planner_with_min_seconds():
+    windows, _ = _plan([10] * 100, ShardPolicy(shards=4, min_seconds=3600))
+    assert len(windows) == 1
+    assert windows[0].count == 100
+    assert windows[0].seconds >= 3600
+
+
+def test_planner_skips_empty_windows():
+    windows, _ = _plan([10, 20], ShardPolicy(shards=2, min_seconds=1))
+    assert [window.count for window in windows] == [1, 1]
+    assert sum(window.seconds for window in windows) < 86400
+
+
+def test_planner_without_records():
+    windows, rounds = _plan([], ShardPolicy())
+    assert windows == []
+    assert rounds == 0
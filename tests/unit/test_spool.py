@@ -0,0 +1,54 @@
+import os
+
+import pytest
+
+from pytmv1 import SpooledItems, SpoolPolicy
+from pytmv1.spool import Spool, open_spool
+
+
+def _files(directory):
+    return sorted(name for _, _, names in os.walk(directory) for name in names)
+
+
+def test_spool(tmp_path):
+    with Spool(SpoolPolicy(str(tmp_path), segment_bytes=36)) as spool:
+        reads = [spool.write(bytes([i]) * 10) for i in range(4)]
+        assert len(_files(tmp_path)) == 2
+        assert [read() for read in reads] == [
+            bytes([i]) * 10 for i in range(4)
+        ]
+        assert len(_files(tmp_path)) == 1
+    assert os.listdir(tmp_path) == []
+
+
+def test_spool_with_large_record(tmp_path):
+    with Spool(SpoolPolicy(str(tmp_path), segment_bytes=16)) as spool:
+        read = spool.write(b"x" * 100)
+        assert read() == b"x" * 100
+
+
+def test_spool_is_closed(tmp_path):
+    spool = Spool(SpoolPolicy(str(tmp_path)))
+    read = spool.write(b"data")
+    spool.close()
+    assert os.listdir(tmp_path) == []
+    with pytest.raises(ValueError):
+        read()
+
+
+def test_open_spool(tmp_path):
+    with open_spool(None) as spool:
+        assert spool is None
+    with open_spool(SpoolPolicy(str(tmp_path))) as spool:
+        assert isinstance(spool, Spool)
+
+
+def test_spooled_items():
+    loads = []
+    items = SpooledItems(lambda: loads.append(1) or [1, 2, 3])
+    assert repr(items) == "SpooledItems(<spooled>)"
+    assert list(items) == [1, 2, 3]
+    assert items[1:] == [2, 3]
+    assert len(items) == 3
+    assert items == [1, 2, 3]
+    assert loads == [1]
@@ -0,0 +1,111 @@
+import hashlib
+import io
+import json
+from email.parser import BytesParser
+
+import pytest
+
+from pytmv1.exceptions import FileAccessError
+from pytmv1.stream import ItemsParser, MultipartStream, open_upload
+
+DOCUMENT = json.dumps(
+    {
+        "totalCount": 3,
+        "items": [{"id": 1, "name": "é"}, {"id": 2}, {"id": 3, "list": [1]}],
+        "progressRate": 100,
+        "nextLink": "https://host/path?skipToken=abc",
+    }
+).encode("utf-8")
+
+
+def _feed(document, size):
+    parser = ItemsParser()
+    items = []
+    for start in range(0, len(document), size):
+        end = start + size
+        items.extend(parser.feed(document[start:end]))
+    items.extend(parser.feed(b"", final=True))
+    return parser, items
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 64, len(DOCUMENT)])
+def test_feed(size):
+    parser, items = _feed(DOCUMENT, size)
+    assert items == [{"id": 1, "name": "é"}, {"id": 2}, {"id": 3, "list": [1]}]
+    assert parser.envelope == {
+        "totalCount": 3,
+        "progressRate": 100,
+        "nextLink": "https://host/path?skipToken=abc",
+    }
+
+
+def test_feed_yields_items_before_end():
+    parser = ItemsParser()
+    assert parser.feed(b'{"items": [{"id": 1}, {"id"') == [{"id": 1}]
+    assert parser.feed(b": 2}]}") == [{"id": 2}]
+    assert parser.feed(b"", final=True) == []
+
+
+def test_feed_with_empty_items():
+    parser, items = _feed(b'{"items": [], "nextLink": null}', 3)
+    assert items == []
+    assert parser.envelope == {"nextLink": None}
+
+
+@pytest.mark.parametrize(
+    "document",
+    [b'{"items": [{"id": 1}', b'["items"]', b'{"items": {}}', b"{} {}"],
+)
+def test_feed_is_failed(document):
+    with pytest.raises(json.JSONDecodeError):
+        _feed(document, 4)
+
+
+def test_multipart_stream():
+    file = io.BytesIO(b"skipped" + b"x" * 200_000)
+    file.seek(7)
+    body = MultipartStream(file, 'sample".exe', {"arguments": "YXJn"})
+    content = b"".join(body)
+    assert len(content) == len(body)
+    assert b"".join(body) == content
+    message = BytesParser().parsebytes(
+        f"Content-Type: {body.content_type}\r\n\r\n".encode() + content
+    )
+    fields, sample = message.get_payload()
+    assert (
+        fields.get_param("name", header="content-disposition") == "arguments"
+    )
+    assert fields.get_payload() == "YXJn"
+    assert sample.get_filename() == "sample%22.exe"
+    assert sample.get_payload(decode=True) == b"x" * 200_000
+    assert body.sha1 == hashlib.sha1(b"x" * 200_000).hexdigest()
+    assert body.sha256 == hashlib.sha256(b"x" * 200_000).hexdigest()
+
+
+def test_open_upload(tmp_path):
+    path = tmp_path / "sample"
+    path.write_bytes(b"content")
+    with open_upload(path) as file:
+        assert file.read() == b"content"
+    assert file.closed
+    with open_upload(b"content") as file:
+        assert file.read() == b"content"
+    opened = io.BytesIO(b"content")
+    with open_upload(opened) as file:
+        assert file is opened
+    assert not opened.closed
+
+
+def test_open_upload_is_failed(tmp_path):
+    with pytest.raises(FileAccessError):
+        with open_upload(tmp_path / "missing"):
+            pass
+
+
+def test_multipart_stream_is_failed(mocker):
+    file = mocker.Mock(spec=io.BytesIO)
+    file.tell.return_value = 0
+    file.seek.return_value = 10
+    file.read.side_effect = OSError(5, "Input/output error")
+    with pytest.raises(FileAccessError):
+        list(MultipartStream(file, "name", {}))
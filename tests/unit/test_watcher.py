@@ -0,0 +1,154 @@
+import asyncio
+
+from pytmv1 import (
+    BaseTaskResp,
+    MsData,
+    MsDataUrl,
+    MultiResp,
+    MultiResult,
+    MultiUrlResp,
+    PollPolicy,
+    Result,
+    ResultCode,
+    SandboxSubmissionStatusResp,
+    Status,
+    TaskWatcher,
+)
+from pytmv1.core import Core
+from pytmv1.watcher import AsyncTaskWatcher
+from tests.data import LocalServer
+
+NO_WAIT = PollPolicy(initial_interval=0, jitter=0)
+
+
+def _statuses(*statuses):
+    calls = {}
+
+    def send(class_, uri):
+        count = calls.get(uri, 0)
+        calls[uri] = count + 1
+        status = statuses[min(count, len(statuses) - 1)]
+        return Result.success(class_.construct(status=status))
+
+    return send, calls
+
+
+def test_add():
+    watcher = TaskWatcher(None)
+    watcher.add(
+        "1",
+        MultiResult.success(
+            MultiResp(
+                items=[
+                    MsData.construct(status=202, task_id="2"),
+                    MsData.construct(status=400),
+                ]
+            )
+        ),
+        MultiResult.success(
+            MultiUrlResp(
+                items=[MsDataUrl.construct(status=202, id="3", task_id="3")]
+            )
+        ),
+        MultiResult.failed(RuntimeError()),
+    )
+    assert [w.id for w in watcher._watches] == ["1", "2", "3"]
+    assert watcher._watches[2].class_ == SandboxSubmissionStatusResp
+
+
+def test_iter(mocker):
+    core = mocker.Mock()
+    core.send, calls = _statuses(
+        Status.QUEUED, Status.RUNNING, Status.SUCCEEDED
+    )
+    watcher = TaskWatcher(core, workers=2, polling=NO_WAIT)
+    for task_id in ["1", "2", "3"]:
+        watcher.add_task(task_id)
+    watcher.add_submission("4")
+    results = dict(watcher)
+    assert sorted(results) == ["1", "2", "3", "4"]
+    assert all(r.response.status == Status.SUCCEEDED for r in results.values())
+    assert all(r.polls == 3 for r in results.values())
+    assert sum(calls.values()) == 12
+    assert len(watcher) == 0
+
+
+def test_iter_with_failed_result(mocker):
+    core = mocker.Mock()
+    core.send.return_value = Result.failed(RuntimeError("error"))
+    watcher = TaskWatcher(core, polling=NO_WAIT)
+    watcher.add_task("1")
+    task_id, result = next(iter(watcher))
+    assert task_id == "1"
+    assert result.result_code == ResultCode.ERROR
+    core.send.assert_called_once()
+
+
+def test_iter_with_timeout(mocker):
+    core = mocker.Mock()
+    core.send, _ = _statuses(Status.RUNNING)
+    watcher = TaskWatcher(core, poll_time_sec=0.2, polling=NO_WAIT)
+    watcher.add_task("1")
+    (_, result), *_ = list(watcher)
+    assert result.response.status == Status.RUNNING
+    assert result.polls > 1
+
+
+def test_iter_yields_first_finished(mocker):
+    core = mocker.Mock()
+    core.send.side_effect = lambda class_, uri: Result.success(
+        class_.construct(
+            status=Status.SUCCEEDED if uri.endswith("/2") else Status.RUNNING
+        )
+    )
+    watcher = TaskWatcher(
+        core,
+        poll_time_sec=0.2,
+        polling=PollPolicy(initial_interval=0.05, jitter=0),
+    )
+    watcher.add_task("1", BaseTaskResp)
+    watcher.add_task("2", BaseTaskResp)
+    assert [task_id for task_id, _ in watcher] == ["2", "1"]
+
+
+def test_iter_with_local_server():
+    def task(method, path, body):
+        return 200, {
+            "id": path.rsplit("/", 1)[1],
+            "status": "succeeded",
+            "action": "isolate",
+            "createdDateTime": "2024-01-01T00:00:00Z",
+            "lastActionDateTime": "2024-01-01T00:00:00Z",
+        }
+
+    with LocalServer(task, delay=0.01) as server:
+        watcher = TaskWatcher(
+            Core("appname", "token", server.url, 1, 4, 30, 30),
+            polling=NO_WAIT,
+        )
+        watcher.add(*[str(i) for i in range(100)])
+        results = dict(watcher)
+    assert sorted(results, key=int) == [str(i) for i in range(100)]
+    assert all(
+        result.response.id == task_id for task_id, result in results.items()
+    )
+
+
+def test_async_iter(mocker):
+    send, calls = _statuses(Status.RUNNING, Status.SUCCEEDED)
+
+    async def async_send(class_, uri):
+        return send(class_, uri)
+
+    core = mocker.Mock()
+    core.send = async_send
+    watcher = AsyncTaskWatcher(core, workers=1, polling=NO_WAIT)
+    watcher.add("1", "2")
+
+    async def collect():
+        return {task_id: result async for task_id, result in watcher}
+
+    results = asyncio.run(collect())
+    assert sorted(results) == ["1", "2"]
+    assert all(r.polls == 2 for r in results.values())
+    assert sum(calls.values()) == 4